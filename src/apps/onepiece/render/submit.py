@@ -6,13 +6,20 @@ import getpass
 import json
 import os
 from pathlib import Path
-from typing import Any, Final, cast
+from typing import Any, Final, Sequence, cast
 
 import click
 import structlog
 import typer
 
 from libraries.automation.render import deadline, mock, opencue, tractor
+from libraries.automation.render.chunking import (
+    ChunkPlan,
+    FrameTime,
+    FrameTimeHistory,
+    parse_frames,
+    plan_chunks,
+)
 from libraries.automation.render.base import (
     AdapterCapabilities,
     RenderAdapterNotImplementedError,
@@ -143,6 +150,202 @@ def _resolve_priority_and_chunk_size(
     return resolved_priority, resolved_chunk, resolved_capabilities
 
 
+def _load_frame_history(path: Path, shot: str | None = None) -> FrameTimeHistory:
+    """Read frame time samples from a JSON list or NDJSON file.
+
+    Records need ``frame_time_ms`` and may carry ``frame``, ``sequence`` and
+    ``shot_id``, so Perona render metric exports can be used directly.
+    ``shot`` filters by ``shot_id`` or ``sequence/shot_id``.
+    """
+
+    if not path.is_file():
+        raise OnePieceIOError(f"Frame time history '{path}' was not found.")
+    text = path.read_text(encoding="utf-8")
+    records: list[Any]
+    if text.lstrip().startswith("["):
+        try:
+            records = json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise OnePieceValidationError(
+                f"Frame time history '{path}' is not valid JSON (--frame-times)."
+            ) from exc
+    else:
+        records = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                log.warning("render.frame_times.invalid", path=str(path))
+
+    samples: list[FrameTime] = []
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        try:
+            frame = record.get("frame")
+            samples.append(
+                FrameTime(
+                    frame_time_ms=float(record["frame_time_ms"]),
+                    frame=int(frame) if frame is not None else None,
+                    sequence=record.get("sequence"),
+                    shot_id=record.get("shot_id"),
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    sequence: str | None = None
+    shot_id = shot
+    if shot and "/" in shot:
+        sequence, shot_id = shot.split("/", 1)
+    try:
+        return FrameTimeHistory.from_samples(
+            samples, sequence=sequence, shot_id=shot_id
+        )
+    except ValueError as exc:
+        raise OnePieceValidationError(
+            f"Frame time history '{path}' has no usable samples (--frame-times)."
+        ) from exc
+
+
+def _plan_chunk_sizes(
+    *,
+    frames: str,
+    history: FrameTimeHistory,
+    target_seconds: float,
+    capabilities: AdapterCapabilities,
+) -> ChunkPlan:
+    """Plan chunk sizes within the adapter limits for ``target_seconds``."""
+
+    if not capabilities.get("chunk_size_enabled", False):
+        raise OnePieceValidationError(
+            "Chunk sizing is not supported by this adapter (--chunk-target)."
+        )
+    try:
+        return plan_chunks(
+            parse_frames(frames),
+            history,
+            target_seconds=target_seconds,
+            min_chunk_size=capabilities.get("chunk_size_min") or 1,
+            max_chunk_size=capabilities.get("chunk_size_max"),
+        )
+    except ValueError as exc:
+        raise OnePieceValidationError(f"{exc} (--frames/--chunk-target).") from exc
+
+
+def _dispatch_render(
+    adapter: RenderAdapter,
+    *,
+    farm: str,
+    dcc: str,
+    scene: Path,
+    frames: str,
+    output: Path,
+    priority: int,
+    user: str,
+    chunk_size: int | None,
+    submitted: Sequence[str] = (),
+) -> str | None:
+    """Submit one frame range and report it, returning the farm job ID.
+
+    ``None`` means the adapter is not implemented and nothing was queued.
+    ``submitted`` lists the job IDs queued earlier for the same plan; they are
+    named in failures so partially submitted plans can be cleaned up.
+    """
+
+    already_submitted = (
+        f" Already submitted job IDs: {', '.join(submitted)}." if submitted else ""
+    )
+    try:
+        result = adapter(
+            scene=str(scene),
+            frames=frames,
+            output=str(output),
+            dcc=dcc,
+            priority=priority,
+            user=user,
+            chunk_size=chunk_size,
+        )
+    except RenderAdapterNotImplementedError as exc:
+        log.warning(
+            "render.submit.not_implemented",
+            dcc=dcc,
+            farm=farm,
+            scene=str(scene),
+            hint=exc.hint,
+            submitted_job_ids=list(submitted),
+        )
+        typer.secho(
+            f"Render adapter response: {exc}{already_submitted}",
+            fg=typer.colors.YELLOW,
+        )
+        if exc.hint:
+            typer.secho(exc.hint, fg=typer.colors.YELLOW)
+        return None
+    except RenderSubmissionError as exc:
+        log.error(
+            "render.submit.failed",
+            dcc=dcc,
+            farm=farm,
+            scene=str(scene),
+            frames=frames,
+            error=str(exc),
+            submitted_job_ids=list(submitted),
+        )
+        raise OnePieceExternalServiceError(
+            f"Render submission failed: {exc}{already_submitted}"
+        ) from exc
+    except Exception as exc:  # pragma: no cover - defensive programming
+        log.exception(
+            "render.submit.error",
+            dcc=dcc,
+            farm=farm,
+            scene=str(scene),
+            submitted_job_ids=list(submitted),
+        )
+        raise OnePieceRuntimeError(
+            f"Render submission failed due to an unexpected error.{already_submitted}"
+        ) from exc
+
+    job_id: str = result.get("job_id", "")
+    status = result.get("status", "unknown")
+    farm_type = result.get("farm_type", farm)
+
+    message = result.get("message")
+
+    log.info(
+        "render.submit.success",
+        dcc=dcc,
+        farm=farm_type,
+        scene=str(scene),
+        frames=frames,
+        job_id=job_id,
+        status=status,
+        user=user,
+        message=message,
+        chunk_size=chunk_size,
+    )
+
+    if status == "not_implemented":
+        detail = message or f"{farm_type.title()} adapter is not implemented yet."
+        typer.secho(
+            f"Render adapter response: {detail}{already_submitted}",
+            fg=typer.colors.YELLOW,
+        )
+        return None
+
+    typer.secho(
+        f"Submitted {dcc} scene '{scene}' to {farm_type} with job ID {job_id} (status: {status}).",
+        fg=typer.colors.GREEN,
+    )
+
+    if message:
+        typer.secho(message, fg=typer.colors.GREEN)
+    return job_id
+
+
 def _validate_preset_name(name: str) -> str:
     cleaned = name.strip()
     if not cleaned:
@@ -232,6 +435,21 @@ def submit(
         "--user",
         help="Submitting user (defaults to the current system user).",
     ),
+    chunk_target: float | None = typer.Option(
+        None,
+        "--chunk-target",
+        help="Target wall-clock seconds per chunk; sizes chunks from --frame-times.",
+    ),
+    frame_times: Path | None = typer.Option(
+        None,
+        "--frame-times",
+        help="JSON or NDJSON frame time history (e.g. a Perona metrics export).",
+    ),
+    shot: str | None = typer.Option(
+        None,
+        "--shot",
+        help="Shot (or sequence/shot) used to filter --frame-times samples.",
+    ),
 ) -> None:
     """Submit a render job to the configured farm."""
 
@@ -253,12 +471,48 @@ def submit(
             f"Output path '{output}' is not a directory (--output)."
         )
 
+    if chunk_target is not None:
+        if chunk_size is not None:
+            raise OnePieceValidationError(
+                "Use either --chunk-size or --chunk-target, not both."
+            )
+        if frame_times is None:
+            raise OnePieceValidationError(
+                "A frame time history is required to plan chunks (--frame-times)."
+            )
+
     resolved_priority, resolved_chunk, capabilities = _resolve_priority_and_chunk_size(
         farm=farm,
         priority=priority,
         chunk_size=chunk_size,
     )
 
+    dispatches: list[tuple[str, int | None]] = [(frames, resolved_chunk)]
+    if chunk_target is not None and frame_times is not None:
+        plan = _plan_chunk_sizes(
+            frames=frames,
+            history=_load_frame_history(frame_times, shot),
+            target_seconds=chunk_target,
+            capabilities=capabilities,
+        )
+        dispatches = [(segment.frames, segment.chunk_size) for segment in plan.segments]
+        resolved_chunk = plan.segments[0].chunk_size
+        log.info(
+            "render.submit.chunk_plan",
+            frames=frames,
+            target_seconds=chunk_target,
+            segments=[
+                {
+                    "frames": segment.frames,
+                    "chunk_size": segment.chunk_size,
+                    "chunks": segment.chunk_count,
+                }
+                for segment in plan.segments
+            ],
+            estimated_seconds=round(plan.estimated_seconds, 3),
+            longest_chunk_seconds=round(plan.longest_chunk_seconds, 3),
+        )
+
     log.info(
         "render.submit.start",
         dcc=dcc,
@@ -274,82 +528,23 @@ def submit(
 
     adapter: RenderAdapter = _get_adapter(farm)
 
-    try:
-        result = adapter(
-            scene=str(scene),
-            frames=frames,
-            output=str(output),
+    submitted: list[str] = []
+    for dispatch_frames, dispatch_chunk in dispatches:
+        job_id = _dispatch_render(
+            adapter,
+            farm=farm,
             dcc=dcc,
+            scene=scene,
+            frames=dispatch_frames,
+            output=output,
             priority=resolved_priority,
             user=resolved_user,
-            chunk_size=resolved_chunk,
-        )
-    except RenderAdapterNotImplementedError as exc:
-        log.warning(
-            "render.submit.not_implemented",
-            dcc=dcc,
-            farm=farm,
-            scene=str(scene),
-            hint=exc.hint,
-        )
-        typer.secho(
-            f"Render adapter response: {exc}",
-            fg=typer.colors.YELLOW,
-        )
-        if exc.hint:
-            typer.secho(exc.hint, fg=typer.colors.YELLOW)
-        return
-    except RenderSubmissionError as exc:
-        log.error(
-            "render.submit.failed",
-            dcc=dcc,
-            farm=farm,
-            scene=str(scene),
-            error=str(exc),
+            chunk_size=dispatch_chunk,
+            submitted=submitted,
         )
-        raise OnePieceExternalServiceError(f"Render submission failed: {exc}") from exc
-    except Exception as exc:  # pragma: no cover - defensive programming
-        log.exception(
-            "render.submit.error",
-            dcc=dcc,
-            farm=farm,
-            scene=str(scene),
-        )
-        raise OnePieceRuntimeError(
-            "Render submission failed due to an unexpected error."
-        ) from exc
-
-    job_id = result.get("job_id", "")
-    status = result.get("status", "unknown")
-    farm_type = result.get("farm_type", farm)
-
-    message = result.get("message")
-
-    log.info(
-        "render.submit.success",
-        dcc=dcc,
-        farm=farm_type,
-        scene=str(scene),
-        frames=frames,
-        job_id=job_id,
-        status=status,
-        user=resolved_user,
-        message=message,
-        chunk_size=resolved_chunk,
-    )
-
-    if status == "not_implemented":
-        detail = message or f"{farm_type.title()} adapter is not implemented yet."
-        typer.secho(f"Render adapter response: {detail}", fg=typer.colors.YELLOW)
-        return
-
-    typer.secho(
-        f"Submitted {dcc} scene '{scene}' to {farm_type} with job ID {job_id} (status: {status}).",
-        fg=typer.colors.GREEN,
-    )
-
-    if message:
-        typer.secho(message, fg=typer.colors.GREEN)
+        if job_id is None:
+            return
+        submitted.append(job_id)
 
 
 @presets_app.command("list")
@@ -524,4 +719,7 @@ def use_preset(
         priority=merged.get("priority"),
         chunk_size=merged.get("chunk_size"),
         user=merged.get("user"),
+        chunk_target=None,
+        frame_times=None,
+        shot=None,
     )
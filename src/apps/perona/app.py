@@ -16,6 +16,11 @@ import typer
 
 from pydantic import ValidationError
 
+from apps.perona.db.render_metrics import (
+    RenderMetricStore,
+    resolve_legacy_metrics_path,
+    resolve_metrics_database_path,
+)
 from apps.perona.engine import (
     DEFAULT_BASELINE_COST_INPUT,
     DEFAULT_PNL_BASELINE_COST,
@@ -57,10 +62,14 @@ settings_app = typer.Typer(
 web_app = typer.Typer(name="web", help="Web interface helpers for Perona.")
 cost_app = typer.Typer(name="cost", help="Cost modelling utilities for Perona.")
 risk_app = typer.Typer(name="risk", help="Risk analytics utilities for Perona.")
+metrics_app = typer.Typer(
+    name="metrics", help="Render metric storage utilities for Perona."
+)
 app.add_typer(settings_app)
 app.add_typer(web_app)
 app.add_typer(cost_app)
 app.add_typer(risk_app)
+app.add_typer(metrics_app)
 
 
 @app.command("version")
@@ -1042,6 +1051,38 @@ def demo_dashboard(
     )
 
 
+@metrics_app.command("import")
+def metrics_import(
+    source: Path | None = typer.Argument(
+        None,
+        help=(
+            "NDJSON metrics file to import. Defaults to PERONA_METRICS_PATH or the "
+            "legacy cache location."
+        ),
+    ),
+    database: Path | None = typer.Option(
+        None,
+        "--database",
+        help="Metrics database to import into. Defaults to PERONA_METRICS_DB.",
+    ),
+) -> None:
+    """Import render metrics from an NDJSON file into the metrics database."""
+
+    source_path = (source or resolve_legacy_metrics_path()).expanduser()
+    if not source_path.is_file():
+        raise typer.BadParameter(f"Metrics file '{source_path}' does not exist.")
+
+    database_path = (database or resolve_metrics_database_path()).expanduser()
+    store = RenderMetricStore(database_path)
+    try:
+        imported = store.import_ndjson(source_path)
+    finally:
+        store.close()
+    typer.echo(
+        f"Imported {imported} render metrics from {source_path} into {database_path}"
+    )
+
+
 @app.command("settings-export")
 def settings_export(
     destination: Path = typer.Argument(
@@ -1077,6 +1118,7 @@ __all__ = [
     "cost_insights",
     "dashboard",
     "demo_dashboard",
+    "metrics_import",
     "settings",
     "settings_export",
     "version",
@@ -1,5 +1,13 @@
-"""Database schema and migration helpers for the Perona dashboard."""
+"""Database schema, migrations and metric storage for the Perona dashboard."""
 
+from .render_metrics import (
+    MetricSnapshot,
+    RenderMetricStore,
+    ShotMetricTotals,
+    StoredRenderMetric,
+    resolve_legacy_metrics_path,
+    resolve_metrics_database_path,
+)
 from .schema import (
     MIGRATIONS,
     Migration,
@@ -11,7 +19,13 @@ from .schema import (
 __all__ = [
     "MIGRATIONS",
     "Migration",
+    "MetricSnapshot",
+    "RenderMetricStore",
+    "ShotMetricTotals",
+    "StoredRenderMetric",
     "apply_migrations",
     "get_applied_migrations",
     "latest_migration_id",
+    "resolve_legacy_metrics_path",
+    "resolve_metrics_database_path",
 ]
@@ -0,0 +1,725 @@
+"""SQLite-backed storage for render telemetry ingested by the dashboard."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from .schema import apply_migrations
+
+DEFAULT_BATCH_SIZE = 500
+METRICS_DATABASE_ENV = "PERONA_METRICS_DB"
+LEGACY_METRICS_PATH_ENV = "PERONA_METRICS_PATH"
+
+_COLUMNS = (
+    "id, sequence, shot_id, captured_at, fps, frame_time_ms, error_count, "
+    "gpu_utilisation, cache_health"
+)
+
+_INSERT = (
+    "INSERT INTO perona_render_metrics (sequence, shot_id, captured_at, fps, "
+    "frame_time_ms, error_count, gpu_utilisation, cache_health) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_NEW = (
+    "INSERT INTO perona_render_metrics (sequence, shot_id, captured_at, fps, "
+    "frame_time_ms, error_count, gpu_utilisation, cache_health) "
+    "SELECT ?, ?, ?, ?, ?, ?, ?, ? WHERE NOT EXISTS ("
+    "SELECT 1 FROM perona_render_metrics "
+    "WHERE sequence = ? AND shot_id = ? AND captured_at = ?)"
+)
+
+
+def _cache_dir() -> Path:
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    base_dir = Path(cache_home).expanduser() if cache_home else Path.home() / ".cache"
+    return base_dir / "perona"
+
+
+def resolve_metrics_database_path() -> Path:
+    """Return the configured metrics database path, falling back to cache dir."""
+
+    env_path = os.getenv(METRICS_DATABASE_ENV)
+    if env_path:
+        return Path(env_path).expanduser()
+    return _cache_dir() / "render-metrics.db"
+
+
+def resolve_legacy_metrics_path() -> Path:
+    """Return the NDJSON metrics file written by earlier releases."""
+
+    env_path = os.getenv(LEGACY_METRICS_PATH_ENV)
+    if env_path:
+        return Path(env_path).expanduser()
+    return _cache_dir() / "render-metrics.ndjson"
+
+
+def normalise_timestamp(value: datetime) -> datetime:
+    """Return ``value`` as a naive UTC datetime so stored rows sort correctly."""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _parse_timestamp(value: object) -> datetime | None:
+    if isinstance(value, datetime):
+        return normalise_timestamp(value)
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return normalise_timestamp(parsed)
+
+
+_FIRST_CAPTURE = (
+    "NOT EXISTS (SELECT 1 FROM perona_render_metrics AS earlier "
+    "WHERE earlier.sequence = perona_render_metrics.sequence "
+    "AND earlier.shot_id = perona_render_metrics.shot_id "
+    "AND earlier.captured_at = perona_render_metrics.captured_at "
+    "AND earlier.id < perona_render_metrics.id)"
+)
+
+
+def _format_timestamp(value: datetime) -> str:
+    return normalise_timestamp(value).isoformat(timespec="microseconds")
+
+
+@dataclass(frozen=True)
+class StoredRenderMetric:
+    """Render metric row read back from the store."""
+
+    id: int
+    sequence: str
+    shot_id: str
+    timestamp: datetime
+    fps: float
+    frame_time_ms: float
+    error_count: int
+    gpu_utilisation: float
+    cache_health: float
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "StoredRenderMetric":
+        return cls(
+            id=int(row[0]),
+            sequence=row[1],
+            shot_id=row[2],
+            timestamp=datetime.fromisoformat(row[3]),
+            fps=float(row[4]),
+            frame_time_ms=float(row[5]),
+            error_count=int(row[6]),
+            gpu_utilisation=float(row[7]),
+            cache_health=float(row[8]),
+        )
+
+
+@dataclass(frozen=True)
+class MetricSnapshot:
+    """Derived state saved next to the metrics it was computed from."""
+
+    name: str
+    fingerprint: str
+    cursor: int
+    min_id: int
+    payload: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class ShotMetricTotals:
+    """Sums of the numeric metric fields recorded for one shot."""
+
+    sequence: str
+    shot_id: str
+    count: int
+    fps_total: float
+    frame_time_total: float
+    gpu_utilisation_total: float
+    error_total: float
+
+
+def _record_values(record: Mapping[str, Any]) -> tuple[Any, ...] | None:
+    """Return insert values for an API payload record, or ``None`` if invalid."""
+
+    timestamp = _parse_timestamp(record.get("timestamp"))
+    sequence = record.get("sequence")
+    shot_id = record.get("shot_id")
+    frame_time = record.get("frame_time_ms")
+    gpu_utilisation = record.get("gpuUtilisation", record.get("gpu_utilisation"))
+    cache_health = record.get("cacheHealth", record.get("cache_health"))
+    if (
+        timestamp is None
+        or not isinstance(sequence, str)
+        or not isinstance(shot_id, str)
+        or frame_time is None
+        or gpu_utilisation is None
+        or cache_health is None
+    ):
+        return None
+    try:
+        values = (
+            sequence,
+            shot_id,
+            _format_timestamp(timestamp),
+            float(record.get("fps", 0.0)),
+            float(frame_time),
+            int(record.get("error_count", 0)),
+            float(gpu_utilisation),
+            float(cache_health),
+        )
+    except (TypeError, ValueError):
+        return None
+    if not all(math.isfinite(value) for value in values[3:]):
+        return None
+    return values
+
+
+class RenderMetricStore:
+    """Persist render metrics to the ``perona_render_metrics`` table.
+
+    The database is migrated on first use and opened in WAL mode so dashboard
+    reads are not blocked by ingestion. Each thread keeps its own connection;
+    :meth:`persist` inserts records in batches of ``batch_size`` inside one
+    transaction per call. Queries filter on the ``(sequence, shot_id,
+    captured_at)`` and ``captured_at`` indexes so callers only read the rows
+    they need. Timestamps are stored as naive UTC ISO strings.
+    """
+
+    def __init__(self, path: Path, *, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self._path = Path(path)
+        self._batch_size = max(int(batch_size), 1)
+        self._local = threading.local()
+        self._migrate_lock = threading.Lock()
+        self._tail: RenderMetricTail | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def identity(self) -> tuple[int, int] | None:
+        """Return the database file's ``(device, inode)``, or ``None`` if missing."""
+
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    @property
+    def tail(self) -> "RenderMetricTail":
+        """Incrementally refreshed view of the stored rows shared by every reader."""
+
+        with self._migrate_lock:
+            if self._tail is None:
+                self._tail = RenderMetricTail(self)
+            return self._tail
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        identity = self.identity()
+        if connection is not None:
+            # Reopen when the database file was replaced or removed underneath us.
+            if identity is not None and identity == self._local.identity:
+                return connection
+            connection.close()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=30.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with self._migrate_lock:
+            apply_migrations(connection)
+        self._local.connection = connection
+        self._local.identity = self.identity()
+        return connection
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def persist(self, records: Sequence[Mapping[str, Any]]) -> int:
+        """Insert valid ``records`` and return how many rows were written."""
+
+        return self._insert(_record_values(record) for record in records)
+
+    def _insert(
+        self, values: Iterable[tuple[Any, ...] | None], *, skip_existing: bool = False
+    ) -> int:
+        connection = self._connection()
+        statement = _INSERT_NEW if skip_existing else _INSERT
+        written = 0
+        batch: list[tuple[Any, ...]] = []
+        with connection:
+            for row in values:
+                if row is None:
+                    continue
+                batch.append(row + row[:3] if skip_existing else row)
+                if len(batch) >= self._batch_size:
+                    written += connection.executemany(statement, batch).rowcount
+                    batch = []
+            if batch:
+                written += connection.executemany(statement, batch).rowcount
+        return written
+
+    def import_ndjson(self, source: Path) -> int:
+        """Load a legacy NDJSON metrics file and return the rows imported.
+
+        Lines that are not valid JSON or miss required fields are skipped, as
+        are samples already stored for the same shot and capture time, so an
+        interrupted import can simply be run again.
+        """
+
+        def _values() -> Iterator[tuple[Any, ...] | None]:
+            with Path(source).open("r", encoding="utf-8") as handle:
+                for raw_line in handle:
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    try:
+                        payload = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(payload, dict):
+                        yield _record_values(payload)
+
+        return self._insert(_values(), skip_existing=True)
+
+    def query(
+        self,
+        *,
+        sequence: str | None = None,
+        shot_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after_id: int | None = None,
+        through_id: int | None = None,
+        first_captures: bool = False,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> list[StoredRenderMetric]:
+        """Return stored metrics matching the filters, ordered by capture time.
+
+        ``since``/``until`` bound ``captured_at`` inclusively, and
+        ``after_id``/``through_id`` keep rows inserted after a previously seen
+        row id and up to (including) another. ``first_captures`` skips rows
+        that repeat an earlier row's shot and capture time. With ``limit`` the
+        newest matching rows are returned.
+        """
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if sequence is not None:
+            clauses.append("sequence = ?")
+            params.append(sequence)
+        if shot_id is not None:
+            clauses.append("shot_id = ?")
+            params.append(shot_id)
+        if since is not None:
+            clauses.append("captured_at >= ?")
+            params.append(_format_timestamp(since))
+        if until is not None:
+            clauses.append("captured_at <= ?")
+            params.append(_format_timestamp(until))
+        if after_id is not None:
+            clauses.append("id > ?")
+            params.append(int(after_id))
+        if through_id is not None:
+            clauses.append("id <= ?")
+            params.append(int(through_id))
+        if first_captures:
+            clauses.append(_FIRST_CAPTURE)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        descending = newest_first or limit is not None
+        order = (
+            " ORDER BY captured_at DESC, id DESC"
+            if descending
+            else " ORDER BY captured_at, id"
+        )
+        sql = f"SELECT {_COLUMNS} FROM perona_render_metrics{where}{order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(int(limit), 0))
+        rows = self._connection().execute(sql, params).fetchall()
+        metrics = [StoredRenderMetric.from_row(row) for row in rows]
+        if limit is not None and not newest_first:
+            metrics.reverse()
+        return metrics
+
+    def shot_totals(
+        self,
+        *,
+        after_id: int | None = None,
+        through_id: int | None = None,
+        first_captures: bool = False,
+    ) -> list[ShotMetricTotals]:
+        """Return per-shot sums computed by SQLite without loading rows.
+
+        ``after_id``/``through_id`` restrict the sums to a range of row ids and
+        ``first_captures`` leaves out rows repeating an earlier row's shot and
+        capture time, as in :meth:`query`.
+        """
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if after_id is not None:
+            clauses.append("id > ?")
+            params.append(int(after_id))
+        if through_id is not None:
+            clauses.append("id <= ?")
+            params.append(int(through_id))
+        if first_captures:
+            clauses.append(_FIRST_CAPTURE)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT sequence, shot_id, COUNT(*), SUM(fps), SUM(frame_time_ms), "
+                "SUM(gpu_utilisation), SUM(error_count) FROM perona_render_metrics"
+                f"{where} GROUP BY sequence, shot_id ORDER BY sequence, shot_id",
+                params,
+            )
+            .fetchall()
+        )
+        return [
+            ShotMetricTotals(
+                sequence=row[0],
+                shot_id=row[1],
+                count=int(row[2]),
+                fps_total=float(row[3] or 0.0),
+                frame_time_total=float(row[4] or 0.0),
+                gpu_utilisation_total=float(row[5] or 0.0),
+                error_total=float(row[6] or 0.0),
+            )
+            for row in rows
+        ]
+
+    def save_snapshot(
+        self,
+        name: str,
+        *,
+        fingerprint: str,
+        cursor: int,
+        min_id: int,
+        payload: Mapping[str, Any],
+    ) -> None:
+        """Store derived state computed from rows up to ``cursor``.
+
+        Snapshots let consumers such as cost insights resume from the rows
+        they already folded in after a restart. ``fingerprint`` identifies the
+        inputs the state depends on and ``min_id`` the oldest row it covers.
+        """
+
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT INTO perona_metric_snapshots "
+                "(name, fingerprint, cursor, min_id, payload) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET fingerprint = excluded.fingerprint, "
+                "cursor = excluded.cursor, min_id = excluded.min_id, "
+                "payload = excluded.payload, updated_at = CURRENT_TIMESTAMP",
+                (
+                    name,
+                    fingerprint,
+                    int(cursor),
+                    int(min_id),
+                    json.dumps(payload, separators=(",", ":")),
+                ),
+            )
+
+    def load_snapshot(self, name: str) -> MetricSnapshot | None:
+        """Return the snapshot saved under ``name``, if any."""
+
+        row = (
+            self._connection()
+            .execute(
+                "SELECT fingerprint, cursor, min_id, payload "
+                "FROM perona_metric_snapshots WHERE name = ?",
+                (name,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            payload = json.loads(row[3])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        return MetricSnapshot(
+            name=name,
+            fingerprint=row[0],
+            cursor=int(row[1]),
+            min_id=int(row[2]),
+            payload=payload,
+        )
+
+    def latest(self) -> StoredRenderMetric | None:
+        """Return the most recently captured metric, if any."""
+
+        metrics = self.query(limit=1)
+        return metrics[0] if metrics else None
+
+    def max_id(self) -> int:
+        """Return the largest row id in the table (``0`` when empty)."""
+
+        return self.id_bounds()[1]
+
+    def id_bounds(self) -> tuple[int, int]:
+        """Return the smallest and largest row ids (``(0, 0)`` when empty)."""
+
+        row = (
+            self._connection()
+            .execute("SELECT MIN(id), MAX(id) FROM perona_render_metrics")
+            .fetchone()
+        )
+        return int(row[0] or 0), int(row[1] or 0)
+
+
+def _sort_key(metric: StoredRenderMetric) -> tuple[datetime, int]:
+    return (metric.timestamp, metric.id)
+
+
+class RenderMetricTail:
+    """Incrementally maintained view over a :class:`RenderMetricStore`.
+
+    :meth:`refresh` remembers the highest row id it has read and the identity
+    of the database file, so each call only aggregates rows inserted since the
+    previous one into running per-shot totals. Like the row feeds, the totals
+    count a repeated shot and capture time once. Only those totals, the cursor
+    and the newest row are held in memory; row feeds are read from SQLite and
+    bounded by the cursor so every reader sees the same rows. When the file is
+    replaced (new inode) or the table is emptied the view is rebuilt, and
+    pruning rows from the start of the table recomputes the totals. Deleting
+    rows from the middle of the table is not detected.
+    """
+
+    def __init__(self, store: RenderMetricStore) -> None:
+        self._store = store
+        self._lock = threading.RLock()
+        self._identity: tuple[int, int] | None = None
+        self._cursor = 0
+        self._min_id = 0
+        self._generation = 0
+        self._epoch = 0
+        self._totals: dict[tuple[str, str], list[float]] = {}
+        self._latest: StoredRenderMetric | None = None
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the view changes."""
+
+        return self._generation
+
+    @property
+    def epoch(self) -> int:
+        """Counter bumped when rows leave the view (reset or pruning).
+
+        Consumers that fold rows incrementally must start over when it moves.
+        """
+
+        return self._epoch
+
+    @property
+    def cursor(self) -> int:
+        """Highest row id included so far."""
+
+        return self._cursor
+
+    @property
+    def min_id(self) -> int:
+        """Lowest row id present in the table at the last refresh."""
+
+        return self._min_id
+
+    def rows_after(
+        self,
+        row_id: int,
+        *,
+        through_id: int | None = None,
+        first_captures: bool = False,
+    ) -> list[StoredRenderMetric]:
+        """Return rows with an id above ``row_id``, in id order.
+
+        Rows past the cursor (or ``through_id``, whichever is lower) are left
+        out; ``first_captures`` is passed on to :meth:`RenderMetricStore.query`.
+        """
+
+        with self._lock:
+            cursor = self._cursor
+        if through_id is not None:
+            cursor = min(cursor, through_id)
+        if cursor <= row_id:
+            return []
+        rows = self._store.query(
+            after_id=row_id, through_id=cursor, first_captures=first_captures
+        )
+        rows.sort(key=lambda row: row.id)
+        return rows
+
+    def refresh(self) -> int:
+        """Fold in rows added since the last call and return how many were counted.
+
+        Rows repeating an earlier row's shot and capture time are not counted.
+        """
+
+        with self._lock:
+            identity = self._store.identity()
+            if identity is None:
+                self._reset(None)
+                return 0
+            if identity != self._identity:
+                self._reset(identity)
+            low, high = self._store.id_bounds()
+            if high < self._cursor:
+                self._reset(identity)
+            elif low > self._min_id and self._cursor:
+                self._prune()
+            self._min_id = low
+            if high <= self._cursor:
+                return 0
+            # Rows committed after ``id_bounds`` carry higher ids and are left
+            # for the next refresh.
+            added = 0
+            for totals in self._store.shot_totals(
+                after_id=self._cursor, through_id=high, first_captures=True
+            ):
+                self._apply_totals(totals)
+                added += totals.count
+            newest = self._store.query(after_id=self._cursor, through_id=high, limit=1)
+            if newest and (
+                self._latest is None or _sort_key(newest[0]) > _sort_key(self._latest)
+            ):
+                self._latest = newest[0]
+            self._cursor = high
+            self._generation += 1
+            return added
+
+    def _reset(self, identity: tuple[int, int] | None) -> None:
+        if self._cursor or self._totals:
+            self._generation += 1
+            self._epoch += 1
+        self._identity = identity
+        self._cursor = 0
+        self._min_id = 0
+        self._totals = {}
+        self._latest = None
+
+    def _apply_totals(self, totals: ShotMetricTotals) -> None:
+        entry = self._totals.setdefault((totals.sequence, totals.shot_id), [0.0] * 5)
+        entry[0] += totals.count
+        entry[1] += totals.fps_total
+        entry[2] += totals.frame_time_total
+        entry[3] += totals.gpu_utilisation_total
+        entry[4] += totals.error_total
+
+    def _prune(self) -> None:
+        """Recompute the totals and newest row for the rows still stored."""
+
+        self._totals = {}
+        for totals in self._store.shot_totals(
+            through_id=self._cursor, first_captures=True
+        ):
+            self._apply_totals(totals)
+        newest = self._store.query(through_id=self._cursor, limit=1)
+        self._latest = newest[0] if newest else None
+        self._generation += 1
+        self._epoch += 1
+
+    def metrics(
+        self,
+        *,
+        sequence: str | None = None,
+        shot_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[StoredRenderMetric]:
+        """Return rows for the filters in capture order.
+
+        With ``limit`` only the newest rows are returned.
+        """
+
+        with self._lock:
+            cursor = self._cursor
+        if not cursor:
+            return []
+        return self._store.query(
+            sequence=sequence, shot_id=shot_id, through_id=cursor, limit=limit
+        )
+
+    def first_captures_matching(
+        self, samples: Iterable[tuple[str, str, datetime]]
+    ) -> list[StoredRenderMetric]:
+        """Return first-capture rows repeating one of ``samples``.
+
+        ``samples`` are ``(sequence, shot_id, timestamp)`` keys. The rows are
+        read with one query bounded by the samples' capture times and matched
+        in memory.
+        """
+
+        keys = {
+            (sequence, shot_id, normalise_timestamp(timestamp))
+            for sequence, shot_id, timestamp in samples
+        }
+        with self._lock:
+            cursor = self._cursor
+        if not cursor or not keys:
+            return []
+        timestamps = [key[2] for key in keys]
+        rows = self._store.query(
+            since=min(timestamps),
+            until=max(timestamps),
+            through_id=cursor,
+            first_captures=True,
+        )
+        return [
+            row for row in rows if (row.sequence, row.shot_id, row.timestamp) in keys
+        ]
+
+    def shot_totals(self) -> list[ShotMetricTotals]:
+        """Return running per-shot sums of the rows in the view."""
+
+        with self._lock:
+            return [
+                ShotMetricTotals(
+                    sequence=sequence,
+                    shot_id=shot_id,
+                    count=int(values[0]),
+                    fps_total=values[1],
+                    frame_time_total=values[2],
+                    gpu_utilisation_total=values[3],
+                    error_total=values[4],
+                )
+                for (sequence, shot_id), values in sorted(self._totals.items())
+            ]
+
+    def latest(self) -> StoredRenderMetric | None:
+        """Return the most recently captured row in the view."""
+
+        with self._lock:
+            return self._latest
+
+
+__all__ = [
+    "LEGACY_METRICS_PATH_ENV",
+    "METRICS_DATABASE_ENV",
+    "MetricSnapshot",
+    "RenderMetricStore",
+    "RenderMetricTail",
+    "ShotMetricTotals",
+    "StoredRenderMetric",
+    "normalise_timestamp",
+    "resolve_legacy_metrics_path",
+    "resolve_metrics_database_path",
+]
@@ -100,6 +100,32 @@ MIGRATIONS: tuple[Migration, ...] = (
             """,
         ),
     ),
+    Migration(
+        identifier="0002_render_metrics_time_index",
+        description="Index render telemetry by capture time for time-range queries.",
+        statements=(
+            """
+            CREATE INDEX IF NOT EXISTS idx_perona_render_metrics_captured
+                ON perona_render_metrics (captured_at)
+            """,
+        ),
+    ),
+    Migration(
+        identifier="0003_metric_snapshots",
+        description="Persist state derived from render telemetry, such as insights.",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS perona_metric_snapshots (
+                name TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                cursor INTEGER NOT NULL,
+                min_id INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+        ),
+    ),
 )
 
 
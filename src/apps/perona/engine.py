@@ -3,24 +3,32 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
-import json
+import bisect
+import hashlib
 import logging
 import os
 from pathlib import Path
 import math
-import statistics
+import sqlite3
+import threading
 from typing import Iterable, Mapping, Sequence
 import tomllib
 
+from apps.perona.db.render_metrics import (
+    RenderMetricStore,
+    RenderMetricTail,
+    ShotMetricTotals,
+    StoredRenderMetric,
+)
 from libraries.analytics.perona import CostDriverDelta
+from libraries.analytics.perona.columnar import FrameTimeGroups, RenderMetricColumns
 from libraries.analytics.perona.ml_foundations import (
     Dataset,
+    FeatureAccumulator,
     FeatureStatistics,
     TrainingExample,
-    analyse_cost_relationships,
-    compute_feature_statistics,
     recommend_best_practices,
 )
 from libraries.automation.render import optimization as render_optimization
@@ -449,6 +457,26 @@ def _safe_float(value: object, default: float, *, setting: str) -> float:
     return default
 
 
+_COST_INSIGHTS_SNAPSHOT = "cost_insights"
+_COST_INSIGHTS_VERSION = 1
+
+
+@dataclass
+class _CostInsightState:
+    """Running cost insight accumulators and the inputs they were built from."""
+
+    telemetry: Sequence[ShotTelemetry]
+    render_log: Sequence[RenderMetric]
+    baseline: CostModelInput
+    fingerprint: str
+    store: RenderMetricStore | None = None
+    epoch: int = 0
+    cursor: int = 0
+    boot: dict[tuple[str, str], FeatureAccumulator] = field(default_factory=dict)
+    fallback: dict[tuple[str, str], FeatureAccumulator] = field(default_factory=dict)
+    persisted: dict[tuple[str, str], FeatureAccumulator] = field(default_factory=dict)
+
+
 class PeronaEngine:
     """High level orchestration of the dashboard analytics."""
 
@@ -471,9 +499,18 @@ class PeronaEngine:
         )
         self._telemetry = self._build_telemetry()
         self._render_log = self._build_render_log()
-        self._frame_times_by_shot = self._group_frame_times(self._render_log)
+        self._columns_lock = threading.Lock()
+        self._columns: RenderMetricColumns | None = None
+        self._columns_source: Sequence[RenderMetric] | None = None
+        self._columns_tail: tuple[RenderMetricTail, int] | None = None
+        self._columns_cursor = 0
+        self._frame_time_groups: tuple[RenderMetricColumns, FrameTimeGroups] | None = (
+            None
+        )
         self._lifecycle = self._build_lifecycle()
         self._pnl_contributions = self._build_pnl_contributions()
+        self._insights_lock = threading.Lock()
+        self._insights: _CostInsightState | None = None
 
     @property
     def baseline_cost_input(self) -> CostModelInput:
@@ -542,12 +579,23 @@ class PeronaEngine:
     ) -> Iterable[RenderMetric]:
         """Return recent render metrics filtered by the supplied identifiers."""
 
-        filtered: list[RenderMetric] = [
-            sample
-            for sample in self._render_log
-            if (sequence is None or sample.sequence == sequence)
-            and (shot_id is None or sample.shot_id == shot_id)
-        ]
+        render_log = self._render_log
+        if sequence is None and shot_id is None:
+            filtered = list(render_log)
+        else:
+            # Persisted samples follow the boot log in the columns; they are
+            # read back from the store below.
+            indices = self.render_columns().select(sequence=sequence, shot_id=shot_id)
+            filtered = [
+                render_log[index]
+                for index in indices[: bisect.bisect_left(indices, len(render_log))]
+            ]
+        persisted = self._load_persisted_render_metrics(
+            sequence=sequence, shot_id=shot_id, limit=limit
+        )
+        if persisted:
+            filtered.extend(persisted)
+            filtered.sort(key=lambda metric: metric.timestamp)
         if limit is not None:
             filtered = filtered[-limit:]
         for sample in filtered:
@@ -565,17 +613,14 @@ class PeronaEngine:
         indicators: list[RiskIndicator] = []
         target_error_rate = max(self._target_error_rate, 1e-6)
         weight_total = _VARIANCE_WEIGHT + _ERROR_WEIGHT + _DEADLINE_WEIGHT
+        frame_times = self.frame_time_groups()
         for telemetry in self._telemetry:
-            frame_times = self._frame_times_by_shot.get(
-                (telemetry.sequence, telemetry.shot_id),
-                (),
+            frame_stats = frame_times.statistics(
+                (telemetry.sequence, telemetry.shot_id)
             )
-            if len(frame_times) > 1:
-                variance = statistics.pvariance(frame_times)
-                mean_frame_time = statistics.fmean(frame_times)
-            elif frame_times:
-                variance = 0.0
-                mean_frame_time = frame_times[0]
+            if frame_stats is not None:
+                variance = frame_stats.variance if frame_stats.count > 1 else 0.0
+                mean_frame_time = frame_stats.mean
             else:
                 variance = 0.0
                 mean_frame_time = telemetry.average_frame_time_ms
@@ -639,101 +684,200 @@ class PeronaEngine:
             )
         return tuple(sorted(indicators, key=lambda item: item.risk_score, reverse=True))
 
-    @staticmethod
-    def _group_frame_times(
-        render_log: Sequence[RenderMetric],
-    ) -> dict[tuple[str, str], tuple[float, ...]]:
-        """Build an index of frame times keyed by (sequence, shot_id)."""
-
-        grouped: dict[tuple[str, str], list[float]] = defaultdict(list)
-        for sample in render_log:
-            grouped[(sample.sequence, sample.shot_id)].append(sample.frame_time_ms)
-        return {key: tuple(values) for key, values in grouped.items()}
+    def render_columns(self) -> RenderMetricColumns:
+        """Return the boot log and persisted render metrics as columns.
+
+        Boot log samples come first, so their indices match the log. Stored
+        rows are appended as the metrics store's tail advances, skipping rows
+        that repeat a boot sample or an earlier capture; the columns are
+        rebuilt when the boot log changes or the tail drops rows.
+        """
+
+        tail = self._metric_tail()
+        tail_state = (tail, tail.epoch) if tail is not None else None
+        with self._columns_lock:
+            columns = self._columns
+            if (
+                columns is None
+                or self._columns_source is not self._render_log
+                or self._columns_tail != tail_state
+            ):
+                columns = RenderMetricColumns(self._render_log)
+                self._columns_source = self._render_log
+                self._columns_tail = tail_state
+                self._columns_cursor = 0
+            if tail is not None and tail.cursor > self._columns_cursor:
+                cursor = tail.cursor
+                boot_keys = {
+                    (sample.sequence, sample.shot_id, sample.timestamp)
+                    for sample in self._render_log
+                }
+                try:
+                    rows = tail.rows_after(
+                        self._columns_cursor, through_id=cursor, first_captures=True
+                    )
+                except sqlite3.Error as exc:
+                    LOGGER.warning("Failed to read persisted render metrics: %s", exc)
+                    rows = []
+                    cursor = self._columns_cursor
+                columns = columns.extended(
+                    row
+                    for row in rows
+                    if (row.sequence, row.shot_id, row.timestamp) not in boot_keys
+                )
+                self._columns_cursor = cursor
+            self._columns = columns
+            return columns
+
+    def frame_time_groups(self) -> FrameTimeGroups:
+        """Return per-shot frame times and statistics over :meth:`render_columns`."""
+
+        columns = self.render_columns()
+        with self._columns_lock:
+            cached = self._frame_time_groups
+            if cached is not None and cached[0] is columns:
+                return cached[1]
+        groups = FrameTimeGroups(columns)
+        with self._columns_lock:
+            self._frame_time_groups = (columns, groups)
+        return groups
 
     @staticmethod
-    def _parse_metric_timestamp(value: str) -> datetime | None:
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
-            return None
-
-    def _load_persisted_render_metrics(self) -> tuple[RenderMetric, ...]:
-        """Return metrics ingested via the API that are not in the boot log."""
+    def _metric_store() -> RenderMetricStore | None:
+        """Return the dashboard's metrics store when its database exists."""
 
         try:
             from apps.perona.web import dashboard as dashboard_module
         except Exception:  # pragma: no cover - defensive guard for optional import
-            return ()
+            return None
 
         metrics_store = getattr(dashboard_module, "_metrics_store", None)
-        path = getattr(metrics_store, "path", None)
-        if not isinstance(path, Path) or not path.exists():
+        if not isinstance(metrics_store, RenderMetricStore):
+            return None
+        if not metrics_store.path.exists():
+            return None
+        return metrics_store
+
+    @staticmethod
+    def _from_stored_metric(stored: StoredRenderMetric) -> RenderMetric:
+        return RenderMetric(
+            sequence=stored.sequence,
+            shot_id=stored.shot_id,
+            timestamp=stored.timestamp,
+            fps=stored.fps,
+            frame_time_ms=stored.frame_time_ms,
+            error_count=stored.error_count,
+            gpu_utilisation=stored.gpu_utilisation,
+            cache_health=stored.cache_health,
+        )
+
+    def _metric_tail(self) -> RenderMetricTail | None:
+        """Return the store's shared tail after folding in newly added rows."""
+
+        metrics_store = self._metric_store()
+        if metrics_store is None:
+            return None
+        tail = metrics_store.tail
+        try:
+            tail.refresh()
+        except sqlite3.Error as exc:
+            LOGGER.warning("Failed to read persisted render metrics: %s", exc)
+        return tail
+
+    def _load_persisted_render_metrics(
+        self,
+        *,
+        sequence: str | None = None,
+        shot_id: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[RenderMetric, ...]:
+        """Return metrics ingested via the API that are not in the boot log.
+
+        Rows are read from the metrics store up to the shared tail's cursor.
+        With ``limit`` the newest matching rows are returned.
+        """
+
+        tail = self._metric_tail()
+        if tail is None:
             return ()
 
+        stored = tail.metrics(sequence=sequence, shot_id=shot_id, limit=limit)
         existing = {
             (metric.sequence, metric.shot_id, metric.timestamp)
             for metric in self._render_log
         }
         fresh: list[RenderMetric] = []
-        try:
-            with path.open("r", encoding="utf-8") as handle:
-                for raw_line in handle:
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-                    try:
-                        payload = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    timestamp_raw = payload.get("timestamp")
-                    if not isinstance(timestamp_raw, str):
-                        continue
-                    timestamp = self._parse_metric_timestamp(timestamp_raw)
-                    if timestamp is None:
-                        continue
-
-                    sequence = payload.get("sequence")
-                    shot_id = payload.get("shot_id")
-                    frame_time = payload.get("frame_time_ms")
-                    gpu_utilisation = payload.get("gpuUtilisation")
-                    cache_health = payload.get("cacheHealth")
-
-                    if not (
-                        isinstance(sequence, str)
-                        and isinstance(shot_id, str)
-                        and frame_time is not None
-                        and gpu_utilisation is not None
-                        and cache_health is not None
-                    ):
-                        continue
-
-                    key = (sequence, shot_id, timestamp)
-                    if key in existing:
-                        continue
-
-                    try:
-                        metric = RenderMetric(
-                            sequence=sequence,
-                            shot_id=shot_id,
-                            timestamp=timestamp,
-                            fps=float(payload.get("fps", 0.0)),
-                            frame_time_ms=float(frame_time),
-                            error_count=int(payload.get("error_count", 0)),
-                            gpu_utilisation=float(gpu_utilisation),
-                            cache_health=float(cache_health),
-                        )
-                    except (TypeError, ValueError):
-                        continue
-
-                    existing.add(key)
-                    fresh.append(metric)
-        except OSError:
-            return ()
-
-        fresh.sort(key=lambda metric: metric.timestamp)
+        for row in stored:
+            key = (row.sequence, row.shot_id, row.timestamp)
+            if key in existing:
+                continue
+            existing.add(key)
+            fresh.append(self._from_stored_metric(row))
         return tuple(fresh)
 
+    def render_metric_totals(
+        self,
+    ) -> tuple[tuple[ShotMetricTotals, ...], RenderMetric | None]:
+        """Return per-shot metric sums and the newest sample.
+
+        Boot log samples are combined with the running totals kept by the
+        metrics store's tail, so persisted history is summarised without
+        revisiting its rows. As in the metric feeds, stored rows that repeat a
+        boot log sample or an earlier stored row are counted once.
+        """
+
+        sums: dict[tuple[str, str], list[float]] = defaultdict(lambda: [0.0] * 5)
+
+        def _add(sample: RenderMetric | StoredRenderMetric, sign: int = 1) -> None:
+            entry = sums[(sample.sequence, sample.shot_id)]
+            entry[0] += sign
+            entry[1] += sign * sample.fps
+            entry[2] += sign * sample.frame_time_ms
+            entry[3] += sign * sample.gpu_utilisation
+            entry[4] += sign * sample.error_count
+
+        latest: RenderMetric | None = None
+        for sample in self._render_log:
+            _add(sample)
+            if latest is None or sample.timestamp > latest.timestamp:
+                latest = sample
+
+        tail = self._metric_tail()
+        if tail is not None:
+            for totals in tail.shot_totals():
+                entry = sums[(totals.sequence, totals.shot_id)]
+                entry[0] += totals.count
+                entry[1] += totals.fps_total
+                entry[2] += totals.frame_time_total
+                entry[3] += totals.gpu_utilisation_total
+                entry[4] += totals.error_total
+            repeated = tail.first_captures_matching(
+                (sample.sequence, sample.shot_id, sample.timestamp)
+                for sample in self._render_log
+            )
+            for row in repeated:
+                _add(row, sign=-1)
+            stored_latest = tail.latest()
+            if stored_latest is not None and (
+                latest is None or stored_latest.timestamp > latest.timestamp
+            ):
+                latest = self._from_stored_metric(stored_latest)
+
+        totals = tuple(
+            ShotMetricTotals(
+                sequence=sequence,
+                shot_id=shot_id,
+                count=int(values[0]),
+                fps_total=values[1],
+                frame_time_total=values[2],
+                gpu_utilisation_total=values[3],
+                error_total=values[4],
+            )
+            for (sequence, shot_id), values in sorted(sums.items())
+            if values[0] > 0
+        )
+        return totals, latest
+
     def _build_cost_training_dataset(self) -> Dataset:
         """Assemble a dataset that links render telemetry to realised costs."""
 
@@ -742,7 +886,10 @@ class PeronaEngine:
         }
 
         samples: list[RenderMetric] = list(self._render_log)
-        samples.extend(self._load_persisted_render_metrics())
+        for sequence, shot_id in telemetry_index:
+            samples.extend(
+                self._load_persisted_render_metrics(sequence=sequence, shot_id=shot_id)
+            )
         samples.sort(key=lambda metric: metric.timestamp)
 
         metrics_by_shot: dict[tuple[str, str], list[RenderMetric]] = defaultdict(list)
@@ -751,75 +898,276 @@ class PeronaEngine:
             if key in telemetry_index:
                 metrics_by_shot[key].append(sample)
 
-        default_render_hours = self._baseline_cost_input.render_hours or (
-            self._baseline_cost_input.frame_count
-            * self._baseline_cost_input.average_frame_time_ms
-            / 1000.0
-            / 3600.0
-        )
-
-        examples: list[TrainingExample] = []
+        pairs: list[tuple[ShotTelemetry, RenderMetric]] = []
         for key, telemetry in telemetry_index.items():
-            samples_for_shot = metrics_by_shot.get(key)
-            if not samples_for_shot:
-                estimated_errors = telemetry.error_rate * telemetry.frames_rendered
-                samples_for_shot = [
-                    RenderMetric(
-                        sequence=telemetry.sequence,
-                        shot_id=telemetry.shot_id,
-                        timestamp=telemetry.deadline,
-                        fps=telemetry.fps,
-                        frame_time_ms=telemetry.average_frame_time_ms,
-                        error_count=int(round(estimated_errors)),
-                        gpu_utilisation=0.75,
-                        cache_health=telemetry.cache_stability,
-                    )
-                ]
+            samples_for_shot = metrics_by_shot.get(key) or [
+                self._synthetic_render_metric(telemetry)
+            ]
+            pairs.extend((telemetry, sample) for sample in samples_for_shot)
 
-            for sample in samples_for_shot:
-                render_hours = (
-                    telemetry.frames_rendered * sample.frame_time_ms / 1000.0 / 3600.0
-                )
-                if render_hours <= 0:
-                    render_hours = default_render_hours
+        return Dataset(self._training_examples(pairs))
 
-                frame_count = (
-                    telemetry.frames_rendered or self._baseline_cost_input.frame_count
-                )
-
-                adjusted_input = replace(
-                    self._baseline_cost_input,
-                    average_frame_time_ms=sample.frame_time_ms,
-                    frame_count=frame_count,
-                    render_hours=render_hours,
-                )
-                breakdown = self.estimate_cost(adjusted_input)
+    @staticmethod
+    def _synthetic_render_metric(telemetry: ShotTelemetry) -> RenderMetric:
+        """Return a sample standing in for a shot without render telemetry."""
+
+        estimated_errors = telemetry.error_rate * telemetry.frames_rendered
+        return RenderMetric(
+            sequence=telemetry.sequence,
+            shot_id=telemetry.shot_id,
+            timestamp=telemetry.deadline,
+            fps=telemetry.fps,
+            frame_time_ms=telemetry.average_frame_time_ms,
+            error_count=int(round(estimated_errors)),
+            gpu_utilisation=0.75,
+            cache_health=telemetry.cache_stability,
+        )
 
-                features = {
+    def _training_examples(
+        self,
+        pairs: Sequence[tuple[ShotTelemetry, RenderMetric | StoredRenderMetric]],
+    ) -> list[TrainingExample]:
+        """Link render samples to the cost of rendering their shot at that pace.
+
+        The cost of every sample is estimated in one
+        :func:`~libraries.automation.render.optimization.estimate_costs` call.
+        """
+
+        if not pairs:
+            return []
+        baseline = self._baseline_cost_input
+        default_render_hours = baseline.render_hours or (
+            baseline.frame_count * baseline.average_frame_time_ms / 1000.0 / 3600.0
+        )
+        frame_counts: list[int] = []
+        frame_times: list[float] = []
+        render_hours: list[float] = []
+        for telemetry, sample in pairs:
+            hours = telemetry.frames_rendered * sample.frame_time_ms / 1000.0 / 3600.0
+            frame_counts.append(telemetry.frames_rendered or baseline.frame_count)
+            frame_times.append(sample.frame_time_ms)
+            render_hours.append(hours if hours > 0 else default_render_hours)
+
+        breakdowns = render_optimization.estimate_costs(
+            render_optimization.CostModelBatch.from_baseline(
+                baseline.to_library(),
+                frame_count=frame_counts,
+                average_frame_time_ms=frame_times,
+                render_hours=render_hours,
+            )
+        )
+        costs = breakdowns.column("total_cost")
+        return [
+            TrainingExample(
+                feature_values={
                     "frame_time_ms": float(sample.frame_time_ms),
                     "gpu_utilisation": float(sample.gpu_utilisation),
                     "error_count": float(sample.error_count),
                     "cache_health": float(sample.cache_health),
-                    "render_hours": float(render_hours),
-                }
-
-                examples.append(
-                    TrainingExample(feature_values=features, cost=breakdown.total_cost)
-                )
-
-        return Dataset(examples)
+                    "render_hours": float(hours),
+                },
+                cost=float(cost),
+            )
+            for (_, sample), hours, cost in zip(pairs, render_hours, costs)
+        ]
 
     def cost_insights(
         self, top_n: int = 3
     ) -> tuple[tuple[FeatureStatistics, ...], tuple[str, ...]]:
-        """Return feature statistics and actionable recommendations."""
-
-        dataset = self._build_cost_training_dataset()
-        statistics = compute_feature_statistics(dataset)
-        importances = analyse_cost_relationships(dataset)
-        recommendations = recommend_best_practices(importances, top_n=top_n)
+        """Return feature statistics and actionable recommendations.
+
+        Statistics come from running accumulators that fold in only the render
+        metrics persisted since the previous call; see
+        :meth:`_refresh_cost_insights`. The result matches computing them over
+        :meth:`_build_cost_training_dataset`.
+        """
+
+        accumulator = self._refresh_cost_insights()
+        statistics = accumulator.statistics()
+        recommendations = recommend_best_practices(
+            accumulator.importances(), top_n=top_n
+        )
         return statistics, recommendations
 
+    def _cost_insights_fingerprint(self) -> str:
+        """Hash the inputs that decide how persisted rows become examples."""
+
+        digest = hashlib.sha1(str(_COST_INSIGHTS_VERSION).encode("utf-8"))
+        digest.update(repr(self._baseline_cost_input).encode("utf-8"))
+        for telemetry in self._telemetry:
+            digest.update(repr(telemetry).encode("utf-8"))
+        for sample in self._render_log:
+            key = (sample.sequence, sample.shot_id, sample.timestamp.isoformat())
+            digest.update(repr(key).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _new_cost_insight_state(self) -> _CostInsightState:
+        """Fold the boot log and per-shot fallbacks into fresh accumulators."""
+
+        state = _CostInsightState(
+            telemetry=self._telemetry,
+            render_log=self._render_log,
+            baseline=self._baseline_cost_input,
+            fingerprint=self._cost_insights_fingerprint(),
+        )
+        telemetry_index = {
+            (item.sequence, item.shot_id): item for item in self._telemetry
+        }
+        boot_pairs = [
+            (telemetry_index[(sample.sequence, sample.shot_id)], sample)
+            for sample in self._render_log
+            if (sample.sequence, sample.shot_id) in telemetry_index
+        ]
+        for key, examples in self._examples_by_shot(boot_pairs).items():
+            state.boot[key] = FeatureAccumulator()
+            state.boot[key].update_many(examples)
+        fallback_pairs = [
+            (telemetry, self._synthetic_render_metric(telemetry))
+            for telemetry in telemetry_index.values()
+        ]
+        for key, examples in self._examples_by_shot(fallback_pairs).items():
+            state.fallback[key] = FeatureAccumulator()
+            state.fallback[key].update_many(examples)
+        return state
+
+    def _examples_by_shot(
+        self,
+        pairs: Sequence[tuple[ShotTelemetry, RenderMetric | StoredRenderMetric]],
+    ) -> dict[tuple[str, str], list[TrainingExample]]:
+        """Return :meth:`_training_examples` for ``pairs`` grouped by shot."""
+
+        grouped: dict[tuple[str, str], list[TrainingExample]] = defaultdict(list)
+        for (telemetry, _), example in zip(pairs, self._training_examples(pairs)):
+            grouped[(telemetry.sequence, telemetry.shot_id)].append(example)
+        return grouped
+
+    def _restore_cost_insights(
+        self, state: _CostInsightState, tail: RenderMetricTail
+    ) -> None:
+        """Resume ``state`` from the snapshot saved in the metrics store."""
+
+        assert state.store is not None
+        try:
+            snapshot = state.store.load_snapshot(_COST_INSIGHTS_SNAPSHOT)
+        except sqlite3.Error as exc:
+            LOGGER.warning("Failed to load cost insight snapshot: %s", exc)
+            return
+        if (
+            snapshot is None
+            or snapshot.fingerprint != state.fingerprint
+            or snapshot.min_id != tail.min_id
+            or snapshot.cursor > tail.cursor
+        ):
+            return
+        try:
+            persisted = {
+                (str(item["sequence"]), str(item["shot_id"])): (
+                    FeatureAccumulator.from_dict(item["accumulator"])
+                )
+                for item in snapshot.payload.get("shots", ())
+            }
+        except (KeyError, TypeError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable cost insight snapshot: %s", exc)
+            return
+        state.persisted = persisted
+        state.cursor = snapshot.cursor
+
+    def _refresh_cost_insights(self) -> FeatureAccumulator:
+        """Return accumulated cost examples, folding in newly persisted rows.
+
+        Boot log examples are accumulated once per engine. Rows from the
+        metrics store are folded in as the store's tail sees them, so each
+        call costs time proportional to the rows added since the last one.
+        The persisted accumulators are saved to the metrics database and
+        picked up by the next process that opens it, provided the telemetry,
+        boot log and baseline cost input are unchanged and no rows were
+        pruned in between.
+        """
+
+        with self._insights_lock:
+            store = self._metric_store()
+            tail = self._metric_tail()
+            state = self._insights
+            if (
+                state is None
+                or state.telemetry is not self._telemetry
+                or state.render_log is not self._render_log
+                or state.baseline != self._baseline_cost_input
+                or state.store is not store
+                or (tail is not None and state.epoch != tail.epoch)
+            ):
+                state = self._new_cost_insight_state()
+                state.store = store
+                if tail is not None and store is not None:
+                    state.epoch = tail.epoch
+                    self._restore_cost_insights(state, tail)
+                self._insights = state
+
+            if tail is not None and store is not None:
+                self._fold_persisted_metrics(state, tail)
+
+            combined = FeatureAccumulator()
+            for key in state.fallback:
+                boot = state.boot.get(key)
+                persisted = state.persisted.get(key)
+                if boot is None and persisted is None:
+                    combined.merge_from(state.fallback[key])
+                    continue
+                for accumulator in (boot, persisted):
+                    if accumulator is not None:
+                        combined.merge_from(accumulator)
+            return combined
+
+    def _fold_persisted_metrics(
+        self, state: _CostInsightState, tail: RenderMetricTail
+    ) -> None:
+        """Add rows persisted after ``state.cursor`` and save the snapshot."""
+
+        cursor = tail.cursor
+        if cursor <= state.cursor:
+            return
+        # Repeated captures of one sample are counted once, at their first id.
+        rows = tail.rows_after(state.cursor, through_id=cursor, first_captures=True)
+        telemetry_index = {
+            (item.sequence, item.shot_id): item for item in self._telemetry
+        }
+        boot_keys = {
+            (sample.sequence, sample.shot_id, sample.timestamp)
+            for sample in self._render_log
+        }
+        pairs: list[tuple[ShotTelemetry, StoredRenderMetric]] = []
+        for row in rows:
+            key = (row.sequence, row.shot_id)
+            telemetry = telemetry_index.get(key)
+            if telemetry is None or (*key, row.timestamp) in boot_keys:
+                continue
+            pairs.append((telemetry, row))
+        for key, batch in self._examples_by_shot(pairs).items():
+            state.persisted.setdefault(key, FeatureAccumulator()).update_many(batch)
+        state.cursor = cursor
+
+        assert state.store is not None
+        payload = {
+            "shots": [
+                {
+                    "sequence": sequence,
+                    "shot_id": shot_id,
+                    "accumulator": accumulator.to_dict(),
+                }
+                for (sequence, shot_id), accumulator in sorted(state.persisted.items())
+            ]
+        }
+        try:
+            state.store.save_snapshot(
+                _COST_INSIGHTS_SNAPSHOT,
+                fingerprint=state.fingerprint,
+                cursor=state.cursor,
+                min_id=tail.min_id,
+                payload=payload,
+            )
+        except sqlite3.Error as exc:
+            LOGGER.warning("Failed to save cost insight snapshot: %s", exc)
+
     def pnl_explainer(self) -> PnLBreakdown:
         """Explain the delta in render spend compared with the baseline."""
 
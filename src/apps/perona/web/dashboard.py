@@ -28,6 +28,10 @@ from fastapi.responses import StreamingResponse
 from PIL import Image, ImageDraw, ImageFont
 from pydantic import BaseModel, ConfigDict, Field
 
+from apps.perona.db.render_metrics import (
+    RenderMetricStore,
+    resolve_metrics_database_path,
+)
 from apps.perona.version import PERONA_VERSION
 
 from apps.perona.engine import (
@@ -69,47 +73,6 @@ class RenderMetricBatch(BaseModel):
         ]
 
 
-class RenderMetricStore:
-    """Simple append-only store that persists render metrics to disk."""
-
-    def __init__(self, path: Path):
-        self._path = path
-        self._lock = Lock()
-
-    @property
-    def path(self) -> Path:
-        return self._path
-
-    def persist(self, records: Sequence[Mapping[str, Any]]) -> None:
-        """Append metrics to the backing store as NDJSON."""
-
-        if not records:
-            return
-
-        lines = [
-            json.dumps(record, ensure_ascii=False, separators=(",", ":"))
-            for record in records
-        ]
-        payload = "\n".join(lines) + "\n"
-
-        with self._lock:
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-            with self._path.open("a", encoding="utf-8") as handle:
-                handle.write(payload)
-
-
-def _resolve_metrics_store_path() -> Path:
-    """Return the configured metrics store path, falling back to cache dir."""
-
-    env_path = os.getenv("PERONA_METRICS_PATH")
-    if env_path:
-        return Path(env_path).expanduser()
-
-    cache_home = os.getenv("XDG_CACHE_HOME")
-    base_dir = Path(cache_home).expanduser() if cache_home else Path.home() / ".cache"
-    return base_dir / "perona" / "render-metrics.ndjson"
-
-
 app = FastAPI(
     title="Perona",
     description=(
@@ -121,7 +84,7 @@ app = FastAPI(
 )
 
 
-_metrics_store = RenderMetricStore(_resolve_metrics_store_path())
+_metrics_store = RenderMetricStore(resolve_metrics_database_path())
 
 
 @app.post("/api/metrics", status_code=status.HTTP_202_ACCEPTED)
@@ -404,6 +367,8 @@ def metrics_summary(engine: PeronaEngine = Depends(get_engine)) -> dict[str, Any
     def _rounded_mean(total: float, count: int) -> float:
         return round(total / count, 3) if count else 0.0
 
+    shot_totals, latest_sample = engine.render_metric_totals()
+
     total_samples = 0
     total_fps = 0.0
     total_frame_time = 0.0
@@ -411,18 +376,16 @@ def metrics_summary(engine: PeronaEngine = Depends(get_engine)) -> dict[str, Any
     total_error_count = 0.0
 
     sequence_stats: dict[str, dict[str, Any]] = {}
-    latest_sample: RenderMetric | None = None
-    latest_timestamp: datetime | None = None
 
-    for sample in engine.stream_render_metrics():
-        total_samples += 1
-        total_fps += sample.fps
-        total_frame_time += sample.frame_time_ms
-        total_gpu_utilisation += sample.gpu_utilisation
-        total_error_count += sample.error_count
+    for totals in shot_totals:
+        total_samples += totals.count
+        total_fps += totals.fps_total
+        total_frame_time += totals.frame_time_total
+        total_gpu_utilisation += totals.gpu_utilisation_total
+        total_error_count += totals.error_total
 
         entry = sequence_stats.setdefault(
-            sample.sequence,
+            totals.sequence,
             {
                 "shots": set(),
                 "count": 0,
@@ -432,16 +395,12 @@ def metrics_summary(engine: PeronaEngine = Depends(get_engine)) -> dict[str, Any
                 "error_total": 0.0,
             },
         )
-        entry["shots"].add(sample.shot_id)
-        entry["count"] += 1
-        entry["fps_total"] += sample.fps
-        entry["frame_time_total"] += sample.frame_time_ms
-        entry["gpu_utilisation_total"] += sample.gpu_utilisation
-        entry["error_total"] += sample.error_count
-
-        if latest_timestamp is None or sample.timestamp > latest_timestamp:
-            latest_timestamp = sample.timestamp
-            latest_sample = sample
+        entry["shots"].add(totals.shot_id)
+        entry["count"] += totals.count
+        entry["fps_total"] += totals.fps_total
+        entry["frame_time_total"] += totals.frame_time_total
+        entry["gpu_utilisation_total"] += totals.gpu_utilisation_total
+        entry["error_total"] += totals.error_total
 
     if total_samples == 0:
         return {
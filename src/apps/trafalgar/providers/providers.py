@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from importlib.metadata import EntryPoint, entry_points
 from pathlib import PurePosixPath
-from typing import Any, ClassVar, Iterable, Mapping, Sequence, TypeVar
+from typing import Any, Callable, ClassVar, Iterable, Mapping, Sequence, TypeVar
 
 import logging
 from datetime import datetime, timezone
 
+from apps.trafalgar.web.execution import BlockingExecutor
+
 
 @dataclass(frozen=True, slots=True)
 class ProviderMetadata:
@@ -209,6 +214,16 @@ class DummyDeliveryProvider(DeliveryProvider):
         ]
 
 
+@dataclass(slots=True)
+class _PrefixListing:
+    """Cached delivery listing for a single S3 prefix."""
+
+    deliveries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    last_key: str | None = None
+    expires_at: float = 0.0
+    ordered: list[dict[str, Any]] = field(default_factory=list)
+
+
 class S3DeliveryProvider(DeliveryProvider):
     metadata: ClassVar[ProviderMetadata] = ProviderMetadata(
         name="s3-delivery",
@@ -232,11 +247,54 @@ class S3DeliveryProvider(DeliveryProvider):
         bucket: str | None = None,
         prefix_template: str = "{project}/",
         manifest_filename: str = "manifest.json",
+        cache_ttl: float = 30.0,
+        incremental: bool = False,
+        fetch_manifests: bool = False,
+        max_workers: int = 8,
+        manifest_cache_size: int = 256,
+        time_provider: Callable[[], float] | None = None,
     ) -> None:
+        """Configure the provider.
+
+        Listings are cached per prefix for ``cache_ttl`` seconds (``0``
+        disables caching). With ``incremental`` enabled an expired listing is
+        refreshed by listing only keys after the last one seen, which suits
+        buckets whose delivery folders sort chronologically; call
+        :meth:`invalidate` to force a full listing. ``fetch_manifests``
+        downloads manifest bodies on a pool of ``max_workers`` threads shared
+        by every listing and caches
+        them by object ETag so unchanged manifests are never fetched twice;
+        at most ``manifest_cache_size`` bodies are kept, least recently used
+        first out.
+        """
+
         self._client = client
         self._bucket = bucket
         self._prefix_template = prefix_template
         self._manifest_filename = manifest_filename
+        self._cache_ttl = max(0.0, float(cache_ttl))
+        self._incremental = incremental
+        self._fetch_manifests = fetch_manifests
+        self._manifest_executor = BlockingExecutor(
+            max(1, int(max_workers)), thread_name_prefix="s3-delivery"
+        )
+        self._time_provider = time_provider or time.monotonic
+        self._listings: dict[str, _PrefixListing] = {}
+        self._manifests: OrderedDict[tuple[str, str | None], Mapping[str, Any]] = (
+            OrderedDict()
+        )
+        self._manifest_cache_size = max(0, int(manifest_cache_size))
+        self._cache_lock = threading.Lock()
+
+    def invalidate(self, project_name: str | None = None) -> None:
+        """Drop cached listings for ``project_name`` or for every prefix."""
+
+        with self._cache_lock:
+            if project_name is None:
+                self._listings.clear()
+                self._manifests.clear()
+                return
+            self._listings.pop(self._format_prefix(project_name), None)
 
     def _resolve_client(self) -> Any | None:
         if self._client is not None:
@@ -278,6 +336,12 @@ class S3DeliveryProvider(DeliveryProvider):
         return identifier, name
 
     def list_deliveries(self, project_name: str) -> Sequence[Mapping[str, Any]]:
+        """Return deliveries under the project's prefix, newest first.
+
+        The returned mappings are shared with the cache and must be treated as
+        read-only.
+        """
+
         bucket = self._bucket
         if not bucket:
             self._logger.warning(
@@ -295,7 +359,59 @@ class S3DeliveryProvider(DeliveryProvider):
             return []
 
         prefix = self._format_prefix(project_name)
-
+        now = self._time_provider()
+        with self._cache_lock:
+            cached = self._listings.get(prefix)
+        if cached is not None and cached.expires_at > now:
+            return cached.ordered
+
+        incremental = self._incremental and cached is not None
+        start_after = cached.last_key if incremental and cached is not None else None
+        objects = self._list_manifest_objects(
+            client, bucket, prefix, project_name, start_after=start_after
+        )
+        if objects is None:
+            return cached.ordered if cached is not None else []
+
+        listing = _PrefixListing(
+            # Carried-over entries are shared with the previous listing; any
+            # that change are replaced by copies rather than mutated.
+            deliveries=(
+                dict(cached.deliveries) if incremental and cached is not None else {}
+            ),
+            last_key=start_after,
+        )
+        for entry in objects:
+            key = entry["Key"]
+            listing.deliveries[key] = self._build_delivery(
+                project_name, bucket, key, entry
+            )
+            if listing.last_key is None or key > listing.last_key:
+                listing.last_key = key
+
+        if self._fetch_manifests:
+            self._attach_manifests(client, bucket, listing.deliveries)
+
+        listing.ordered = sorted(
+            listing.deliveries.values(),
+            key=lambda item: item.get("created_at") or "",
+            reverse=True,
+        )
+        listing.expires_at = now + self._cache_ttl
+        if self._cache_ttl > 0:
+            with self._cache_lock:
+                self._listings[prefix] = listing
+        return listing.ordered
+
+    def _list_manifest_objects(
+        self,
+        client: Any,
+        bucket: str,
+        prefix: str,
+        project_name: str,
+        *,
+        start_after: str | None = None,
+    ) -> list[Mapping[str, Any]] | None:
         try:
             paginator = client.get_paginator("list_objects_v2")
         except Exception as exc:  # pragma: no cover - defensive
@@ -304,10 +420,19 @@ class S3DeliveryProvider(DeliveryProvider):
                 exc_info=exc,
                 extra={"project": project_name, "bucket": bucket},
             )
-            return []
+            return None
 
+        params: dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
+        if start_after:
+            params["StartAfter"] = start_after
         try:
-            pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
+            pages = paginator.paginate(**params)
+            objects: list[Mapping[str, Any]] = []
+            for page in pages:
+                for entry in page.get("Contents") or []:
+                    key = entry.get("Key")
+                    if isinstance(key, str) and key.endswith(self._manifest_filename):
+                        objects.append(entry)
         except Exception as exc:
             self._logger.exception(
                 "s3_delivery_list_failed",
@@ -318,38 +443,75 @@ class S3DeliveryProvider(DeliveryProvider):
                     "prefix": prefix,
                 },
             )
-            return []
-
-        deliveries: list[dict[str, Any]] = []
-        for page in pages:
-            objects = page.get("Contents") or []
-            for entry in objects:
-                key = entry.get("Key")
-                if not isinstance(key, str):
-                    continue
-                if not key.endswith(self._manifest_filename):
-                    continue
-                identifier, name = self._derive_delivery_identity(key)
-                timestamp = self._format_timestamp(entry.get("LastModified"))
-                etag = entry.get("ETag")
-                if isinstance(etag, str):
-                    etag = etag.strip('"')
-                deliveries.append(
-                    {
-                        "project": project_name,
-                        "bucket": bucket,
-                        "key": key,
-                        "manifest": key,
-                        "delivery_id": identifier,
-                        "name": name,
-                        "created_at": timestamp,
-                        "size": entry.get("Size"),
-                        "etag": etag,
-                    }
+            return None
+        return objects
+
+    def _build_delivery(
+        self, project_name: str, bucket: str, key: str, entry: Mapping[str, Any]
+    ) -> dict[str, Any]:
+        identifier, name = self._derive_delivery_identity(key)
+        etag = entry.get("ETag")
+        if isinstance(etag, str):
+            etag = etag.strip('"')
+        return {
+            "project": project_name,
+            "bucket": bucket,
+            "key": key,
+            "manifest": key,
+            "delivery_id": identifier,
+            "name": name,
+            "created_at": self._format_timestamp(entry.get("LastModified")),
+            "size": entry.get("Size"),
+            "etag": etag,
+        }
+
+    def _attach_manifests(
+        self, client: Any, bucket: str, deliveries: dict[str, dict[str, Any]]
+    ) -> None:
+        """Add manifest bodies, replacing each delivery that gains one by a copy."""
+
+        attached: dict[str, Mapping[str, Any]] = {}
+        pending: list[str] = []
+        with self._cache_lock:
+            for key, delivery in deliveries.items():
+                cache_key = (key, delivery.get("etag"))
+                cached = self._manifests.get(cache_key)
+                if cached is not None:
+                    self._manifests.move_to_end(cache_key)
+                    if delivery.get("manifest_data") is not cached:
+                        attached[key] = cached
+                elif "manifest_data" not in delivery:
+                    pending.append(key)
+
+        def _download(key: str) -> Mapping[str, Any] | None:
+            try:
+                response = client.get_object(Bucket=bucket, Key=key)
+                payload = json.loads(response["Body"].read())
+            except Exception as exc:
+                self._logger.warning(
+                    "s3_delivery_manifest_fetch_failed",
+                    extra={"bucket": bucket, "key": key, "error": str(exc)},
                 )
-
-        deliveries.sort(key=lambda item: item.get("created_at") or "", reverse=True)
-        return deliveries
+                return None
+            return payload if isinstance(payload, Mapping) else None
+
+        if pending:
+            manifests = self._manifest_executor.map(_download, pending)
+            with self._cache_lock:
+                for key, manifest in zip(pending, manifests):
+                    if manifest is None:
+                        continue
+                    attached[key] = manifest
+                    if self._manifest_cache_size == 0:
+                        continue
+                    cache_key = (key, deliveries[key].get("etag"))
+                    self._manifests[cache_key] = manifest
+                    self._manifests.move_to_end(cache_key)
+                while len(self._manifests) > self._manifest_cache_size:
+                    self._manifests.popitem(last=False)
+
+        for key, manifest in attached.items():
+            deliveries[key] = {**deliveries[key], "manifest_data": manifest}
 
 
 def initialize_providers() -> ProviderRegistry:
@@ -0,0 +1,192 @@
+"""Time-to-live cache for render farm capability discovery."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import structlog
+
+from libraries.automation.render.base import AdapterCapabilities, RenderSubmissionError
+from libraries.automation.render.models import CapabilityProvider
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_CAPABILITY_TTL = 300.0
+DEFAULT_REFRESH_AHEAD = 0.2
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    capabilities: AdapterCapabilities
+    fetched_at: float
+    expires_at: float
+
+
+@dataclass(slots=True)
+class _FarmStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    invalidations: int = 0
+    errors: int = 0
+    last_error: str | None = None
+
+
+class CapabilityCache:
+    """Per-farm capability descriptors kept for ``ttl`` seconds.
+
+    :meth:`get` answers from the cache while an entry is fresh and only calls
+    the provider on a miss. Callers that run a background refresher pass
+    ``allow_stale=True`` so an expired entry is still served while
+    :meth:`due` hands the farm to the refresher, keeping discovery off the
+    request path. :meth:`mark_stale` expires an entry early so the refresher
+    renews it while lookups keep serving it; a provider failure drops the
+    entry so the next lookup rediscovers the farm. A ``ttl`` of zero disables
+    caching.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_CAPABILITY_TTL,
+        refresh_ahead: float = DEFAULT_REFRESH_AHEAD,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self._ttl = max(float(ttl), 0.0)
+        self._refresh_ahead = self._ttl * min(max(float(refresh_ahead), 0.0), 1.0)
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._entries: dict[str, _CacheEntry] = {}
+        self._stats: dict[str, _FarmStats] = {}
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def get(
+        self, farm: str, provider: CapabilityProvider, *, allow_stale: bool = False
+    ) -> AdapterCapabilities:
+        """Return capabilities for ``farm``, calling ``provider`` on a miss."""
+
+        if self.enabled:
+            now = self._clock()
+            with self._lock:
+                stats = self._stats.setdefault(farm, _FarmStats())
+                entry = self._entries.get(farm)
+                if entry is not None and (now < entry.expires_at or allow_stale):
+                    if now < entry.expires_at:
+                        stats.hits += 1
+                    else:
+                        stats.stale_hits += 1
+                    return entry.capabilities.copy()
+                stats.misses += 1
+        return self.refresh(farm, provider)
+
+    def refresh(self, farm: str, provider: CapabilityProvider) -> AdapterCapabilities:
+        """Query ``provider`` and store the result for ``farm``."""
+
+        try:
+            capabilities = AdapterCapabilities(**(provider() or {}))
+        except RenderSubmissionError as exc:
+            with self._lock:
+                stats = self._stats.setdefault(farm, _FarmStats())
+                stats.errors += 1
+                stats.last_error = str(exc)
+                self._entries.pop(farm, None)
+            raise
+        if self.enabled:
+            now = self._clock()
+            with self._lock:
+                stats = self._stats.setdefault(farm, _FarmStats())
+                stats.refreshes += 1
+                stats.last_error = None
+                self._entries[farm] = _CacheEntry(
+                    capabilities=capabilities,
+                    fetched_at=now,
+                    expires_at=now + self._ttl,
+                )
+        return capabilities.copy()
+
+    def mark_stale(self, farm: str, *, reason: str | None = None) -> bool:
+        """Expire the entry of ``farm`` now without dropping it.
+
+        Returns whether an entry was cached; a stale entry is still served to
+        ``allow_stale`` lookups and is reported by :meth:`due`.
+        """
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(farm)
+            if entry is None:
+                return False
+            entry.expires_at = min(entry.expires_at, now)
+            self._stats.setdefault(farm, _FarmStats()).invalidations += 1
+        logger.info("render.farm.capabilities.marked_stale", farm=farm, reason=reason)
+        return True
+
+    def forget(self, farm: str) -> None:
+        """Drop the entry and counters of ``farm`` (for example when replaced)."""
+
+        with self._lock:
+            self._entries.pop(farm, None)
+            self._stats.pop(farm, None)
+
+    def due(self, now: float | None = None) -> list[str]:
+        """Return cached farms that expire within the refresh-ahead window."""
+
+        moment = self._clock() if now is None else now
+        with self._lock:
+            return [
+                farm
+                for farm, entry in self._entries.items()
+                if entry.expires_at - self._refresh_ahead <= moment
+            ]
+
+    def seconds_until_next(self, now: float | None = None) -> float | None:
+        """Return the delay until an entry becomes due, or ``None`` when empty."""
+
+        moment = self._clock() if now is None else now
+        with self._lock:
+            if not self._entries:
+                return None
+            earliest = min(entry.expires_at for entry in self._entries.values())
+        return max(earliest - self._refresh_ahead - moment, 0.0)
+
+    def snapshot(self, now: float | None = None) -> dict[str, Any]:
+        """Return cache settings and per-farm state for health reporting."""
+
+        moment = self._clock() if now is None else now
+        farms: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for farm in sorted(set(self._stats) | set(self._entries)):
+                stats = self._stats.get(farm, _FarmStats())
+                entry = self._entries.get(farm)
+                farms[farm] = {
+                    "cached": entry is not None,
+                    "fresh": entry is not None and moment < entry.expires_at,
+                    "age_seconds": (
+                        round(moment - entry.fetched_at, 3) if entry else None
+                    ),
+                    "expires_in_seconds": (
+                        round(entry.expires_at - moment, 3) if entry else None
+                    ),
+                    "hits": stats.hits,
+                    "stale_hits": stats.stale_hits,
+                    "misses": stats.misses,
+                    "refreshes": stats.refreshes,
+                    "invalidations": stats.invalidations,
+                    "errors": stats.errors,
+                    "last_error": stats.last_error,
+                }
+        return {"ttl_seconds": self._ttl, "farms": farms}
+
+
+__all__ = ["CapabilityCache", "DEFAULT_CAPABILITY_TTL"]
@@ -0,0 +1,149 @@
+"""Conditional response helpers deriving ETags from data generation counters."""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+import threading
+from typing import Any, Hashable, TypeVar
+
+from fastapi import Request, Response
+
+CACHE_CONTROL_ENV = "TRAFALGAR_CACHE_CONTROL"
+_DEFAULT_CACHE_CONTROL = "private, no-cache"
+GZIP_ETAG_SUFFIX = "-gzip"
+
+_ResponseT = TypeVar("_ResponseT", bound=Response)
+
+# Shared across trackers so that a freshly constructed service can never hand
+# out a generation that an older instance already used for different data.
+_GENERATION_SEQUENCE = itertools.count(1)
+
+
+def resolve_cache_control() -> str:
+    """Return the ``Cache-Control`` value attached to conditional responses.
+
+    ``no-cache`` lets browsers keep the body but forces them to revalidate on
+    every poll, which is cheap once the ETag matches.
+    """
+
+    value = os.environ.get(CACHE_CONTROL_ENV, "").strip()
+    return value or _DEFAULT_CACHE_CONTROL
+
+
+def compute_etag(
+    resource: str, *generations: Hashable | None, params: Hashable = None
+) -> str | None:
+    """Return a strong ETag for a resource or ``None`` when it cannot be derived.
+
+    ``generations`` are the change counters of the services that produced the
+    payload; any ``None`` generation means the payload is not tracked and no
+    ETag is emitted. ``params`` captures request parameters that shape the
+    payload, such as filters or limits.
+    """
+
+    if any(generation is None for generation in generations):
+        return None
+    digest = hashlib.sha256(
+        repr((resource, params, generations)).encode("utf-8")
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str | None) -> bool:
+    """Return whether ``If-None-Match`` on ``request`` matches ``etag``."""
+
+    if etag is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        token = candidate.strip()
+        if token == "*":
+            return True
+        # If-None-Match uses the weak comparison function (RFC 9110 13.1.2).
+        if token.startswith("W/"):
+            token = token[2:]
+        if token == etag or token == gzip_etag(etag):
+            return True
+    return False
+
+
+def gzip_etag(etag: str) -> str:
+    """Return the validator of the gzip-encoded variant of ``etag``.
+
+    Compressed and identity bodies are different representations, so they must
+    not share a strong validator; both still revalidate against the same
+    generation through :func:`etag_matches`.
+    """
+
+    if etag.endswith(GZIP_ETAG_SUFFIX + '"'):
+        return etag
+    return f'{etag[:-1]}{GZIP_ETAG_SUFFIX}"'
+
+
+def apply_cache_headers(response: _ResponseT, etag: str | None) -> _ResponseT:
+    """Attach ``ETag`` and ``Cache-Control`` headers to ``response``."""
+
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = resolve_cache_control()
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty ``304 Not Modified`` response for ``etag``."""
+
+    return apply_cache_headers(Response(status_code=304), etag)
+
+
+class GenerationTracker:
+    """Assign generation numbers to payloads that are recomputed on demand.
+
+    Services without an intrinsic change counter call :meth:`observe` with
+    each freshly computed payload; the generation for ``key`` only advances
+    when the payload's fingerprint differs from the previous observation.
+    Generations are drawn from a process-wide sequence, so they are unique
+    across tracker instances.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[int, str]] = {}
+
+    def observe(self, payload: Any, *, key: Hashable = None) -> int:
+        """Record ``payload`` for ``key`` and return its generation."""
+
+        fingerprint = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == fingerprint:
+                return entry[0]
+            generation = next(_GENERATION_SEQUENCE)
+            self._entries[key] = (generation, fingerprint)
+            return generation
+
+    def generation(self, key: Hashable = None) -> int | None:
+        """Return the last generation observed for ``key``."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+
+__all__ = [
+    "CACHE_CONTROL_ENV",
+    "GZIP_ETAG_SUFFIX",
+    "GenerationTracker",
+    "apply_cache_headers",
+    "compute_etag",
+    "etag_matches",
+    "gzip_etag",
+    "not_modified",
+    "resolve_cache_control",
+]
@@ -1,20 +1,31 @@
 """FastAPI dashboard exposing aggregated project status information."""
 
+import hashlib
 import hmac
-import asyncio
 import json
 import os
-from collections import Counter, OrderedDict, defaultdict
+import threading
+from collections import Counter, OrderedDict
 from functools import lru_cache
 from datetime import datetime, timezone
 from html import escape
 from pathlib import Path
 from time import monotonic
-from typing import Any, Awaitable, Callable, Hashable, Iterable, Mapping, Sequence
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+    cast,
+)
 from urllib.parse import quote
 
 import structlog
-from fastapi import Depends, FastAPI, HTTPException, Request, Security
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Security
 from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
@@ -28,14 +39,42 @@ from apps.trafalgar.providers.providers import (
 from apps.trafalgar.version import TRAFALGAR_VERSION
 from libraries.automation.delivery.manifest import get_manifest_data
 from libraries.automation.reconcile import comparator
+from .conditional import (
+    GenerationTracker,
+    apply_cache_headers,
+    compute_etag,
+    etag_matches,
+    not_modified,
+)
+from .execution import (
+    gather_sources,
+    get_source_executor,
+    run_for_source,
+)
+from .pagination import (
+    CollectionQuery,
+    CursorKey,
+    Page,
+    apply_page_headers,
+    build_collection_query,
+    collection_query,
+    paginate,
+    select_fields,
+    sortable_timestamp,
+)
 from .ingest_adapter import (
     IngestRunDashboardFacade,
     get_ingest_dashboard_facade,
 )
-from .render import RenderSubmissionService, get_render_service
+from .render import RenderJobMetadata, RenderSubmissionService, get_render_service
 from . import review as review_module
-from libraries.automation.review.dailies import fetch_playlist_versions
-from libraries.automation.review.dailies import DailiesClip
+from .responses import FastJSONResponse, compressed_route_class
+from libraries.automation.review.dailies import (
+    DailiesClip,
+    fetch_playlist_versions,
+    fetch_versions_by_ids,
+    playlist_version_ids,
+)
 from libraries.integrations.shotgrid.api import ShotGridError
 
 logger = structlog.get_logger(__name__)
@@ -316,6 +355,208 @@ def _load_cache_configuration() -> tuple[float, int, int]:
 # ---------------------------------------------------------------------------
 
 
+def _canonical_project_key(value: Any) -> str:
+    """Return the case-insensitive key used to group versions by project."""
+
+    coerced = _coerce_project_name(value)
+    if coerced is None:
+        text = str(value).strip()
+    else:
+        text = coerced
+    return text.casefold()
+
+
+def _published_timestamp(record: Mapping[str, Any]) -> Any:
+    return _parse_datetime(
+        record.get("timestamp")
+        or record.get("published_at")
+        or record.get("updated_at")
+        or record.get("created_at")
+    )
+
+
+class _ProjectAggregate:
+    """Counters describing the versions of a single project in a snapshot."""
+
+    __slots__ = (
+        "versions",
+        "episodes",
+        "shots",
+        "status_totals",
+        "episode_stats",
+        "published",
+        "summary",
+        "episode_breakdown",
+    )
+
+    def __init__(self) -> None:
+        self.versions = 0
+        self.episodes: set[str] = set()
+        self.shots: set[str] = set()
+        self.status_totals: Counter[str] = Counter()
+        self.episode_stats: dict[str, dict[str, Any]] = {}
+        self.published: list[Mapping[str, Any]] = []
+        self.summary: dict[str, Any] = {}
+        self.episode_breakdown: dict[str, Any] = {}
+
+    def add(self, record: Mapping[str, Any], status: str) -> None:
+        self.versions += 1
+        self.status_totals[status] += 1
+
+        episode = _extract_episode(record)
+        if episode:
+            self.episodes.add(episode)
+        shot = record.get("shot")
+        if shot:
+            self.shots.add(str(shot))
+
+        stats = self.episode_stats.get(episode or "unassigned")
+        if stats is None:
+            stats = {"shots": set(), "versions": 0, "status_counts": Counter()}
+            self.episode_stats[episode or "unassigned"] = stats
+        if shot:
+            stats["shots"].add(str(shot))
+        stats["versions"] += 1
+        stats["status_counts"][status] += 1
+
+        if status == "published":
+            self.published.append(record)
+
+    def finalise(self) -> "_ProjectAggregate":
+        """Materialise response payloads and release per-record state."""
+
+        published = sorted(
+            self.published,
+            key=lambda item: _published_timestamp(item) or "",
+            reverse=True,
+        )
+        latest = [
+            {
+                "shot": record.get("shot"),
+                "version": _normalise_version_name(record),
+                "user": record.get("user"),
+                "timestamp": _published_timestamp(record),
+            }
+            for record in published[:5]
+        ]
+        status_totals = dict(sorted(self.status_totals.items()))
+        self.summary = {
+            "episodes": len(self.episodes),
+            "shots": len(self.shots),
+            "versions": self.versions,
+            "approved_versions": self.status_totals.get("approved", 0),
+            "status_totals": status_totals,
+            "latest_published": latest,
+        }
+        self.episode_breakdown = {
+            "episodes": [
+                {
+                    "episode": name,
+                    "shots": len(self.episode_stats[name]["shots"]),
+                    "versions": self.episode_stats[name]["versions"],
+                    "status_counts": dict(
+                        sorted(self.episode_stats[name]["status_counts"].items())
+                    ),
+                }
+                for name in sorted(self.episode_stats)
+            ],
+            "status_totals": status_totals,
+        }
+        self.episodes = set()
+        self.shots = set()
+        self.episode_stats = {}
+        self.published = []
+        return self
+
+    def project_summary(self, project_name: str) -> dict[str, Any]:
+        summary = self.summary
+        return {
+            "project": project_name,
+            "episodes": summary.get("episodes", 0),
+            "shots": summary.get("shots", 0),
+            "versions": summary.get("versions", 0),
+            "approved_versions": summary.get("approved_versions", 0),
+            "status_totals": dict(summary.get("status_totals", {})),
+            "latest_published": [
+                dict(item) for item in summary.get("latest_published", [])
+            ],
+        }
+
+    def episode_summary(self, project_name: str) -> dict[str, Any]:
+        breakdown = self.episode_breakdown
+        return {
+            "project": project_name,
+            "episodes": [
+                {**entry, "status_counts": dict(entry["status_counts"])}
+                for entry in breakdown.get("episodes", [])
+            ],
+            "status_totals": dict(breakdown.get("status_totals", {})),
+        }
+
+
+class _VersionAggregates:
+    """Materialised dashboard counters derived from one version snapshot.
+
+    Aggregates are rebuilt only when :class:`ShotGridService` observes a new
+    snapshot and are then served as-is, so summary endpoints no longer scale
+    with the number of versions in a show.
+    """
+
+    __slots__ = (
+        "source",
+        "generation",
+        "fingerprint",
+        "versions",
+        "shots",
+        "project_names",
+        "projects",
+    )
+
+    def __init__(self, source: Sequence[Mapping[str, Any]]) -> None:
+        self.source = source
+        self.generation = 0
+        self.versions = len(source)
+
+        shots: set[tuple[str, str]] = set()
+        project_names: set[str] = set()
+        projects: dict[str, _ProjectAggregate] = {}
+        for record in source:
+            project_value = record.get("project")
+            shot_value = record.get("shot")
+            name = _coerce_project_name(project_value)
+            if name:
+                project_names.add(name)
+            if project_value and shot_value:
+                shots.add((str(project_value), str(shot_value)))
+
+            key = _canonical_project_key(project_value)
+            project = projects.get(key)
+            if project is None:
+                project = projects[key] = _ProjectAggregate()
+            project.add(record, _canonicalise_status(record.get("status")))
+
+        self.shots = len(shots)
+        self.project_names = frozenset(project_names)
+        self.projects = {key: value.finalise() for key, value in projects.items()}
+        self.fingerprint = self._compute_fingerprint()
+
+    def _compute_fingerprint(self) -> str:
+        payload = {
+            "versions": self.versions,
+            "shots": self.shots,
+            "projects": sorted(self.project_names),
+            "summaries": {
+                key: [value.summary, value.episode_breakdown]
+                for key, value in self.projects.items()
+            },
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def lookup(self, project_name: str) -> _ProjectAggregate | None:
+        return self.projects.get(_canonical_project_key(project_name))
+
+
 class ShotGridService:
     """Aggregate project data using a ShotGrid client."""
 
@@ -356,6 +597,10 @@ class ShotGridService:
         self._version_cache: dict[
             tuple[Any, ...], tuple[float, list[Mapping[str, Any]]]
         ] = {}
+        self._version_cache_lock = threading.Lock()
+        self._aggregates: _VersionAggregates | None = None
+        self._aggregates_lock = threading.Lock()
+        self._generation = 0
 
     @property
     def cache_settings(self) -> dict[str, float | int]:
@@ -388,7 +633,44 @@ class ShotGridService:
     def invalidate_cache(self) -> None:
         """Clear cached ShotGrid responses."""
 
-        self._version_cache.clear()
+        with self._version_cache_lock:
+            self._version_cache.clear()
+
+    @property
+    def data_generation(self) -> int:
+        """Return the generation number of the last materialised snapshot.
+
+        The counter only advances when refreshed versions change the
+        aggregated dashboard data, so identical ShotGrid responses keep the
+        same generation.
+        """
+
+        return self._generation
+
+    def cached_generation(self) -> int | None:
+        """Return the generation of the cached snapshot without fetching.
+
+        ``None`` means no unexpired snapshot is cached (caching disabled, TTL
+        elapsed, or nothing loaded yet), so the data has to be fetched before
+        its generation is known.
+        """
+
+        if self._cache_ttl <= 0:
+            return None
+        with self._version_cache_lock:
+            cached = self._version_cache.get(self._cache_key())
+        if cached is None or cached[0] <= self._time_provider():
+            return None
+        with self._aggregates_lock:
+            current = self._aggregates
+            if current is None or current.source is not cached[1]:
+                return None
+            return current.generation
+
+    def refresh_aggregates(self) -> int:
+        """Ensure aggregates reflect the current snapshot and return its generation."""
+
+        return self._version_aggregates().generation
 
     def discover_projects(self) -> list[str]:
         """Return a sorted list of known projects using ShotGrid if available."""
@@ -429,14 +711,6 @@ class ShotGridService:
         return discovered
 
     def _filter_versions(self, project_name: str) -> list[Mapping[str, Any]]:
-        def _canonical_project_key(value: Any) -> str:
-            coerced = _coerce_project_name(value)
-            if coerced is None:
-                text = str(value).strip()
-            else:
-                text = coerced
-            return text.casefold()
-
         target_key = _canonical_project_key(project_name)
 
         versions = [
@@ -458,8 +732,15 @@ class ShotGridService:
         )
 
     def _fetch_versions(self) -> list[Mapping[str, Any]]:
+        """Return a defensive copy of the current version snapshot."""
+
+        return [dict(item) for item in self._load_versions()]
+
+    def _load_versions(self) -> list[Mapping[str, Any]]:
         """
         Fetch versions from the configured client or fetcher.
+
+        Cached snapshots are returned as-is so callers must not mutate them.
         Supports three strategies:
         - self._fetcher callback
         - client.list_versions()
@@ -469,11 +750,12 @@ class ShotGridService:
         now = self._time_provider()
 
         if self._cache_ttl > 0:
-            cached = self._version_cache.get(cache_key)
+            with self._version_cache_lock:
+                cached = self._version_cache.get(cache_key)
             if cached is not None:
                 expires_at, cached_versions = cached
                 if expires_at > now:
-                    return [dict(item) for item in cached_versions]
+                    return cached_versions
 
         if self._fetcher is not None:
             fetcher: Callable[[Any], Sequence[Mapping[str, Any]]] = self._fetcher
@@ -539,139 +821,88 @@ class ShotGridService:
             if project_count > self._cache_max_projects:
                 can_cache = False
 
-        if can_cache:
-            self._version_cache[cache_key] = (
-                now + self._cache_ttl,
-                [dict(item) for item in versions_result],
-            )
-        else:
-            self._version_cache.pop(cache_key, None)
+        snapshot: list[Mapping[str, Any]] = [dict(item) for item in versions_result]
+        with self._version_cache_lock:
+            if can_cache:
+                self._version_cache[cache_key] = (now + self._cache_ttl, snapshot)
+            else:
+                self._version_cache.pop(cache_key, None)
 
-        return [dict(item) for item in versions_result]
+        return snapshot
 
-    def _project_names(self, versions: Iterable[Mapping[str, Any]]) -> set[str]:
-        names = {
-            name for v in versions if (name := _coerce_project_name(v.get("project")))
-        }
-        names.update(self._configured_projects)
-        return {name for name in names if name}
+    def _version_aggregates(self) -> _VersionAggregates:
+        """Return aggregates for the current snapshot, rebuilding them if stale.
 
-    def overall_status(self) -> dict[str, Any]:
-        versions = self._fetch_versions()
-        projects = self._project_names(versions)
-        shots = {
-            (str(v.get("project")), str(v.get("shot")))
-            for v in versions
-            if v.get("project") and v.get("shot")
-        }
-        return {
-            "projects": len(projects),
-            "shots": len(shots),
-            "versions": len(versions),
-        }
+        The cached snapshot is recognised by identity. Any other snapshot
+        (after a TTL expiry, or with caching disabled) is aggregated again, and
+        the existing aggregates and generation are kept when the fingerprint
+        of the rebuilt counters is unchanged.
+        """
 
-    def project_summary(self, project_name: str) -> dict[str, Any]:
-        versions = self._filter_versions(project_name)
+        versions = self._load_versions()
+        with self._aggregates_lock:
+            current = self._aggregates
+            if current is not None and current.source is versions:
+                return current
+
+            aggregates = _VersionAggregates(versions)
+            if current is not None and current.fingerprint == aggregates.fingerprint:
+                current.source = versions
+                return current
+            self._generation += 1
+            aggregates.generation = self._generation
+            self._aggregates = aggregates
+            return aggregates
 
-        episodes = {
-            episode for record in versions if (episode := _extract_episode(record))
-        }
-        shots = {str(record.get("shot")) for record in versions if record.get("shot")}
-        approved = sum(
-            1
-            for record in versions
-            if _canonicalise_status(record.get("status")) == "approved"
-        )
-        published = [
-            record
-            for record in versions
-            if _canonicalise_status(record.get("status")) == "published"
-        ]
-
-        status_totals: Counter[str] = Counter()
-        for record in versions:
-            key = _canonicalise_status(record.get("status"))
-            status_totals[key] += 1
-
-        published.sort(
-            key=lambda item: _parse_datetime(
-                item.get("timestamp")
-                or item.get("published_at")
-                or item.get("updated_at")
-                or item.get("created_at")
-            )
-            or "",
-            reverse=True,
-        )
+    def overall_status(self) -> dict[str, Any]:
+        return self.overall_status_with_generation()[0]
 
-        latest = []
-        for record in published[:5]:
-            latest.append(
-                {
-                    "shot": record.get("shot"),
-                    "version": _normalise_version_name(record),
-                    "user": record.get("user"),
-                    "timestamp": _parse_datetime(
-                        record.get("timestamp")
-                        or record.get("published_at")
-                        or record.get("updated_at")
-                        or record.get("created_at")
-                    ),
-                }
-            )
+    def overall_status_with_generation(self) -> tuple[dict[str, Any], int]:
+        """Return the status summary and the generation of its snapshot."""
 
-        return {
-            "project": project_name,
-            "episodes": len(episodes),
-            "shots": len(shots),
-            "versions": len(versions),
-            "approved_versions": approved,
-            "status_totals": dict(sorted(status_totals.items())),
-            "latest_published": latest,
+        aggregates = self._version_aggregates()
+        projects = set(aggregates.project_names)
+        projects.update(name for name in self._configured_projects if name)
+        summary = {
+            "projects": len(projects),
+            "shots": aggregates.shots,
+            "versions": aggregates.versions,
         }
+        return summary, aggregates.generation
+
+    def _project_aggregate(
+        self, aggregates: _VersionAggregates, project_name: str
+    ) -> _ProjectAggregate:
+        project = aggregates.lookup(project_name)
+        if project is None:
+            if project_name not in self._configured_projects:
+                raise KeyError(project_name)
+            project = _ProjectAggregate().finalise()
+        return project
 
-    def project_episode_summary(self, project_name: str) -> dict[str, Any]:
-        versions = self._filter_versions(project_name)
-
-        episode_stats: dict[str, dict[str, Any]] = defaultdict(
-            lambda: {
-                "shots": set(),
-                "versions": 0,
-                "status_counts": Counter(),
-            }
-        )
-        overall_status: Counter[str] = Counter()
+    def project_summary(self, project_name: str) -> dict[str, Any]:
+        return self.project_summary_with_generation(project_name)[0]
 
-        for record in versions:
-            episode = _extract_episode(record) or "unassigned"
-            stats = episode_stats[episode]
-            shot = record.get("shot")
-            if shot:
-                stats["shots"].add(str(shot))
-            stats["versions"] += 1
+    def project_summary_with_generation(
+        self, project_name: str
+    ) -> tuple[dict[str, Any], int]:
+        """Return a project summary and the generation of its snapshot."""
 
-            key = _canonicalise_status(record.get("status"))
-            stats["status_counts"][key] += 1
-            overall_status[key] += 1
+        aggregates = self._version_aggregates()
+        project = self._project_aggregate(aggregates, project_name)
+        return project.project_summary(project_name), aggregates.generation
 
-        payload: dict[str, Any] = {
-            "project": project_name,
-            "episodes": [],
-            "status_totals": dict(sorted(overall_status.items())),
-        }
+    def project_episode_summary(self, project_name: str) -> dict[str, Any]:
+        return self.project_episode_summary_with_generation(project_name)[0]
 
-        for name in sorted(episode_stats):
-            stats = episode_stats[name]
-            payload["episodes"].append(
-                {
-                    "episode": name,
-                    "shots": len(stats["shots"]),
-                    "versions": stats["versions"],
-                    "status_counts": dict(sorted(stats["status_counts"].items())),
-                }
-            )
+    def project_episode_summary_with_generation(
+        self, project_name: str
+    ) -> tuple[dict[str, Any], int]:
+        """Return an episode breakdown and the generation of its snapshot."""
 
-        return payload
+        aggregates = self._version_aggregates()
+        project = self._project_aggregate(aggregates, project_name)
+        return project.episode_summary(project_name), aggregates.generation
 
 
 def _resolve_reconcile_provider(
@@ -712,6 +943,18 @@ def _resolve_reconcile_provider(
     return resolved
 
 
+def _mismatch_cursor_key(mismatch: Mapping[str, Any]) -> CursorKey:
+    version = mismatch.get("expected")
+    if version is None:
+        version = mismatch.get("found")
+    return (
+        str(mismatch.get("type") or ""),
+        str(mismatch.get("shot") or ""),
+        "" if version is None else str(version),
+        str(mismatch.get("path") or mismatch.get("key") or ""),
+    )
+
+
 class ReconcileService:
     def __init__(
         self,
@@ -721,49 +964,67 @@ class ReconcileService:
     ) -> None:
         self._provider = _resolve_reconcile_provider(provider)
         self._comparator = comparator_fn or comparator.compare_datasets
+        self._generations = GenerationTracker()
+
+    @property
+    def data_generation(self) -> int | None:
+        """Return the generation of the last mismatch list returned."""
+
+        return self._generations.generation()
 
     def list_errors(self) -> list[Mapping[str, Any]]:
+        return self.list_errors_with_generation()[0]
+
+    def list_errors_with_generation(self) -> tuple[list[Mapping[str, Any]], int]:
+        """Return the current mismatches and the generation they were assigned."""
+
         payload = self._provider.load()
         shotgrid = payload.get("shotgrid", [])
         filesystem = payload.get("filesystem", [])
         s3 = payload.get("s3")
-        return list(self._comparator(shotgrid, filesystem, s3=s3))
+        mismatches = list(self._comparator(shotgrid, filesystem, s3=s3))
+        return mismatches, self._generations.observe(mismatches)
 
     def summarise_errors(self) -> list[dict[str, Any]]:
-        mismatches = self.list_errors()
-        grouped: dict[tuple[str, str], dict[str, Any]] = {}
-
-        for mismatch in mismatches:
-            mismatch_type = str(mismatch.get("type") or "unknown")
-            path_value = ""
-            for key in ("path", "key"):
-                value = mismatch.get(key)
-                if value:
-                    path_value = str(value)
-                    break
-            group = grouped.setdefault(
-                (mismatch_type, path_value),
-                {"type": mismatch_type, "path": path_value, "count": 0, "shots": set()},
-            )
-            group["count"] += 1
-            shot = mismatch.get("shot")
-            if shot:
-                group["shots"].add(str(shot))
-
-        summary: list[dict[str, Any]] = []
-        for _, data in sorted(
-            grouped.items(), key=lambda item: (item[0][0], item[0][1])
-        ):
-            summary.append(
-                {
-                    "type": data["type"],
-                    "path": data["path"],
-                    "count": data["count"],
-                    "shots": sorted(data["shots"]),
-                }
-            )
+        return _summarise_mismatches(self.list_errors())
+
+
+def _summarise_mismatches(
+    mismatches: Iterable[Mapping[str, Any]],
+) -> list[dict[str, Any]]:
+    """Group mismatches by type and location with their affected shots."""
+
+    grouped: dict[tuple[str, str], dict[str, Any]] = {}
+
+    for mismatch in mismatches:
+        mismatch_type = str(mismatch.get("type") or "unknown")
+        path_value = ""
+        for key in ("path", "key"):
+            value = mismatch.get(key)
+            if value:
+                path_value = str(value)
+                break
+        group = grouped.setdefault(
+            (mismatch_type, path_value),
+            {"type": mismatch_type, "path": path_value, "count": 0, "shots": set()},
+        )
+        group["count"] += 1
+        shot = mismatch.get("shot")
+        if shot:
+            group["shots"].add(str(shot))
+
+    summary: list[dict[str, Any]] = []
+    for _, data in sorted(grouped.items(), key=lambda item: (item[0][0], item[0][1])):
+        summary.append(
+            {
+                "type": data["type"],
+                "path": data["path"],
+                "count": data["count"],
+                "shots": sorted(data["shots"]),
+            }
+        )
 
-        return summary
+    return summary
 
 
 class RenderDashboardFacade:
@@ -772,8 +1033,26 @@ class RenderDashboardFacade:
     def __init__(self, service: RenderSubmissionService | None = None) -> None:
         self._service = service or get_render_service()
 
+    @property
+    def data_generation(self) -> int:
+        """Return the render service's job generation counter."""
+
+        return self._service.data_generation
+
     async def summarise_jobs(self) -> dict[str, Any]:
-        jobs = await asyncio.to_thread(self._service.list_jobs)
+        jobs = await run_for_source("render", self._service.list_jobs)
+        return self._summarise(jobs)
+
+    async def summarise_jobs_with_generation(self) -> tuple[dict[str, Any], int]:
+        """Return job counts and the generation of the listing they describe."""
+
+        jobs, generation = await run_for_source(
+            "render", self._service.list_jobs_with_generation
+        )
+        return self._summarise(jobs), generation
+
+    @staticmethod
+    def _summarise(jobs: Sequence[RenderJobMetadata]) -> dict[str, Any]:
         status_counts: Counter[str] = Counter()
         farm_counts: Counter[str] = Counter()
         for job in jobs:
@@ -786,103 +1065,295 @@ class RenderDashboardFacade:
         }
 
 
+def _record_field(record: Mapping[str, Any], key: str) -> Any:
+    """Return *key* from a ShotGrid record's attributes or top level."""
+
+    attributes = record.get("attributes")
+    if isinstance(attributes, Mapping) and key in attributes:
+        return attributes.get(key)
+    return record.get(key)
+
+
+def _related_id(record: Mapping[str, Any], key: str) -> int | None:
+    """Return the id of a single-entity relationship on *record*."""
+
+    related: Any = None
+    relationships = record.get("relationships")
+    if isinstance(relationships, Mapping):
+        entry = relationships.get(key)
+        if isinstance(entry, Mapping):
+            related = entry.get("data")
+    if related is None:
+        related = record.get(key)
+    if isinstance(related, Mapping):
+        related = related.get("id")
+    try:
+        return int(related) if related is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
 class ReviewDashboardFacade:
-    """Summarise review playlist activity across projects."""
+    """Summarise review playlist activity across projects.
+
+    Clients exposing ``list_projects_by_name`` and
+    ``list_playlists_for_projects`` are queried in bulk: projects and playlist
+    memberships are fetched with set-based queries and only playlists whose
+    ``updated_at`` changed since the previous call have their versions
+    resolved, using chunked ``id[$in]`` lookups. Other clients fall back to the
+    per-playlist path, with projects summarised concurrently.
+    """
 
-    def __init__(self, client: Any | None = None) -> None:
+    def __init__(self, client: Any | None = None, *, max_workers: int = 4) -> None:
         self._client = client or review_module.get_shotgrid_client()
+        self._max_workers = max(1, int(max_workers))
+        self._playlist_cache: dict[int, tuple[str, dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+        self._generations = GenerationTracker()
+
+    @property
+    def data_generation(self) -> int | None:
+        """Return the generation of the last review summary produced."""
+
+        return self._generations.generation()
 
     def summarise_projects(self, project_names: Iterable[str]) -> dict[str, Any]:
-        project_summaries: list[dict[str, Any]] = []
-        total_playlists = 0
-        total_clips = 0
-        total_shots = 0
-        total_duration = 0.0
+        return self.summarise_projects_with_generation(project_names)[0]
 
+    def summarise_projects_with_generation(
+        self, project_names: Iterable[str]
+    ) -> tuple[dict[str, Any], int]:
+        """Return the review summary and the generation it was assigned."""
+
+        names = [str(name) for name in project_names]
+        project_summaries: list[dict[str, Any]] | None = None
+        if self._supports_batched_queries():
+            try:
+                project_summaries = self._summarise_batched(names)
+            except ShotGridError as exc:
+                logger.warning("dashboard.review.batch_failed", error=str(exc))
+        if project_summaries is None:
+            project_summaries = self._summarise_per_project(names)
+
+        summary = {
+            "totals": {
+                "projects": len(project_summaries),
+                "playlists": sum(entry["playlists"] for entry in project_summaries),
+                "clips": sum(entry["clips"] for entry in project_summaries),
+                "shots": sum(entry["shots"] for entry in project_summaries),
+                "duration_seconds": sum(
+                    entry["duration_seconds"] for entry in project_summaries
+                ),
+            },
+            "projects": project_summaries,
+        }
+        return summary, self._generations.observe(summary)
+
+    def _supports_batched_queries(self) -> bool:
+        return callable(getattr(self._client, "list_projects_by_name", None)) and (
+            callable(getattr(self._client, "list_playlists_for_projects", None))
+        )
+
+    @staticmethod
+    def _project_entry(
+        project: str, summaries: Iterable[Mapping[str, Any]]
+    ) -> dict[str, Any]:
+        playlists = 0
+        clips = 0
+        shots = 0
+        duration = 0.0
+        for summary in summaries:
+            playlists += 1
+            clips += int(summary.get("clips", 0))
+            shots += int(summary.get("shots", 0))
+            duration += float(summary.get("duration_seconds", 0.0))
+        return {
+            "project": project,
+            "playlists": playlists,
+            "clips": clips,
+            "shots": shots,
+            "duration_seconds": duration,
+        }
+
+    def _summarise_batched(self, project_names: list[str]) -> list[dict[str, Any]]:
+        project_ids: dict[str, int] = {}
+        for record in self._client.list_projects_by_name(project_names) or []:
+            if not isinstance(record, Mapping) or record.get("id") is None:
+                continue
+            name = _record_field(record, "name")
+            if name is None:
+                continue
+            try:
+                project_ids[str(name)] = int(record["id"])
+            except (TypeError, ValueError):
+                continue
+
+        playlists_by_project: dict[int, dict[str, Mapping[str, Any]]] = {}
+        records = (
+            self._client.list_playlists_for_projects(set(project_ids.values()))
+            if project_ids
+            else []
+        )
+        for record in records or []:
+            if not isinstance(record, Mapping):
+                continue
+            project_id = _related_id(record, "project")
+            name = review_module._extract_playlist_name(record)  # noqa: SLF001
+            if project_id is None or not name:
+                continue
+            # Mirror the per-playlist path, which resolves the first match.
+            playlists_by_project.setdefault(project_id, {}).setdefault(name, record)
+
+        summaries = self._playlist_summaries(
+            [
+                record
+                for playlists in playlists_by_project.values()
+                for record in playlists.values()
+            ]
+        )
+
+        project_summaries: list[dict[str, Any]] = []
         for project in project_names:
+            project_id = project_ids.get(project)
+            if project_id is None:
+                logger.info("dashboard.review.project_missing", project=project)
+                playlists: dict[str, Mapping[str, Any]] = {}
+            else:
+                playlists = playlists_by_project.get(project_id, {})
+            project_summaries.append(
+                self._project_entry(
+                    project,
+                    (
+                        summaries[id(playlists[name])]
+                        for name in sorted(playlists)
+                        if id(playlists[name]) in summaries
+                    ),
+                )
+            )
+        return project_summaries
+
+    def _playlist_summaries(
+        self, records: Sequence[Mapping[str, Any]]
+    ) -> dict[int, dict[str, Any]]:
+        """Return clip summaries keyed by ``id(record)``.
+
+        Cached summaries are reused while a playlist's ``updated_at`` is
+        unchanged; the remaining playlists share bulk version lookups.
+        """
+
+        summaries: dict[int, dict[str, Any]] = {}
+        stale: list[tuple[Mapping[str, Any], int | None, str | None, list[int]]] = []
+        with self._cache_lock:
+            for record in records:
+                try:
+                    playlist_id: int | None = int(record["id"])
+                except (KeyError, TypeError, ValueError):
+                    playlist_id = None
+                updated_raw = _record_field(record, "updated_at")
+                updated_at = str(updated_raw) if updated_raw else None
+                cached = (
+                    self._playlist_cache.get(playlist_id)
+                    if playlist_id is not None
+                    else None
+                )
+                if cached is not None and updated_at and cached[0] == updated_at:
+                    summaries[id(record)] = cached[1]
+                    continue
+                stale.append(
+                    (
+                        record,
+                        playlist_id,
+                        updated_at,
+                        playlist_version_ids(dict(record)),
+                    )
+                )
+
+        if not stale:
+            return summaries
+
+        clips_by_id = fetch_versions_by_ids(
+            self._client,
+            (version_id for *_, version_ids in stale for version_id in version_ids),
+        )
+
+        with self._cache_lock:
+            for record, playlist_id, updated_at, version_ids in stale:
+                summary = review_module._summarise_clips(  # noqa: SLF001
+                    clips_by_id[version_id]
+                    for version_id in version_ids
+                    if version_id in clips_by_id
+                )
+                summaries[id(record)] = summary
+                if playlist_id is not None and updated_at:
+                    self._playlist_cache[playlist_id] = (updated_at, summary)
+        return summaries
+
+    def _summarise_per_project(self, project_names: list[str]) -> list[dict[str, Any]]:
+        if len(project_names) <= 1:
+            results = [self._summarise_project(name) for name in project_names]
+        else:
+            # Runs on a "review" source thread, so per-project work goes to a
+            # separate bulkhead instead of queueing behind its own caller.
+            executor = get_source_executor("review.projects")
+            results = []
+            for start in range(0, len(project_names), self._max_workers):
+                batch = project_names[start : start + self._max_workers]
+                results.extend(executor.map(self._summarise_project, batch))
+        return [entry for entry in results if entry is not None]
+
+    def _summarise_project(self, project: str) -> dict[str, Any] | None:
+        try:
+            playlists = review_module._list_project_playlists(  # noqa: SLF001
+                self._client, project
+            )
+        except ShotGridError as exc:
+            logger.warning(
+                "dashboard.review.playlists_failed",
+                project=project,
+                error=str(exc),
+            )
+            return None
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logger.warning(
+                "dashboard.review.playlists_error",
+                project=project,
+                error=str(exc),
+            )
+            return None
+
+        summaries: list[dict[str, Any]] = []
+        for playlist in playlists:
             try:
-                playlists = review_module._list_project_playlists(  # noqa: SLF001
-                    self._client, project
+                clips: Iterable[DailiesClip] = fetch_playlist_versions(
+                    self._client, project, playlist
                 )
             except ShotGridError as exc:
                 logger.warning(
-                    "dashboard.review.playlists_failed",
+                    "dashboard.review.playlist_summary_failed",
                     project=project,
+                    playlist=playlist,
                     error=str(exc),
                 )
                 continue
             except Exception as exc:  # pragma: no cover - defensive guard
                 logger.warning(
-                    "dashboard.review.playlists_error",
+                    "dashboard.review.playlist_summary_error",
                     project=project,
+                    playlist=playlist,
                     error=str(exc),
                 )
                 continue
 
-            playlists_processed = 0
-            project_clips = 0
-            project_shots = 0
-            project_duration = 0.0
-
-            for playlist in playlists:
-                try:
-                    clips: Iterable[DailiesClip] = fetch_playlist_versions(
-                        self._client, project, playlist
-                    )
-                except ShotGridError as exc:
-                    logger.warning(
-                        "dashboard.review.playlist_summary_failed",
-                        project=project,
-                        playlist=playlist,
-                        error=str(exc),
-                    )
-                    continue
-                except Exception as exc:  # pragma: no cover - defensive guard
-                    logger.warning(
-                        "dashboard.review.playlist_summary_error",
-                        project=project,
-                        playlist=playlist,
-                        error=str(exc),
-                    )
-                    continue
-
-                summary = review_module._summarise_clips(clips)  # noqa: SLF001
-                playlists_processed += 1
-                project_clips += int(summary.get("clips", 0))
-                project_shots += int(summary.get("shots", 0))
-                project_duration += float(summary.get("duration_seconds", 0.0))
+            summaries.append(review_module._summarise_clips(clips))  # noqa: SLF001
 
-            total_playlists += playlists_processed
-            total_clips += project_clips
-            total_shots += project_shots
-            total_duration += project_duration
-
-            project_summaries.append(
-                {
-                    "project": project,
-                    "playlists": playlists_processed,
-                    "clips": project_clips,
-                    "shots": project_shots,
-                    "duration_seconds": project_duration,
-                }
-            )
-
-        return {
-            "totals": {
-                "projects": len(project_summaries),
-                "playlists": total_playlists,
-                "clips": total_clips,
-                "shots": total_shots,
-                "duration_seconds": total_duration,
-            },
-            "projects": project_summaries,
-        }
+        return self._project_entry(project, summaries)
 
 
 def get_render_dashboard_facade() -> RenderDashboardFacade:  # pragma: no cover - wiring
     return RenderDashboardFacade()
 
 
+@lru_cache(maxsize=1)
 def get_review_dashboard_facade() -> ReviewDashboardFacade:  # pragma: no cover - wiring
     return ReviewDashboardFacade()
 
@@ -944,6 +1415,8 @@ class DashboardMetricsModel(BaseModel):
     ingest: IngestSummaryModel
     render: RenderSummaryModel
     review: ReviewSummaryModel
+    degraded: bool = False
+    degraded_sources: Sequence[str] = Field(default_factory=list)
 
 
 class CacheSettingsModel(BaseModel):
@@ -1001,6 +1474,42 @@ def _resolve_delivery_provider(
     return resolved
 
 
+def _page_errors(
+    reconcile_service: ReconcileService,
+    query: CollectionQuery,
+    *,
+    types: Collection[str] | None = None,
+    shots: Collection[str] | None = None,
+) -> tuple[Page[Mapping[str, Any]], int | None]:
+    """Return one page of mismatches filtered by ``types`` and ``shots``.
+
+    Paged requests are ordered by type, shot, version, and location so that
+    cursors stay valid while the comparison is recomputed. The generation the
+    mismatches were assigned is returned with the page.
+    """
+
+    type_filter = {value.strip().lower() for value in types or () if value}
+    shot_filter = {value.strip() for value in shots or () if value}
+    listed, generation = _read_with_generation(reconcile_service, "list_errors")
+    mismatches: Iterable[Mapping[str, Any]] = (
+        mismatch
+        for mismatch in listed
+        if (not type_filter or str(mismatch.get("type") or "").lower() in type_filter)
+        and (not shot_filter or str(mismatch.get("shot") or "") in shot_filter)
+    )
+    if query.paginated:
+        mismatches = sorted(mismatches, key=_mismatch_cursor_key)
+    page = paginate(mismatches, key=_mismatch_cursor_key, query=query, descending=False)
+    return page, generation
+
+
+def _delivery_cursor_key(delivery: Mapping[str, Any]) -> CursorKey:
+    return (
+        sortable_timestamp(delivery.get("created_at")),
+        str(delivery.get("delivery_id") or delivery.get("manifest") or ""),
+    )
+
+
 class DeliveryService:
     def __init__(
         self,
@@ -1011,6 +1520,13 @@ class DeliveryService:
         self._provider = _resolve_delivery_provider(provider)
         self._manifest_cache: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
         self._manifest_cache_size = max(0, manifest_cache_size)
+        self._manifest_lock = threading.Lock()
+        self._generations = GenerationTracker()
+
+    def listing_generation(self, project_name: str) -> int | None:
+        """Return the generation of the last delivery listing for a project."""
+
+        return self._generations.generation(project_name)
 
     def _manifest_cache_key(self, delivery: Mapping[str, Any]) -> Hashable | None:
         for key in ("id", "delivery_id"):
@@ -1042,39 +1558,65 @@ class DeliveryService:
             cloned_files = []
         return {"files": cloned_files}
 
-    def _store_manifest(self, key: Hashable, manifest: Mapping[str, Any]) -> None:
+    @staticmethod
+    def _share_manifest_data(manifest: Mapping[str, Any]) -> dict[str, Any]:
+        files = manifest.get("files", [])
+        if isinstance(files, list):
+            return {"files": files}
+        if isinstance(files, Sequence) and not isinstance(
+            files, (str, bytes, bytearray)
+        ):
+            return {"files": list(files)}
+        return {"files": []}
+
+    def _store_manifest(self, key: Hashable, manifest: dict[str, Any]) -> None:
+        # Listings share cached manifests read-only instead of copying them on
+        # every request; ``get_delivery_manifest`` hands out private copies.
         if self._manifest_cache_size == 0:
             return
-        self._manifest_cache[key] = self._clone_manifest_data(manifest)
-        self._manifest_cache.move_to_end(key)
-        while len(self._manifest_cache) > self._manifest_cache_size:
-            self._manifest_cache.popitem(last=False)
+        with self._manifest_lock:
+            self._manifest_cache[key] = manifest
+            self._manifest_cache.move_to_end(key)
+            while len(self._manifest_cache) > self._manifest_cache_size:
+                self._manifest_cache.popitem(last=False)
 
     def _lookup_manifest(self, key: Hashable) -> dict[str, Any] | None:
         if self._manifest_cache_size == 0:
             return None
-        cached = self._manifest_cache.get(key)
-        if cached is None:
-            return None
-        self._manifest_cache.move_to_end(key)
-        return self._clone_manifest_data(cached)
+        with self._manifest_lock:
+            cached = self._manifest_cache.get(key)
+            if cached is not None:
+                self._manifest_cache.move_to_end(key)
+            return cached
 
     @staticmethod
     def _normalise_manifest_payload(
         payload: Any,
     ) -> dict[str, Any] | None:
         if isinstance(payload, Mapping):
-            return DeliveryService._clone_manifest_data(payload)
+            return DeliveryService._share_manifest_data(payload)
         if isinstance(payload, Sequence) and not isinstance(
             payload, (str, bytes, bytearray)
         ):
-            files = [
-                dict(item) if isinstance(item, Mapping) else item for item in payload
-            ]
-            return {"files": files}
+            return {"files": payload if isinstance(payload, list) else list(payload)}
         return None
 
+    def invalidate_cache(self, project_name: str | None = None) -> None:
+        """Forget cached manifests and ask the provider to drop its listings."""
+
+        with self._manifest_lock:
+            self._manifest_cache.clear()
+        invalidate = getattr(self._provider, "invalidate", None)
+        if callable(invalidate):
+            invalidate(project_name)
+
     def list_deliveries(self, project_name: str) -> list[dict[str, Any]]:
+        """Return summaries of a project's deliveries.
+
+        ``items`` lists are shared with the manifest cache and must not be
+        mutated by callers.
+        """
+
         deliveries = self._provider.list_deliveries(project_name)
         result: list[dict[str, Any]] = []
         for delivery in deliveries:
@@ -1122,6 +1664,7 @@ class DeliveryService:
                     "file_count": len(files),
                 }
             )
+        self._generations.observe(result, key=project_name)
         return result
 
     def get_delivery_manifest(
@@ -1140,7 +1683,7 @@ class DeliveryService:
             for key in cache_keys:
                 cached_manifest = self._lookup_manifest(key)
                 if cached_manifest is not None:
-                    return cached_manifest
+                    return self._clone_manifest_data(cached_manifest)
 
             entries = delivery.get("entries") or []
             manifest_data = self._normalise_manifest_payload(
@@ -1156,11 +1699,29 @@ class DeliveryService:
 
             for key in cache_keys:
                 self._store_manifest(key, manifest_data)
-            return manifest_data
+            return self._clone_manifest_data(manifest_data)
 
         raise KeyError(f"Delivery not found: {identifier}")
 
 
+def _page_deliveries(
+    delivery_service: DeliveryService, project_name: str, query: CollectionQuery
+) -> Page[dict[str, Any]]:
+    """Return deliveries created inside the query's date range, page by page.
+
+    Paged requests are ordered by creation time, newest first.
+    """
+
+    deliveries: Iterable[dict[str, Any]] = (
+        delivery
+        for delivery in delivery_service.list_deliveries(project_name)
+        if query.matches_timestamp(delivery.get("created_at"))
+    )
+    if query.paginated:
+        deliveries = sorted(deliveries, key=_delivery_cursor_key, reverse=True)
+    return paginate(deliveries, key=_delivery_cursor_key, query=query)
+
+
 # ---------------------------------------------------------------------------
 # Dependency factories
 # ---------------------------------------------------------------------------
@@ -1190,6 +1751,7 @@ def get_shotgrid_service() -> ShotGridService:
     )
 
 
+@lru_cache(maxsize=1)
 def get_reconcile_service() -> ReconcileService:
     try:
         return ReconcileService()
@@ -1197,6 +1759,7 @@ def get_reconcile_service() -> ReconcileService:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
 
+@lru_cache(maxsize=1)
 def get_delivery_service() -> DeliveryService:
     provider = _resolve_delivery_provider(None)
     return DeliveryService(provider=provider)
@@ -1207,7 +1770,12 @@ def get_delivery_service() -> DeliveryService:
 # ---------------------------------------------------------------------------
 
 
-app = FastAPI(title="OnePiece Dashboard", version=TRAFALGAR_VERSION)
+app = FastAPI(
+    title="OnePiece Dashboard",
+    version=TRAFALGAR_VERSION,
+    default_response_class=FastJSONResponse,
+)
+app.router.route_class = compressed_route_class()
 _TEMPLATE_CACHE: str | None = None
 
 
@@ -1255,6 +1823,106 @@ async def log_requests(
     return response
 
 
+def _dashboard_source_defaults() -> dict[str, Any]:
+    """Return the placeholder payloads used when a data source is degraded."""
+
+    return {
+        "shotgrid": {"projects": 0, "shots": 0, "versions": 0},
+        "reconcile": [],
+        "ingest": {
+            "counts": {"total": 0, "successful": 0, "failed": 0, "running": 0},
+            "last_success_at": None,
+            "failure_streak": 0,
+        },
+        "render": {},
+        "review": {},
+    }
+
+
+def _read_with_generation(
+    source: Any, method: str, *args: Any
+) -> tuple[Any, int | None]:
+    """Call ``method`` on a dashboard source and return its payload and generation.
+
+    Services expose ``<method>_with_generation`` so that the generation is read
+    together with the data it describes. Sources without it, such as the demo
+    overrides, return their payload without a generation and no ETag is
+    emitted for them.
+    """
+
+    versioned = getattr(source, f"{method}_with_generation", None)
+    if not callable(versioned):
+        return getattr(source, method)(*args), None
+    payload, generation = versioned(*args)
+    return payload, generation if isinstance(generation, int) else None
+
+
+def _cached_generation(source: Any) -> int | None:
+    """Return a generation known without fetching, for early 304 checks."""
+
+    cached = getattr(source, "cached_generation", None)
+    if not callable(cached):
+        return None
+    value = cached()
+    return value if isinstance(value, int) else None
+
+
+async def _collect_dashboard_sources(
+    shotgrid_service: ShotGridService,
+    reconcile_service: ReconcileService,
+    ingest_facade: IngestRunDashboardFacade,
+    render_facade: RenderDashboardFacade,
+    review_facade: ReviewDashboardFacade,
+) -> tuple[dict[str, Any], list[int | str | None], list[str]]:
+    """Gather the independent dashboard sub-summaries concurrently.
+
+    Blocking providers run on per-source executors and each source is bounded
+    by its own timeout, so a slow ShotGrid query degrades its section of the
+    payload instead of stalling the event loop. Alongside the payloads the
+    generation each source returned with its data is collected for the ETag;
+    degraded sources contribute a fixed marker because their section is the
+    static placeholder.
+    """
+
+    def _summarise_review() -> tuple[Any, int | None]:
+        project_names = shotgrid_service.discover_projects()
+        return _read_with_generation(review_facade, "summarise_projects", project_names)
+
+    async def _summarise_render() -> tuple[Any, int | None]:
+        versioned = getattr(render_facade, "summarise_jobs_with_generation", None)
+        if callable(versioned):
+            payload, generation = await versioned()
+            return payload, generation if isinstance(generation, int) else None
+        return await render_facade.summarise_jobs(), None
+
+    sources: dict[str, Callable[[], Awaitable[Any]]] = {
+        "shotgrid": lambda: run_for_source(
+            "shotgrid", _read_with_generation, shotgrid_service, "overall_status"
+        ),
+        "reconcile": lambda: run_for_source(
+            "reconcile", _read_with_generation, reconcile_service, "list_errors"
+        ),
+        "ingest": lambda: run_for_source(
+            "ingest",
+            _read_with_generation,
+            ingest_facade,
+            "summarise_recent_runs",
+        ),
+        "render": _summarise_render,
+        "review": lambda: run_for_source("review", _summarise_review),
+    }
+    defaults = {
+        name: (placeholder, "degraded")
+        for name, placeholder in _dashboard_source_defaults().items()
+    }
+    outcomes, degraded = await gather_sources(
+        sources, defaults=defaults, log_key="dashboard.sources"
+    )
+    results = {name: outcome[0] for name, outcome in outcomes.items()}
+    generations = [outcome[1] for outcome in outcomes.values()]
+    return results, generations, degraded
+
+
 def _load_landing_template() -> str:
     global _TEMPLATE_CACHE
     if _TEMPLATE_CACHE is None:
@@ -1265,7 +1933,7 @@ def _load_landing_template() -> str:
 
 @app.get("/", response_class=HTMLResponse)
 async def landing_page(request: Request) -> HTMLResponse:
-    projects = discover_projects()
+    projects = await run_for_source("shotgrid", discover_projects)
     example_project = projects[0] if projects else None
 
     nav_items: list[str] = [
@@ -1317,17 +1985,29 @@ async def landing_page(request: Request) -> HTMLResponse:
 
 @app.get("/status")
 async def status(
+    request: Request,
     shotgrid_service: ShotGridService = Depends(get_shotgrid_service),
     reconcile_service: ReconcileService = Depends(get_reconcile_service),
     ingest_facade: IngestRunDashboardFacade = Depends(get_ingest_dashboard_facade),
     render_facade: RenderDashboardFacade = Depends(get_render_dashboard_facade),
     review_facade: ReviewDashboardFacade = Depends(get_review_dashboard_facade),
-) -> JSONResponse:
-    summary = shotgrid_service.overall_status()
-    errors = reconcile_service.list_errors()
-    ingest_summary = ingest_facade.summarise_recent_runs()
+) -> Response:
+    results, generations, degraded = await _collect_dashboard_sources(
+        shotgrid_service,
+        reconcile_service,
+        ingest_facade,
+        render_facade,
+        review_facade,
+    )
+    etag = compute_etag("status", *generations)
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
 
-    render_raw = await render_facade.summarise_jobs()
+    summary = results["shotgrid"]
+    errors = results["reconcile"]
+    ingest_summary = results["ingest"]
+
+    render_raw = results["render"]
     if not isinstance(render_raw, Mapping):
         render_raw = {}
     render_summary = {
@@ -1342,8 +2022,7 @@ async def status(
         },
     }
 
-    project_names = shotgrid_service.discover_projects()
-    review_raw = review_facade.summarise_projects(project_names)
+    review_raw = results["review"]
     if not isinstance(review_raw, Mapping):
         review_raw = {}
     review_projects_raw = list(review_raw.get("projects", []))
@@ -1382,8 +2061,10 @@ async def status(
         "ingest": ingest_summary,
         "render": render_summary,
         "review": review_summary,
+        "degraded": bool(degraded),
+        "degraded_sources": degraded,
     }
-    return JSONResponse(content=payload)
+    return apply_cache_headers(FastJSONResponse(content=payload), etag)
 
 
 @app.get(
@@ -1392,16 +2073,32 @@ async def status(
     dependencies=[Depends(require_dashboard_auth)],
 )
 async def metrics(
+    request: Request,
+    response: Response,
     shotgrid_service: ShotGridService = Depends(get_shotgrid_service),
     reconcile_service: ReconcileService = Depends(get_reconcile_service),
     ingest_facade: IngestRunDashboardFacade = Depends(get_ingest_dashboard_facade),
     render_facade: RenderDashboardFacade = Depends(get_render_dashboard_facade),
     review_facade: ReviewDashboardFacade = Depends(get_review_dashboard_facade),
-) -> DashboardMetricsModel:
-    status_summary = shotgrid_service.overall_status()
-    error_count = len(reconcile_service.list_errors())
+) -> DashboardMetricsModel | Response:
+    results, generations, degraded = await _collect_dashboard_sources(
+        shotgrid_service,
+        reconcile_service,
+        ingest_facade,
+        render_facade,
+        review_facade,
+    )
+    etag = compute_etag("metrics", *generations)
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
+    apply_cache_headers(response, etag)
 
-    ingest_raw = ingest_facade.summarise_recent_runs()
+    status_summary = results["shotgrid"]
+    if not isinstance(status_summary, Mapping):
+        status_summary = {}
+    error_count = len(results["reconcile"] or [])
+
+    ingest_raw = results["ingest"]
     ingest_counts_raw = (
         ingest_raw.get("counts", {}) if isinstance(ingest_raw, Mapping) else {}
     )
@@ -1422,7 +2119,9 @@ async def metrics(
         ),
     )
 
-    render_raw = await render_facade.summarise_jobs()
+    render_raw = results["render"]
+    if not isinstance(render_raw, Mapping):
+        render_raw = {}
     render_model = RenderSummaryModel(
         jobs=_parse_int(render_raw.get("jobs"), 0),
         by_status={
@@ -1435,8 +2134,7 @@ async def metrics(
         },
     )
 
-    project_names = shotgrid_service.discover_projects()
-    review_raw = review_facade.summarise_projects(project_names)
+    review_raw = results["review"]
     review_projects_raw = (
         list(review_raw.get("projects", [])) if isinstance(review_raw, Mapping) else []
     )
@@ -1481,6 +2179,8 @@ async def metrics(
         ingest=ingest_model,
         render=render_model,
         review=review_model,
+        degraded=bool(degraded),
+        degraded_sources=degraded,
     )
 
 
@@ -1534,50 +2234,113 @@ async def update_cache_settings(
 
 @app.get("/projects/{project_name}")
 async def project_detail(
+    request: Request,
     project_name: str,
     shotgrid_service: ShotGridService = Depends(get_shotgrid_service),
-) -> JSONResponse:
+) -> Response:
+    etag = compute_etag(
+        "project", _cached_generation(shotgrid_service), params=project_name
+    )
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
     try:
-        summary = shotgrid_service.project_summary(project_name)
+        summary, generation = await run_for_source(
+            "shotgrid",
+            _read_with_generation,
+            shotgrid_service,
+            "project_summary",
+            project_name,
+        )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Project not found") from exc
-    return JSONResponse(content=summary)
+    etag = compute_etag("project", generation, params=project_name)
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
+    return apply_cache_headers(FastJSONResponse(content=summary), etag)
 
 
 @app.get("/projects/{project_name}/episodes")
 async def project_episode_detail(
+    request: Request,
     project_name: str,
     shotgrid_service: ShotGridService = Depends(get_shotgrid_service),
-) -> JSONResponse:
+) -> Response:
+    etag = compute_etag(
+        "project.episodes", _cached_generation(shotgrid_service), params=project_name
+    )
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
     try:
-        payload = shotgrid_service.project_episode_summary(project_name)
+        payload, generation = await run_for_source(
+            "shotgrid",
+            _read_with_generation,
+            shotgrid_service,
+            "project_episode_summary",
+            project_name,
+        )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Project not found") from exc
-    return JSONResponse(content=payload)
+    etag = compute_etag("project.episodes", generation, params=project_name)
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
+    return apply_cache_headers(FastJSONResponse(content=payload), etag)
 
 
 @app.get("/errors")
 async def errors(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = Query(None),
+    type: list[str] | None = Query(None, description="Filter by mismatch type."),
+    shot: list[str] | None = Query(None, description="Filter by shot code."),
+    fields: list[str] | None = Query(None),
     reconcile_service: ReconcileService = Depends(get_reconcile_service),
-) -> JSONResponse:
-    mismatches = reconcile_service.list_errors()
-    return JSONResponse(content=mismatches)
+) -> Response:
+    query = build_collection_query(limit=limit, cursor=cursor, fields=fields)
+    page, generation = await run_for_source(
+        "reconcile", _page_errors, reconcile_service, query, types=type, shots=shot
+    )
+    etag = compute_etag(
+        "errors",
+        generation,
+        params=(query.cache_key, tuple(sorted(type or ())), tuple(sorted(shot or ()))),
+    )
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
+    response = FastJSONResponse(
+        content=[select_fields(item, query.fields) for item in page.items]
+    )
+    apply_page_headers(request, response, page.next_cursor)
+    return apply_cache_headers(response, etag)
 
 
 @app.get("/errors/summary")
 async def error_summary(
+    request: Request,
     reconcile_service: ReconcileService = Depends(get_reconcile_service),
-) -> JSONResponse:
-    payload = reconcile_service.summarise_errors()
-    return JSONResponse(content=payload)
+) -> Response:
+    if not callable(getattr(reconcile_service, "list_errors_with_generation", None)):
+        payload = await run_for_source("reconcile", reconcile_service.summarise_errors)
+        return FastJSONResponse(content=payload)
+    mismatches, generation = await run_for_source(
+        "reconcile", reconcile_service.list_errors_with_generation
+    )
+    # The summary is only built once the validator misses.
+    etag = compute_etag("errors.summary", generation)
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
+    payload = _summarise_mismatches(mismatches)
+    return apply_cache_headers(FastJSONResponse(content=payload), etag)
 
 
 @app.get("/deliveries/{project_name}")
 async def deliveries(
+    request: Request,
     project_name: str,
+    query: CollectionQuery = Depends(collection_query),
     delivery_service: DeliveryService = Depends(get_delivery_service),
     credentials: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
-) -> JSONResponse:
+) -> Response:
     include_manifest_api = False
     try:
         require_dashboard_auth(credentials)
@@ -1587,17 +2350,31 @@ async def deliveries(
     else:
         include_manifest_api = True
 
-    payload = delivery_service.list_deliveries(project_name)
+    page = await run_for_source(
+        "delivery", _page_deliveries, delivery_service, project_name, query
+    )
+    listing_generation = getattr(delivery_service, "listing_generation", None)
+    etag = compute_etag(
+        "deliveries",
+        listing_generation(project_name) if callable(listing_generation) else None,
+        params=(project_name, include_manifest_api, query.cache_key),
+    )
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
     if include_manifest_api:
         project_fragment = quote(project_name, safe="")
-        for entry in payload:
+        for entry in page.items:
             identifier = entry.get("delivery_id") or entry.get("manifest")
             if not identifier:
                 continue
             entry["manifest_api"] = (
                 f"/deliveries/{project_fragment}/{quote(str(identifier), safe='')}"
             )
-    return JSONResponse(content=payload)
+    response = FastJSONResponse(
+        content=[select_fields(entry, query.fields) for entry in page.items]
+    )
+    apply_page_headers(request, response, page.next_cursor)
+    return apply_cache_headers(response, etag)
 
 
 @app.get(
@@ -1610,9 +2387,12 @@ async def delivery_manifest(
     delivery_service: DeliveryService = Depends(get_delivery_service),
 ) -> JSONResponse:
     try:
-        manifest = delivery_service.get_delivery_manifest(
-            project_name, delivery_identifier
+        manifest = await run_for_source(
+            "delivery",
+            delivery_service.get_delivery_manifest,
+            project_name,
+            delivery_identifier,
         )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Delivery not found") from exc
-    return JSONResponse(content=manifest)
+    return FastJSONResponse(content=manifest)
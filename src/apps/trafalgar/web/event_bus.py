@@ -0,0 +1,229 @@
+"""Cross-process distribution of Trafalgar broadcaster events."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+EVENT_BUS_PATH_ENV = "TRAFALGAR_EVENT_BUS_PATH"
+
+DEFAULT_POLL_INTERVAL = 0.05
+DEFAULT_RETENTION = 60.0
+
+EventHandler = Callable[[str | None, bytes], None]
+
+
+class EventBus(ABC):
+    """Transport that shares encoded events between Trafalgar worker processes.
+
+    Broadcasters publish every frame they deliver locally to a ``channel`` and
+    register a handler for frames that other processes published to it.
+    Implementations must never hand a process its own frames back, and
+    :meth:`publish` must not block on I/O because it may be called from the
+    event loop thread.
+    """
+
+    @abstractmethod
+    def publish(self, channel: str, event: str | None, data: bytes) -> None:
+        """Queue ``data`` for delivery to the other processes on ``channel``."""
+
+    @abstractmethod
+    def subscribe(self, channel: str, handler: EventHandler) -> None:
+        """Call ``handler(event, data)`` for frames other processes publish."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop background work and release resources."""
+
+
+class SQLiteEventBus(EventBus):
+    """Event bus backed by a shared SQLite database in WAL mode.
+
+    All workers on a host point at the same file. A daemon thread writes
+    queued frames in batches and polls for rows inserted by other processes
+    every ``poll_interval`` seconds; rows older than ``retention`` seconds are
+    pruned as it goes. Handlers run on that thread.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        retention: float = DEFAULT_RETENTION,
+    ) -> None:
+        self._path = Path(path)
+        self._poll_interval = max(float(poll_interval), 0.001)
+        self._retention = max(float(retention), 1.0)
+        self._origin = uuid.uuid4().hex
+        self._handlers: dict[str, list[EventHandler]] = {}
+        self._outbox: deque[tuple[str, str | None, bytes]] = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._cursor = 0
+        self._last_prune = 0.0
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connect()
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "origin TEXT NOT NULL, "
+                "channel TEXT NOT NULL, "
+                "event TEXT, "
+                "data BLOB NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+            row = connection.execute("SELECT MAX(id) FROM events").fetchone()
+            # Only frames published after this process joined are delivered.
+            self._cursor = int(row[0] or 0)
+        finally:
+            connection.close()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def publish(self, channel: str, event: str | None, data: bytes) -> None:
+        with self._lock:
+            self._outbox.append((channel, event, data))
+        self._ensure_thread()
+        self._wake.set()
+
+    def subscribe(self, channel: str, handler: EventHandler) -> None:
+        with self._lock:
+            self._handlers.setdefault(channel, []).append(handler)
+        self._ensure_thread()
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._stopped.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="trafalgar-event-bus", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        connection = self._connect()
+        try:
+            while not self._stopped.is_set():
+                try:
+                    self._write(connection)
+                    self._read(connection)
+                    self._prune(connection)
+                except sqlite3.Error as exc:
+                    logger.warning("trafalgar.event_bus.error", error=str(exc))
+                self._wake.wait(self._poll_interval)
+                self._wake.clear()
+            self._write(connection)
+        finally:
+            connection.close()
+
+    def _write(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            pending = list(self._outbox)
+        if not pending:
+            return
+        now = time.time()
+        with connection:
+            connection.executemany(
+                "INSERT INTO events (origin, channel, event, data, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self._origin, channel, event, data, now)
+                    for channel, event, data in pending
+                ],
+            )
+        # Frames leave the outbox only once committed, so a failed write (for
+        # example "database is locked") is retried on the next pass. Only this
+        # thread removes frames; newer ones were appended behind these.
+        with self._lock:
+            for _ in pending:
+                self._outbox.popleft()
+
+    def _read(self, connection: sqlite3.Connection) -> None:
+        rows = connection.execute(
+            "SELECT id, origin, channel, event, data FROM events "
+            "WHERE id > ? ORDER BY id",
+            (self._cursor,),
+        ).fetchall()
+        if not rows:
+            return
+        self._cursor = rows[-1][0]
+        with self._lock:
+            handlers = {name: list(items) for name, items in self._handlers.items()}
+        for _, origin, channel, event, data in rows:
+            if origin == self._origin:
+                continue
+            for handler in handlers.get(channel, ()):
+                try:
+                    handler(event, bytes(data))
+                except Exception:  # pragma: no cover - defensive guard
+                    logger.exception("trafalgar.event_bus.handler_failed")
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < self._retention / 2:
+            return
+        self._last_prune = now
+        with connection:
+            connection.execute(
+                "DELETE FROM events WHERE created_at < ?",
+                (time.time() - self._retention,),
+            )
+
+
+@lru_cache(maxsize=1)
+def event_bus_from_env() -> EventBus | None:
+    """Return the shared bus configured by ``TRAFALGAR_EVENT_BUS_PATH``."""
+
+    path = os.environ.get(EVENT_BUS_PATH_ENV)
+    if not path or not path.strip():
+        return None
+    try:
+        return SQLiteEventBus(path.strip())
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning(
+            "trafalgar.event_bus.unavailable",
+            env=EVENT_BUS_PATH_ENV,
+            value=path,
+            error=str(exc),
+        )
+        return None
+
+
+__all__ = [
+    "EVENT_BUS_PATH_ENV",
+    "EventBus",
+    "EventHandler",
+    "SQLiteEventBus",
+    "event_bus_from_env",
+]
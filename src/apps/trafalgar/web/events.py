@@ -3,26 +3,243 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import json
 import os
+import secrets
+import threading
+from collections import deque
 from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, replace
 from typing import Any
 
 import structlog
 
+from apps.trafalgar.web.event_bus import EventBus
+from apps.trafalgar.web.responses import render_json
+
 logger = structlog.get_logger(__name__)
 
+LAST_EVENT_ID_HEADER = "Last-Event-ID"
+DEFAULT_REPLAY_SIZE = 256
+RESYNC_EVENT = "stream.resync"
+
 _KEEPALIVE_ENV_CACHE: dict[str, tuple[str | None, float | None]] = {}
 _KEEPALIVE_STATE_CACHE: dict[tuple[int, str], tuple[Any, float | None]] = {}
 
 
+@dataclass(frozen=True, slots=True)
+class EventFrame:
+    """One published event, serialised once and shared by every subscriber.
+
+    ``id`` combines the broadcaster's epoch with the frame's ``sequence`` so a
+    ``Last-Event-ID`` issued by another process (or before a restart) is never
+    mistaken for a position in the current stream.
+    """
+
+    id: str
+    sequence: int
+    event: str | None
+    payload: Any
+    data: bytes
+    text: str
+    sse: bytes
+
+    @classmethod
+    def encode(
+        cls, payload: Any, *, epoch: str, sequence: int, event: str | None = None
+    ) -> "EventFrame":
+        return cls.build(
+            payload, render_json(payload), epoch=epoch, sequence=sequence, event=event
+        )
+
+    @classmethod
+    def build(
+        cls,
+        payload: Any,
+        data: bytes,
+        *,
+        epoch: str,
+        sequence: int,
+        event: str | None = None,
+    ) -> "EventFrame":
+        frame_id = f"{epoch}-{sequence}"
+        return cls(
+            id=frame_id,
+            sequence=sequence,
+            event=event,
+            payload=payload,
+            data=data,
+            text=data.decode("utf-8"),
+            sse=format_sse_chunk(event, data, event_id=frame_id),
+        )
+
+
+def format_sse_chunk(
+    event_name: str | None, payload: bytes, *, event_id: str | None = None
+) -> bytes:
+    """Return an SSE message for ``payload`` with optional ``event``/``id`` fields."""
+
+    lines: list[bytes] = []
+    if event_name:
+        lines.append(b"event: " + event_name.encode("utf-8"))
+    lines.append(b"data: " + payload)
+    if event_id:
+        lines.append(b"id: " + event_id.encode("utf-8"))
+    return b"\n".join(lines) + b"\n\n"
+
+
+@dataclass(slots=True)
+class EventBroadcasterStats:
+    """Counters describing how a broadcaster handled its event stream."""
+
+    subscribers: int = 0
+    published: int = 0
+    delivered: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    resyncs: int = 0
+    relayed: int = 0
+    received: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def _resync_frame() -> EventFrame:
+    data = render_json({"event": RESYNC_EVENT})
+    return EventFrame(
+        id="",
+        sequence=0,
+        event=RESYNC_EVENT,
+        payload={"event": RESYNC_EVENT},
+        data=data,
+        text=data.decode("utf-8"),
+        sse=format_sse_chunk(RESYNC_EVENT, data),
+    )
+
+
+RESYNC_FRAME = _resync_frame()
+
+
+def _coalesce_pending(
+    pending: tuple[Any, str | None], payload: Any, event: str | None
+) -> tuple[Any, str | None]:
+    """Fold a newer ``payload`` into the frame already pending for its key.
+
+    The latest payload always wins, but the burst keeps the event name of its
+    first frame so a creation followed by updates still reaches clients as a
+    creation. Removals replace the pending frame outright.
+    """
+
+    first_event = pending[1]
+    if first_event is None or first_event == event:
+        return payload, event
+    if event is not None and event.endswith(".removed"):
+        return payload, event
+    if isinstance(payload, dict) and payload.get("event") == event:
+        payload = {**payload, "event": first_event}
+    return payload, first_event
+
+
 class EventBroadcaster:
-    """Publish state updates to multiple subscribers with backpressure handling."""
+    """Publish state updates to multiple subscribers with backpressure handling.
+
+    Payloads are encoded into an :class:`EventFrame` once and the same frame is
+    queued for every subscriber. The most recent ``replay_size`` frames are
+    kept so reconnecting clients can resume from a ``Last-Event-ID`` through
+    :meth:`replay`.
+
+    Events published with a ``key`` are coalesced for ``coalesce_window``
+    seconds: only the latest payload per key is encoded and delivered when the
+    window closes. Subscriber queues hold at most ``max_buffer`` frames; a
+    subscriber that falls behind has its backlog discarded and receives
+    :data:`RESYNC_FRAME`, telling it to reload a snapshot before continuing.
+
+    With a ``bus``, every locally published frame is also relayed to other
+    processes on ``channel`` and frames they publish are delivered to local
+    subscribers as if they had been published here.
+    """
 
-    def __init__(self, max_buffer: int = 32) -> None:
-        self._max_buffer = max_buffer
+    def __init__(
+        self,
+        max_buffer: int = 32,
+        *,
+        replay_size: int = DEFAULT_REPLAY_SIZE,
+        coalesce_window: float = 0.0,
+        bus: EventBus | None = None,
+        channel: str = "events",
+    ) -> None:
+        self._max_buffer = max(max_buffer, 1)
+        self._coalesce_window = max(float(coalesce_window), 0.0)
         self._subscribers: set[asyncio.Queue[Any]] = set()
         self._loop: asyncio.AbstractEventLoop | None = None
-        self._lock: asyncio.Lock | None = None
+        self._epoch = secrets.token_hex(4)
+        self._sequence = itertools.count(1)
+        self._replay: deque[EventFrame] = deque(maxlen=max(replay_size, 0))
+        self._last_frame: EventFrame | None = None
+        # Guards the sequence, replay buffer, inbox, pending map, and counters.
+        # Publishers only hold it briefly; frames are encoded outside it.
+        self._state_lock = threading.Lock()
+        self._inbox: deque[EventFrame] = deque()
+        self._drain_scheduled = False
+        self._pending: dict[str, tuple[Any, str | None]] = {}
+        self._flush_armed = False
+        self._stats = EventBroadcasterStats()
+        self._bus = bus
+        self._channel = channel
+
+    @property
+    def coalesce_window(self) -> float:
+        return self._coalesce_window
+
+    @property
+    def stats(self) -> EventBroadcasterStats:
+        """Return a snapshot of the broadcaster's counters."""
+
+        with self._state_lock:
+            return replace(self._stats, subscribers=len(self._subscribers))
+
+    @property
+    def last_frame(self) -> EventFrame | None:
+        """Return the newest frame handed to subscribers, if any."""
+
+        with self._state_lock:
+            return self._last_frame
+
+    @property
+    def last_event_id(self) -> str | None:
+        """Return the id of the newest frame handed to subscribers."""
+
+        frame = self.last_frame
+        return frame.id if frame is not None else None
+
+    def replay(self, last_event_id: str | None) -> list[EventFrame] | None:
+        """Return the frames published after ``last_event_id``.
+
+        ``None`` means the id cannot be honoured, either because it belongs to
+        another epoch or because the frames after it were already evicted, and
+        the caller should fall back to a full snapshot.
+        """
+
+        if not last_event_id:
+            return None
+        epoch, _, raw_sequence = last_event_id.strip().rpartition("-")
+        if epoch != self._epoch:
+            return None
+        try:
+            sequence = int(raw_sequence)
+        except ValueError:
+            return None
+        with self._state_lock:
+            frames = list(self._replay)
+        if not frames:
+            return None if sequence > 0 else []
+        if sequence > frames[-1].sequence:
+            return None
+        if sequence < frames[0].sequence - 1:
+            return None
+        return [frame for frame in frames if frame.sequence > sequence]
 
     async def subscribe(self) -> asyncio.Queue[Any]:
         """Register a new subscriber and return its queue."""
@@ -32,26 +249,18 @@ class EventBroadcaster:
 
         if self._loop is None:
             self._loop = loop
-            self._lock = asyncio.Lock()
+            if self._bus is not None:
+                self._bus.subscribe(self._channel, self._receive)
         elif self._loop is not loop:
             raise RuntimeError("EventBroadcaster is bound to a different event loop")
 
-        lock = self._ensure_lock()
-
-        async with lock:
-            self._subscribers.add(queue)
+        self._subscribers.add(queue)
         return queue
 
     async def unsubscribe(self, queue: asyncio.Queue[Any]) -> None:
         """Remove a subscriber queue from the broadcast set."""
 
-        lock = self._lock
-        if lock is None:
-            self._subscribers.discard(queue)
-            return
-
-        async with lock:
-            self._subscribers.discard(queue)
+        self._subscribers.discard(queue)
 
     async def iter(self) -> AsyncIterator[Any]:
         """Yield events for the lifetime of the subscription."""
@@ -63,92 +272,174 @@ class EventBroadcaster:
         finally:
             await self.unsubscribe(queue)
 
-    def publish(self, payload: Any) -> None:
-        """Schedule an event for delivery to all subscribers."""
+    def publish(
+        self, payload: Any, *, event: str | None = None, key: str | None = None
+    ) -> None:
+        """Encode ``payload`` once and schedule it for every subscriber.
+
+        ``event`` becomes the SSE ``event:`` field; leave it unset for streams
+        whose clients listen for unnamed messages. ``key`` identifies the
+        entity the payload describes so bursts for it can be coalesced.
+        """
 
         loop = self._loop
         if loop is None:
+            # Nobody listens in this process, but other workers may.
+            if self._bus is not None:
+                with self._state_lock:
+                    self._stats.published += 1
+                self._relay([(render_json(payload), event)])
+            return
+        on_loop = _running_loop() is loop
+
+        if key is not None and self._coalesce_window > 0:
+            with self._state_lock:
+                self._stats.published += 1
+                pending = self._pending.get(key)
+                if pending is not None:
+                    self._stats.coalesced += 1
+                    payload, event = _coalesce_pending(pending, payload, event)
+                self._pending[key] = (payload, event)
+                if self._flush_armed:
+                    return
+                self._flush_armed = True
+            if on_loop:
+                self._arm_flush()
+            else:
+                loop.call_soon_threadsafe(self._arm_flush)
             return
 
-        try:
-            running_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            running_loop = None
-
-        if running_loop is loop:
-            loop.create_task(self._publish(payload))
+        data = render_json(payload)
+        self._relay([(data, event)])
+        with self._state_lock:
+            self._stats.published += 1
+            self._inbox.append(self._sequence_frame(payload, data, event))
+            if self._drain_scheduled and not on_loop:
+                return
+            self._drain_scheduled = True
+        if on_loop:
+            self._drain()
         else:
-            loop.call_soon_threadsafe(self._schedule_publish, payload)
-
-    def _schedule_publish(self, payload: Any) -> None:
-        """Enqueue a publish task from the broadcaster's event loop thread."""
+            loop.call_soon_threadsafe(self._drain)
 
-        loop = self._ensure_loop()
-        loop.create_task(self._publish(payload))
+    def _relay(self, encoded: list[tuple[bytes, str | None]]) -> None:
+        """Hand locally published frames to the cross-process bus."""
 
-    async def _publish(self, payload: Any) -> None:
-        """Dispatch payload to all subscribers respecting backpressure."""
-
-        lock = self._lock
-        if lock is None:
+        bus = self._bus
+        if bus is None or not encoded:
             return
+        for data, event in encoded:
+            bus.publish(self._channel, event, data)
+        with self._state_lock:
+            self._stats.relayed += len(encoded)
 
-        async with lock:
-            subscribers = list(self._subscribers)
+    def _receive(self, event: str | None, data: bytes) -> None:
+        """Accept a frame another process published; runs on the bus thread."""
 
-        if not subscribers:
+        loop = self._loop
+        if loop is None:  # pragma: no cover - the bus is joined on first subscribe
             return
+        payload = json.loads(data)
+        with self._state_lock:
+            self._stats.received += 1
+            self._inbox.append(self._sequence_frame(payload, data, event))
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        try:
+            loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:  # pragma: no cover - the loop has been closed
+            with self._state_lock:
+                self._drain_scheduled = False
+
+    def _sequence_frame(
+        self, payload: Any, data: bytes, event: str | None
+    ) -> EventFrame:
+        """Assign the next sequence id; the caller holds ``_state_lock``."""
+
+        frame = EventFrame.build(
+            payload, data, epoch=self._epoch, sequence=next(self._sequence), event=event
+        )
+        self._replay.append(frame)
+        self._last_frame = frame
+        return frame
 
-        to_remove: list[asyncio.Queue[Any]] = []
-        for queue in subscribers:
-            if not self._offer(queue, payload):
-                to_remove.append(queue)
-
-        if to_remove:
-            async with lock:
-                for queue in to_remove:
-                    removed = queue in self._subscribers
-                    self._subscribers.discard(queue)
-                    if removed:
-                        logger.warning(
-                            "trafalgar.events.dropped_subscriber", queue_id=id(queue)
-                        )
-
-    def _offer(self, queue: asyncio.Queue[Any], payload: Any) -> bool:
-        """Attempt to enqueue ``payload`` without blocking.
-
-        Returns ``True`` if the payload was enqueued or ``False`` when the
-        subscriber was dropped because it could not keep up with the stream.
+    def _arm_flush(self) -> None:
+        loop = self._loop
+        if loop is None:  # pragma: no cover - publish requires a bound loop
+            return
+        loop.call_later(self._coalesce_window, self._flush)
+
+    def _flush(self) -> None:
+        """Encode and deliver the latest payload for every coalesced key."""
+
+        with self._state_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._flush_armed = False
+        encoded = [(payload, render_json(payload), event) for payload, event in pending]
+        self._relay([(data, event) for _, data, event in encoded])
+        with self._state_lock:
+            for payload, data, event in encoded:
+                self._inbox.append(self._sequence_frame(payload, data, event))
+            self._drain_scheduled = True
+        self._drain()
+
+    def _drain(self) -> None:
+        """Deliver queued frames in sequence order from the loop thread."""
+
+        with self._state_lock:
+            frames = list(self._inbox)
+            self._inbox.clear()
+            self._drain_scheduled = False
+        if not frames:
+            return
+        dropped = resyncs = 0
+        for frame in frames:
+            for queue in self._subscribers:
+                lost = self._offer(queue, frame)
+                if lost:
+                    dropped += lost
+                    resyncs += 1
+        with self._state_lock:
+            self._stats.delivered += len(frames)
+            self._stats.dropped += dropped
+            self._stats.resyncs += resyncs
+
+    def _offer(self, queue: asyncio.Queue[Any], frame: EventFrame) -> int:
+        """Enqueue ``frame`` without blocking and return how many were dropped.
+
+        A full queue means the subscriber cannot keep up: its backlog and
+        ``frame`` are discarded and replaced by :data:`RESYNC_FRAME`.
         """
+
         try:
-            queue.put_nowait(payload)
-            return True
+            queue.put_nowait(frame)
+            return 0
         except asyncio.QueueFull:
+            pass
+        lost = 1
+        while True:
             try:
                 queue.get_nowait()
-            except asyncio.QueueEmpty:  # pragma: no cover - defensive guard
-                pass
-            try:
-                queue.put_nowait(payload)
-                logger.warning(
-                    "trafalgar.events.backpressure", queue_id=id(queue), action="trim"
-                )
-                return True
-            except asyncio.QueueFull:
-                logger.warning(
-                    "trafalgar.events.backpressure", queue_id=id(queue), action="drop"
-                )
-                return False
-
-    def _ensure_lock(self) -> asyncio.Lock:
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-        return self._lock
-
-    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
-        loop = self._loop or asyncio.get_event_loop()
-        self._loop = loop
-        return loop
+            except asyncio.QueueEmpty:
+                break
+            lost += 1
+        queue.put_nowait(RESYNC_FRAME)
+        logger.warning(
+            "trafalgar.events.backpressure",
+            queue_id=id(queue),
+            action="resync",
+            dropped=lost,
+        )
+        return lost
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
 
 
 def _parse_keepalive_value(
@@ -256,3 +547,17 @@ def clear_keepalive_caches() -> None:
 
     _KEEPALIVE_ENV_CACHE.clear()
     _KEEPALIVE_STATE_CACHE.clear()
+
+
+__all__ = [
+    "DEFAULT_REPLAY_SIZE",
+    "EventBroadcaster",
+    "EventBroadcasterStats",
+    "EventFrame",
+    "LAST_EVENT_ID_HEADER",
+    "RESYNC_EVENT",
+    "RESYNC_FRAME",
+    "clear_keepalive_caches",
+    "format_sse_chunk",
+    "resolve_keepalive_interval",
+]
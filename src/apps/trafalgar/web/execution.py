@@ -0,0 +1,334 @@
+"""Execution helpers that keep blocking integrations off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, Mapping, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+BLOCKING_WORKERS_ENV = "TRAFALGAR_BLOCKING_WORKERS"
+SOURCE_TIMEOUT_ENV = "TRAFALGAR_SOURCE_TIMEOUT"
+_DEFAULT_BLOCKING_WORKERS = 8
+_DEFAULT_SOURCE_WORKERS = 4
+_DEFAULT_SOURCE_TIMEOUT = 10.0
+
+
+def _positive_int_from_env(env_name: str, default: int) -> int:
+    raw_value = os.environ.get(env_name)
+    if raw_value is None:
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError:
+        logger.warning("trafalgar.execution.env_invalid", env=env_name, value=raw_value)
+        return default
+    if value <= 0:
+        logger.warning("trafalgar.execution.env_ignored", env=env_name, value=raw_value)
+        return default
+    return value
+
+
+def _positive_float_from_env(env_name: str, default: float | None) -> float | None:
+    raw_value = os.environ.get(env_name)
+    if raw_value is None:
+        return default
+    try:
+        value = float(raw_value)
+    except ValueError:
+        logger.warning("trafalgar.execution.env_invalid", env=env_name, value=raw_value)
+        return default
+    if value <= 0:
+        logger.warning("trafalgar.execution.env_ignored", env=env_name, value=raw_value)
+        return default
+    return value
+
+
+class BlockingExecutor:
+    """Run synchronous provider calls on a bounded thread pool.
+
+    Async handlers await :meth:`run` instead of calling ShotGrid, reconcile,
+    ingest, or render adapters directly so that a slow integration only
+    occupies one of ``max_workers`` threads rather than the event loop.
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, *, thread_name_prefix: str = "trafalgar"
+    ) -> None:
+        workers = max_workers or _positive_int_from_env(
+            BLOCKING_WORKERS_ENV, _DEFAULT_BLOCKING_WORKERS
+        )
+        self._max_workers = max(1, int(workers))
+        self._thread_name_prefix = thread_name_prefix
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of concurrent blocking calls."""
+
+        return self._max_workers
+
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix=self._thread_name_prefix,
+                )
+            return self._pool
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Execute ``func`` in the pool and await its result."""
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        return await loop.run_in_executor(self._ensure_pool(), call)
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply ``func`` to ``items`` in the pool from synchronous code.
+
+        Must not be called from one of this executor's own threads, which
+        could wait on work queued behind itself.
+        """
+
+        return list(self._ensure_pool().map(func, items))
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        """Release the worker threads; the pool is recreated on next use."""
+
+        with self._lock:
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class AsyncRateLimiter:
+    """Space out acquisitions so at most ``rate`` start per second.
+
+    Each :meth:`acquire` reserves the next free slot and sleeps until it is
+    reached, so concurrent callers are released in arrival order without
+    bursting. The limiter holds no loop-bound state and can be shared by
+    calls made on different event loops.
+    """
+
+    def __init__(
+        self, rate: float, *, clock: Callable[[], float] | None = None
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._interval = 1.0 / float(rate)
+        self._clock = clock or time.monotonic
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return 1.0 / self._interval
+
+    def reserve(self) -> float:
+        """Claim the next slot and return how long to wait for it."""
+
+        with self._lock:
+            now = self._clock()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._interval
+            return slot - now
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncConcurrencyLimiter:
+    """Admit at most ``limit`` concurrent holders, in arrival order.
+
+    Unlike :class:`asyncio.Semaphore` the limiter holds no loop-bound state:
+    waiters from different event loops share the same slots, and a released
+    slot is handed directly to the oldest waiter on that waiter's loop.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self._limit = int(limit)
+        self._active = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = (
+            deque()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._active < self._limit and not self._waiters:
+                self._active += 1
+                return
+            waiter: asyncio.Future[None] = loop.create_future()
+            self._waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, waiter))
+                except ValueError:
+                    granted = True
+                else:
+                    granted = False
+            if granted:
+                # The slot was handed over before the cancellation landed.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_grant_slot, waiter)
+                except RuntimeError:  # pragma: no cover - waiter's loop closed
+                    continue
+                return
+            self._active -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+def _grant_slot(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_SHARED_EXECUTOR: BlockingExecutor | None = None
+_SOURCE_EXECUTORS: dict[str, BlockingExecutor] = {}
+_SHARED_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_blocking_executor() -> BlockingExecutor:
+    """Return the process-wide executor used by Trafalgar web services."""
+
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        if _SHARED_EXECUTOR is None:
+            _SHARED_EXECUTOR = BlockingExecutor(thread_name_prefix="trafalgar-io")
+        return _SHARED_EXECUTOR
+
+
+def get_source_executor(source: str) -> BlockingExecutor:
+    """Return the executor dedicated to one integration (a bulkhead).
+
+    Calls that outlive their timeout keep running on their thread, so each
+    source gets its own pool: hung ShotGrid calls can only exhaust the
+    ShotGrid pool while other sources and endpoints keep their threads. The
+    size comes from ``TRAFALGAR_BLOCKING_WORKERS_<SOURCE>`` (default ``4``).
+    """
+
+    name = source.strip().lower()
+    with _SHARED_EXECUTOR_LOCK:
+        executor = _SOURCE_EXECUTORS.get(name)
+        if executor is None:
+            workers = _positive_int_from_env(
+                f"{BLOCKING_WORKERS_ENV}_{name.upper().replace('.', '_')}",
+                _DEFAULT_SOURCE_WORKERS,
+            )
+            executor = BlockingExecutor(workers, thread_name_prefix=f"trafalgar-{name}")
+            _SOURCE_EXECUTORS[name] = executor
+        return executor
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run ``func`` on the shared bounded executor."""
+
+    return await get_blocking_executor().run(func, *args, **kwargs)
+
+
+async def run_for_source(
+    source: str, func: Callable[..., T], /, *args: Any, **kwargs: Any
+) -> T:
+    """Run ``func`` on the executor dedicated to ``source``."""
+
+    return await get_source_executor(source).run(func, *args, **kwargs)
+
+
+def resolve_source_timeout(name: str, default: float | None = None) -> float | None:
+    """Return the timeout in seconds for the named data source.
+
+    ``TRAFALGAR_SOURCE_TIMEOUT_<NAME>`` overrides ``TRAFALGAR_SOURCE_TIMEOUT``
+    which in turn overrides ``default``.
+    """
+
+    fallback = default if default is not None else _DEFAULT_SOURCE_TIMEOUT
+    base = _positive_float_from_env(SOURCE_TIMEOUT_ENV, fallback)
+    specific_env = f"{SOURCE_TIMEOUT_ENV}_{name.strip().upper()}"
+    return _positive_float_from_env(specific_env, base)
+
+
+async def gather_sources(
+    sources: Mapping[str, Callable[[], Awaitable[Any]]],
+    *,
+    timeouts: Mapping[str, float | None] | None = None,
+    defaults: Mapping[str, Any] | None = None,
+    log_key: str = "trafalgar.sources",
+) -> tuple[dict[str, Any], list[str]]:
+    """Await independent sources concurrently with per-source timeouts.
+
+    Returns the collected results and the sorted names of sources that timed
+    out or failed. Degraded sources are reported with their entry from
+    ``defaults`` (or ``None``) so callers can still render partial payloads.
+    """
+
+    timeout_map = timeouts or {}
+    default_map = defaults or {}
+
+    async def _collect(name: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        timeout = timeout_map.get(name, resolve_source_timeout(name))
+        return await asyncio.wait_for(factory(), timeout=timeout)
+
+    names = list(sources)
+    outcomes = await asyncio.gather(
+        *(_collect(name, sources[name]) for name in names),
+        return_exceptions=True,
+    )
+
+    results: dict[str, Any] = {}
+    degraded: list[str] = []
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(f"{log_key}.timeout", source=name)
+            else:
+                logger.warning(
+                    f"{log_key}.failed",
+                    source=name,
+                    error=str(outcome),
+                    error_type=type(outcome).__name__,
+                )
+            degraded.append(name)
+            results[name] = default_map.get(name)
+            continue
+        results[name] = outcome
+    return results, sorted(degraded)
@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from functools import lru_cache
 from dataclasses import asdict
 from datetime import datetime
 from typing import (
@@ -23,7 +24,22 @@ from starlette.responses import Response
 from starlette.websockets import WebSocketDisconnect
 
 from apps.trafalgar.version import TRAFALGAR_VERSION
-from apps.trafalgar.web.events import EventBroadcaster, resolve_keepalive_interval
+from apps.trafalgar.web.event_bus import event_bus_from_env
+from apps.trafalgar.web.events import (
+    EventBroadcaster,
+    EventFrame,
+    resolve_keepalive_interval,
+)
+from apps.trafalgar.web.pagination import (
+    CollectionQuery,
+    CursorKey,
+    Page,
+    apply_page_headers,
+    build_collection_query,
+    paginate,
+    select_fields,
+    sortable_timestamp,
+)
 from apps.trafalgar.web.security import (
     AuthenticatedPrincipal,
     ROLE_INGEST_READ,
@@ -33,6 +49,14 @@ from apps.trafalgar.web.security import (
 from libraries.automation.ingest.registry import IngestRunRecord, IngestRunRegistry
 from libraries.automation.ingest.service import IngestReport, IngestedMedia
 
+from .conditional import (
+    apply_cache_headers,
+    compute_etag,
+    etag_matches,
+    not_modified,
+)
+from .responses import FastJSONResponse, compressed_route_class
+
 logger = structlog.get_logger(__name__)
 
 INGEST_SSE_KEEPALIVE_INTERVAL_ENV = "TRAFALGAR_INGEST_SSE_KEEPALIVE_INTERVAL"
@@ -66,12 +90,20 @@ def _serialise_datetime(value: datetime | None) -> str | None:
     return value.isoformat() if value is not None else None
 
 
+def _run_status(record: IngestRunRecord) -> str:
+    return "completed" if record.completed_at else "running"
+
+
+def _run_cursor_key(record: IngestRunRecord) -> CursorKey:
+    return (sortable_timestamp(record.started_at), record.run_id)
+
+
 def _serialise_run(record: IngestRunRecord) -> Mapping[str, Any]:
     return {
         "id": record.run_id,
         "started_at": _serialise_datetime(record.started_at),
         "completed_at": _serialise_datetime(record.completed_at),
-        "status": "completed" if record.completed_at else "running",
+        "status": _run_status(record),
         "report": _serialise_report(record.report),
     }
 
@@ -82,6 +114,10 @@ class IngestRunProvider:
     def __init__(self, registry: IngestRunRegistry | None = None) -> None:
         self._registry = registry or IngestRunRegistry()
 
+    @property
+    def data_generation(self) -> int:
+        return int(self._registry.generation)
+
     def _cached_runs(self, *, refresh: bool = False) -> list[IngestRunRecord]:
         return cast(
             list[IngestRunRecord], self._registry.load_all(force_refresh=refresh)
@@ -119,12 +155,42 @@ class IngestRunService:
         self._events = broadcaster
         self._snapshots: dict[str, str] = {}
 
+    @property
+    def data_generation(self) -> int | None:
+        """Return the provider's generation counter when it exposes one."""
+
+        generation = getattr(self._provider, "data_generation", None)
+        return generation if isinstance(generation, int) else None
+
     def list_runs(self, limit: int) -> list[Mapping[str, Any]]:
         records = self._provider.load_recent_runs(limit)
         payloads = [self._serialize(record) for record in records]
         self._sync_events(payloads)
         return payloads
 
+    def page_runs(self, query: CollectionQuery) -> Page[Mapping[str, Any]]:
+        """Return one page of runs, newest first, serialising only that page."""
+
+        # The provider orders by start time only; sort by the full cursor key
+        # so runs sharing a timestamp page deterministically by id.
+        records = sorted(
+            (
+                record
+                for record in self._provider.load_recent_runs(None)
+                if query.matches_timestamp(record.started_at)
+                and query.matches_status(_run_status(record))
+            ),
+            key=_run_cursor_key,
+            reverse=True,
+        )
+        page = paginate(records, key=_run_cursor_key, query=query)
+        payloads = [self._serialize(record) for record in page.items]
+        self._sync_events(payloads)
+        return Page(
+            items=[select_fields(payload, query.fields) for payload in payloads],
+            next_cursor=page.next_cursor,
+        )
+
     def get_run(self, run_id: str) -> Mapping[str, Any]:
         record = self._provider.get_run(run_id)
         if record is None:
@@ -163,14 +229,22 @@ class IngestRunService:
             self._events.publish({"event": "run.removed", "run": {"id": run_id}})
 
 
-INGEST_EVENTS = EventBroadcaster(max_buffer=64)
+INGEST_EVENTS = EventBroadcaster(
+    max_buffer=64, replay_size=0, bus=event_bus_from_env(), channel="ingest.runs"
+)
 
 
+@lru_cache(maxsize=1)
 def get_ingest_run_service() -> IngestRunService:  # pragma: no cover - runtime wiring
     return IngestRunService(broadcaster=INGEST_EVENTS)
 
 
-app = FastAPI(title="OnePiece Ingest Runs", version=TRAFALGAR_VERSION)
+app = FastAPI(
+    title="OnePiece Ingest Runs",
+    version=TRAFALGAR_VERSION,
+    default_response_class=FastJSONResponse,
+)
+app.router.route_class = compressed_route_class()
 router = create_protected_router()
 
 
@@ -198,12 +272,39 @@ def root(
 
 @router.get("/runs")  # type: ignore[misc]
 async def list_runs(
+    request: Request,
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from a previous X-Next-Cursor header."
+    ),
+    status: list[str] | None = Query(
+        None, description="Filter by run status (running or completed)."
+    ),
+    since: datetime | None = Query(
+        None, description="Only include runs started at or after this time."
+    ),
+    until: datetime | None = Query(
+        None, description="Only include runs started at or before this time."
+    ),
+    fields: list[str] | None = Query(None, description="Top-level fields to include."),
     service: IngestRunService = Depends(get_ingest_run_service),
     _principal: AuthenticatedPrincipal = Depends(require_roles(ROLE_INGEST_READ)),
-) -> JSONResponse:
-    payload = service.list_runs(limit)
-    return JSONResponse(content=payload)
+) -> Response:
+    query = build_collection_query(
+        limit=limit,
+        cursor=cursor,
+        status_values=status,
+        since=since,
+        until=until,
+        fields=fields,
+    )
+    etag = compute_etag("ingest.runs", service.data_generation, params=query.cache_key)
+    if etag_matches(request, etag):
+        return not_modified(cast(str, etag))
+    page = service.page_runs(query)
+    response = FastJSONResponse(content=page.items)
+    apply_page_headers(request, response, page.next_cursor)
+    return apply_cache_headers(response, etag)
 
 
 def _resolve_ingest_keepalive_interval(request: Request) -> float:
@@ -226,14 +327,15 @@ async def _ingest_event_stream(
         while True:
             try:
                 interval = _resolve_ingest_keepalive_interval(request)
-                event = await asyncio.wait_for(queue.get(), timeout=interval)
+                frame: EventFrame = await asyncio.wait_for(
+                    queue.get(), timeout=interval
+                )
             except asyncio.TimeoutError:
                 if await request.is_disconnected():
                     break
                 yield b"data: {}\n\n"
                 continue
-            payload = json.dumps(event).encode("utf-8")
-            yield b"data: " + payload + b"\n\n"
+            yield b"data: " + frame.data + b"\n\n"
     finally:
         await INGEST_EVENTS.unsubscribe(queue)
 
@@ -257,8 +359,8 @@ async def runs_websocket(
     queue = await INGEST_EVENTS.subscribe()
     try:
         while True:
-            event = await queue.get()
-            await websocket.send_json(event)
+            frame: EventFrame = await queue.get()
+            await websocket.send_text(frame.text)
     except WebSocketDisconnect:
         pass
     finally:
@@ -275,7 +377,7 @@ async def get_run(
         payload = service.get_run(run_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Run not found") from exc
-    return JSONResponse(content=payload)
+    return FastJSONResponse(content=payload)
 
 
 @router.get("/health")  # type: ignore[misc]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Mapping, Sequence, cast
 
 from .ingest import IngestRunService
@@ -80,10 +81,28 @@ class IngestRunDashboardFacade:
     def __init__(self, service: IngestRunService | None = None) -> None:
         self._service = service or IngestRunService()
 
+    @property
+    def data_generation(self) -> int | None:
+        return self._service.data_generation
+
     def summarise_recent_runs(self, limit: int = RECENT_RUN_LIMIT) -> dict[str, Any]:
         runs = self._service.list_runs(limit)
         return self._summarise_runs(runs)
 
+    def summarise_recent_runs_with_generation(
+        self, limit: int = RECENT_RUN_LIMIT
+    ) -> tuple[dict[str, Any], int | None]:
+        """Return the run summary with a generation no newer than its data.
+
+        The registry generation is a fingerprint of the file rather than a
+        counter guarded together with the records, so it is read before the
+        runs: a write racing the listing can only make the tag older than the
+        payload, which costs a refetch rather than a stale ``304``.
+        """
+
+        generation = self._service.data_generation
+        return self.summarise_recent_runs(limit), generation
+
     def _summarise_runs(self, runs: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
         successes = [
             _parse_timestamp(run.get("completed_at"))
@@ -119,6 +138,7 @@ class IngestRunDashboardFacade:
         return summary
 
 
+@lru_cache(maxsize=1)
 def get_ingest_dashboard_facade() -> (
     IngestRunDashboardFacade
 ):  # pragma: no cover - runtime wiring
@@ -0,0 +1,198 @@
+"""Secondary indexes over render jobs for filtered, ordered listings."""
+
+from __future__ import annotations
+
+import bisect
+from typing import Collection, Generic, Iterator, Mapping, TypeVar
+
+from apps.trafalgar.web.pagination import CursorKey
+
+V = TypeVar("V")
+
+INDEXED_FIELDS = ("farm", "status", "user")
+
+
+def _normalise(value: str | None) -> str | None:
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    return text or None
+
+
+class JobIndex(Generic[V]):
+    """Ordered view cache with posting sets for the filterable job fields.
+
+    Each job is stored under its cursor key together with a read-only view
+    (the snapshot handed to readers) and its normalised ``farm``, ``status``,
+    and ``user`` values. Writers call :meth:`upsert` and :meth:`remove` on
+    every state transition; :meth:`select` answers filtered queries from the
+    posting sets, so its cost follows the number of matching jobs rather than
+    the size of the history. The index does no locking of its own.
+    """
+
+    def __init__(self) -> None:
+        self._order: list[CursorKey] = []
+        self._keys: dict[str, CursorKey] = {}
+        self._views: dict[str, V] = {}
+        self._values: dict[str, dict[str, str]] = {}
+        self._postings: dict[str, dict[str, set[str]]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def clear(self) -> None:
+        self._order.clear()
+        self._keys.clear()
+        self._views.clear()
+        self._values.clear()
+        for postings in self._postings.values():
+            postings.clear()
+
+    def upsert(
+        self,
+        job_id: str,
+        key: CursorKey,
+        view: V,
+        values: Mapping[str, str | None],
+    ) -> None:
+        """Store ``view`` for ``job_id`` and re-index its field ``values``."""
+
+        previous_key = self._keys.get(job_id)
+        if previous_key != key:
+            if previous_key is not None:
+                self._discard_key(previous_key)
+            bisect.insort(self._order, key)
+            self._keys[job_id] = key
+        self._views[job_id] = view
+
+        current = self._values.setdefault(job_id, {})
+        for name in INDEXED_FIELDS:
+            value = _normalise(values.get(name))
+            old = current.get(name)
+            if old == value:
+                continue
+            postings = self._postings[name]
+            if old is not None:
+                self._discard_posting(postings, old, job_id)
+                del current[name]
+            if value is not None:
+                postings.setdefault(value, set()).add(job_id)
+                current[name] = value
+
+    def remove(self, job_id: str) -> None:
+        """Forget ``job_id`` and drop it from every posting set."""
+
+        key = self._keys.pop(job_id, None)
+        if key is not None:
+            self._discard_key(key)
+        self._views.pop(job_id, None)
+        for name, value in self._values.pop(job_id, {}).items():
+            self._discard_posting(self._postings[name], value, job_id)
+
+    def _discard_key(self, key: CursorKey) -> None:
+        position = bisect.bisect_left(self._order, key)
+        if position < len(self._order) and self._order[position] == key:
+            del self._order[position]
+
+    @staticmethod
+    def _discard_posting(
+        postings: dict[str, set[str]], value: str, job_id: str
+    ) -> None:
+        members = postings.get(value)
+        if members is None:
+            return
+        members.discard(job_id)
+        if not members:
+            del postings[value]
+
+    def _matching_ids(
+        self, filters: Mapping[str, Collection[str] | None]
+    ) -> set[str] | None:
+        selected: list[set[str]] = []
+        for name, values in filters.items():
+            if values is None:
+                continue
+            postings = self._postings[name]
+            matches: set[str] = set()
+            for value in values:
+                normalised = _normalise(value)
+                if normalised is not None:
+                    matches.update(postings.get(normalised, ()))
+            selected.append(matches)
+        if not selected:
+            return None
+        selected.sort(key=len)
+        return selected[0].intersection(*selected[1:])
+
+    def select(
+        self,
+        *,
+        filters: Mapping[str, Collection[str] | None] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        before: CursorKey | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[CursorKey, V]]:
+        """Return matching ``(key, view)`` pairs, newest first.
+
+        ``filters`` maps indexed field names to accepted values (``None``
+        disables a filter). ``since``/``until`` bound the timestamp part of the
+        key inclusively and ``before`` keeps only keys below a cursor.
+        """
+
+        if limit is not None and limit <= 0:
+            return []
+        matching = self._matching_ids(filters or {})
+        if matching is None:
+            keys: Iterator[CursorKey] = self._range(since, until, before)
+        else:
+            keys = iter(
+                sorted(
+                    (
+                        key
+                        for key in (self._keys[job_id] for job_id in matching)
+                        if self._in_range(key, since, until, before)
+                    ),
+                    reverse=True,
+                )
+            )
+        result: list[tuple[CursorKey, V]] = []
+        for key in keys:
+            result.append((key, self._views[key[-1]]))
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def _range(
+        self, since: str | None, until: str | None, before: CursorKey | None
+    ) -> Iterator[CursorKey]:
+        low = 0 if since is None else bisect.bisect_left(self._order, (since,))
+        high = len(self._order)
+        if until is not None:
+            # Every key whose timestamp equals ``until`` sorts below this probe.
+            high = bisect.bisect_left(self._order, (until + "\x00",))
+        if before is not None:
+            high = min(high, bisect.bisect_left(self._order, before))
+        for position in range(high - 1, low - 1, -1):
+            yield self._order[position]
+
+    @staticmethod
+    def _in_range(
+        key: CursorKey,
+        since: str | None,
+        until: str | None,
+        before: CursorKey | None,
+    ) -> bool:
+        stamp = key[0]
+        if since is not None and stamp < since:
+            return False
+        if until is not None and stamp > until:
+            return False
+        if before is not None and key >= before:
+            return False
+        return True
+
+
+__all__ = ["INDEXED_FIELDS", "JobIndex"]
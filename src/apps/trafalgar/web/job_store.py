@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, TYPE_CHECKING
+from typing import Any, Iterable, Iterator, TYPE_CHECKING
 
 import structlog
 
@@ -17,6 +18,8 @@ if TYPE_CHECKING:  # pragma: no cover - import only used for typing
 
 logger = structlog.get_logger(__name__)
 
+DEFAULT_COMPACT_MIN_ENTRIES = 1000
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -41,6 +44,9 @@ class JobStoreStats:
     last_save_at: datetime | None = None
     last_rotation_at: datetime | None = None
     last_rotation_error: str | None = None
+    journal_entries: int = 0
+    last_append_at: datetime | None = None
+    last_compaction_at: datetime | None = None
 
     def to_dict(self) -> dict[str, object]:
         data = asdict(self)
@@ -55,18 +61,33 @@ class JobStoreStats:
         data["last_load_at"] = _serialise_datetime(self.last_load_at)
         data["last_save_at"] = _serialise_datetime(self.last_save_at)
         data["last_rotation_at"] = _serialise_datetime(self.last_rotation_at)
+        data["last_append_at"] = _serialise_datetime(self.last_append_at)
+        data["last_compaction_at"] = _serialise_datetime(self.last_compaction_at)
         return data
 
 
 class JobStore:
-    """Lightweight JSON backed store for render job records."""
+    """Lightweight JSON backed store for render job records.
+
+    The store keeps a compact JSON snapshot at ``path`` and an append-only
+    journal of JSON lines next to it. :meth:`append` records individual job
+    changes in the journal, :meth:`compact` folds the journal back into the
+    snapshot (applying retention), and :meth:`load` replays the journal on top
+    of the snapshot. :meth:`save` still rewrites the full snapshot.
+    """
 
     def __init__(
-        self, path: os.PathLike[str] | str, *, retention: timedelta | None = None
+        self,
+        path: os.PathLike[str] | str,
+        *,
+        retention: timedelta | None = None,
+        compact_min_entries: int = DEFAULT_COMPACT_MIN_ENTRIES,
     ) -> None:
         self._path = Path(path)
         self._retention = retention
+        self._compact_min_entries = max(1, compact_min_entries)
         self._stats = JobStoreStats(retention=retention)
+        self._journal_lock = threading.Lock()
 
     @property
     def path(self) -> Path:
@@ -74,12 +95,34 @@ class JobStore:
 
         return self._path
 
+    @property
+    def journal_path(self) -> Path:
+        """Return the path of the append-only change journal."""
+
+        return self._path.with_suffix(self._path.suffix + ".journal")
+
+    @property
+    def _compacting_path(self) -> Path:
+        return self._path.with_suffix(self._path.suffix + ".journal.compacting")
+
     @property
     def stats(self) -> JobStoreStats:
         """Expose store metrics for health endpoints."""
 
         return self._stats
 
+    @property
+    def needs_compaction(self) -> bool:
+        """Return whether the journal has outgrown the snapshot.
+
+        Compaction is due once the journal holds at least as many entries as
+        the snapshot holds records (and no fewer than ``compact_min_entries``),
+        which keeps its amortised cost proportional to the appended changes.
+        """
+
+        threshold = max(self._compact_min_entries, self._stats.retained_records)
+        return self._stats.journal_entries >= threshold
+
     def _apply_retention(
         self, records: list[_JobRecord], *, now: datetime | None = None
     ) -> tuple[list[_JobRecord], int]:
@@ -103,7 +146,7 @@ class JobStore:
         self, records: list[_JobRecord], *, now: datetime | None = None
     ) -> None:
         payload = [record.to_storage() for record in records]
-        serialised = json.dumps(payload, indent=2, sort_keys=True)
+        serialised = json.dumps(payload, separators=(",", ":"))
 
         moment = now or _utcnow()
         self._path.parent.mkdir(parents=True, exist_ok=True)
@@ -146,14 +189,8 @@ class JobStore:
         self._stats.last_save_at = moment
         self._stats.retained_records = len(records)
 
-    def load(self) -> list[_JobRecord]:
-        """Load job records from disk."""
-
-        from .render import _JobRecord  # Local import to avoid circular dependency
-
-        self._stats.last_load_at = _utcnow()
+    def _read_snapshot(self) -> list[dict[str, Any]]:
         if not self._path.exists():
-            self._stats.retained_records = 0
             return []
         try:
             raw_data = self._path.read_text(encoding="utf-8")
@@ -161,7 +198,6 @@ class JobStore:
             logger.warning(
                 "render.store.read_failed", path=str(self._path), error=str(exc)
             )
-            self._stats.retained_records = 0
             return []
         try:
             payload = json.loads(raw_data or "[]")
@@ -169,18 +205,60 @@ class JobStore:
             logger.warning(
                 "render.store.decode_failed", path=str(self._path), error=str(exc)
             )
-            self._stats.retained_records = 0
             return []
-
-        records: list[_JobRecord] = []
         if not isinstance(payload, list):
             logger.warning("render.store.invalid_payload", path=str(self._path))
-            self._stats.retained_records = 0
             return []
+        return [item for item in payload if isinstance(item, dict)]
 
-        for item in payload:
-            if not isinstance(item, dict):
-                continue
+    def _read_journal(self, path: Path) -> Iterator[dict[str, Any]]:
+        try:
+            handle = path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        except OSError as exc:  # pragma: no cover - defensive guard
+            logger.warning("render.store.read_failed", path=str(path), error=str(exc))
+            return
+        with handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line is expected after a crash mid-append.
+                    logger.warning(
+                        "render.store.journal_entry_invalid",
+                        path=str(path),
+                        line=line_number,
+                    )
+                    continue
+                if isinstance(entry, dict):
+                    yield entry
+
+    def load(self) -> list[_JobRecord]:
+        """Load job records from the snapshot and replay the journal."""
+
+        from .render import _JobRecord  # Local import to avoid circular dependency
+
+        self._stats.last_load_at = _utcnow()
+        payloads: dict[str, dict[str, Any]] = {}
+        for item in self._read_snapshot():
+            payloads[str(item.get("job_id"))] = item
+
+        replayed = 0
+        for journal in (self._compacting_path, self.journal_path):
+            for entry in self._read_journal(journal):
+                replayed += 1
+                operation = entry.get("op")
+                if operation == "put" and isinstance(entry.get("job"), dict):
+                    job = entry["job"]
+                    payloads[str(job.get("job_id"))] = job
+                elif operation == "delete":
+                    payloads.pop(str(entry.get("job_id")), None)
+
+        records: list[_JobRecord] = []
+        for item in payloads.values():
             try:
                 record = _JobRecord.from_storage(item)
             except Exception as exc:  # pragma: no cover - defensive guard
@@ -193,25 +271,94 @@ class JobStore:
         retained, removed = self._apply_retention(records, now=now)
         if removed:
             self._record_prune(removed, now=now)
+        self._stats.retained_records = len(retained)
+        self._stats.journal_entries = replayed
+        if removed or replayed:
             try:
-                self._write_payload(retained, now=now)
+                self.begin_compaction()
+                self.compact(retained)
             except OSError as exc:  # pragma: no cover - defensive guard
                 logger.warning(
                     "render.store.compaction_failed",
                     path=str(self._path),
                     error=str(exc),
                 )
-        else:
-            self._stats.retained_records = len(retained)
         return retained
 
-    def save(self, records: Iterable[_JobRecord]) -> None:
-        """Persist the supplied job records to disk."""
-
-        materialised = list(records)
-        materialised.sort(key=lambda entry: entry.created_at)
+    def append(
+        self,
+        records: Iterable[_JobRecord],
+        *,
+        removed: Iterable[str] = (),
+    ) -> None:
+        """Append changed ``records`` and ``removed`` job IDs to the journal.
+
+        Each change is written as one compact JSON line, so the cost is
+        proportional to the change rather than the retained history.
+        """
+
+        lines = [
+            json.dumps({"op": "put", "job": record.to_storage()}, separators=(",", ":"))
+            for record in records
+        ]
+        lines.extend(
+            json.dumps({"op": "delete", "job_id": job_id}, separators=(",", ":"))
+            for job_id in removed
+        )
+        if not lines:
+            return
+        with self._journal_lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+                handle.flush()
+            self._stats.journal_entries += len(lines)
+            self._stats.last_append_at = _utcnow()
+
+    def begin_compaction(self) -> None:
+        """Set the current journal aside so new appends start a fresh one.
+
+        Call this before capturing the records passed to :meth:`compact`: any
+        change appended afterwards lands in the new journal and survives the
+        compaction.
+        """
+
+        with self._journal_lock:
+            journal = self.journal_path
+            if not journal.exists():
+                return
+            compacting = self._compacting_path
+            if compacting.exists():
+                # A previous compaction did not finish; keep its entries first.
+                with compacting.open("a", encoding="utf-8") as handle:
+                    handle.write(journal.read_text(encoding="utf-8"))
+                journal.unlink()
+            else:
+                os.replace(journal, compacting)
+            self._stats.journal_entries = 0
+
+    def compact(self, records: Iterable[_JobRecord]) -> None:
+        """Rewrite the snapshot from ``records`` and drop set-aside entries.
+
+        ``records`` must reflect every change appended before the matching
+        :meth:`begin_compaction` call. Retention is applied here rather than on
+        every append.
+        """
+
+        materialised = sorted(records, key=lambda entry: entry.created_at)
         now = _utcnow()
         retained, removed = self._apply_retention(materialised, now=now)
         if removed:
             self._record_prune(removed, now=now)
         self._write_payload(retained, now=now)
+        try:
+            self._compacting_path.unlink()
+        except FileNotFoundError:
+            pass
+        self._stats.last_compaction_at = now
+
+    def save(self, records: Iterable[_JobRecord]) -> None:
+        """Persist the supplied job records to disk as a full snapshot."""
+
+        self.begin_compaction()
+        self.compact(records)
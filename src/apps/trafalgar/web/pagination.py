@@ -0,0 +1,270 @@
+"""Cursor pagination, filtering, and field selection for Trafalgar collections."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Generic, Hashable, Iterable, Mapping, TypeVar
+
+from fastapi import HTTPException, Query, Request, Response, status
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+
+CursorKey = tuple[str, ...]
+
+
+def encode_cursor(key: CursorKey) -> str:
+    """Return an opaque cursor token for the sort ``key`` of the last item."""
+
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> CursorKey:
+    """Decode a token produced by :func:`encode_cursor`.
+
+    Raises ``ValueError`` when the token is malformed.
+    """
+
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {token!r}") from exc
+    if not isinstance(payload, list) or not all(
+        isinstance(part, str) for part in payload
+    ):
+        raise ValueError(f"Invalid cursor: {token!r}")
+    return tuple(payload)
+
+
+def _normalise_datetime(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def sortable_timestamp(value: Any) -> str:
+    """Return ``value`` as a UTC ISO string that sorts chronologically."""
+
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return ""
+        try:
+            value = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return text
+    if isinstance(value, datetime):
+        return _normalise_datetime(value).isoformat()
+    return ""
+
+
+@dataclass(frozen=True, slots=True)
+class CollectionQuery:
+    """Pagination, filter, and projection parameters shared by collections."""
+
+    limit: int | None = None
+    cursor: CursorKey | None = None
+    status: frozenset[str] | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    fields: tuple[str, ...] | None = None
+
+    @property
+    def paginated(self) -> bool:
+        return self.limit is not None or self.cursor is not None
+
+    @property
+    def cache_key(self) -> Hashable:
+        """Return a hashable summary suitable for ETag ``params``."""
+
+        return (
+            self.limit,
+            self.cursor,
+            tuple(sorted(self.status or ())),
+            self.since.isoformat() if self.since else None,
+            self.until.isoformat() if self.until else None,
+            self.fields,
+        )
+
+    def matches_status(self, value: Any) -> bool:
+        if self.status is None:
+            return True
+        return str(value or "").strip().lower() in self.status
+
+    def matches_timestamp(self, value: Any) -> bool:
+        """Return whether ``value`` falls inside ``[since, until]``.
+
+        Items without a timestamp only match when no range is requested.
+        """
+
+        if self.since is None and self.until is None:
+            return True
+        stamp = sortable_timestamp(value)
+        if not stamp:
+            return False
+        if self.since is not None and stamp < self.since.isoformat():
+            return False
+        if self.until is not None and stamp > self.until.isoformat():
+            return False
+        return True
+
+
+def _split_values(values: list[str] | None) -> list[str]:
+    result: list[str] = []
+    for value in values or ():
+        for part in value.split(","):
+            text = part.strip()
+            if text:
+                result.append(text)
+    return result
+
+
+def build_collection_query(
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+    status_values: list[str] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    fields: list[str] | None = None,
+) -> CollectionQuery:
+    """Validate raw query parameters and return a :class:`CollectionQuery`."""
+
+    decoded: CursorKey | None = None
+    if cursor:
+        try:
+            decoded = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+
+    statuses = {value.lower() for value in _split_values(status_values)}
+    selected = _split_values(fields)
+    return CollectionQuery(
+        limit=limit,
+        cursor=decoded,
+        status=frozenset(statuses) or None,
+        since=_normalise_datetime(since) if since is not None else None,
+        until=_normalise_datetime(until) if until is not None else None,
+        fields=tuple(dict.fromkeys(selected)) or None,
+    )
+
+
+def collection_query(
+    limit: int | None = Query(
+        None, ge=1, le=MAX_PAGE_SIZE, description="Maximum items per page."
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from a previous X-Next-Cursor header."
+    ),
+    since: datetime | None = Query(
+        None, description="Only include items at or after this timestamp."
+    ),
+    until: datetime | None = Query(
+        None, description="Only include items at or before this timestamp."
+    ),
+    fields: list[str] | None = Query(
+        None, description="Top-level fields to include (comma separated or repeated)."
+    ),
+) -> CollectionQuery:
+    """FastAPI dependency parsing the shared collection query parameters."""
+
+    return build_collection_query(
+        limit=limit, cursor=cursor, since=since, until=until, fields=fields
+    )
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """A page of items together with the cursor for the following page."""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def paginate(
+    items: Iterable[T],
+    *,
+    key: Callable[[T], CursorKey],
+    query: CollectionQuery,
+    descending: bool = True,
+    exact: bool = True,
+) -> Page[T]:
+    """Return the page of ``items`` following ``query.cursor``.
+
+    ``items`` must already be ordered by ``key`` (descending unless
+    ``descending`` is false). Iteration stops one item past the page to learn
+    whether another page exists. Pass ``exact=False`` for lazy iterables whose
+    items are expensive to produce: iteration then stops at the page boundary
+    and a full page always carries a cursor, even if the next page is empty.
+    """
+
+    after = query.cursor
+    limit = query.limit
+    page: list[T] = []
+    has_more = False
+    for item in items:
+        item_key = key(item)
+        if after is not None:
+            if descending and item_key >= after:
+                continue
+            if not descending and item_key <= after:
+                continue
+        if limit is not None and len(page) >= limit:
+            has_more = True
+            break
+        page.append(item)
+        if not exact and limit is not None and len(page) >= limit:
+            has_more = True
+            break
+
+    next_cursor = encode_cursor(key(page[-1])) if has_more and page else None
+    return Page(items=page, next_cursor=next_cursor)
+
+
+def select_fields(
+    item: Mapping[str, Any], fields: tuple[str, ...] | None
+) -> Mapping[str, Any]:
+    """Return ``item`` restricted to the requested top-level ``fields``."""
+
+    if fields is None:
+        return item
+    return {name: item[name] for name in fields if name in item}
+
+
+def apply_page_headers(
+    request: Request, response: Response, next_cursor: str | None
+) -> Response:
+    """Expose ``next_cursor`` through ``X-Next-Cursor`` and a ``Link`` header."""
+
+    if next_cursor is None:
+        return response
+    response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
+
+
+__all__ = [
+    "CollectionQuery",
+    "MAX_PAGE_SIZE",
+    "NEXT_CURSOR_HEADER",
+    "Page",
+    "apply_page_headers",
+    "build_collection_query",
+    "collection_query",
+    "decode_cursor",
+    "encode_cursor",
+    "paginate",
+    "select_fields",
+    "sortable_timestamp",
+]
@@ -0,0 +1,163 @@
+"""Due-time scheduling for render job status polling."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Callable, Collection
+
+DEFAULT_FRESH_WINDOW = 60.0
+DEFAULT_MAX_INTERVAL_FACTOR = 12.0
+DEFAULT_MAX_BACKOFF_FACTOR = 60.0
+DEFAULT_JITTER = 0.25
+
+
+class PollScheduler:
+    """Priority queue of job identifiers ordered by their next due time.
+
+    Jobs whose status changed within ``fresh_window`` seconds are polled every
+    ``base_interval`` seconds. Afterwards the interval grows linearly with the
+    time since the last change, capped at ``max_interval``, and jobs in one of
+    ``terminal_statuses`` are not rescheduled at all. Failed lookups back off
+    exponentially from ``base_interval`` up to ``max_backoff`` with +/-
+    ``jitter`` randomisation so that a struggling farm is not hit by every job
+    at once when it recovers.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_interval: float,
+        max_interval: float | None = None,
+        fresh_window: float = DEFAULT_FRESH_WINDOW,
+        max_backoff: float | None = None,
+        jitter: float = DEFAULT_JITTER,
+        terminal_statuses: Collection[str] = (),
+        clock: Callable[[], float] | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._base_interval = max(float(base_interval), 0.0)
+        self._max_interval = max(
+            (
+                float(max_interval)
+                if max_interval is not None
+                else self._base_interval * DEFAULT_MAX_INTERVAL_FACTOR
+            ),
+            self._base_interval,
+        )
+        self._fresh_window = max(float(fresh_window), 0.0)
+        self._max_backoff = max(
+            (
+                float(max_backoff)
+                if max_backoff is not None
+                else self._base_interval * DEFAULT_MAX_BACKOFF_FACTOR
+            ),
+            self._base_interval,
+        )
+        self._jitter = min(max(float(jitter), 0.0), 1.0)
+        self._terminal = {status.strip().lower() for status in terminal_statuses}
+        self._clock = clock or time.monotonic
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._heap: list[tuple[float, int, str]] = []
+        self._entries: dict[str, tuple[float, int]] = {}
+        self._failures: dict[str, int] = {}
+        self._sequence = itertools.count()
+
+    @property
+    def base_interval(self) -> float:
+        return self._base_interval
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, job_id: object) -> bool:
+        with self._lock:
+            return job_id in self._entries
+
+    def schedule(self, job_id: str, *, delay: float = 0.0) -> None:
+        """Make ``job_id`` due ``delay`` seconds from now, replacing any entry."""
+
+        due = self._clock() + max(delay, 0.0)
+        with self._lock:
+            token = next(self._sequence)
+            self._entries[job_id] = (due, token)
+            heapq.heappush(self._heap, (due, token, job_id))
+
+    def discard(self, job_id: str) -> None:
+        """Stop polling ``job_id``; stale heap entries are skipped lazily."""
+
+        with self._lock:
+            self._entries.pop(job_id, None)
+            self._failures.pop(job_id, None)
+
+    def pop_due(self, now: float | None = None) -> list[str]:
+        """Remove and return every job whose due time has passed."""
+
+        moment = self._clock() if now is None else now
+        due: list[str] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= moment:
+                _, token, job_id = heapq.heappop(self._heap)
+                entry = self._entries.get(job_id)
+                if entry is None or entry[1] != token:
+                    continue
+                del self._entries[job_id]
+                due.append(job_id)
+        return due
+
+    def seconds_until_next(self, now: float | None = None) -> float | None:
+        """Return the delay until the next job is due, or ``None`` when idle."""
+
+        moment = self._clock() if now is None else now
+        with self._lock:
+            while self._heap:
+                due, token, job_id = self._heap[0]
+                entry = self._entries.get(job_id)
+                if entry is not None and entry[1] == token:
+                    return max(due - moment, 0.0)
+                heapq.heappop(self._heap)
+        return None
+
+    def interval_for(self, status: str | None, since_change: float) -> float | None:
+        """Return the next poll interval for a job, or ``None`` to stop polling."""
+
+        if (status or "").strip().lower() in self._terminal:
+            return None
+        if since_change <= self._fresh_window or self._fresh_window <= 0:
+            return self._base_interval
+        scaled = self._base_interval * (since_change / self._fresh_window)
+        return min(scaled, self._max_interval)
+
+    def record_success(
+        self, job_id: str, status: str | None, since_change: float
+    ) -> float | None:
+        """Reschedule ``job_id`` after a successful lookup and return the delay."""
+
+        with self._lock:
+            self._failures.pop(job_id, None)
+        interval = self.interval_for(status, since_change)
+        if interval is None:
+            self.discard(job_id)
+            return None
+        self.schedule(job_id, delay=interval)
+        return interval
+
+    def record_failure(self, job_id: str) -> float:
+        """Reschedule ``job_id`` with jittered exponential backoff."""
+
+        with self._lock:
+            failures = self._failures.get(job_id, 0) + 1
+            self._failures[job_id] = failures
+            spread = self._rng.uniform(1.0 - self._jitter, 1.0 + self._jitter)
+        backoff = min(self._base_interval * 2.0 ** min(failures, 32), self._max_backoff)
+        delay = backoff * spread
+        self.schedule(job_id, delay=delay)
+        return delay
+
+
+__all__ = ["PollScheduler"]
@@ -5,13 +5,12 @@ from __future__ import annotations
 import asyncio
 import getpass
 import os
-import re
 import threading
+import time
 from collections import OrderedDict, defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
-import json
 from typing import (
     Any,
     Awaitable,
@@ -21,6 +20,9 @@ from typing import (
     AsyncGenerator,
     Collection,
     ClassVar,
+    Iterable,
+    Iterator,
+    cast,
 )
 
 import structlog
@@ -38,21 +40,50 @@ from apps.onepiece.render.submit import (
     _get_adapter_capabilities,
     _resolve_priority_and_chunk_size,
 )
-from apps.onepiece.utils.errors import (
-    OnePieceExternalServiceError,
-    OnePieceValidationError,
-)
+from apps.onepiece.utils.errors import OnePieceValidationError
 from apps.trafalgar.version import TRAFALGAR_VERSION
 from libraries.automation.render.base import (
     AdapterCapabilities,
+    RenderAdapterNotImplementedError,
     RenderAdapterUnavailableError,
     RenderSubmissionError,
     SubmissionResult,
 )
+from libraries.automation.render.chunking import parse_frame_segment
 from libraries.automation.render.models import CapabilityProvider, RenderAdapter
 
-from apps.trafalgar.web.events import EventBroadcaster, resolve_keepalive_interval
+from apps.trafalgar.web.capability_cache import (
+    DEFAULT_CAPABILITY_TTL,
+    CapabilityCache,
+)
+from apps.trafalgar.web.event_bus import event_bus_from_env
+from apps.trafalgar.web.events import (
+    LAST_EVENT_ID_HEADER,
+    RESYNC_FRAME,
+    EventBroadcaster,
+    EventFrame,
+    format_sse_chunk,
+    resolve_keepalive_interval,
+)
+from apps.trafalgar.web.execution import (
+    AsyncConcurrencyLimiter,
+    AsyncRateLimiter,
+    BlockingExecutor,
+)
+from apps.trafalgar.web.job_index import JobIndex
 from apps.trafalgar.web.job_store import JobStore
+from apps.trafalgar.web.pagination import (
+    CollectionQuery,
+    CursorKey,
+    Page,
+    apply_page_headers,
+    build_collection_query,
+    paginate,
+    select_fields,
+    sortable_timestamp,
+)
+from apps.trafalgar.web.poll_schedule import PollScheduler
+from apps.trafalgar.web.render_analytics import RenderAnalyticsIndex
 from apps.trafalgar.web.security import (
     AuthenticatedPrincipal,
     ROLE_RENDER_MANAGE,
@@ -62,6 +93,18 @@ from apps.trafalgar.web.security import (
     require_roles,
 )
 
+from .conditional import (
+    apply_cache_headers,
+    compute_etag,
+    etag_matches,
+    not_modified,
+)
+from .responses import (
+    FastJSONResponse,
+    compressed_route_class,
+    render_json,
+)
+
 logger = structlog.get_logger(__name__)
 
 
@@ -261,10 +304,6 @@ class RenderJobRequest(BaseModel):
         lambda: tuple(FARM_ADAPTERS)
     )
 
-    _FRAME_SEGMENT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
-        r"^(?P<start>-?\d+)(?:-(?P<end>-?\d+)(?:x(?P<step>\d+))?)?$"
-    )
-
     dcc: str = Field(
         ..., description="Digital content creation package (e.g. maya, nuke)."
     )
@@ -345,24 +384,7 @@ class RenderJobRequest(BaseModel):
                 "Frame range must be a comma separated list of frames or ranges (e.g. 1-10,20-30x2)."
             )
         for segment in segments:
-            match = cls._FRAME_SEGMENT_PATTERN.match(segment)
-            if match is None:
-                raise ValueError(
-                    "Frame range must use Deadline notation (e.g. 1-10,20-30x2)."
-                )
-            end_text = match.group("end")
-            if end_text is not None:
-                start = int(match.group("start"))
-                end = int(end_text)
-                if end < start:
-                    raise ValueError(
-                        f"Frame range segment '{segment}' must have the end greater than or equal to the start."
-                    )
-                step_text = match.group("step")
-                if step_text is not None and int(step_text) <= 0:
-                    raise ValueError(
-                        f"Frame range segment '{segment}' must use a positive step."
-                    )
+            parse_frame_segment(segment)
         return ",".join(segments)
 
 
@@ -384,6 +406,36 @@ class RenderJobResponse(BaseModel):
     )
 
 
+class RenderBatchItemResult(BaseModel):
+    """Outcome of one job within a batch submission."""
+
+    index: int = Field(..., description="Position of the job in the submitted batch.")
+    job_id: str | None = Field(
+        None, description="Identifier returned by the render farm on success."
+    )
+    status: str = Field(
+        ...,
+        description="Submission status reported by the farm, or 'error' on failure.",
+    )
+    farm_type: str | None = Field(
+        None, description="Render farm adapter that processed the submission."
+    )
+    message: str | None = Field(
+        None, description="Optional detail returned by the adapter."
+    )
+    error: APIErrorDetail | None = Field(
+        None, description="Failure details when the farm rejected the job."
+    )
+
+
+class RenderBatchResponse(BaseModel):
+    """Per-job results for a batch submission, in request order."""
+
+    submitted: int = Field(..., description="Number of jobs the farms accepted.")
+    failed: int = Field(..., description="Number of jobs that failed to submit.")
+    results: list[RenderBatchItemResult]
+
+
 class RenderJobMetadata(BaseModel):
     """Structured metadata about a submitted render job."""
 
@@ -522,6 +574,31 @@ class APIErrorResponse(BaseModel):
     error: APIErrorDetail
 
 
+RenderBatchItemResult.model_rebuild()
+
+
+def _job_cursor_key(job: RenderJobMetadata) -> CursorKey:
+    return (sortable_timestamp(job.submitted_at), job.job_id)
+
+
+def _normalise_filter(values: Collection[str] | None) -> set[str] | None:
+    if not values:
+        return None
+    normalised = {value.strip().lower() for value in values if value and value.strip()}
+    return normalised or None
+
+
+@dataclass(slots=True)
+class _PreparedSubmission:
+    """A validated submission with its adapter and resolved farm settings."""
+
+    request: RenderJobRequest
+    adapter: RenderAdapter
+    user: str
+    priority: int
+    chunk_size: int | None
+
+
 @dataclass
 class _JobRecord:
     """Internal storage representation for submitted render jobs."""
@@ -571,6 +648,11 @@ class _JobRecord:
             durations[status] += (end - start).total_seconds()
         return dict(durations)
 
+    def copy(self) -> "_JobRecord":
+        """Return a copy unaffected by later status updates to this record."""
+
+        return replace(self, status_history=list(self.status_history))
+
     def snapshot(self) -> RenderJobMetadata:
         return RenderJobMetadata(
             job_id=self.job_id,
@@ -676,13 +758,24 @@ JOB_STORE_PATH_ENV = "TRAFALGAR_RENDER_JOBS_PATH"
 JOB_HISTORY_LIMIT_ENV = "TRAFALGAR_RENDER_JOBS_HISTORY_LIMIT"
 JOB_RETENTION_HOURS_ENV = "TRAFALGAR_RENDER_JOBS_RETENTION_HOURS"
 JOB_STATUS_POLL_INTERVAL_ENV = "TRAFALGAR_RENDER_STATUS_POLL_INTERVAL"
+JOB_STATUS_POLL_CONCURRENCY_ENV = "TRAFALGAR_RENDER_STATUS_POLL_CONCURRENCY"
+JOB_STATUS_POLL_MAX_INTERVAL_ENV = "TRAFALGAR_RENDER_STATUS_POLL_MAX_INTERVAL"
 JOB_STORE_PERSIST_THROTTLE_ENV = "TRAFALGAR_RENDER_STORE_PERSIST_INTERVAL"
+JOB_SUBMIT_CONCURRENCY_ENV = "TRAFALGAR_RENDER_SUBMIT_CONCURRENCY"
+JOB_SUBMIT_RATE_ENV = "TRAFALGAR_RENDER_SUBMIT_RATE"
+JOB_CAPABILITY_TTL_ENV = "TRAFALGAR_RENDER_CAPABILITY_TTL"
 RENDER_SSE_KEEPALIVE_INTERVAL_ENV = "TRAFALGAR_RENDER_SSE_KEEPALIVE_INTERVAL"
+RENDER_EVENT_COALESCE_WINDOW_ENV = "TRAFALGAR_RENDER_EVENT_COALESCE_WINDOW"
 _RENDER_SSE_STATE_ATTR = "render_sse_keepalive_interval"
 _DEFAULT_SSE_KEEPALIVE_INTERVAL = 30.0
+_DEFAULT_EVENT_COALESCE_WINDOW = 0.1
 
 DEFAULT_STATUS_POLL_INTERVAL = 5.0
+DEFAULT_STATUS_POLL_CONCURRENCY = 8
+STATUS_BATCH_SIZE = 100
 DEFAULT_STORE_PERSIST_INTERVAL = 1.0
+DEFAULT_SUBMIT_CONCURRENCY = 4
+MAX_BATCH_SUBMISSIONS = 500
 
 
 class RenderSubmissionService:
@@ -707,6 +800,11 @@ class RenderSubmissionService:
         broadcaster: EventBroadcaster | None = None,
         status_poll_interval: float | None = None,
         store_persist_interval: float | None = None,
+        status_poll_concurrency: int | None = None,
+        status_poll_max_interval: float | None = None,
+        submission_concurrency: int | None = None,
+        submission_rate: float | None = None,
+        capability_ttl: float | None = None,
     ) -> None:
         initial_adapters = adapters or FARM_ADAPTERS
         self._adapters = {
@@ -725,6 +823,11 @@ class RenderSubmissionService:
             entry = base_capabilities.get(name)
             if entry is not None:
                 self._capability_sources[name] = entry
+        self._capabilities = CapabilityCache(
+            ttl=capability_ttl if capability_ttl is not None else DEFAULT_CAPABILITY_TTL
+        )
+        self._capability_task: asyncio.Task[None] | None = None
+        self._capability_wakeup: asyncio.Event | None = None
         self._lock = threading.RLock()
         self._jobs: OrderedDict[str, _JobRecord] = OrderedDict()
         self._store = job_store
@@ -745,6 +848,8 @@ class RenderSubmissionService:
             self._persist_throttle = timedelta(seconds=float(persist_interval_value))
         self._last_persist_at: datetime | None = None
         self._persist_pending = False
+        self._dirty_job_ids: set[str] = set()
+        self._removed_job_ids: set[str] = set()
         poll_interval_value = (
             status_poll_interval
             if status_poll_interval is not None
@@ -756,7 +861,48 @@ class RenderSubmissionService:
             else None
         )
         self._poll_task: asyncio.Task[None] | None = None
+        self._poll_schedule: PollScheduler | None = None
+        if self._poll_interval is not None:
+            self._poll_schedule = PollScheduler(
+                base_interval=self._poll_interval,
+                max_interval=(
+                    status_poll_max_interval
+                    if status_poll_max_interval and status_poll_max_interval > 0
+                    else None
+                ),
+                terminal_statuses=TERMINAL_STATUSES,
+            )
+        self._poll_executor = BlockingExecutor(
+            max(1, status_poll_concurrency or DEFAULT_STATUS_POLL_CONCURRENCY),
+            thread_name_prefix="render-poll",
+        )
+        self._submit_concurrency = max(
+            1, submission_concurrency or DEFAULT_SUBMIT_CONCURRENCY
+        )
+        self._submit_rate = (
+            float(submission_rate) if submission_rate and submission_rate > 0 else None
+        )
+        self._submit_limiters: dict[str, AsyncRateLimiter] = {}
+        self._submit_slots: dict[str, AsyncConcurrencyLimiter] = {}
+        self._submit_executor = BlockingExecutor(
+            self._submit_concurrency * max(len(self._adapters), 1),
+            thread_name_prefix="render-submit",
+        )
+        self._generation = 0
+        self._analytics = RenderAnalyticsIndex()
+        self._analytics_source: OrderedDict[str, _JobRecord] | None = None
+        self._index: JobIndex[RenderJobMetadata] = JobIndex()
+        self._indexed_jobs: OrderedDict[str, _JobRecord] | None = None
         self._load_jobs()
+        self._sync_analytics()
+        self._sync_indexes()
+
+    @property
+    def data_generation(self) -> int:
+        """Return a counter that advances whenever any job changes."""
+
+        with self._lock:
+            return self._generation
 
     def list_farms(self) -> list[FarmInfo]:
         entries: list[FarmInfo] = []
@@ -785,15 +931,24 @@ class RenderSubmissionService:
             return None, entry
         return dict(entry), None
 
-    def _describe_capabilities(self, farm: str) -> AdapterCapabilities | None:
+    def _load_capabilities(self, farm: str) -> AdapterCapabilities | None:
+        """Return capabilities for ``farm`` through the capability cache.
+
+        While the background refresher runs, an expired entry is still served
+        and refreshed off the request path.
+        """
+
         capabilities, provider = self._capability_source(farm)
-        if capabilities is not None:
+        if capabilities is not None or provider is None:
             return capabilities
-        if provider is None:
-            return None
+        return self._capabilities.get(
+            farm, provider, allow_stale=self._capability_refresher_running()
+        )
+
+    def _describe_capabilities(self, farm: str) -> AdapterCapabilities | None:
         try:
-            return provider() or {}
-        except RenderSubmissionError as exc:  # pragma: no cover - defensive guard
+            return self._load_capabilities(farm)
+        except RenderSubmissionError as exc:
             logger.warning(
                 "render.farm.capabilities.unavailable",
                 farm=farm,
@@ -817,6 +972,7 @@ class RenderSubmissionService:
             )
         key = name.strip().lower()
         self._adapters[key] = adapter
+        self._capabilities.forget(key)
         if capabilities is not None:
             self._capability_sources[key] = dict(capabilities)
         elif capability_provider is not None:
@@ -830,6 +986,148 @@ class RenderSubmissionService:
         return tuple(sorted(self._adapters))
 
     def submit_job(self, request: RenderJobRequest) -> SubmissionResult:
+        prepared = self._prepare_submission(request)
+        result = self._dispatch_submission(prepared)
+        record = self._record_submission(prepared, result)
+        if record is not None:
+            self._emit_event("job.created", record)
+            self._persist_jobs(force=True)
+        return result
+
+    async def submit_jobs(
+        self, requests: Sequence[RenderJobRequest]
+    ) -> RenderBatchResponse:
+        """Validate ``requests`` up front, then submit them concurrently.
+
+        Every request is checked against its farm before anything is sent, and
+        a single invalid request rejects the whole batch. Dispatch runs on the
+        submission executor with at most ``submission_concurrency`` jobs in
+        flight per farm and, when ``submission_rate`` is set, no more than that
+        many submissions started per second per farm. Both limits are held by
+        the service, so concurrent batches share them. Adapter failures are
+        reported per job; subscribers receive one ``jobs.created`` event.
+        """
+
+        prepared = await self._submit_executor.run(self._prepare_batch, requests)
+
+        async def _submit(
+            item: _PreparedSubmission,
+        ) -> SubmissionResult | RenderSubmissionError:
+            farm = item.request.farm
+            async with self._submission_slots(farm):
+                limiter = self._submission_limiter(farm)
+                if limiter is not None:
+                    await limiter.acquire()
+                try:
+                    return await self._submit_executor.run(
+                        self._dispatch_submission, item
+                    )
+                except RenderSubmissionError as exc:
+                    return exc
+                except Exception as exc:  # pragma: no cover - defensive guard
+                    logger.exception(
+                        "render.batch.submit.error", farm=farm, scene=item.request.scene
+                    )
+                    return RenderSubmissionError(
+                        "Unexpected error while submitting render job.",
+                        code="render.submission_failed",
+                        status_code=500,
+                        context={"farm": farm, "error": str(exc)},
+                    )
+
+        outcomes = await asyncio.gather(*(_submit(item) for item in prepared))
+
+        results: list[RenderBatchItemResult] = []
+        records: list[_JobRecord] = []
+        for index, (item, outcome) in enumerate(zip(prepared, outcomes)):
+            if isinstance(outcome, RenderSubmissionError):
+                results.append(
+                    RenderBatchItemResult(
+                        index=index,
+                        status="error",
+                        error=APIErrorDetail(
+                            code=outcome.code,
+                            message=str(outcome),
+                            hint=outcome.hint,
+                            context=outcome.context or None,
+                        ),
+                    )
+                )
+                continue
+            record = self._record_submission(item, outcome)
+            if record is not None:
+                records.append(record)
+            results.append(
+                RenderBatchItemResult(
+                    index=index,
+                    job_id=outcome.get("job_id", ""),
+                    status=outcome.get("status", "unknown"),
+                    farm_type=outcome.get("farm_type", item.request.farm),
+                    message=outcome.get("message"),
+                )
+            )
+
+        if records:
+            views: list[RenderJobMetadata] = []
+            for record in records:
+                view = self._emit_event("job.created", record, publish=False)
+                if view is None:
+                    # The job was evicted by the history limit before it was
+                    # indexed, so no shared view exists for it.
+                    view = record.snapshot()
+                views.append(view)
+            if self._events:
+                self._events.publish(
+                    {"event": "jobs.created", "jobs": views}, event="jobs.created"
+                )
+            self._persist_jobs(force=True)
+
+        failed = sum(1 for result in results if result.error is not None)
+        return RenderBatchResponse(
+            submitted=len(results) - failed, failed=failed, results=results
+        )
+
+    def _submission_slots(self, farm: str) -> AsyncConcurrencyLimiter:
+        with self._lock:
+            slots = self._submit_slots.get(farm)
+            if slots is None:
+                slots = self._submit_slots[farm] = AsyncConcurrencyLimiter(
+                    self._submit_concurrency
+                )
+            return slots
+
+    def _submission_limiter(self, farm: str) -> AsyncRateLimiter | None:
+        if self._submit_rate is None:
+            return None
+        with self._lock:
+            limiter = self._submit_limiters.get(farm)
+            if limiter is None:
+                limiter = self._submit_limiters[farm] = AsyncRateLimiter(
+                    self._submit_rate
+                )
+            return limiter
+
+    def _prepare_batch(
+        self, requests: Sequence[RenderJobRequest]
+    ) -> list[_PreparedSubmission]:
+        prepared: list[_PreparedSubmission] = []
+        errors: list[dict[str, Any]] = []
+        for index, request in enumerate(requests):
+            try:
+                prepared.append(self._prepare_submission(request))
+            except RenderSubmissionError as exc:
+                errors.append({"index": index, "code": exc.code, "message": str(exc)})
+        if errors:
+            raise RenderSubmissionError(
+                f"{len(errors)} of {len(requests)} batch submissions are invalid.",
+                code="render.batch_invalid",
+                status_code=422,
+                hint="Fix the listed jobs and resubmit the batch; nothing was sent to the farms.",
+                context={"errors": errors},
+            )
+        return prepared
+
+    def _prepare_submission(self, request: RenderJobRequest) -> _PreparedSubmission:
         adapter = self._adapters.get(request.farm)
         if adapter is None:
             raise RenderSubmissionError(
@@ -840,16 +1138,26 @@ class RenderSubmissionService:
                 context={"farm": request.farm},
             )
         resolved_user = request.user or getpass.getuser()
-        capability_data, capability_provider = self._capability_source(request.farm)
-        if capability_data is None and capability_provider is None:
-            capability_data = {}
+        try:
+            capability_data = self._load_capabilities(request.farm) or {}
+        except RenderSubmissionError as exc:
+            raise RenderSubmissionError(
+                f"Failed to query capabilities from '{request.farm}' adapter: {exc}",
+                code="render.capabilities_unavailable",
+                status_code=400,
+                hint="Retry once the render farm capabilities endpoint is available or contact an administrator.",
+                context={
+                    "farm": request.farm,
+                    "priority": request.priority,
+                    "chunk_size": request.chunk_size,
+                },
+            ) from exc
         try:
             resolved_priority, resolved_chunk, _ = _resolve_priority_and_chunk_size(
                 farm=request.farm,
                 priority=request.priority,
                 chunk_size=request.chunk_size,
                 capabilities=capability_data,
-                capability_provider=capability_provider,
             )
         except OnePieceValidationError as exc:
             raise RenderSubmissionError(
@@ -863,27 +1171,42 @@ class RenderSubmissionService:
                     "chunk_size": request.chunk_size,
                 },
             ) from exc
-        except OnePieceExternalServiceError as exc:
-            raise RenderSubmissionError(
-                str(exc),
-                code="render.capabilities_unavailable",
-                status_code=400,
-                hint="Retry once the render farm capabilities endpoint is available or contact an administrator.",
-                context={
-                    "farm": request.farm,
-                    "priority": request.priority,
-                    "chunk_size": request.chunk_size,
-                },
-            ) from exc
-        result = adapter(
-            scene=request.scene,
-            frames=request.frames,
-            output=request.output,
-            dcc=request.dcc,
-            priority=resolved_priority,
+        return _PreparedSubmission(
+            request=request,
+            adapter=adapter,
             user=resolved_user,
+            priority=resolved_priority,
             chunk_size=resolved_chunk,
         )
+
+    def _dispatch_submission(self, prepared: _PreparedSubmission) -> SubmissionResult:
+        request = prepared.request
+        try:
+            return prepared.adapter(
+                scene=request.scene,
+                frames=request.frames,
+                output=request.output,
+                dcc=request.dcc,
+                priority=prepared.priority,
+                user=prepared.user,
+                chunk_size=prepared.chunk_size,
+            )
+        except RenderAdapterNotImplementedError:
+            raise
+        except RenderSubmissionError as exc:
+            # The farm may have changed its limits. Keep serving the cached
+            # descriptor and let the refresher renew it off the request path;
+            # without a refresher the next lookup rediscovers the farm.
+            if self._capabilities.mark_stale(request.farm, reason=exc.code):
+                self._wake_capability_refresher()
+            raise
+
+    def _record_submission(
+        self, prepared: _PreparedSubmission, result: SubmissionResult
+    ) -> _JobRecord | None:
+        """Store the job the farm accepted; returns ``None`` without a job id."""
+
+        request = prepared.request
         raw_job_id = result.get("job_id")
         job_id: str = ""
         if raw_job_id is not None:
@@ -894,8 +1217,10 @@ class RenderSubmissionService:
                 text = str(raw_job_id)
                 if text:
                     job_id = text
+        if not job_id:
+            return None
         stored_request = request.model_copy(
-            update={"priority": resolved_priority, "chunk_size": resolved_chunk},
+            update={"priority": prepared.priority, "chunk_size": prepared.chunk_size},
             deep=True,
         )
         record = _JobRecord(
@@ -907,13 +1232,17 @@ class RenderSubmissionService:
             request=stored_request,
             created_at=_utcnow(),
         )
-        if job_id:
-            with self._lock:
-                self._jobs[job_id] = record
-                self._enforce_history_limit()
-            self._persist_jobs(force=True)
-            self._emit_event("job.created", record)
-        return result
+        with self._lock:
+            self._jobs[job_id] = record
+            # Listings and analytics see the job as soon as it is stored.
+            self._analytics.observe(record)
+            self._index_record(record)
+            self._enforce_history_limit()
+        if self._poll_schedule is not None:
+            self._poll_schedule.schedule(
+                job_id, delay=self._poll_schedule.base_interval
+            )
+        return record
 
     def list_jobs(
         self,
@@ -921,60 +1250,130 @@ class RenderSubmissionService:
         limit: int | None = None,
         status: Collection[str] | None = None,
         farm: Collection[str] | None = None,
+        user: Collection[str] | None = None,
+        refresh: bool = False,
     ) -> list[RenderJobMetadata]:
-        """Return the cached job list filtered by farm and status."""
+        """Return the cached job list filtered by farm, status, and user.
+
+        Statuses are kept current by the background poller, so the listing is
+        answered from the service's secondary indexes, holding the lock only
+        while matching snapshots are collected. The returned snapshots are
+        shared and must be treated as read-only. Pass ``refresh=True`` to query
+        each listed job's adapter first.
+        """
 
         if limit is not None and limit <= 0:
             return []
 
-        status_filter: set[str] | None = None
-        if status:
-            normalised = {value.strip().lower() for value in status if value}
-            status_filter = normalised or None
-
-        farm_filter: set[str] | None = None
-        if farm:
-            normalised = {value.strip().lower() for value in farm if value}
-            farm_filter = normalised or None
-
+        status_filter = _normalise_filter(status)
+        filters = {
+            "farm": _normalise_filter(farm),
+            "user": _normalise_filter(user),
+            "status": None if refresh else status_filter,
+        }
+        self._sync_indexes()
         with self._lock:
-            job_ids = list(reversed(self._jobs.keys()))
+            selected = self._index.select(
+                filters=filters, limit=None if refresh else limit
+            )
+        if not refresh:
+            return [view for _, view in selected]
 
         jobs: list[RenderJobMetadata] = []
         dirty = False
-        for job_id in job_ids:
+        for _, view in selected:
             if limit is not None and len(jobs) >= limit:
                 break
-
             with self._lock:
-                record = self._jobs.get(job_id)
+                record = self._jobs.get(view.job_id)
             if record is None:
                 continue
-
             dirty = self._refresh_job(record) or dirty
-
             with self._lock:
-                current = self._jobs.get(job_id)
+                current = self._jobs.get(view.job_id)
                 if current is None:
                     continue
+                record_status = (current.status or "").strip().lower()
+                if status_filter is not None and record_status not in status_filter:
+                    continue
+                snapshot = current.snapshot()
+            jobs.append(snapshot)
 
-                if status_filter is not None:
-                    record_status = (current.status or "").strip().lower()
-                    if record_status not in status_filter:
-                        continue
+        if dirty:
+            self._persist_jobs(force=True)
+        return jobs
 
-                if farm_filter is not None:
-                    record_farm = (current.farm or "").strip().lower()
-                    if record_farm not in farm_filter:
-                        continue
+    def list_jobs_with_generation(self) -> tuple[list[RenderJobMetadata], int]:
+        """Return every cached job together with the generation it belongs to.
 
-                snapshot = current.snapshot()
+        Both are read under one lock, so the generation always describes the
+        returned listing and can be used to derive a validator for it.
+        """
 
-            jobs.append(snapshot)
+        self._sync_indexes()
+        with self._lock:
+            return [view for _, view in self._index.select()], self._generation
+
+    def page_jobs(
+        self,
+        query: CollectionQuery,
+        *,
+        farm: Collection[str] | None = None,
+        user: Collection[str] | None = None,
+        refresh: bool = False,
+    ) -> Page[RenderJobMetadata]:
+        """Return one page of jobs ordered by submission time, newest first.
+
+        Jobs are served from the secondary indexes unless ``refresh`` is true.
+        On a refresh the date range, farm, user, and cursor filters are still
+        resolved from the indexes before any adapter is queried, so only jobs
+        considered for the page are polled. A full page always carries a
+        cursor.
+        """
+
+        filters = {
+            "farm": _normalise_filter(farm),
+            "user": _normalise_filter(user),
+            "status": None if refresh else query.status,
+        }
+        self._sync_indexes()
+        with self._lock:
+            selected = self._index.select(
+                filters=filters,
+                since=query.since.isoformat() if query.since else None,
+                until=query.until.isoformat() if query.until else None,
+                before=query.cursor,
+                limit=None if refresh else query.limit,
+            )
+        if not refresh:
+            return paginate(
+                [view for _, view in selected],
+                key=_job_cursor_key,
+                query=query,
+                exact=False,
+            )
 
+        dirty = False
+
+        def _iter_jobs() -> Iterator[RenderJobMetadata]:
+            nonlocal dirty
+            for _, view in selected:
+                with self._lock:
+                    record = self._jobs.get(view.job_id)
+                if record is None:
+                    continue
+                dirty = self._refresh_job(record) or dirty
+                with self._lock:
+                    current = self._jobs.get(view.job_id)
+                    if current is None or not query.matches_status(current.status):
+                        continue
+                    snapshot = current.snapshot()
+                yield snapshot
+
+        page = paginate(_iter_jobs(), key=_job_cursor_key, query=query, exact=False)
         if dirty:
             self._persist_jobs(force=True)
-        return jobs
+        return page
 
     def get_job(self, job_id: str) -> RenderJobMetadata:
         with self._lock:
@@ -1033,13 +1432,80 @@ class RenderSubmissionService:
                 raise KeyError(job_id)
             return current.snapshot()
 
+    def _refresh_job_by_id(self, job_id: str) -> tuple[bool, dict[str, bool | None]]:
+        with self._lock:
+            record = self._jobs.get(job_id)
+        if record is None:
+            return False, {}
+        changed, ok = self._lookup_job_status(record)
+        return changed, {job_id: ok}
+
+    def _refresh_job_batch(
+        self, farm: str, job_ids: Sequence[str]
+    ) -> tuple[bool, dict[str, bool | None]]:
+        """Refresh ``job_ids`` with one ``get_job_statuses`` call to ``farm``.
+
+        Jobs missing from the batch result, or given an empty result, are
+        refreshed individually. Returns
+        whether any job changed and the per-job outcome reported by
+        :meth:`_lookup_job_status`.
+        """
+
+        adapter = self._adapters.get(farm)
+        batch_lookup = getattr(adapter, "get_job_statuses", None)
+        if not callable(batch_lookup):
+            return False, dict.fromkeys(job_ids)
+        try:
+            results = batch_lookup(list(job_ids))
+        except RenderSubmissionError as exc:
+            logger.warning(
+                "render.job.status.batch_failed",
+                farm=farm,
+                jobs=len(job_ids),
+                error=str(exc),
+            )
+            return False, dict.fromkeys(job_ids, False)
+        except Exception:  # pragma: no cover - defensive guard
+            logger.exception("render.job.status.batch_error", farm=farm)
+            return False, dict.fromkeys(job_ids, False)
+
+        changed = False
+        outcomes: dict[str, bool | None] = {}
+        missing: list[str] = []
+        with self._lock:
+            for job_id in job_ids:
+                # An empty result is as good as none; the job is looked up alone.
+                result = results.get(job_id) if results else None
+                if not result:
+                    missing.append(job_id)
+                    continue
+                current = self._jobs.get(job_id)
+                if current is None:
+                    continue
+                outcomes[job_id] = True
+                changed = self._update_record_from_result(current, result) or changed
+        for job_id in missing:
+            job_changed, job_outcomes = self._refresh_job_by_id(job_id)
+            changed = job_changed or changed
+            outcomes.update(job_outcomes)
+        return changed, outcomes
+
     def _refresh_job(self, record: _JobRecord) -> bool:
+        return self._lookup_job_status(record)[0]
+
+    def _lookup_job_status(self, record: _JobRecord) -> tuple[bool, bool | None]:
+        """Query the farm for ``record`` and apply the result.
+
+        Returns ``(changed, ok)`` where ``ok`` is ``False`` when the lookup
+        failed and ``None`` when the farm cannot report job status at all.
+        """
+
         adapter = self._adapters.get(record.farm)
         if adapter is None:
-            return False
+            return False, None
         status_lookup = getattr(adapter, "get_job_status", None)
         if not callable(status_lookup):
-            return False
+            return False, None
         try:
             result = status_lookup(record.job_id)
         except RenderSubmissionError as exc:
@@ -1049,17 +1515,17 @@ class RenderSubmissionService:
                 farm=record.farm,
                 error=str(exc),
             )
-            return False
+            return False, False
         except Exception:  # pragma: no cover - defensive guard
             logger.exception(
                 "render.job.status.error", job_id=record.job_id, farm=record.farm
             )
-            return False
+            return False, False
         with self._lock:
             current = self._jobs.get(record.job_id)
             if current is None:
-                return False
-            return self._update_record_from_result(current, result)
+                return False, True
+            return self._update_record_from_result(current, result), True
 
     def _update_record_from_result(
         self, record: _JobRecord, result: SubmissionResult
@@ -1076,6 +1542,9 @@ class RenderSubmissionService:
                 record.completed_at = moment
             else:
                 record.completed_at = None
+                schedule = self._poll_schedule
+                if schedule is not None and record.job_id not in schedule:
+                    schedule.schedule(record.job_id, delay=schedule.base_interval)
             changed = True
         if "message" in result and result.get("message") != record.message:
             record.message = result.get("message")
@@ -1109,11 +1578,20 @@ class RenderSubmissionService:
             self._persist_jobs(force=True)
 
     def _persist_jobs(self, *, force: bool = False) -> None:
+        """Write pending job changes to the store.
+
+        Stores exposing ``append`` receive only the jobs changed or removed
+        since the last write; other stores are handed the full history.
+        """
+
         store = self._store
         if not store:
             with self._lock:
                 self._persist_pending = False
+                self._dirty_job_ids.clear()
+                self._removed_job_ids.clear()
             return
+        append = getattr(store, "append", None)
         now = _utcnow()
         with self._lock:
             if (
@@ -1124,11 +1602,56 @@ class RenderSubmissionService:
             ):
                 self._persist_pending = True
                 return
-            records = list(self._jobs.values())
-        store.save(records)
+            # Records are copied while the lock is held so concurrent status
+            # updates cannot change them while they are serialised.
+            if callable(append):
+                changed = [
+                    self._jobs[job_id].copy()
+                    for job_id in self._dirty_job_ids
+                    if job_id in self._jobs
+                ]
+                removed = list(self._removed_job_ids)
+                self._dirty_job_ids.clear()
+                self._removed_job_ids.clear()
+            else:
+                records = [record.copy() for record in self._jobs.values()]
+        if callable(append):
+            try:
+                append(changed, removed=removed)
+            except Exception:
+                with self._lock:
+                    self._dirty_job_ids.update(record.job_id for record in changed)
+                    self._removed_job_ids.update(removed)
+                raise
+        else:
+            store.save(records)
         with self._lock:
             self._last_persist_at = now
             self._persist_pending = False
+        if self._store_needs_compaction() and not self._poller_running():
+            self._compact_store()
+
+    def _poller_running(self) -> bool:
+        return self._poll_task is not None and not self._poll_task.done()
+
+    def _store_needs_compaction(self) -> bool:
+        return bool(getattr(self._store, "needs_compaction", False))
+
+    def _compact_store(self) -> None:
+        """Fold the store's journal into a fresh snapshot of the history."""
+
+        store = self._store
+        begin = getattr(store, "begin_compaction", None)
+        compact = getattr(store, "compact", None)
+        if not callable(begin) or not callable(compact):
+            return
+        begin()
+        with self._lock:
+            records = [record.copy() for record in self._jobs.values()]
+        try:
+            compact(records)
+        except OSError as exc:  # pragma: no cover - defensive guard
+            logger.warning("render.store.compaction_failed", error=str(exc))
 
     def _enforce_history_limit(self) -> None:
         with self._lock:
@@ -1149,18 +1672,37 @@ class RenderSubmissionService:
                 self._history_pruned_total += removed
 
     def start_background_polling(self) -> None:
-        """Launch the asynchronous poller that refreshes job statuses."""
+        """Launch the asynchronous poller that refreshes job statuses.
 
+        The capability refresher starts alongside it so farm capabilities are
+        discovered and renewed in the background.
+        """
+
+        self._start_capability_refresher()
         if self._poll_interval is None:
             return
         if self._poll_task and not self._poll_task.done():
             return
+        if self._poll_schedule is not None:
+            for job_ids in self._pollable_jobs_by_farm().values():
+                for job_id in job_ids:
+                    if job_id not in self._poll_schedule:
+                        self._poll_schedule.schedule(job_id)
         loop = asyncio.get_running_loop()
         self._poll_task = loop.create_task(self._run_status_poller())
 
     async def stop_background_polling(self) -> None:
         """Stop the poller if it is running and flush pending persistence."""
 
+        capability_task = self._capability_task
+        self._capability_task = None
+        self._capability_wakeup = None
+        if capability_task is not None:
+            capability_task.cancel()
+            try:
+                await capability_task
+            except asyncio.CancelledError:
+                pass
         if not self._poll_task:
             return
         task = self._poll_task
@@ -1170,21 +1712,189 @@ class RenderSubmissionService:
             await task
         except asyncio.CancelledError:
             pass
+        self._poll_executor.shutdown()
+        self._submit_executor.shutdown()
+
+    def _capability_refresher_running(self) -> bool:
+        return self._capability_task is not None and not self._capability_task.done()
+
+    def _start_capability_refresher(self) -> None:
+        if not self._capabilities.enabled or self._capability_refresher_running():
+            return
+        loop = asyncio.get_running_loop()
+        self._capability_wakeup = asyncio.Event()
+        self._capability_task = loop.create_task(self._run_capability_refresher())
+
+    def _wake_capability_refresher(self) -> None:
+        """Ask a running refresher to renew due farms now; thread-safe."""
+
+        task = self._capability_task
+        wakeup = self._capability_wakeup
+        if task is None or task.done() or wakeup is None:
+            return
+        try:
+            task.get_loop().call_soon_threadsafe(wakeup.set)
+        except RuntimeError:  # pragma: no cover - the loop has been closed
+            pass
+
+    def _capability_providers(self) -> dict[str, CapabilityProvider]:
+        return {
+            farm: entry
+            for farm, entry in list(self._capability_sources.items())
+            if callable(entry)
+        }
+
+    async def _refresh_capabilities(self, farms: Iterable[str]) -> None:
+        providers = self._capability_providers()
+        calls = [
+            self._poll_executor.run(self._capabilities.refresh, farm, providers[farm])
+            for farm in farms
+            if farm in providers
+        ]
+        for outcome in await asyncio.gather(*calls, return_exceptions=True):
+            if isinstance(outcome, RenderSubmissionError):
+                logger.warning(
+                    "render.farm.capabilities.refresh_failed",
+                    code=outcome.code,
+                    error=str(outcome),
+                )
+            elif isinstance(outcome, Exception):  # pragma: no cover - defensive
+                logger.warning(
+                    "render.farm.capabilities.refresh_error", error=str(outcome)
+                )
+
+    async def _run_capability_refresher(self) -> None:
+        """Discover provider-backed farm capabilities and renew them before expiry.
+
+        Farms that are not cached (never discovered, invalidated, or failing)
+        are retried once per TTL; cached farms are refreshed shortly before
+        their entries expire.
+        """
+
+        cache = self._capabilities
+        wakeup = self._capability_wakeup or asyncio.Event()
+        await self._refresh_capabilities(self._capability_providers())
+        last_sweep = time.monotonic()
+        while True:
+            wait = cache.seconds_until_next()
+            if wait is None or wait > cache.ttl:
+                wait = cache.ttl
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            due = set(cache.due())
+            if time.monotonic() - last_sweep >= cache.ttl:
+                snapshot = cache.snapshot()["farms"]
+                due.update(
+                    farm
+                    for farm in self._capability_providers()
+                    if not snapshot.get(farm, {}).get("cached")
+                )
+                last_sweep = time.monotonic()
+            if due:
+                await self._refresh_capabilities(sorted(due))
+
+    def _pollable_jobs_by_farm(
+        self, job_ids: Iterable[str] | None = None
+    ) -> dict[str, list[str]]:
+        groups: dict[str, list[str]] = defaultdict(list)
+        with self._lock:
+            if job_ids is None:
+                records = list(self._jobs.values())
+            else:
+                records = [
+                    record
+                    for record in (self._jobs.get(job_id) for job_id in job_ids)
+                    if record is not None
+                ]
+            for record in records:
+                if (record.status or "").strip().lower() in TERMINAL_STATUSES:
+                    continue
+                groups[record.farm].append(record.job_id)
+        return groups
+
+    async def _poll_statuses(self, job_ids: Iterable[str] | None = None) -> bool:
+        """Refresh non-terminal jobs once and report whether any changed.
+
+        ``job_ids`` restricts the refresh to the jobs the poll schedule found
+        due; by default every non-terminal job is refreshed. Adapter calls run
+        on the poller's bounded executor. Farms whose adapter exposes
+        ``get_job_statuses`` are queried in batches of ``STATUS_BATCH_SIZE``;
+        other farms fall back to one ``get_job_status`` call per job. Each
+        polled job is then rescheduled from its outcome.
+        """
+
+        calls: list[Awaitable[tuple[bool, dict[str, bool | None]]]] = []
+        for farm, farm_job_ids in self._pollable_jobs_by_farm(job_ids).items():
+            adapter = self._adapters.get(farm)
+            if adapter is None:
+                continue
+            if callable(getattr(adapter, "get_job_statuses", None)):
+                for start in range(0, len(farm_job_ids), STATUS_BATCH_SIZE):
+                    chunk = farm_job_ids[start : start + STATUS_BATCH_SIZE]
+                    calls.append(
+                        self._poll_executor.run(self._refresh_job_batch, farm, chunk)
+                    )
+            elif callable(getattr(adapter, "get_job_status", None)):
+                calls.extend(
+                    self._poll_executor.run(self._refresh_job_by_id, job_id)
+                    for job_id in farm_job_ids
+                )
+        if not calls:
+            return False
+        changed = False
+        outcomes: dict[str, bool | None] = {}
+        for job_changed, job_outcomes in await asyncio.gather(*calls):
+            changed = job_changed or changed
+            outcomes.update(job_outcomes)
+        self._reschedule_polls(outcomes)
+        return changed
+
+    def _reschedule_polls(self, outcomes: Mapping[str, bool | None]) -> None:
+        schedule = self._poll_schedule
+        if schedule is None:
+            return
+        now = _utcnow()
+        for job_id, ok in outcomes.items():
+            if ok is False:
+                schedule.record_failure(job_id)
+                continue
+            with self._lock:
+                record = self._jobs.get(job_id)
+                state = (
+                    (record.status, record.updated_at or record.created_at)
+                    if record is not None
+                    else None
+                )
+            if ok is None or state is None:
+                schedule.discard(job_id)
+                continue
+            status, changed_at = state
+            since_change = max((now - changed_at).total_seconds(), 0.0)
+            schedule.record_success(job_id, status, since_change)
 
     async def _run_status_poller(self) -> None:
         assert self._poll_interval is not None
+        assert self._poll_schedule is not None
+        schedule = self._poll_schedule
         try:
             while True:
-                with self._lock:
-                    records = list(self._jobs.values())
-                dirty = False
-                for record in records:
-                    dirty = self._refresh_job(record) or dirty
+                due = schedule.pop_due()
+                dirty = await self._poll_statuses(due) if due else False
                 with self._lock:
                     persist_pending = self._persist_pending
                 if dirty or persist_pending:
-                    self._persist_jobs()
-                await asyncio.sleep(self._poll_interval)
+                    await self._poll_executor.run(self._persist_jobs)
+                if self._store_needs_compaction():
+                    await self._poll_executor.run(self._compact_store)
+                # Jobs submitted while sleeping are first due one base interval
+                # later, so never sleep longer than that.
+                wait = schedule.seconds_until_next()
+                if wait is None or wait > self._poll_interval:
+                    wait = self._poll_interval
+                await asyncio.sleep(wait)
         except asyncio.CancelledError:
             raise
         finally:
@@ -1210,157 +1920,109 @@ class RenderSubmissionService:
             "last_history_prune_at": _serialise_datetime(last_history_prune_at),
             "last_history_pruned": last_history_prune_count,
             "store": store_metrics,
+            "events": self._events.stats.to_dict() if self._events else None,
+            "capabilities": self._capabilities.snapshot(),
         }
 
+    def _sync_analytics(self) -> None:
+        """Rebuild the analytics index if the job table was replaced wholesale."""
+
+        with self._lock:
+            if self._analytics_source is self._jobs:
+                return
+            self._analytics.rebuild(self._jobs.values())
+            self._analytics_source = self._jobs
+
+    def _sync_indexes(self) -> None:
+        """Rebuild the listing index if the job table was replaced wholesale."""
+
+        with self._lock:
+            if self._indexed_jobs is self._jobs:
+                return
+            self._index.clear()
+            for record in self._jobs.values():
+                self._index_record(record)
+            self._indexed_jobs = self._jobs
+
+    def _index_record(self, record: _JobRecord) -> RenderJobMetadata:
+        view = record.snapshot()
+        self._index.upsert(
+            record.job_id,
+            _job_cursor_key(view),
+            view,
+            {"farm": record.farm, "status": record.status, "user": record.request.user},
+        )
+        return view
+
     def get_render_analytics(
         self, *, now: datetime | None = None
     ) -> RenderAnalyticsResponse:
-        """Compute aggregated analytics for render job history."""
+        """Return aggregated analytics for render job history.
+
+        The figures are read from an index updated as jobs are created,
+        change state, or are pruned, so the cost does not grow with history.
+        """
 
         moment = now or _utcnow()
+        self._sync_analytics()
         with self._lock:
-            records = list(self._jobs.values())
-
-            status_totals: dict[str, dict[str, Any]] = {}
-            adapter_totals: dict[str, Any] = {}
-
-            def normalise_status(value: str | None) -> str:
-                if value is None:
-                    return "unknown"
-                text = str(value).strip().lower()
-                return text or "unknown"
-
-            for record in records:
-                record_updated = record.updated_at or record.created_at
-                durations = record.status_durations(now=moment)
-                for status_name, duration_seconds in durations.items():
-                    status_key = normalise_status(status_name)
-                    status_entry = status_totals.setdefault(
-                        status_key,
-                        {
-                            "jobs": set(),
-                            "total_duration": 0.0,
-                            "active": 0,
-                            "last_updated": None,
-                        },
-                    )
-                    # Track job identifiers per status so we can report the number of
-                    # distinct jobs that have visited the status rather than the number
-                    # of status transitions recorded in history.
-                    status_entry["jobs"].add(record.job_id)
-                    status_entry["total_duration"] += max(duration_seconds, 0.0)
-                    if record_updated is not None:
-                        last_updated: datetime | None = status_entry["last_updated"]
-                        if last_updated is None or record_updated > last_updated:
-                            status_entry["last_updated"] = record_updated
-
-                record_status = normalise_status(record.status)
-                status_entry = status_totals.setdefault(
-                    record_status,
-                    {
-                        "jobs": set(),
-                        "total_duration": 0.0,
-                        "active": 0,
-                        "last_updated": None,
-                    },
-                )
-                status_entry["active"] += 1
-                status_entry["jobs"].add(record.job_id)
-                if record_updated is not None:
-                    last_updated = status_entry["last_updated"]
-                    if last_updated is None or record_updated > last_updated:
-                        status_entry["last_updated"] = record_updated
-
-                adapter_entry = adapter_totals.setdefault(
-                    record.farm,
-                    {
-                        "total_jobs": 0,
-                        "statuses": defaultdict(int),
-                        "completed_jobs": 0,
-                        "total_completion": 0.0,
-                        "first_submission": None,
-                        "last_submission": None,
-                    },
-                )
-                adapter_entry["total_jobs"] += 1
-                adapter_entry["statuses"][record_status] += 1
-
-                created_at = record.created_at
-                first_submission: datetime | None = adapter_entry["first_submission"]
-                if first_submission is None or created_at < first_submission:
-                    adapter_entry["first_submission"] = created_at
-                last_submission: datetime | None = adapter_entry["last_submission"]
-                if last_submission is None or created_at > last_submission:
-                    adapter_entry["last_submission"] = created_at
-
-                if record.completed_at is not None:
-                    adapter_entry["completed_jobs"] += 1
-                    completion_seconds = (
-                        record.completed_at - record.created_at
-                    ).total_seconds()
-                    adapter_entry["total_completion"] += max(completion_seconds, 0.0)
+            total_jobs = len(self._jobs)
+            statuses = self._analytics.status_summaries(now=moment)
+            farms = self._analytics.farm_summaries()
+            windows = self._analytics.window_summaries(
+                self.DEFAULT_SUBMISSION_WINDOWS, now=moment
+            )
 
             status_payload: dict[str, RenderStatusAnalytics] = {}
-            for status_name, entry in status_totals.items():
-                count = len(entry["jobs"])
-                active = entry["active"]
-                total_duration = entry["total_duration"]
-                effective_count = count or active
+            for status_name, summary in statuses.items():
+                effective_count = summary.count or summary.active
                 average = (
-                    (total_duration / effective_count) if effective_count else None
+                    (summary.total_seconds / effective_count)
+                    if effective_count
+                    else None
                 )
                 status_payload[status_name] = RenderStatusAnalytics(
-                    count=count,
-                    active=active,
-                    last_updated_at=entry["last_updated"],
+                    count=summary.count,
+                    active=summary.active,
+                    last_updated_at=summary.last_updated_at,
                     durations=DurationMetrics(
-                        total_seconds=total_duration,
+                        total_seconds=summary.total_seconds,
                         average_seconds=average,
                     ),
                 )
 
             adapter_payload: dict[str, RenderAdapterAnalytics] = {}
-            for adapter_name, entry in adapter_totals.items():
-                completed = entry["completed_jobs"]
-                total_completion = entry["total_completion"]
+            for adapter_name, farm_summary in farms.items():
+                completed = farm_summary.completed_jobs
                 adapter_payload[adapter_name] = RenderAdapterAnalytics(
-                    total_jobs=entry["total_jobs"],
-                    statuses=dict(entry["statuses"]),
+                    total_jobs=farm_summary.total_jobs,
+                    statuses=farm_summary.statuses,
                     completed_jobs=completed,
                     average_completion_seconds=(
-                        total_completion / completed if completed else None
+                        farm_summary.total_completion_seconds / completed
+                        if completed
+                        else None
                     ),
-                    first_submission_at=entry["first_submission"],
-                    last_submission_at=entry["last_submission"],
+                    first_submission_at=farm_summary.first_submission_at,
+                    last_submission_at=farm_summary.last_submission_at,
                 )
 
             window_payload: dict[str, RenderWindowAnalytics] = {}
-            for label, window in self.DEFAULT_SUBMISSION_WINDOWS.items():
-                cutoff = moment - window
-                total = 0
-                completed = 0
-                total_completion = 0.0
-                for record in records:
-                    if record.created_at < cutoff:
-                        continue
-                    total += 1
-                    if record.completed_at is not None:
-                        completed += 1
-                        completion_seconds = (
-                            record.completed_at - record.created_at
-                        ).total_seconds()
-                        total_completion += max(completion_seconds, 0.0)
+            for label, window_summary in windows.items():
+                completed = window_summary.completed_jobs
                 window_payload[label] = RenderWindowAnalytics(
-                    total_jobs=total,
+                    total_jobs=window_summary.total_jobs,
                     completed_jobs=completed,
                     average_completion_seconds=(
-                        total_completion / completed if completed else None
+                        window_summary.total_completion_seconds / completed
+                        if completed
+                        else None
                     ),
                 )
 
             response = RenderAnalyticsResponse(
                 generated_at=moment,
-                total_jobs=len(records),
+                total_jobs=total_jobs,
                 statuses=status_payload,
                 adapters=adapter_payload,
                 submission_windows=window_payload,
@@ -1373,19 +2035,57 @@ class RenderSubmissionService:
         record: _JobRecord,
         *,
         payload_override: Mapping[str, Any] | None = None,
-    ) -> None:
-        if not self._events:
-            return
-        payload = {
-            "event": event,
-            "job": record.snapshot().model_dump(mode="json"),
-        }
+        publish: bool = True,
+    ) -> RenderJobMetadata | None:
+        # Every job mutation is announced here, so it doubles as the point
+        # where the data generation advances and the job is marked for the
+        # store's journal.
+        view: RenderJobMetadata | None = None
+        with self._lock:
+            self._generation += 1
+            if event == "job.removed":
+                self._dirty_job_ids.discard(record.job_id)
+                self._removed_job_ids.add(record.job_id)
+                self._analytics.discard(record.job_id)
+                self._index.remove(record.job_id)
+            else:
+                self._dirty_job_ids.add(record.job_id)
+                if self._jobs.get(record.job_id) is record:
+                    self._analytics.observe(record)
+                    view = self._index_record(record)
+        if not self._events or not publish:
+            return view
+        # The view is handed to the broadcaster as-is; it is serialised once
+        # into the shared event frame rather than dumped to a dict here.
+        payload: dict[str, Any] = {"event": event, "job": view or record.snapshot()}
         if payload_override:
             payload.update(payload_override)
-        self._events.publish(payload)
+        self._events.publish(payload, event=event, key=record.job_id)
+        return view
 
 
-JOB_EVENTS = EventBroadcaster(max_buffer=64)
+def _event_coalesce_window_from_env() -> float:
+    raw_value = os.environ.get(RENDER_EVENT_COALESCE_WINDOW_ENV)
+    if raw_value is None:
+        return _DEFAULT_EVENT_COALESCE_WINDOW
+    try:
+        window = float(raw_value)
+    except ValueError:
+        logger.warning(
+            "render.events.coalesce_window.invalid",
+            value=raw_value,
+            env=RENDER_EVENT_COALESCE_WINDOW_ENV,
+        )
+        return _DEFAULT_EVENT_COALESCE_WINDOW
+    return max(window, 0.0)
+
+
+JOB_EVENTS = EventBroadcaster(
+    max_buffer=64,
+    coalesce_window=_event_coalesce_window_from_env(),
+    bus=event_bus_from_env(),
+    channel="render.jobs",
+)
 
 
 @lru_cache
@@ -1396,7 +2096,12 @@ def get_render_service() -> (
     history_limit_value = os.environ.get(JOB_HISTORY_LIMIT_ENV)
     retention_hours_value = os.environ.get(JOB_RETENTION_HOURS_ENV)
     poll_interval_value = os.environ.get(JOB_STATUS_POLL_INTERVAL_ENV)
+    poll_concurrency_value = os.environ.get(JOB_STATUS_POLL_CONCURRENCY_ENV)
+    poll_max_interval_value = os.environ.get(JOB_STATUS_POLL_MAX_INTERVAL_ENV)
     persist_interval_value = os.environ.get(JOB_STORE_PERSIST_THROTTLE_ENV)
+    submit_concurrency_value = os.environ.get(JOB_SUBMIT_CONCURRENCY_ENV)
+    submit_rate_value = os.environ.get(JOB_SUBMIT_RATE_ENV)
+    capability_ttl_value = os.environ.get(JOB_CAPABILITY_TTL_ENV)
 
     retention: timedelta | None = None
     if retention_hours_value:
@@ -1450,6 +2155,44 @@ def get_render_service() -> (
                     env=JOB_STATUS_POLL_INTERVAL_ENV,
                 )
 
+    poll_concurrency_override: int | None = None
+    if poll_concurrency_value is not None:
+        try:
+            poll_concurrency_override = int(poll_concurrency_value)
+        except ValueError:
+            logger.warning(
+                "render.job.poll_concurrency.invalid",
+                value=poll_concurrency_value,
+                env=JOB_STATUS_POLL_CONCURRENCY_ENV,
+            )
+        else:
+            if poll_concurrency_override <= 0:
+                logger.warning(
+                    "render.job.poll_concurrency.ignored",
+                    value=poll_concurrency_value,
+                    env=JOB_STATUS_POLL_CONCURRENCY_ENV,
+                )
+                poll_concurrency_override = None
+
+    poll_max_interval_override: float | None = None
+    if poll_max_interval_value is not None:
+        try:
+            poll_max_interval_override = float(poll_max_interval_value)
+        except ValueError:
+            logger.warning(
+                "render.job.poll_max_interval.invalid",
+                value=poll_max_interval_value,
+                env=JOB_STATUS_POLL_MAX_INTERVAL_ENV,
+            )
+        else:
+            if poll_max_interval_override <= 0:
+                logger.warning(
+                    "render.job.poll_max_interval.ignored",
+                    value=poll_max_interval_value,
+                    env=JOB_STATUS_POLL_MAX_INTERVAL_ENV,
+                )
+                poll_max_interval_override = None
+
     persist_interval_override: float | None = None
     if persist_interval_value is not None:
         try:
@@ -1469,12 +2212,74 @@ def get_render_service() -> (
                     env=JOB_STORE_PERSIST_THROTTLE_ENV,
                 )
 
+    submit_concurrency_override: int | None = None
+    if submit_concurrency_value is not None:
+        try:
+            submit_concurrency_override = int(submit_concurrency_value)
+        except ValueError:
+            logger.warning(
+                "render.job.submit_concurrency.invalid",
+                value=submit_concurrency_value,
+                env=JOB_SUBMIT_CONCURRENCY_ENV,
+            )
+        else:
+            if submit_concurrency_override <= 0:
+                logger.warning(
+                    "render.job.submit_concurrency.ignored",
+                    value=submit_concurrency_value,
+                    env=JOB_SUBMIT_CONCURRENCY_ENV,
+                )
+                submit_concurrency_override = None
+
+    submit_rate_override: float | None = None
+    if submit_rate_value is not None:
+        try:
+            submit_rate_override = float(submit_rate_value)
+        except ValueError:
+            logger.warning(
+                "render.job.submit_rate.invalid",
+                value=submit_rate_value,
+                env=JOB_SUBMIT_RATE_ENV,
+            )
+        else:
+            if submit_rate_override <= 0:
+                logger.warning(
+                    "render.job.submit_rate.disabled",
+                    value=submit_rate_value,
+                    env=JOB_SUBMIT_RATE_ENV,
+                )
+                submit_rate_override = None
+
+    capability_ttl_override: float | None = None
+    if capability_ttl_value is not None:
+        try:
+            capability_ttl_override = float(capability_ttl_value)
+        except ValueError:
+            logger.warning(
+                "render.job.capability_ttl.invalid",
+                value=capability_ttl_value,
+                env=JOB_CAPABILITY_TTL_ENV,
+            )
+        else:
+            if capability_ttl_override <= 0:
+                logger.warning(
+                    "render.job.capability_ttl.disabled",
+                    value=capability_ttl_value,
+                    env=JOB_CAPABILITY_TTL_ENV,
+                )
+                capability_ttl_override = 0.0
+
     service = RenderSubmissionService(
         job_store=job_store,
         history_limit=history_limit,
         broadcaster=JOB_EVENTS,
         status_poll_interval=poll_interval_override,
         store_persist_interval=persist_interval_override,
+        status_poll_concurrency=poll_concurrency_override,
+        status_poll_max_interval=poll_max_interval_override,
+        submission_concurrency=submit_concurrency_override,
+        submission_rate=submit_rate_override,
+        capability_ttl=capability_ttl_override,
     )
 
     RenderJobRequest.configure_farm_registry(service.adapter_keys)
@@ -1497,7 +2302,61 @@ def parse_render_job_request(
         raise RequestValidationError(exc.errors()) from exc
 
 
-app = FastAPI(title="OnePiece Render Service", version=TRAFALGAR_VERSION)
+def parse_render_batch_request(
+    payload: Mapping[str, Any] = Body(...),
+    service: RenderSubmissionService = Depends(get_render_service),
+) -> list[RenderJobRequest]:
+    """Validate every job of a batch submission before any is dispatched."""
+
+    jobs = payload.get("jobs") if isinstance(payload, Mapping) else None
+    if not isinstance(jobs, list) or not jobs:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "missing",
+                    "loc": ("body", "jobs"),
+                    "msg": "Provide a non-empty 'jobs' list.",
+                    "input": payload,
+                }
+            ]
+        )
+    if len(jobs) > MAX_BATCH_SUBMISSIONS:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "too_long",
+                    "loc": ("body", "jobs"),
+                    "msg": f"A batch may contain at most {MAX_BATCH_SUBMISSIONS} jobs.",
+                    "input": len(jobs),
+                }
+            ]
+        )
+    registry = service.adapter_keys()
+    requests: list[RenderJobRequest] = []
+    errors: list[Any] = []
+    for index, job in enumerate(jobs):
+        try:
+            requests.append(
+                RenderJobRequest.model_validate(
+                    job, context={"farm_registry": registry}
+                )
+            )
+        except ValidationError as exc:
+            for error in exc.errors():
+                errors.append(
+                    {**error, "loc": ("body", "jobs", index, *error.get("loc", ()))}
+                )
+    if errors:
+        raise RequestValidationError(errors)
+    return requests
+
+
+app = FastAPI(
+    title="OnePiece Render Service",
+    version=TRAFALGAR_VERSION,
+    default_response_class=FastJSONResponse,
+)
+app.router.route_class = compressed_route_class()
 router = create_protected_router()
 
 
@@ -1652,11 +2511,33 @@ async def create_job(
         job_id=payload.job_id,
     )
 
-    return JSONResponse(status_code=201, content=payload.model_dump())
+    return FastJSONResponse(status_code=201, content=payload.model_dump())
+
+
+@router.post("/jobs/batch", response_model=RenderBatchResponse)  # type: ignore[misc]
+async def create_jobs(
+    job_requests: list[RenderJobRequest] = Depends(parse_render_batch_request),
+    service: RenderSubmissionService = Depends(get_render_service),
+    _principal: AuthenticatedPrincipal = Depends(require_roles(ROLE_RENDER_SUBMIT)),
+) -> RenderBatchResponse:
+    logger.info(
+        "render.api.batch.start",
+        jobs=len(job_requests),
+        farms=sorted({request.farm for request in job_requests}),
+    )
+    response = await service.submit_jobs(job_requests)
+    logger.info(
+        "render.api.batch.complete",
+        submitted=response.submitted,
+        failed=response.failed,
+    )
+    return response
 
 
 @router.get("/jobs", response_model=JobsListResponse)  # type: ignore[misc]
 def list_jobs(
+    request: Request,
+    response: Response,
     service: RenderSubmissionService = Depends(get_render_service),
     _principal: AuthenticatedPrincipal = Depends(require_roles(ROLE_RENDER_READ)),
     limit: int | None = Query(
@@ -1672,9 +2553,62 @@ def list_jobs(
         None,
         description="Filter by one or more farm identifiers.",
     ),
-) -> JobsListResponse:
-    jobs = service.list_jobs(limit=limit, status=status, farm=farm)
-    return JobsListResponse(jobs=jobs)
+    user: list[str] | None = Query(
+        None,
+        description="Filter by one or more submitting users.",
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from a previous X-Next-Cursor header."
+    ),
+    since: datetime | None = Query(
+        None, description="Only include jobs submitted at or after this time."
+    ),
+    until: datetime | None = Query(
+        None, description="Only include jobs submitted at or before this time."
+    ),
+    fields: list[str] | None = Query(
+        None, description="Top-level job fields to include."
+    ),
+    refresh: bool = Query(
+        False,
+        description="Query the render farms for the listed jobs before responding.",
+    ),
+) -> JobsListResponse | Response:
+    query = build_collection_query(
+        limit=limit,
+        cursor=cursor,
+        status_values=status,
+        since=since,
+        until=until,
+        fields=fields,
+    )
+    params = (query.cache_key, tuple(sorted(farm or ())), tuple(sorted(user or ())))
+    if refresh:
+        page = service.page_jobs(query, farm=farm, user=user, refresh=True)
+        etag = compute_etag("render.jobs", service.data_generation, params=params)
+        if etag_matches(request, etag):
+            return not_modified(cast(str, etag))
+    else:
+        # Cached listings only change with the data generation, so a matching
+        # validator short-circuits before any page is built.
+        etag = compute_etag("render.jobs", service.data_generation, params=params)
+        if etag_matches(request, etag):
+            return not_modified(cast(str, etag))
+        page = service.page_jobs(query, farm=farm, user=user)
+    if query.fields is not None:
+        selected = FastJSONResponse(
+            content={
+                "jobs": [
+                    select_fields(job.model_dump(mode="json"), query.fields)
+                    for job in page.items
+                ]
+            }
+        )
+        apply_page_headers(request, selected, page.next_cursor)
+        return apply_cache_headers(selected, etag)
+    apply_page_headers(request, response, page.next_cursor)
+    apply_cache_headers(response, etag)
+    return JobsListResponse(jobs=page.items)
 
 
 @router.get("/jobs/metrics", response_model=RenderAnalyticsResponse)  # type: ignore[misc]
@@ -1685,14 +2619,6 @@ def job_metrics(
     return service.get_render_analytics()
 
 
-def _format_sse_chunk(event_name: str | None, payload: bytes) -> bytes:
-    lines: list[bytes] = []
-    if event_name:
-        lines.append(b"event: " + event_name.encode("utf-8"))
-    lines.append(b"data: " + payload)
-    return b"\n".join(lines) + b"\n\n"
-
-
 def _resolve_render_keepalive_interval(request: Request) -> float:
     return float(
         resolve_keepalive_interval(
@@ -1712,30 +2638,56 @@ async def _render_jobs_snapshot(
     return [job.model_dump(mode="json") for job in jobs]
 
 
-async def _job_event_stream(request: Request) -> AsyncGenerator[bytes, Any]:
+async def _render_snapshot_chunk(
+    service: "RenderSubmissionService",
+) -> tuple[bytes, int]:
+    """Return a ``jobs.snapshot`` SSE chunk and the last sequence it covers."""
+
+    covered = JOB_EVENTS.last_frame
+    jobs_snapshot = await _render_jobs_snapshot(service)
+    snapshot_event = {"event": "jobs.snapshot", "jobs": jobs_snapshot}
+    chunk = format_sse_chunk(
+        "jobs.snapshot",
+        render_json(snapshot_event),
+        event_id=covered.id if covered is not None else None,
+    )
+    return chunk, covered.sequence if covered is not None else 0
+
+
+async def _job_event_stream(
+    request: Request, last_event_id: str | None = None
+) -> AsyncGenerator[bytes, Any]:
     service = get_render_service()
     queue = await JOB_EVENTS.subscribe()
     try:
-        jobs_snapshot = await _render_jobs_snapshot(service)
-        snapshot_event = {"event": "jobs.snapshot", "jobs": jobs_snapshot}
-        snapshot_payload = json.dumps(snapshot_event).encode("utf-8")
-        yield _format_sse_chunk("jobs.snapshot", snapshot_payload)
+        # Frames already replayed (or covered by a snapshot) are skipped
+        # when they also arrive through the live queue.
+        delivered = 0
+        backlog = JOB_EVENTS.replay(last_event_id)
+        if backlog is None:
+            chunk, delivered = await _render_snapshot_chunk(service)
+            yield chunk
+        else:
+            for frame in backlog:
+                delivered = frame.sequence
+                yield frame.sse
 
         while True:
             try:
                 interval = _resolve_render_keepalive_interval(request)
-                event = await asyncio.wait_for(queue.get(), timeout=interval)
+                frame = await asyncio.wait_for(queue.get(), timeout=interval)
             except asyncio.TimeoutError:
                 if await request.is_disconnected():
                     break
-                yield _format_sse_chunk(None, b"{}")
+                yield format_sse_chunk(None, b"{}")
                 continue
-            payload = json.dumps(event).encode("utf-8")
-            event_name = event.get("event") if isinstance(event, Mapping) else None
-            chunk = _format_sse_chunk(
-                event_name if isinstance(event_name, str) else None, payload
-            )
-            yield chunk
+            if frame is RESYNC_FRAME:
+                chunk, delivered = await _render_snapshot_chunk(service)
+                yield chunk
+                continue
+            if frame.sequence <= delivered:
+                continue
+            yield frame.sse
     finally:
         await JOB_EVENTS.unsubscribe(queue)
 
@@ -1745,7 +2697,10 @@ async def stream_jobs(
     request: Request,
     _principal: AuthenticatedPrincipal = Depends(require_roles(ROLE_RENDER_READ)),
 ) -> StreamingResponse:
-    return StreamingResponse(_job_event_stream(request), media_type="text/event-stream")
+    return StreamingResponse(
+        _job_event_stream(request, request.headers.get(LAST_EVENT_ID_HEADER)),
+        media_type="text/event-stream",
+    )
 
 
 @router.websocket("/jobs/ws")  # type: ignore[misc]
@@ -1765,8 +2720,17 @@ async def jobs_websocket(
         await websocket.send_json(handshake)
 
         while True:
-            event = await queue.get()
-            await websocket.send_json(event)
+            frame: EventFrame = await queue.get()
+            if frame is RESYNC_FRAME:
+                jobs_snapshot = await _render_jobs_snapshot(service)
+                await websocket.send_json(
+                    {
+                        "type": "resync",
+                        "snapshot": {"event": "jobs.snapshot", "jobs": jobs_snapshot},
+                    }
+                )
+                continue
+            await websocket.send_text(frame.text)
     except WebSocketDisconnect:
         pass
     finally:
@@ -0,0 +1,369 @@
+"""Incrementally maintained aggregates behind the render analytics endpoint."""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterable, Mapping
+
+if TYPE_CHECKING:  # pragma: no cover - import only used for typing
+    from .render import _JobRecord
+
+
+DEFAULT_BUCKET_SECONDS = 300.0
+
+# Open status intervals are summed as offsets from this reference so the
+# running totals keep sub-millisecond precision.
+_REFERENCE = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def _status_key(value: str | None) -> str:
+    if value is None:
+        return "unknown"
+    text = str(value).strip().lower()
+    return text or "unknown"
+
+
+def _offset(value: datetime) -> float:
+    return (value - _REFERENCE).total_seconds()
+
+
+class _Extreme:
+    """Track the smallest (or largest) datetime across a keyed collection.
+
+    Values are kept in a heap with lazy deletion, so updates and removals are
+    ``O(log n)`` and stale heap entries are discarded when they surface.
+    """
+
+    def __init__(self, *, largest: bool = False) -> None:
+        self._sign = -1.0 if largest else 1.0
+        self._values: dict[str, datetime] = {}
+        self._heap: list[tuple[float, int, str, datetime]] = []
+        self._sequence = itertools.count()
+
+    def set(self, key: str, value: datetime) -> None:
+        if self._values.get(key) == value:
+            return
+        self._values[key] = value
+        heapq.heappush(
+            self._heap, (self._sign * _offset(value), next(self._sequence), key, value)
+        )
+        if len(self._heap) > 2 * len(self._values) + 64:
+            self._heap = [
+                (self._sign * _offset(stored), next(self._sequence), name, stored)
+                for name, stored in self._values.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def discard(self, key: str) -> None:
+        self._values.pop(key, None)
+
+    def peek(self) -> datetime | None:
+        while self._heap:
+            _, _, key, value = self._heap[0]
+            if self._values.get(key) == value:
+                return value
+            heapq.heappop(self._heap)
+        return None
+
+
+@dataclass(slots=True)
+class _JobContribution:
+    """What one job adds to the aggregates, kept so it can be subtracted."""
+
+    farm: str
+    created_at: datetime
+    status: str
+    updated_at: datetime | None
+    visited: frozenset[str]
+    closed: dict[str, float]
+    open_status: str | None
+    open_start: float
+    completion: float | None
+
+    @classmethod
+    def from_record(cls, record: _JobRecord) -> "_JobContribution":
+        history = record.status_history
+        closed: dict[str, float] = defaultdict(float)
+        visited: set[str] = set()
+        open_status: str | None = None
+        open_start = 0.0
+        for index, (status, start) in enumerate(history):
+            key = _status_key(status)
+            if index + 1 < len(history):
+                end = history[index + 1][1]
+            elif record.completed_at is not None:
+                end = record.completed_at
+            else:
+                open_status = key
+                open_start = _offset(start)
+                visited.add(key)
+                continue
+            if end < start:
+                continue
+            closed[key] += (end - start).total_seconds()
+            visited.add(key)
+        status = _status_key(record.status)
+        visited.add(status)
+        completion: float | None = None
+        if record.completed_at is not None:
+            completion = max(
+                (record.completed_at - record.created_at).total_seconds(), 0.0
+            )
+        return cls(
+            farm=record.farm,
+            created_at=record.created_at,
+            status=status,
+            updated_at=record.updated_at or record.created_at,
+            visited=frozenset(visited),
+            closed=dict(closed),
+            open_status=open_status,
+            open_start=open_start,
+            completion=completion,
+        )
+
+
+@dataclass(slots=True)
+class _StatusTotals:
+    visitors: int = 0
+    active: int = 0
+    closed_seconds: float = 0.0
+    open_count: int = 0
+    open_start_sum: float = 0.0
+    last_updated: _Extreme = field(default_factory=lambda: _Extreme(largest=True))
+
+    @property
+    def empty(self) -> bool:
+        return self.visitors == 0 and self.active == 0
+
+
+@dataclass(slots=True)
+class _FarmTotals:
+    total_jobs: int = 0
+    statuses: Counter[str] = field(default_factory=Counter)
+    completed_jobs: int = 0
+    total_completion: float = 0.0
+    first_submission: _Extreme = field(default_factory=_Extreme)
+    last_submission: _Extreme = field(default_factory=lambda: _Extreme(largest=True))
+
+
+@dataclass(slots=True)
+class _Bucket:
+    total_jobs: int = 0
+    completed_jobs: int = 0
+    total_completion: float = 0.0
+    job_ids: set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True, slots=True)
+class StatusSummary:
+    """Aggregated metrics for jobs that visited one status."""
+
+    count: int
+    active: int
+    total_seconds: float
+    last_updated_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class FarmSummary:
+    """Aggregated metrics for the jobs submitted to one farm."""
+
+    total_jobs: int
+    statuses: dict[str, int]
+    completed_jobs: int
+    total_completion_seconds: float
+    first_submission_at: datetime | None
+    last_submission_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class WindowSummary:
+    """Submission counts for jobs created inside a trailing window."""
+
+    total_jobs: int
+    completed_jobs: int
+    total_completion_seconds: float
+
+
+class RenderAnalyticsIndex:
+    """Running aggregates over render job records.
+
+    :meth:`observe` replaces a job's contribution whenever it is created or
+    changes state and :meth:`discard` removes it, so reads cost ``O(statuses +
+    farms)`` plus one pass over the time buckets for the submission windows,
+    independent of the number of jobs. Submissions are bucketed by creation
+    time in ``bucket_seconds`` slots; the bucket straddling a window's cutoff
+    is resolved job by job so window counts stay exact.
+    """
+
+    def __init__(self, *, bucket_seconds: float = DEFAULT_BUCKET_SECONDS) -> None:
+        self._bucket_seconds = max(float(bucket_seconds), 1.0)
+        self._jobs: dict[str, _JobContribution] = {}
+        self._statuses: dict[str, _StatusTotals] = {}
+        self._farms: dict[str, _FarmTotals] = {}
+        self._buckets: dict[int, _Bucket] = {}
+        self._bucket_keys: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def rebuild(self, records: Iterable[_JobRecord]) -> None:
+        """Discard every aggregate and rebuild them from ``records``."""
+
+        self._jobs.clear()
+        self._statuses.clear()
+        self._farms.clear()
+        self._buckets.clear()
+        self._bucket_keys.clear()
+        for record in records:
+            self.observe(record)
+
+    def observe(self, record: _JobRecord) -> None:
+        """Add ``record`` or replace its previous contribution."""
+
+        self.discard(record.job_id)
+        contribution = _JobContribution.from_record(record)
+        self._jobs[record.job_id] = contribution
+        self._apply(record.job_id, contribution, 1)
+
+    def discard(self, job_id: str) -> None:
+        """Remove the contribution of ``job_id`` if it is tracked."""
+
+        contribution = self._jobs.pop(job_id, None)
+        if contribution is not None:
+            self._apply(job_id, contribution, -1)
+
+    def _bucket_key(self, value: datetime) -> int:
+        return int(_offset(value) // self._bucket_seconds)
+
+    def _apply(self, job_id: str, contribution: _JobContribution, sign: int) -> None:
+        for status in contribution.visited:
+            totals = self._statuses.setdefault(status, _StatusTotals())
+            totals.visitors += sign
+            totals.closed_seconds += sign * contribution.closed.get(status, 0.0)
+            if sign > 0 and contribution.updated_at is not None:
+                totals.last_updated.set(job_id, contribution.updated_at)
+            elif sign < 0:
+                totals.last_updated.discard(job_id)
+        if contribution.open_status is not None:
+            totals = self._statuses.setdefault(
+                contribution.open_status, _StatusTotals()
+            )
+            totals.open_count += sign
+            totals.open_start_sum += sign * contribution.open_start
+        current = self._statuses.setdefault(contribution.status, _StatusTotals())
+        current.active += sign
+        for status in contribution.visited:
+            if self._statuses[status].empty:
+                del self._statuses[status]
+
+        farm = self._farms.setdefault(contribution.farm, _FarmTotals())
+        farm.total_jobs += sign
+        farm.statuses[contribution.status] += sign
+        if farm.statuses[contribution.status] <= 0:
+            del farm.statuses[contribution.status]
+        if contribution.completion is not None:
+            farm.completed_jobs += sign
+            farm.total_completion += sign * contribution.completion
+        if sign > 0:
+            farm.first_submission.set(job_id, contribution.created_at)
+            farm.last_submission.set(job_id, contribution.created_at)
+        else:
+            farm.first_submission.discard(job_id)
+            farm.last_submission.discard(job_id)
+            if farm.total_jobs <= 0:
+                del self._farms[contribution.farm]
+
+        key = self._bucket_key(contribution.created_at)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket()
+            bisect.insort(self._bucket_keys, key)
+        bucket.total_jobs += sign
+        if contribution.completion is not None:
+            bucket.completed_jobs += sign
+            bucket.total_completion += sign * contribution.completion
+        if sign > 0:
+            bucket.job_ids.add(job_id)
+        else:
+            bucket.job_ids.discard(job_id)
+            if bucket.total_jobs <= 0:
+                del self._buckets[key]
+                del self._bucket_keys[bisect.bisect_left(self._bucket_keys, key)]
+
+    def status_summaries(self, *, now: datetime) -> dict[str, StatusSummary]:
+        """Return per-status metrics with open intervals measured to ``now``."""
+
+        moment = _offset(now)
+        summaries: dict[str, StatusSummary] = {}
+        for status, totals in self._statuses.items():
+            open_seconds = totals.open_count * moment - totals.open_start_sum
+            summaries[status] = StatusSummary(
+                count=totals.visitors,
+                active=totals.active,
+                total_seconds=max(totals.closed_seconds + open_seconds, 0.0),
+                last_updated_at=totals.last_updated.peek(),
+            )
+        return summaries
+
+    def farm_summaries(self) -> dict[str, FarmSummary]:
+        """Return per-farm submission and completion metrics."""
+
+        return {
+            name: FarmSummary(
+                total_jobs=totals.total_jobs,
+                statuses=dict(totals.statuses),
+                completed_jobs=totals.completed_jobs,
+                total_completion_seconds=totals.total_completion,
+                first_submission_at=totals.first_submission.peek(),
+                last_submission_at=totals.last_submission.peek(),
+            )
+            for name, totals in self._farms.items()
+        }
+
+    def window_summaries(
+        self, windows: Mapping[str, timedelta], *, now: datetime
+    ) -> dict[str, WindowSummary]:
+        """Return submission metrics for each trailing window ending at ``now``."""
+
+        summaries: dict[str, WindowSummary] = {}
+        for label, window in windows.items():
+            cutoff = now - window
+            boundary = self._bucket_key(cutoff)
+            total = completed = 0
+            total_completion = 0.0
+            start = bisect.bisect_right(self._bucket_keys, boundary)
+            for key in self._bucket_keys[start:]:
+                bucket = self._buckets[key]
+                total += bucket.total_jobs
+                completed += bucket.completed_jobs
+                total_completion += bucket.total_completion
+            edge = self._buckets.get(boundary)
+            if edge is not None:
+                for job_id in edge.job_ids:
+                    contribution = self._jobs[job_id]
+                    if contribution.created_at < cutoff:
+                        continue
+                    total += 1
+                    if contribution.completion is not None:
+                        completed += 1
+                        total_completion += contribution.completion
+            summaries[label] = WindowSummary(
+                total_jobs=total,
+                completed_jobs=completed,
+                total_completion_seconds=total_completion,
+            )
+        return summaries
+
+
+__all__ = [
+    "FarmSummary",
+    "RenderAnalyticsIndex",
+    "StatusSummary",
+    "WindowSummary",
+]
@@ -0,0 +1,221 @@
+"""Response rendering and compression helpers shared by the Trafalgar apps."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Callable, Coroutine
+
+import structlog
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from .conditional import gzip_etag
+
+try:  # pragma: no cover - optional dependency
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - fallback to the standard library encoder
+    _orjson = None  # type: ignore[assignment]
+
+logger = structlog.get_logger(__name__)
+
+GZIP_MINIMUM_SIZE_ENV = "TRAFALGAR_GZIP_MINIMUM_SIZE"
+GZIP_LEVEL_ENV = "TRAFALGAR_GZIP_LEVEL"
+_DEFAULT_GZIP_MINIMUM_SIZE = 1024
+_DEFAULT_GZIP_LEVEL = 5
+# Bodies at least this large are compressed on a worker thread so that a burst
+# of big listings does not stall the event loop.
+_THREAD_COMPRESSION_SIZE = 64 * 1024
+
+
+def _encode_fallback(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, PurePath):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serialisable")
+
+
+def render_json(content: Any) -> bytes:
+    """Serialise ``content`` to compact UTF-8 JSON.
+
+    ``orjson`` is used when installed; otherwise the standard library encoder
+    produces the same compact output that :class:`JSONResponse` emits.
+    """
+
+    if isinstance(content, BaseModel):
+        content = content.model_dump(mode="json")
+    if _orjson is not None:
+        return _orjson.dumps(
+            content,
+            default=_encode_fallback,
+            option=_orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_encode_fallback,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` that renders through :func:`render_json`."""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+def _int_from_env(env_name: str, default: int, *, minimum: int, maximum: int) -> int:
+    raw_value = os.environ.get(env_name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError:
+        logger.warning("trafalgar.responses.env_invalid", env=env_name, value=raw_value)
+        return default
+    if not minimum <= value <= maximum:
+        logger.warning("trafalgar.responses.env_ignored", env=env_name, value=raw_value)
+        return default
+    return value
+
+
+def resolve_gzip_minimum_size() -> int:
+    """Return the smallest body size compressed with gzip (``0`` disables it)."""
+
+    return _int_from_env(
+        GZIP_MINIMUM_SIZE_ENV, _DEFAULT_GZIP_MINIMUM_SIZE, minimum=0, maximum=2**31
+    )
+
+
+def resolve_gzip_level() -> int:
+    """Return the gzip compression level applied to large responses."""
+
+    return _int_from_env(GZIP_LEVEL_ENV, _DEFAULT_GZIP_LEVEL, minimum=1, maximum=9)
+
+
+def _accepts_gzip(request: Request) -> bool:
+    header = request.headers.get("accept-encoding", "")
+    for candidate in header.split(","):
+        coding, _, params = candidate.strip().partition(";")
+        if coding.strip().lower() not in {"gzip", "*"}:
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        return True
+    return False
+
+
+def _add_vary(response: Response) -> None:
+    vary = response.headers.get("vary")
+    if not vary:
+        response.headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        response.headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+def _requested_etags(request: Request) -> set[str]:
+    header = request.headers.get("if-none-match", "")
+    return {token.strip().removeprefix("W/") for token in header.split(",") if token}
+
+
+async def compress_response(
+    request: Request, response: Response, *, minimum_size: int, level: int
+) -> Response:
+    """Gzip ``response`` in place when the client accepts it and it is large.
+
+    Compressed bodies carry a ``-gzip`` variant of the route's ``ETag`` and a
+    ``304`` keeps the variant the client revalidated with. Every response on a
+    compressing route gets ``Vary: Accept-Encoding``.
+    """
+
+    if minimum_size <= 0 or isinstance(response, StreamingResponse):
+        return response
+    _add_vary(response)
+    etag = response.headers.get("etag")
+    if response.status_code == 304:
+        if etag and gzip_etag(etag) in _requested_etags(request):
+            response.headers["ETag"] = gzip_etag(etag)
+        return response
+    body = getattr(response, "body", None)
+    if not isinstance(body, (bytes, bytearray)) or len(body) < minimum_size:
+        return response
+    if "content-encoding" in response.headers or not _accepts_gzip(request):
+        return response
+
+    if len(body) >= _THREAD_COMPRESSION_SIZE:
+        compressed = await asyncio.to_thread(
+            gzip.compress, bytes(body), compresslevel=level, mtime=0
+        )
+    else:
+        compressed = gzip.compress(bytes(body), compresslevel=level, mtime=0)
+    response.body = compressed
+    response.headers["Content-Encoding"] = "gzip"
+    response.headers["Content-Length"] = str(len(compressed))
+    if etag:
+        response.headers["ETag"] = gzip_etag(etag)
+    return response
+
+
+def compressed_route_class(
+    *, minimum_size: int | None = None, level: int | None = None
+) -> type[APIRoute]:
+    """Return an ``APIRoute`` subclass that gzips large responses.
+
+    Pass the result as ``route_class`` when creating a router to tune
+    compression for that router; ``None`` values fall back to
+    ``TRAFALGAR_GZIP_MINIMUM_SIZE`` and ``TRAFALGAR_GZIP_LEVEL`` when the routes
+    are registered.
+    """
+
+    class CompressedRoute(APIRoute):
+        def get_route_handler(
+            self,
+        ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            handler = super().get_route_handler()
+            threshold = (
+                resolve_gzip_minimum_size() if minimum_size is None else minimum_size
+            )
+            compresslevel = resolve_gzip_level() if level is None else level
+
+            async def _handler(request: Request) -> Response:
+                response = await handler(request)
+                return await compress_response(
+                    request, response, minimum_size=threshold, level=compresslevel
+                )
+
+            return _handler
+
+    return CompressedRoute
+
+
+__all__ = [
+    "FastJSONResponse",
+    "GZIP_LEVEL_ENV",
+    "GZIP_MINIMUM_SIZE_ENV",
+    "compress_response",
+    "compressed_route_class",
+    "render_json",
+    "resolve_gzip_level",
+    "resolve_gzip_minimum_size",
+]
@@ -16,6 +16,8 @@ from apps.trafalgar.web.security import (
 from libraries.automation.review.dailies import DailiesClip, fetch_playlist_versions
 from libraries.integrations.shotgrid.api import ShotGridClient, ShotGridError
 
+from .responses import FastJSONResponse, compressed_route_class
+
 logger = structlog.get_logger(__name__)
 
 
@@ -160,7 +162,12 @@ def _summarise_clips(clips: Iterable[DailiesClip]) -> dict[str, Any]:
     }
 
 
-app = FastAPI(title="OnePiece Review API", version=TRAFALGAR_VERSION)
+app = FastAPI(
+    title="OnePiece Review API",
+    version=TRAFALGAR_VERSION,
+    default_response_class=FastJSONResponse,
+)
+app.router.route_class = compressed_route_class()
 router = create_protected_router()
 
 
@@ -196,7 +203,7 @@ def list_playlists(
         payload.append({"name": name, **summary})
 
     response = {"project": project_name, "playlists": payload}
-    return JSONResponse(content=response)
+    return FastJSONResponse(content=response)
 
 
 @router.get("/projects/{project_name}/playlists/{playlist_name}")  # type: ignore[misc]
@@ -234,7 +241,7 @@ def playlist_detail(
         "summary": summary,
         "clips": [_clip_to_dict(clip) for clip in clips],
     }
-    return JSONResponse(content=response)
+    return FastJSONResponse(content=response)
 
 
 app.include_router(router)
@@ -11,9 +11,12 @@ from typing import Any, Callable, Iterable, Mapping, Sequence
 import copy
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Security, status
+from fastapi.routing import APIRoute
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import AliasChoices, BaseModel, Field, ValidationError, field_validator
 
+from apps.trafalgar.web.responses import FastJSONResponse, compressed_route_class
+
 logger = structlog.get_logger(__name__)
 
 
@@ -374,16 +377,28 @@ def reset_security_state() -> None:
 
 
 def create_protected_router(
-    *, roles: Sequence[str] | None = None, any_of: bool = True
+    *,
+    roles: Sequence[str] | None = None,
+    any_of: bool = True,
+    route_class: type[APIRoute] | None = None,
 ) -> APIRouter:
-    """Create an ``APIRouter`` guarded by the authentication backend."""
+    """Create an ``APIRouter`` guarded by the authentication backend.
+
+    Routes render JSON through :class:`FastJSONResponse` and gzip large bodies;
+    pass ``route_class`` (see :func:`compressed_route_class`) to tune
+    compression for the router.
+    """
 
     from fastapi import APIRouter
 
     dependencies = [Depends(authenticate_request)]
     if roles:
         dependencies = [Depends(require_roles(*roles, any_of=any_of))]
-    return APIRouter(dependencies=dependencies)
+    return APIRouter(
+        dependencies=dependencies,
+        default_response_class=FastJSONResponse,
+        route_class=route_class or compressed_route_class(),
+    )
 
 
 __all__ = [
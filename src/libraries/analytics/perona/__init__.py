@@ -2,19 +2,24 @@
 
 from .pnl_explainer import CostDriverDelta, summarise_cost_deltas, total_cost_delta
 from .ml_foundations import (
+    CorrelationMatrix,
     Dataset,
+    FeatureAccumulator,
     FeatureImportance,
     FeatureStatistics,
     MLFeature,
     TrainingExample,
     analyse_cost_relationships,
+    compute_correlation_matrix,
     compute_feature_statistics,
     recommend_best_practices,
 )
 
 __all__ = [
+    "CorrelationMatrix",
     "CostDriverDelta",
     "Dataset",
+    "FeatureAccumulator",
     "FeatureImportance",
     "FeatureStatistics",
     "MLFeature",
@@ -22,6 +27,7 @@ __all__ = [
     "total_cost_delta",
     "TrainingExample",
     "analyse_cost_relationships",
+    "compute_correlation_matrix",
     "compute_feature_statistics",
     "recommend_best_practices",
 ]
@@ -0,0 +1,423 @@
+"""Column-oriented storage for Perona render telemetry.
+
+Render metrics arrive as one object per sample, which is convenient for
+serialisation but slow to filter and aggregate in Python once a log holds
+millions of samples.  :class:`RenderMetricColumns` copies the fields the
+analytics need into contiguous columns and answers filters and per-shot
+group-bys with vectorised NumPy operations.  NumPy is optional: without it
+(or with ``use_numpy=False``) the same API runs over :mod:`array` columns in
+pure Python and returns the same results.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import copy
+import math
+import threading
+from typing import TYPE_CHECKING, Any, Protocol, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    try:  # pragma: no cover - exercised when the optional dependency is present
+        import numpy as np
+    except ImportError:  # pragma: no cover - dependency optional
+        np = None  # type: ignore[assignment]
+
+NUMPY_AVAILABLE = np is not None
+
+ShotKey = tuple[str, str]
+
+_EPOCH = datetime(1970, 1, 1)
+_FLOAT_COLUMNS = ("frame_time_ms", "gpu_utilisation")
+_BUFFER_COLUMNS = ("codes", "timestamps", *_FLOAT_COLUMNS)
+
+
+class RenderSample(Protocol):
+    """Attributes read from each render metric sample."""
+
+    sequence: str
+    shot_id: str
+    timestamp: datetime
+    frame_time_ms: float
+    gpu_utilisation: float
+
+
+def _require_numpy() -> Any:
+    """Return :mod:`numpy` or raise a helpful error if unavailable."""
+
+    if np is None:
+        raise RuntimeError(
+            "NumPy is required for the vectorised backend. Install the "
+            "'onepiece[perona-analytics]' extra."
+        )
+    return np
+
+
+def _timestamp_us(value: datetime) -> int:
+    """Return ``value`` as microseconds since the epoch, treating naive as UTC."""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _encode(
+    samples: Iterable[RenderSample],
+    keys: Mapping[ShotKey, int],
+    added: dict[ShotKey, int],
+) -> tuple[array[int], array[int], array[float], array[float]]:
+    """Encode ``samples`` into raw columns.
+
+    Shots missing from ``keys`` are given the next free group codes and
+    recorded in ``added``; ``keys`` itself is left untouched.
+    """
+
+    codes = array("q")
+    timestamps = array("q")
+    frame_times = array("d")
+    gpu_utilisation = array("d")
+    for sample in samples:
+        key = (sample.sequence, sample.shot_id)
+        code = keys.get(key)
+        if code is None:
+            code = added.get(key)
+            if code is None:
+                code = added[key] = len(keys) + len(added)
+        codes.append(code)
+        timestamps.append(_timestamp_us(sample.timestamp))
+        frame_times.append(float(sample.frame_time_ms))
+        gpu_utilisation.append(float(sample.gpu_utilisation))
+    return codes, timestamps, frame_times, gpu_utilisation
+
+
+class _ColumnBuffer:
+    """Append-only column storage shared by successive column snapshots.
+
+    Each :class:`RenderMetricColumns` reads only the first ``length`` rows and
+    ``key_count`` shots it was created with, so rows appended for a newer
+    snapshot never show through an older one. NumPy columns keep spare
+    capacity and double when full; :mod:`array` columns grow in place.
+    """
+
+    def __init__(self, use_numpy: bool) -> None:
+        self.use_numpy = use_numpy
+        self.lock = threading.Lock()
+        self.size = 0
+        self.keys: list[ShotKey] = []
+        self.codes_by_key: dict[ShotKey, int] = {}
+        if use_numpy:
+            numpy = _require_numpy()
+            self.columns: dict[str, Any] = {
+                name: numpy.empty(0, dtype=dtype)
+                for name, dtype in zip(
+                    _BUFFER_COLUMNS,
+                    (numpy.int64, numpy.int64, numpy.float64, numpy.float64),
+                )
+            }
+        else:
+            self.columns = {
+                name: array(typecode)
+                for name, typecode in zip(_BUFFER_COLUMNS, ("q", "q", "d", "d"))
+            }
+
+    def append(self, samples: Iterable[RenderSample]) -> None:
+        """Append ``samples``; callers hold :attr:`lock` and own the last row."""
+
+        added: dict[ShotKey, int] = {}
+        encoded = _encode(samples, self.codes_by_key, added)
+        count = len(encoded[0])
+        if not count:
+            return
+        end = self.size + count
+        for name, values in zip(_BUFFER_COLUMNS, encoded):
+            column = self.columns[name]
+            if not self.use_numpy:
+                column.extend(values)
+                continue
+            if end > len(column):
+                numpy = _require_numpy()
+                grown = numpy.empty(max(end, 2 * len(column)), dtype=column.dtype)
+                grown[: self.size] = column[: self.size]
+                column = self.columns[name] = grown
+            column[self.size : end] = values
+        self.keys.extend(added)
+        self.codes_by_key.update(added)
+        self.size = end
+
+    def copy(self, size: int, key_count: int) -> _ColumnBuffer:
+        """Return a private buffer holding the first ``size`` rows."""
+
+        clone = _ColumnBuffer(self.use_numpy)
+        clone.keys = self.keys[:key_count]
+        clone.codes_by_key = {key: code for code, key in enumerate(clone.keys)}
+        clone.columns = {
+            name: column[:size].copy() if self.use_numpy else column[:size]
+            for name, column in self.columns.items()
+        }
+        clone.size = size
+        return clone
+
+
+@dataclass(frozen=True)
+class GroupStatistics:
+    """Count, sum, mean and population variance of one column for a shot."""
+
+    count: int
+    total: float
+    mean: float
+    variance: float
+
+
+class RenderMetricColumns:
+    """Render telemetry stored as columns with vectorised filters and group-bys.
+
+    Each sample's ``(sequence, shot_id)`` is encoded as an integer group code
+    so per-shot aggregation is a single ``bincount`` pass. Indices returned by
+    :meth:`select` refer to the order of the samples the columns were built
+    from. Instances are never modified in place: :meth:`extended` returns new
+    columns with more samples appended, so readers can keep using the old ones.
+    """
+
+    def __init__(
+        self,
+        samples: Iterable[RenderSample],
+        *,
+        use_numpy: bool | None = None,
+    ) -> None:
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        elif use_numpy:
+            _require_numpy()
+        self._use_numpy = use_numpy
+        self._buffer = _ColumnBuffer(use_numpy)
+        self._buffer.append(samples)
+        self._length = self._buffer.size
+        self._key_count = len(self._buffer.keys)
+
+    def extended(self, samples: Iterable[RenderSample]) -> RenderMetricColumns:
+        """Return columns holding these samples followed by ``samples``.
+
+        Existing indices keep pointing at the same samples. ``self`` is
+        returned unchanged when ``samples`` is empty. The rows are appended to
+        storage shared with ``self``, so extending the newest columns costs
+        time in proportion to ``samples`` only; extending older columns again
+        first copies their rows.
+        """
+
+        buffer = self._buffer
+        with buffer.lock:
+            if buffer.size != self._length:
+                buffer = buffer.copy(self._length, self._key_count)
+            buffer.append(samples)
+            length = buffer.size
+            key_count = len(buffer.keys)
+        if length == self._length:
+            return self
+        clone = copy.copy(self)
+        clone._buffer = buffer
+        clone._length = length
+        clone._key_count = key_count
+        return clone
+
+    def _raw(self, name: str) -> Any:
+        """Return the first ``len(self)`` values of a buffer column."""
+
+        return self._buffer.columns[name][: self._length]
+
+    @property
+    def backend(self) -> str:
+        """``"numpy"`` or ``"python"`` depending on the storage in use."""
+
+        return "numpy" if self._use_numpy else "python"
+
+    @property
+    def keys(self) -> tuple[ShotKey, ...]:
+        """Distinct ``(sequence, shot_id)`` pairs in first-seen order."""
+
+        return tuple(self._buffer.keys[: self._key_count])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def column(self, name: str) -> Sequence[float]:
+        """Return the named float column (a NumPy array or :class:`array.array`)."""
+
+        if name not in _FLOAT_COLUMNS:
+            raise KeyError(
+                f"Unknown column '{name}'; expected one of {', '.join(_FLOAT_COLUMNS)}."
+            )
+        return self._raw(name)  # type: ignore[no-any-return]
+
+    def select(
+        self,
+        *,
+        sequence: str | None = None,
+        shot_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[int]:
+        """Return the indices of samples matching every supplied filter.
+
+        ``since`` and ``until`` bound the timestamp inclusively. Indices are
+        returned in ascending order.
+        """
+
+        codes: set[int] | None = None
+        if sequence is not None or shot_id is not None:
+            codes = {
+                code
+                for code, (key_sequence, key_shot) in enumerate(self.keys)
+                if (sequence is None or key_sequence == sequence)
+                and (shot_id is None or key_shot == shot_id)
+            }
+            if not codes:
+                return []
+        low = _timestamp_us(since) if since is not None else None
+        high = _timestamp_us(until) if until is not None else None
+        group_codes = self._raw("codes")
+        timestamps = self._raw("timestamps")
+
+        if self._use_numpy:
+            numpy = _require_numpy()
+            mask = numpy.ones(self._length, dtype=bool)
+            if codes is not None:
+                mask &= numpy.isin(
+                    group_codes, numpy.fromiter(codes, dtype=numpy.int64)
+                )
+            if low is not None:
+                mask &= timestamps >= low
+            if high is not None:
+                mask &= timestamps <= high
+            return numpy.flatnonzero(mask).tolist()  # type: ignore[no-any-return]
+
+        return [
+            index
+            for index, (code, stamp) in enumerate(zip(group_codes, timestamps))
+            if (codes is None or code in codes)
+            and (low is None or stamp >= low)
+            and (high is None or stamp <= high)
+        ]
+
+    def group_statistics(self, name: str) -> dict[ShotKey, GroupStatistics]:
+        """Return per-shot count, sum, mean and population variance of a column."""
+
+        values = self.column(name)
+        keys = self.keys
+        if not keys:
+            return {}
+        group_codes = self._raw("codes")
+        if self._use_numpy:
+            numpy = _require_numpy()
+            size = len(keys)
+            counts = numpy.bincount(group_codes, minlength=size)
+            totals = numpy.bincount(group_codes, weights=values, minlength=size)
+            means = totals / counts
+            deviations = values - means[group_codes]
+            variances = (
+                numpy.bincount(
+                    group_codes, weights=deviations * deviations, minlength=size
+                )
+                / counts
+            )
+            return {
+                key: GroupStatistics(
+                    count=int(counts[code]),
+                    total=float(totals[code]),
+                    mean=float(means[code]),
+                    variance=float(variances[code]),
+                )
+                for code, key in enumerate(keys)
+            }
+
+        grouped = self._python_groups(group_codes, values)
+        statistics: dict[ShotKey, GroupStatistics] = {}
+        for key, group in zip(keys, grouped):
+            total = math.fsum(group)
+            mean = total / len(group)
+            variance = math.fsum((value - mean) ** 2 for value in group) / len(group)
+            statistics[key] = GroupStatistics(
+                count=len(group), total=total, mean=mean, variance=variance
+            )
+        return statistics
+
+    def group_values(self, name: str) -> dict[ShotKey, tuple[float, ...]]:
+        """Return each shot's column values in sample order."""
+
+        values = self.column(name)
+        keys = self.keys
+        if not keys:
+            return {}
+        group_codes = self._raw("codes")
+        if self._use_numpy:
+            numpy = _require_numpy()
+            order = numpy.argsort(group_codes, kind="stable")
+            boundaries = numpy.cumsum(numpy.bincount(group_codes, minlength=len(keys)))[
+                :-1
+            ]
+            return {
+                key: tuple(group.tolist())
+                for key, group in zip(keys, numpy.split(values[order], boundaries))
+            }
+        return {
+            key: tuple(group)
+            for key, group in zip(keys, self._python_groups(group_codes, values))
+        }
+
+    def _python_groups(
+        self, group_codes: Sequence[int], values: Sequence[float]
+    ) -> list[list[float]]:
+        grouped: list[list[float]] = [[] for _ in range(self._key_count)]
+        for code, value in zip(group_codes, values):
+            grouped[code].append(value)
+        return grouped
+
+
+class FrameTimeGroups(Mapping[ShotKey, tuple[float, ...]]):
+    """Frame times per ``(sequence, shot_id)`` with precomputed statistics.
+
+    Behaves as a read-only mapping of shot keys to frame time tuples; the
+    statistics used by risk scoring are computed once, in a single grouped
+    pass, when the groups are built. The frame time tuples are only grouped
+    the first time a shot's values are read.
+    """
+
+    def __init__(self, columns: RenderMetricColumns) -> None:
+        self._columns = columns
+        self._keys = columns.keys
+        self._values: dict[ShotKey, tuple[float, ...]] | None = None
+        self._statistics = columns.group_statistics("frame_time_ms")
+
+    def __getitem__(self, key: ShotKey) -> tuple[float, ...]:
+        values = self._values
+        if values is None:
+            values = self._values = self._columns.group_values("frame_time_ms")
+        return values[key]
+
+    def __iter__(self) -> Iterator[ShotKey]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._statistics
+
+    def statistics(self, key: ShotKey) -> GroupStatistics | None:
+        """Return the frame time statistics for ``key`` if it has samples."""
+
+        return self._statistics.get(key)
+
+
+__all__ = [
+    "FrameTimeGroups",
+    "GroupStatistics",
+    "NUMPY_AVAILABLE",
+    "RenderMetricColumns",
+    "RenderSample",
+]
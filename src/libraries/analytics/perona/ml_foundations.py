@@ -16,6 +16,8 @@ import math
 import random
 from statistics import mean
 from typing import (
+    TYPE_CHECKING,
+    Any,
     Callable,
     Iterable,
     Mapping,
@@ -25,9 +27,32 @@ from typing import (
     overload,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    try:  # pragma: no cover - exercised when the optional dependency is present
+        import numpy as np
+    except ImportError:  # pragma: no cover - dependency optional
+        np = None  # type: ignore[assignment]
+
+NUMPY_AVAILABLE = np is not None
+
 FeatureTransform = Callable[[float], float]
 
 
+def _use_numpy(use_numpy: bool | None) -> bool:
+    """Resolve the backend flag accepted by the statistics helpers."""
+
+    if use_numpy is None:
+        return NUMPY_AVAILABLE
+    if use_numpy and np is None:
+        raise RuntimeError(
+            "NumPy is required for the vectorised backend. Install the "
+            "'onepiece[perona-analytics]' extra."
+        )
+    return use_numpy
+
+
 @dataclass(frozen=True)
 class MLFeature:
     """Describe an input feature that feeds into a cost model."""
@@ -74,6 +99,7 @@ class Dataset(Sequence[TrainingExample]):
             feature for example in self._examples for feature in example.feature_values
         }
         self._feature_names = tuple(sorted(feature_names))
+        self._moments: FeatureAccumulator | None = None
 
     def __len__(self) -> int:
         return len(self._examples)
@@ -140,6 +166,38 @@ class Dataset(Sequence[TrainingExample]):
 
         return [example.cost for example in self._examples]
 
+    def to_array(self, *, fill_value: float = 0.0) -> Any:
+        """Return features followed by the cost as a contiguous NumPy array.
+
+        Rows follow the dataset order and columns follow :attr:`feature_names`
+        with the target cost in the last column.
+        """
+
+        _use_numpy(True)
+        names = self._feature_names
+        width = len(names) + 1
+
+        def _values() -> Iterable[float]:
+            for example in self._examples:
+                values = example.feature_values
+                for name in names:
+                    yield values.get(name, fill_value)
+                yield example.cost
+
+        flat = np.fromiter(
+            _values(), dtype=np.float64, count=len(self._examples) * width
+        )
+        return flat.reshape(len(self._examples), width)
+
+    def _vectorised_moments(self) -> FeatureAccumulator:
+        """Return cached feature/cost moments computed from :meth:`to_array`."""
+
+        if self._moments is None:
+            self._moments = FeatureAccumulator.from_array(
+                self._feature_names, self.to_array()
+            )
+        return self._moments
+
     def split(
         self,
         *,
@@ -185,8 +243,17 @@ class FeatureStatistics:
     maximum: float
 
 
-def compute_feature_statistics(dataset: Dataset) -> tuple[FeatureStatistics, ...]:
-    """Compute descriptive statistics for each observed feature."""
+def compute_feature_statistics(
+    dataset: Dataset, *, use_numpy: bool | None = None
+) -> tuple[FeatureStatistics, ...]:
+    """Compute descriptive statistics for each observed feature.
+
+    With NumPy available (or ``use_numpy=True``) every feature is summarised
+    from one contiguous array; otherwise each feature is scanned in Python.
+    """
+
+    if _use_numpy(use_numpy):
+        return dataset._vectorised_moments().statistics()
 
     stats: list[FeatureStatistics] = []
     for name in dataset.feature_names:
@@ -220,9 +287,28 @@ class FeatureImportance:
         return "increasing" if self.slope > 0 else "decreasing"
 
 
-def analyse_cost_relationships(dataset: Dataset) -> tuple[FeatureImportance, ...]:
+def _importance(
+    name: str, covariance: float, variance: float, target_std: float
+) -> FeatureImportance:
+    if math.isclose(variance, 0.0):
+        return FeatureImportance(name=name, slope=0.0, correlation=0.0)
+    slope = covariance / variance
+    value_std = math.sqrt(variance)
+    if math.isclose(value_std, 0.0) or math.isclose(target_std, 0.0):
+        correlation = 0.0
+    else:
+        correlation = covariance / (value_std * target_std)
+    return FeatureImportance(name=name, slope=slope, correlation=correlation)
+
+
+def analyse_cost_relationships(
+    dataset: Dataset, *, use_numpy: bool | None = None
+) -> tuple[FeatureImportance, ...]:
     """Estimate linear relationships between each feature and cost."""
 
+    if _use_numpy(use_numpy):
+        return dataset._vectorised_moments().importances()
+
     targets = dataset.to_targets()
     target_mean = mean(targets)
     target_variance = mean((target - target_mean) ** 2 for target in targets)
@@ -237,21 +323,316 @@ def analyse_cost_relationships(dataset: Dataset) -> tuple[FeatureImportance, ...
             for value, target in zip(values, targets)
         )
         variance = mean((value - value_mean) ** 2 for value in values)
-        if math.isclose(variance, 0.0):
-            slope = 0.0
-            correlation = 0.0
-        else:
-            slope = covariance / variance
-            value_std = math.sqrt(variance)
-            if math.isclose(value_std, 0.0) or math.isclose(target_std, 0.0):
-                correlation = 0.0
+        importances.append(_importance(name, covariance, variance, target_std))
+
+    return tuple(sorted(importances, key=lambda item: abs(item.slope), reverse=True))
+
+
+@dataclass(frozen=True)
+class CorrelationMatrix:
+    """Pearson correlations between every pair of features."""
+
+    names: tuple[str, ...]
+    values: tuple[tuple[float, ...], ...]
+
+    def get(self, first: str, second: str) -> float:
+        """Return the correlation between two named features."""
+
+        return self.values[self.names.index(first)][self.names.index(second)]
+
+
+def _correlation_from_covariance(
+    names: tuple[str, ...], covariance: Sequence[Sequence[float]]
+) -> CorrelationMatrix:
+    stddevs = [
+        math.sqrt(max(covariance[index][index], 0.0)) for index in range(len(names))
+    ]
+    rows: list[tuple[float, ...]] = []
+    for row in range(len(names)):
+        values: list[float] = []
+        for column in range(len(names)):
+            scale = stddevs[row] * stddevs[column]
+            if math.isclose(scale, 0.0):
+                values.append(1.0 if row == column else 0.0)
             else:
-                correlation = covariance / (value_std * target_std)
-        importances.append(
-            FeatureImportance(name=name, slope=slope, correlation=correlation)
+                values.append(covariance[row][column] / scale)
+        rows.append(tuple(values))
+    return CorrelationMatrix(names=names, values=tuple(rows))
+
+
+def compute_correlation_matrix(
+    dataset: Dataset, *, use_numpy: bool | None = None
+) -> CorrelationMatrix:
+    """Return the correlation matrix of the dataset's features.
+
+    Features with no variance correlate ``0.0`` with everything but
+    themselves.
+    """
+
+    names = dataset.feature_names
+    if _use_numpy(use_numpy):
+        return dataset._vectorised_moments().correlation_matrix()
+
+    columns = [
+        [example.feature_values.get(name, 0.0) for example in dataset] for name in names
+    ]
+    means = [mean(column) for column in columns]
+    covariance = [
+        [
+            mean(
+                (first - means[row]) * (second - means[column])
+                for first, second in zip(columns[row], columns[column])
+            )
+            for column in range(len(names))
+        ]
+        for row in range(len(names))
+    ]
+    return _correlation_from_covariance(names, covariance)
+
+
+class FeatureAccumulator:
+    """Running, mergeable moments of feature values and cost.
+
+    Samples are folded in with Welford's update and accumulators combine with
+    the parallel formula of Chan et al., so statistics, cost relationships and
+    correlations can be refreshed from new samples only. The accumulator keeps
+    the count, means, extrema and the co-moment matrix of the features and the
+    cost; results use population (``1/n``) moments like
+    :func:`compute_feature_statistics`. Features missing from a sample count
+    as ``0.0``, matching :meth:`Dataset.to_matrix`.
+    """
+
+    def __init__(self) -> None:
+        self._names: list[str] = []
+        self._index: dict[str, int] = {}
+        self._count = 0
+        # Slot 0 holds the cost; features follow in first-seen order.
+        self._means: list[float] = [0.0]
+        self._comoments: list[list[float]] = [[0.0]]
+        self._minimums: list[float] = [math.inf]
+        self._maximums: list[float] = [-math.inf]
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def feature_names(self) -> tuple[str, ...]:
+        return tuple(sorted(self._names))
+
+    def _ensure(self, names: Iterable[str]) -> None:
+        for name in names:
+            if name in self._index:
+                continue
+            self._index[name] = len(self._means)
+            self._names.append(name)
+            self._means.append(0.0)
+            for row in self._comoments:
+                row.append(0.0)
+            self._comoments.append([0.0] * len(self._means))
+            # Earlier samples implicitly recorded 0.0 for the new feature.
+            self._minimums.append(0.0 if self._count else math.inf)
+            self._maximums.append(0.0 if self._count else -math.inf)
+
+    def _positions(self, names: Sequence[str]) -> list[int]:
+        return [0] + [self._index[name] for name in names]
+
+    def update(self, example: TrainingExample) -> None:
+        """Fold a single example into the running moments."""
+
+        self._ensure(example.feature_values)
+        values = [0.0] * len(self._means)
+        values[0] = example.cost
+        for name, value in example.feature_values.items():
+            values[self._index[name]] = value
+        self._count += 1
+        delta = [value - mean for value, mean in zip(values, self._means)]
+        self._means = [mean + d / self._count for mean, d in zip(self._means, delta)]
+        delta_after = [value - mean for value, mean in zip(values, self._means)]
+        for row, row_delta in zip(self._comoments, delta):
+            for column, column_delta in enumerate(delta_after):
+                row[column] += row_delta * column_delta
+        self._minimums = [min(a, b) for a, b in zip(self._minimums, values)]
+        self._maximums = [max(a, b) for a, b in zip(self._maximums, values)]
+
+    def update_many(
+        self, examples: Iterable[TrainingExample], *, use_numpy: bool | None = None
+    ) -> None:
+        """Fold ``examples`` in, as one vectorised batch when NumPy is available."""
+
+        if not _use_numpy(use_numpy):
+            for example in examples:
+                self.update(example)
+            return
+        batch = tuple(examples)
+        if batch:
+            self.merge_from(Dataset(batch)._vectorised_moments())
+
+    @classmethod
+    def from_array(cls, names: Sequence[str], matrix: Any) -> FeatureAccumulator:
+        """Build an accumulator from a :meth:`Dataset.to_array` NumPy array.
+
+        ``matrix`` holds one column per name followed by the cost column.
+        """
+
+        accumulator = cls()
+        accumulator._ensure(names)
+        if not len(matrix):
+            return accumulator
+        ordered = matrix[:, [len(names), *range(len(names))]]
+        means = ordered.mean(axis=0)
+        centred = ordered - means
+        accumulator._count = int(ordered.shape[0])
+        accumulator._means = means.tolist()
+        accumulator._comoments = (centred.T @ centred).tolist()
+        accumulator._minimums = ordered.min(axis=0).tolist()
+        accumulator._maximums = ordered.max(axis=0).tolist()
+        return accumulator
+
+    def copy(self) -> FeatureAccumulator:
+        """Return an independent copy of the accumulator."""
+
+        duplicate = FeatureAccumulator()
+        duplicate._names = list(self._names)
+        duplicate._index = dict(self._index)
+        duplicate._count = self._count
+        duplicate._means = list(self._means)
+        duplicate._comoments = [list(row) for row in self._comoments]
+        duplicate._minimums = list(self._minimums)
+        duplicate._maximums = list(self._maximums)
+        return duplicate
+
+    def merge_from(self, other: FeatureAccumulator) -> None:
+        """Combine the samples of ``other`` into this accumulator."""
+
+        self._ensure(other._names)
+        if not other._count:
+            return
+        aligned = other.copy()
+        aligned._ensure(self._names)
+        positions = aligned._positions(self._names)
+        other_means = [aligned._means[i] for i in positions]
+        other_comoments = [
+            [aligned._comoments[i][j] for j in positions] for i in positions
+        ]
+        other_minimums = [aligned._minimums[i] for i in positions]
+        other_maximums = [aligned._maximums[i] for i in positions]
+        if not self._count:
+            self._count = aligned._count
+            self._means = other_means
+            self._comoments = other_comoments
+            self._minimums = other_minimums
+            self._maximums = other_maximums
+            return
+
+        total = self._count + aligned._count
+        weight = self._count * aligned._count / total
+        delta = [b - a for a, b in zip(self._means, other_means)]
+        self._means = [
+            mean + d * aligned._count / total for mean, d in zip(self._means, delta)
+        ]
+        for row, other_row, row_delta in zip(self._comoments, other_comoments, delta):
+            for column, column_delta in enumerate(delta):
+                row[column] += other_row[column] + row_delta * column_delta * weight
+        self._minimums = [min(a, b) for a, b in zip(self._minimums, other_minimums)]
+        self._maximums = [max(a, b) for a, b in zip(self._maximums, other_maximums)]
+        self._count = total
+
+    def merge(self, other: FeatureAccumulator) -> FeatureAccumulator:
+        """Return a new accumulator holding the samples of both."""
+
+        merged = self.copy()
+        merged.merge_from(other)
+        return merged
+
+    def _require_samples(self) -> None:
+        if not self._count:
+            msg = "FeatureAccumulator requires at least one sample"
+            raise ValueError(msg)
+
+    def _variance(self, position: int) -> float:
+        return max(self._comoments[position][position] / self._count, 0.0)
+
+    def statistics(self) -> tuple[FeatureStatistics, ...]:
+        """Return :class:`FeatureStatistics` for each feature, sorted by name."""
+
+        self._require_samples()
+        return tuple(
+            FeatureStatistics(
+                name=name,
+                mean=self._means[self._index[name]],
+                stddev=math.sqrt(self._variance(self._index[name])),
+                minimum=self._minimums[self._index[name]],
+                maximum=self._maximums[self._index[name]],
+            )
+            for name in self.feature_names
         )
 
-    return tuple(sorted(importances, key=lambda item: abs(item.slope), reverse=True))
+    def importances(self) -> tuple[FeatureImportance, ...]:
+        """Return cost relationships as :func:`analyse_cost_relationships` does."""
+
+        self._require_samples()
+        target_std = math.sqrt(self._variance(0))
+        importances = [
+            _importance(
+                name,
+                self._comoments[self._index[name]][0] / self._count,
+                self._variance(self._index[name]),
+                target_std,
+            )
+            for name in self.feature_names
+        ]
+        return tuple(
+            sorted(importances, key=lambda item: abs(item.slope), reverse=True)
+        )
+
+    def correlation_matrix(self) -> CorrelationMatrix:
+        """Return the feature correlation matrix."""
+
+        self._require_samples()
+        names = self.feature_names
+        positions = [self._index[name] for name in names]
+        covariance = [
+            [self._comoments[row][column] / self._count for column in positions]
+            for row in positions
+        ]
+        return _correlation_from_covariance(names, covariance)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot of the accumulator."""
+
+        return {
+            "names": list(self._names),
+            "count": self._count,
+            "means": list(self._means),
+            "comoments": [list(row) for row in self._comoments],
+            "minimums": [None if math.isinf(v) else v for v in self._minimums],
+            "maximums": [None if math.isinf(v) else v for v in self._maximums],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> FeatureAccumulator:
+        """Rebuild an accumulator saved with :meth:`to_dict`."""
+
+        accumulator = cls()
+        accumulator._ensure(str(name) for name in payload["names"])
+        size = len(accumulator._means)
+        means = [float(value) for value in payload["means"]]
+        comoments = [[float(value) for value in row] for row in payload["comoments"]]
+        if len(means) != size or any(len(row) != size for row in comoments):
+            msg = "Accumulator snapshot does not match its feature names"
+            raise ValueError(msg)
+        accumulator._count = int(payload["count"])
+        accumulator._means = means
+        accumulator._comoments = comoments
+        accumulator._minimums = [
+            math.inf if value is None else float(value) for value in payload["minimums"]
+        ]
+        accumulator._maximums = [
+            -math.inf if value is None else float(value)
+            for value in payload["maximums"]
+        ]
+        return accumulator
 
 
 def recommend_best_practices(
@@ -280,12 +661,16 @@ def recommend_best_practices(
 
 
 __all__ = [
+    "NUMPY_AVAILABLE",
+    "CorrelationMatrix",
     "Dataset",
+    "FeatureAccumulator",
     "FeatureImportance",
     "FeatureStatistics",
     "MLFeature",
     "TrainingExample",
     "analyse_cost_relationships",
+    "compute_correlation_matrix",
     "compute_feature_statistics",
     "recommend_best_practices",
 ]
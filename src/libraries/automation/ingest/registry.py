@@ -128,6 +128,17 @@ class IngestRunRegistry:
     def path(self) -> Path:
         return self._path
 
+    @property
+    def generation(self) -> int:
+        """Return a token identifying the current registry file contents.
+
+        The token is derived from the file's modification time and size, the
+        same fingerprint that governs cache reloads, so separate registry
+        instances agree on it and reading it costs a single ``stat`` call.
+        """
+
+        return hash(self._snapshot())
+
     def _snapshot(self) -> tuple[float, int] | None:
         try:
             stat = self._path.stat()
@@ -2,6 +2,7 @@
 
 from .analytics import (
     cost_per_frame,
+    average_frame_time_by_frame,
     average_frame_time_by_sequence,
     average_frame_time_by_shot,
     rolling_mean,
@@ -9,12 +10,16 @@ from .analytics import (
     total_cost_per_shot,
 )
 from .base import RenderSubmissionError, SubmissionResult
+from .chunking import ChunkPlan, ChunkSegment, FrameTimeHistory, plan_chunks
 from .optimization import (
     CostBreakdown,
+    CostBreakdownBatch,
+    CostModelBatch,
     CostModelInput,
     OptimizationProjection,
     OptimizationScenario,
     estimate_cost,
+    estimate_costs,
     simulate_optimizations,
 )
 
@@ -22,15 +27,23 @@ __all__ = [
     "RenderSubmissionError",
     "SubmissionResult",
     "cost_per_frame",
+    "average_frame_time_by_frame",
     "average_frame_time_by_sequence",
     "average_frame_time_by_shot",
     "rolling_mean",
     "total_cost_per_sequence",
     "total_cost_per_shot",
+    "ChunkPlan",
+    "ChunkSegment",
+    "FrameTimeHistory",
+    "plan_chunks",
     "CostModelInput",
+    "CostModelBatch",
     "CostBreakdown",
+    "CostBreakdownBatch",
     "OptimizationScenario",
     "OptimizationProjection",
     "estimate_cost",
+    "estimate_costs",
     "simulate_optimizations",
 ]
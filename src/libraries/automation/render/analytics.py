@@ -15,6 +15,14 @@ class FrameTimeSample(Protocol):
     frame_time_ms: SupportsFloat
 
 
+@runtime_checkable
+class FrameIndexedSample(Protocol):
+    """Protocol describing telemetry samples recorded for a specific frame."""
+
+    frame: int
+    frame_time_ms: SupportsFloat
+
+
 @runtime_checkable
 class ShotRenderSummary(Protocol):
     """Protocol describing summary telemetry for rendered frame counts."""
@@ -79,6 +87,26 @@ def average_frame_time_by_shot(
     return {key: totals[key] / counts[key] for key in totals if counts[key]}
 
 
+def average_frame_time_by_frame(
+    samples: Iterable[FrameIndexedSample],
+) -> dict[int, float]:
+    """Return the mean frame time recorded for each frame number.
+
+    Repeated renders of the same frame are averaged together, so the result
+    describes how render cost varies across a shot's frame range.
+    """
+
+    totals: dict[int, float] = defaultdict(float)
+    counts: dict[int, int] = defaultdict(int)
+
+    for sample in samples:
+        frame = int(sample.frame)
+        totals[frame] += float(sample.frame_time_ms)
+        counts[frame] += 1
+
+    return {frame: totals[frame] / counts[frame] for frame in totals if counts[frame]}
+
+
 def rolling_mean(
     values: Sequence[SupportsFloat], window: int
 ) -> tuple[float | None, ...]:
@@ -219,6 +247,7 @@ def total_cost_per_sequence(
 
 __all__ = [
     "cost_per_frame",
+    "average_frame_time_by_frame",
     "average_frame_time_by_sequence",
     "average_frame_time_by_shot",
     "rolling_mean",
@@ -0,0 +1,326 @@
+"""Plan render chunk sizes from historical frame times."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import re
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Sequence, SupportsFloat
+
+from .analytics import FrameIndexedSample, average_frame_time_by_frame
+
+DEFAULT_SIZE_TOLERANCE = 0.25
+
+_FRAME_SEGMENT_PATTERN = re.compile(
+    r"^(?P<start>-?\d+)(?:-(?P<end>-?\d+)(?:x(?P<step>\d+))?)?$"
+)
+
+
+def parse_frame_segment(segment: str) -> range:
+    """Return the frames of one Deadline style segment (e.g. ``20-30x2``)."""
+
+    match = _FRAME_SEGMENT_PATTERN.match(segment)
+    if match is None:
+        raise ValueError(
+            f"Frame range segment '{segment}' must use Deadline notation (e.g. 1-10,20-30x2)."
+        )
+    start = int(match.group("start"))
+    end = int(match.group("end") or start)
+    step = int(match.group("step") or 1)
+    if end < start:
+        raise ValueError(
+            f"Frame range segment '{segment}' must have the end greater than or equal to the start."
+        )
+    if step <= 0:
+        raise ValueError(f"Frame range segment '{segment}' must use a positive step.")
+    return range(start, end + 1, step)
+
+
+def parse_frames(frames: str) -> tuple[int, ...]:
+    """Expand a Deadline style frame list (e.g. ``1-10,20-30x2``) in order."""
+
+    expanded: list[int] = []
+    seen: set[int] = set()
+    for segment in frames.split(","):
+        for frame in parse_frame_segment(segment.strip()):
+            if frame not in seen:
+                seen.add(frame)
+                expanded.append(frame)
+    return tuple(expanded)
+
+
+def format_frames(frames: Sequence[int]) -> str:
+    """Collapse ``frames`` into Deadline notation, keeping their order."""
+
+    parts: list[str] = []
+    index = 0
+    while index < len(frames):
+        start = frames[index]
+        if index + 1 == len(frames):
+            parts.append(str(start))
+            break
+        step = frames[index + 1] - start
+        end_index = index + 1
+        while (
+            step > 0
+            and end_index + 1 < len(frames)
+            and frames[end_index + 1] - frames[end_index] == step
+        ):
+            end_index += 1
+        if step <= 0:
+            parts.append(str(start))
+            index += 1
+            continue
+        end = frames[end_index]
+        parts.append(f"{start}-{end}" if step == 1 else f"{start}-{end}x{step}")
+        index = end_index + 1
+    return ",".join(parts)
+
+
+@dataclass(frozen=True)
+class FrameTime:
+    """Frame time observation, optionally tied to a frame number."""
+
+    frame_time_ms: float
+    frame: int | None = None
+    sequence: str | None = None
+    shot_id: str | None = None
+
+
+class FrameTimeHistory:
+    """Estimated render time per frame derived from past renders.
+
+    Frames with recorded times use them directly; frames between recorded
+    ones are linearly interpolated and frames outside the recorded span use
+    the nearest recorded value. Without any per-frame data every frame costs
+    ``default_ms``.
+    """
+
+    def __init__(
+        self,
+        frame_times: Mapping[int, SupportsFloat] | None = None,
+        *,
+        default_ms: SupportsFloat | None = None,
+    ) -> None:
+        values = {int(frame): float(ms) for frame, ms in (frame_times or {}).items()}
+        if any(ms <= 0 for ms in values.values()):
+            raise ValueError("frame times must be positive")
+        default = float(default_ms) if default_ms is not None else None
+        if default is not None and default <= 0:
+            raise ValueError("default_ms must be positive")
+        if not values and default is None:
+            raise ValueError("frame history requires frame times or default_ms")
+        self._frames = sorted(values)
+        self._times = [values[frame] for frame in self._frames]
+        self._values = values
+        self._default = default
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: Iterable[object],
+        *,
+        sequence: str | None = None,
+        shot_id: str | None = None,
+    ) -> "FrameTimeHistory":
+        """Build a history from telemetry samples.
+
+        ``samples`` may mix per-frame records (with a ``frame`` attribute) and
+        per-shot telemetry such as Perona render metrics; the latter only
+        contribute to the fallback mean. ``sequence`` and ``shot_id`` filter
+        samples that carry those attributes.
+        """
+
+        selected: list[object] = []
+        for sample in samples:
+            if sequence is not None and getattr(sample, "sequence", None) != sequence:
+                continue
+            if shot_id is not None and getattr(sample, "shot_id", None) != shot_id:
+                continue
+            if float(getattr(sample, "frame_time_ms")) <= 0:
+                continue
+            selected.append(sample)
+        indexed = [
+            sample
+            for sample in selected
+            if isinstance(sample, FrameIndexedSample)
+            and getattr(sample, "frame") is not None
+        ]
+        default = None
+        if selected:
+            default = math.fsum(
+                float(getattr(sample, "frame_time_ms")) for sample in selected
+            ) / len(selected)
+        return cls(average_frame_time_by_frame(indexed), default_ms=default)
+
+    def estimate_ms(self, frame: int) -> float:
+        """Return the expected render time of ``frame`` in milliseconds."""
+
+        recorded = self._values.get(frame)
+        if recorded is not None:
+            return recorded
+        if not self._frames:
+            assert self._default is not None
+            return self._default
+        position = bisect.bisect_left(self._frames, frame)
+        if position == 0:
+            return self._times[0]
+        if position == len(self._frames):
+            return self._times[-1]
+        low, high = self._frames[position - 1], self._frames[position]
+        weight = (frame - low) / (high - low)
+        return self._times[position - 1] + weight * (
+            self._times[position] - self._times[position - 1]
+        )
+
+
+@dataclass(frozen=True)
+class ChunkSegment:
+    """Contiguous frames dispatched with a single chunk size."""
+
+    frames: str
+    frame_count: int
+    chunk_size: int
+    chunk_count: int
+    estimated_seconds: float
+    longest_chunk_seconds: float
+
+
+@dataclass(frozen=True)
+class ChunkPlan:
+    """Chunk sizes chosen for a frame range and their expected durations."""
+
+    target_seconds: float
+    segments: tuple[ChunkSegment, ...]
+
+    @property
+    def chunk_count(self) -> int:
+        return sum(segment.chunk_count for segment in self.segments)
+
+    @property
+    def estimated_seconds(self) -> float:
+        return math.fsum(segment.estimated_seconds for segment in self.segments)
+
+    @property
+    def longest_chunk_seconds(self) -> float:
+        return max(
+            (segment.longest_chunk_seconds for segment in self.segments), default=0.0
+        )
+
+
+def _greedy_chunk_sizes(
+    costs: Sequence[float],
+    budget: float,
+    min_size: int,
+    max_size: int | None,
+) -> list[int]:
+    sizes: list[int] = []
+    index = 0
+    while index < len(costs):
+        size = 0
+        total = 0.0
+        while index + size < len(costs):
+            if max_size is not None and size >= max_size:
+                break
+            cost = costs[index + size]
+            # Stop once adding the next frame moves the chunk further from
+            # the budget than leaving it out.
+            if size >= min_size and total + cost - budget > budget - total:
+                break
+            total += cost
+            size += 1
+        sizes.append(size)
+        index += size
+    return sizes
+
+
+def plan_chunks(
+    frames: Sequence[int],
+    history: FrameTimeHistory,
+    *,
+    target_seconds: float,
+    overhead_seconds: float = 0.0,
+    min_chunk_size: int = 1,
+    max_chunk_size: int | None = None,
+    tolerance: float = DEFAULT_SIZE_TOLERANCE,
+) -> ChunkPlan:
+    """Split ``frames`` into chunks that each take about ``target_seconds``.
+
+    Frames are walked in order and grouped until the estimated chunk time,
+    including ``overhead_seconds`` of per-chunk farm start-up, is closest to
+    the target, so cheap stretches get long chunks and expensive stretches
+    short ones. Neighbouring chunks whose sizes differ by no more than
+    ``tolerance`` (a fraction of the segment's first size) share a segment and
+    are dispatched with their rounded mean size; every segment maps onto one
+    farm job, so a shot with uniform cost stays a single job.
+    """
+
+    if not frames:
+        raise ValueError("frames cannot be empty")
+    if target_seconds <= 0:
+        raise ValueError("target_seconds must be positive")
+    if overhead_seconds < 0:
+        raise ValueError("overhead_seconds cannot be negative")
+    if min_chunk_size <= 0:
+        raise ValueError("min_chunk_size must be positive")
+    if max_chunk_size is not None and max_chunk_size < min_chunk_size:
+        raise ValueError("max_chunk_size cannot be below min_chunk_size")
+    if tolerance < 0:
+        raise ValueError("tolerance cannot be negative")
+
+    costs = [history.estimate_ms(frame) / 1000.0 for frame in frames]
+    budget = max(target_seconds - overhead_seconds, 0.0)
+    sizes = _greedy_chunk_sizes(costs, budget, min_chunk_size, max_chunk_size)
+
+    runs: list[list[int]] = []
+    for position, size in enumerate(sizes):
+        if not runs:
+            runs.append([size])
+            continue
+        reference = runs[-1][0]
+        remainder = position == len(sizes) - 1 and size < reference
+        if remainder or abs(size - reference) <= tolerance * reference:
+            runs[-1].append(size)
+        else:
+            runs.append([size])
+
+    segments: list[ChunkSegment] = []
+    start = 0
+    for run in runs:
+        count = sum(run)
+        # A short final chunk is the remainder of the range; it joins the
+        # previous segment and stays out of the mean.
+        sample = run[:-1] if len(run) > 1 and start + count == len(frames) else run
+        chunk_size = max(round(sum(sample) / len(sample)), min_chunk_size)
+        if max_chunk_size is not None:
+            chunk_size = min(chunk_size, max_chunk_size)
+        segment_costs = costs[start : start + count]
+        chunk_times = [
+            overhead_seconds + math.fsum(segment_costs[offset : offset + chunk_size])
+            for offset in range(0, count, chunk_size)
+        ]
+        segments.append(
+            ChunkSegment(
+                frames=format_frames(frames[start : start + count]),
+                frame_count=count,
+                chunk_size=chunk_size,
+                chunk_count=len(chunk_times),
+                estimated_seconds=math.fsum(chunk_times),
+                longest_chunk_seconds=max(chunk_times),
+            )
+        )
+        start += count
+    return ChunkPlan(target_seconds=float(target_seconds), segments=tuple(segments))
+
+
+__all__ = [
+    "ChunkPlan",
+    "ChunkSegment",
+    "FrameTime",
+    "FrameTimeHistory",
+    "format_frames",
+    "parse_frame_segment",
+    "parse_frames",
+    "plan_chunks",
+]
@@ -1,5 +1,5 @@
 from typing import Protocol
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 
 from libraries.automation.render.base import AdapterCapabilities, SubmissionResult
 
@@ -18,7 +18,19 @@ class RenderAdapter(Protocol):
     ) -> SubmissionResult: ...
 
 
+class BatchStatusProvider(Protocol):
+    """Optional adapter capability returning many job statuses in one call.
+
+    Job identifiers missing from the returned mapping are refreshed through the
+    adapter's per-job ``get_job_status`` when available.
+    """
+
+    def get_job_statuses(
+        self, job_ids: Sequence[str]
+    ) -> Mapping[str, SubmissionResult]: ...
+
+
 CapabilityProvider = Callable[[], AdapterCapabilities]
 
 
-__all__ = ["RenderAdapter", "CapabilityProvider"]
+__all__ = ["BatchStatusProvider", "RenderAdapter", "CapabilityProvider"]
@@ -1,9 +1,28 @@
-"""Simulation helpers for render cost optimisation scenarios."""
+"""Simulation helpers for render cost optimisation scenarios.
+
+:func:`estimate_cost` prices a single workload. :func:`estimate_costs` prices
+many at once from column-oriented inputs (:class:`CostModelBatch`) and returns
+the breakdowns as columns, using vectorised NumPy arithmetic when the optional
+dependency is installed and a plain loop otherwise.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
-from typing import Sequence
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields, replace
+import itertools
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Sequence, cast
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    try:  # pragma: no cover - exercised when the optional dependency is present
+        import numpy as np
+    except ImportError:  # pragma: no cover - dependency optional
+        np = None  # type: ignore[assignment]
+
+NUMPY_AVAILABLE = np is not None
 
 
 @dataclass(frozen=True)
@@ -62,53 +81,310 @@ class OptimizationProjection:
     savings_percent: float
 
 
+_INPUT_FIELDS = tuple(item.name for item in fields(CostModelInput))
+_BREAKDOWN_FIELDS = tuple(item.name for item in fields(CostBreakdown))
+
+# (field, strictly positive) pairs checked before estimating; the remaining
+# rates must merely be non-negative.
+_VALIDATED_FIELDS = (
+    ("frame_count", True),
+    ("average_frame_time_ms", True),
+    ("gpu_hourly_rate", False),
+    ("gpu_count", True),
+    ("render_farm_hourly_rate", False),
+    ("storage_rate_per_gb", False),
+    ("egress_rate_per_gb", False),
+)
+
+# Decimal places each breakdown field is rounded to.
+_ROUNDING = {
+    "gpu_hours": 4,
+    "render_hours": 4,
+    "gpu_cost": 2,
+    "render_farm_cost": 2,
+    "storage_cost": 2,
+    "egress_cost": 2,
+    "misc_cost": 2,
+    "total_cost": 2,
+    "cost_per_frame": 4,
+}
+
+
+def _require_numpy() -> Any:
+    """Return :mod:`numpy` or raise a helpful error if unavailable."""
+
+    if np is None:
+        raise RuntimeError(
+            "NumPy is required for vectorised cost estimation. Install the "
+            "'onepiece[perona-analytics]' extra."
+        )
+    return np
+
+
+def _validation_error(name: str, strict: bool) -> ValueError:
+    requirement = "must be positive" if strict else "cannot be negative"
+    return ValueError(f"{name} {requirement}")
+
+
+@dataclass(frozen=True)
+class CostModelBatch:
+    """Column-oriented :class:`CostModelInput` values for :func:`estimate_costs`.
+
+    Every field holds either one value per workload (a sequence or NumPy
+    array) or a scalar shared by all of them. All sequences must have the
+    same length; a batch made only of scalars describes a single workload.
+    """
+
+    frame_count: int | Sequence[int]
+    average_frame_time_ms: float | Sequence[float]
+    gpu_hourly_rate: float | Sequence[float]
+    gpu_count: int | Sequence[int] = 1
+    render_hours: float | Sequence[float] = 0.0
+    render_farm_hourly_rate: float | Sequence[float] = 0.0
+    storage_gb: float | Sequence[float] = 0.0
+    storage_rate_per_gb: float | Sequence[float] = 0.0
+    data_egress_gb: float | Sequence[float] = 0.0
+    egress_rate_per_gb: float | Sequence[float] = 0.0
+    misc_costs: float | Sequence[float] = 0.0
+
+    def __post_init__(self) -> None:
+        lengths = {
+            len(value)
+            for value in (getattr(self, name) for name in _INPUT_FIELDS)
+            if not isinstance(value, Real)
+        }
+        if len(lengths) > 1:
+            raise ValueError("CostModelBatch columns must have the same length")
+
+    @classmethod
+    def from_inputs(cls, inputs: Iterable[CostModelInput]) -> CostModelBatch:
+        """Transpose individual inputs into columns."""
+
+        rows = tuple(inputs)
+        return cls(
+            **{name: [getattr(row, name) for row in rows] for name in _INPUT_FIELDS}
+        )
+
+    @classmethod
+    def from_baseline(cls, baseline: CostModelInput, **columns: Any) -> CostModelBatch:
+        """Return ``baseline`` with the named fields replaced by ``columns``."""
+
+        values = {name: getattr(baseline, name) for name in _INPUT_FIELDS}
+        values.update(columns)
+        return cls(**values)
+
+    def __len__(self) -> int:
+        for name in _INPUT_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, Real):
+                return len(value)
+        return 1
+
+
+class CostBreakdownBatch(Sequence[CostBreakdown]):
+    """Breakdowns returned by :func:`estimate_costs`, stored as columns.
+
+    Reading :meth:`column` avoids materialising a :class:`CostBreakdown` per
+    workload; indexing or iterating builds them on demand.
+    """
+
+    def __init__(self, columns: dict[str, Sequence[float]], size: int) -> None:
+        self._columns = columns
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> Sequence[float]:
+        """Return one breakdown field for every workload."""
+
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(
+                f"Unknown column '{name}'; expected one of "
+                f"{', '.join(_BREAKDOWN_FIELDS)}."
+            ) from None
+
+    def __getitem__(self, index: int) -> CostBreakdown:  # type: ignore[override]
+        if not -self._size <= index < self._size:
+            raise IndexError("CostBreakdownBatch index out of range")
+        values: dict[str, Any] = {
+            name: float(self._columns[name][index]) for name in _BREAKDOWN_FIELDS
+        }
+        values["frame_count"] = int(values["frame_count"])
+        values["concurrency"] = int(values["concurrency"])
+        return CostBreakdown(**values)
+
+    def __iter__(self) -> Iterator[CostBreakdown]:
+        for index in range(self._size):
+            yield self[index]
+
+
+def estimate_costs(
+    inputs: CostModelBatch | Iterable[CostModelInput],
+    *,
+    use_numpy: bool | None = None,
+) -> CostBreakdownBatch:
+    """Estimate the render cost of many workloads in one call.
+
+    ``inputs`` is a :class:`CostModelBatch` or an iterable of
+    :class:`CostModelInput`. Each breakdown equals what :func:`estimate_cost`
+    returns for that workload on either backend, including rounding. Invalid
+    values raise the same :class:`ValueError` as :func:`estimate_cost`.
+    """
+
+    batch = (
+        inputs
+        if isinstance(inputs, CostModelBatch)
+        else CostModelBatch.from_inputs(inputs)
+    )
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy:
+        return _estimate_costs_numpy(batch)
+
+    size = len(batch)
+    for name, strict in _VALIDATED_FIELDS:
+        value = getattr(batch, name)
+        if isinstance(value, Real):
+            lowest = float(value)
+        else:
+            lowest = min(cast(Sequence[float], value), default=1.0)
+        if lowest <= 0 if strict else lowest < 0:
+            raise _validation_error(name, strict)
+    input_columns = []
+    for name in _INPUT_FIELDS:
+        value = getattr(batch, name)
+        input_columns.append(
+            itertools.repeat(value, size) if isinstance(value, Real) else value
+        )
+    rows = map(_estimate, *input_columns)
+    columns = [list(column) for column in zip(*rows)] or [[] for _ in _BREAKDOWN_FIELDS]
+    return CostBreakdownBatch(dict(zip(_BREAKDOWN_FIELDS, columns)), size)
+
+
+def _estimate_costs_numpy(batch: CostModelBatch) -> CostBreakdownBatch:
+    numpy = _require_numpy()
+    size = len(batch)
+    values = {
+        name: numpy.broadcast_to(
+            numpy.asarray(getattr(batch, name), dtype=numpy.float64), (size,)
+        )
+        for name in _INPUT_FIELDS
+    }
+    for name, strict in _VALIDATED_FIELDS:
+        lowest = values[name].min(initial=1)
+        if lowest <= 0 if strict else lowest < 0:
+            raise _validation_error(name, strict)
+
+    frame_count = values["frame_count"]
+    gpu_hours = frame_count * values["average_frame_time_ms"] / 1000 / 3600
+    concurrency = numpy.maximum(values["gpu_count"], 1)
+    render_hours = numpy.where(
+        values["render_hours"] > 0, values["render_hours"], gpu_hours / concurrency
+    )
+    gpu_cost = gpu_hours * values["gpu_hourly_rate"]
+    render_farm_cost = render_hours * values["render_farm_hourly_rate"]
+    storage_cost = values["storage_gb"] * values["storage_rate_per_gb"]
+    egress_cost = values["data_egress_gb"] * values["egress_rate_per_gb"]
+    misc_cost = values["misc_costs"]
+    total_cost = gpu_cost + render_farm_cost + storage_cost + egress_cost + misc_cost
+
+    raw = {
+        "gpu_hours": gpu_hours,
+        "render_hours": render_hours,
+        "gpu_cost": gpu_cost,
+        "render_farm_cost": render_farm_cost,
+        "storage_cost": storage_cost,
+        "egress_cost": egress_cost,
+        "misc_cost": misc_cost,
+        "total_cost": total_cost,
+        "cost_per_frame": total_cost / frame_count,
+    }
+    columns: dict[str, Sequence[float]] = {
+        "frame_count": frame_count.astype(numpy.int64),
+        "concurrency": concurrency.astype(numpy.int64),
+    }
+    for name, digits in _ROUNDING.items():
+        columns[name] = _round_half_like_python(numpy, raw[name], digits)
+    return CostBreakdownBatch({name: columns[name] for name in _BREAKDOWN_FIELDS}, size)
+
+
+def _round_half_like_python(numpy: Any, values: Any, digits: int) -> Any:
+    """Round ``values`` to ``digits`` places exactly as :func:`round` does.
+
+    :func:`numpy.round` rounds the scaled product ``value * 10**digits``, which
+    is itself rounded, so a value such as ``0.025`` (stored slightly above the
+    half-way point) comes out as ``0.02`` where :func:`round` gives ``0.03``.
+    The two can only disagree when the scaled product lies within a couple of
+    units in the last place of a half-way point, so those few entries are
+    re-rounded with :func:`round`.
+    """
+
+    scaled = values * 10.0**digits
+    rounded = numpy.round(values, digits)
+    distance = numpy.abs(scaled - numpy.floor(scaled) - 0.5)
+    near_half = numpy.flatnonzero(distance <= 2 * numpy.spacing(numpy.abs(scaled)))
+    for index in near_half.tolist():
+        rounded[index] = round(float(values[index]), digits)
+    return rounded
+
+
 def estimate_cost(inputs: CostModelInput) -> CostBreakdown:
     """Estimate the render cost for a set of model inputs."""
 
-    if inputs.frame_count <= 0:
-        raise ValueError("frame_count must be positive")
-    if inputs.average_frame_time_ms <= 0:
-        raise ValueError("average_frame_time_ms must be positive")
-    if inputs.gpu_hourly_rate < 0:
-        raise ValueError("gpu_hourly_rate cannot be negative")
-    if inputs.gpu_count <= 0:
-        raise ValueError("gpu_count must be positive")
-    if inputs.render_farm_hourly_rate < 0:
-        raise ValueError("render_farm_hourly_rate cannot be negative")
-    if inputs.storage_rate_per_gb < 0:
-        raise ValueError("storage_rate_per_gb cannot be negative")
-    if inputs.egress_rate_per_gb < 0:
-        raise ValueError("egress_rate_per_gb cannot be negative")
-
-    frame_seconds = inputs.frame_count * inputs.average_frame_time_ms / 1000
+    for name, strict in _VALIDATED_FIELDS:
+        value = getattr(inputs, name)
+        if value <= 0 if strict else value < 0:
+            raise _validation_error(name, strict)
+
+    return CostBreakdown(*_estimate(*(getattr(inputs, name) for name in _INPUT_FIELDS)))
+
+
+def _estimate(
+    frame_count: int,
+    average_frame_time_ms: float,
+    gpu_hourly_rate: float,
+    gpu_count: int,
+    render_hours: float,
+    render_farm_hourly_rate: float,
+    storage_gb: float,
+    storage_rate_per_gb: float,
+    data_egress_gb: float,
+    egress_rate_per_gb: float,
+    misc_costs: float,
+) -> tuple[Any, ...]:
+    """Return the breakdown field values for validated inputs, in field order."""
+
+    frame_seconds = frame_count * average_frame_time_ms / 1000
     gpu_hours = frame_seconds / 3600
-    concurrency = max(inputs.gpu_count, 1)
+    concurrency = max(gpu_count, 1)
     theoretical_render_hours = frame_seconds / 3600 / concurrency
-    render_hours = (
-        inputs.render_hours if inputs.render_hours > 0 else theoretical_render_hours
-    )
+    if render_hours <= 0:
+        render_hours = theoretical_render_hours
 
-    gpu_cost = gpu_hours * inputs.gpu_hourly_rate
-    render_farm_cost = render_hours * inputs.render_farm_hourly_rate
-    storage_cost = inputs.storage_gb * inputs.storage_rate_per_gb
-    egress_cost = inputs.data_egress_gb * inputs.egress_rate_per_gb
-    misc_cost = inputs.misc_costs
+    gpu_cost = gpu_hours * gpu_hourly_rate
+    render_farm_cost = render_hours * render_farm_hourly_rate
+    storage_cost = storage_gb * storage_rate_per_gb
+    egress_cost = data_egress_gb * egress_rate_per_gb
+    misc_cost = misc_costs
 
     total_cost = gpu_cost + render_farm_cost + storage_cost + egress_cost + misc_cost
-    cost_per_frame = total_cost / inputs.frame_count
-
-    return CostBreakdown(
-        frame_count=inputs.frame_count,
-        gpu_hours=round(gpu_hours, 4),
-        render_hours=round(render_hours, 4),
-        concurrency=concurrency,
-        gpu_cost=round(gpu_cost, 2),
-        render_farm_cost=round(render_farm_cost, 2),
-        storage_cost=round(storage_cost, 2),
-        egress_cost=round(egress_cost, 2),
-        misc_cost=round(misc_cost, 2),
-        total_cost=round(total_cost, 2),
-        cost_per_frame=round(cost_per_frame, 4),
+    cost_per_frame = total_cost / frame_count
+
+    return (
+        frame_count,
+        round(gpu_hours, 4),
+        round(render_hours, 4),
+        concurrency,
+        round(gpu_cost, 2),
+        round(render_farm_cost, 2),
+        round(storage_cost, 2),
+        round(egress_cost, 2),
+        round(misc_cost, 2),
+        round(total_cost, 2),
+        round(cost_per_frame, 4),
     )
 
 
@@ -117,12 +393,13 @@ def simulate_optimizations(
 ) -> tuple[CostBreakdown, tuple[OptimizationProjection, ...]]:
     """Simulate cost savings for the supplied optimisation ``scenarios``."""
 
-    baseline_breakdown = estimate_cost(baseline)
+    scenario_inputs = [_apply_scenario(baseline, scenario) for scenario in scenarios]
+    breakdowns = estimate_costs([baseline, *scenario_inputs])
+    baseline_breakdown = breakdowns[0]
     projections: list[OptimizationProjection] = []
 
-    for scenario in scenarios:
-        scenario_input = _apply_scenario(baseline, scenario)
-        breakdown = estimate_cost(scenario_input)
+    for index, scenario in enumerate(scenarios, start=1):
+        breakdown = breakdowns[index]
         savings = round(baseline_breakdown.total_cost - breakdown.total_cost, 2)
         savings_percent = 0.0
         if baseline_breakdown.total_cost:
@@ -170,9 +447,13 @@ def _apply_scenario(
 
 __all__ = [
     "CostModelInput",
+    "CostModelBatch",
     "CostBreakdown",
+    "CostBreakdownBatch",
+    "NUMPY_AVAILABLE",
     "OptimizationScenario",
     "OptimizationProjection",
     "estimate_cost",
+    "estimate_costs",
     "simulate_optimizations",
 ]
@@ -38,6 +38,10 @@ VERSION_FIELDS = ",".join(
     ]
 )
 
+# Upper bound on ids per ``id[$in]`` filter so bulk lookups stay within
+# typical URL length limits.
+VERSION_ID_BATCH_SIZE = 200
+
 
 @dataclass
 class DailiesClip:
@@ -195,6 +199,17 @@ def fetch_playlist_versions(
         )
         return []
 
+    version_ids = playlist_version_ids(playlist)
+    if not version_ids:
+        return []
+
+    filters = [{"id[$in]": ",".join(str(vid) for vid in version_ids)}]
+    return _fetch_versions(client, filters)
+
+
+def playlist_version_ids(playlist: object) -> list[int]:
+    """Return the Version identifiers referenced by a playlist record."""
+
     relationships = (
         playlist.get("relationships", {}) if isinstance(playlist, dict) else {}
     )
@@ -210,11 +225,42 @@ def fetch_playlist_versions(
                 version_ids.append(int(entry["id"]))
             except (TypeError, ValueError):
                 continue
-    if not version_ids:
-        return []
+    return version_ids
 
-    filters = [{"id[$in]": ",".join(str(vid) for vid in version_ids)}]
-    return _fetch_versions(client, filters)
+
+def fetch_versions_by_ids(
+    client: ShotGridClient,
+    version_ids: Iterable[int],
+    *,
+    batch_size: int = VERSION_ID_BATCH_SIZE,
+) -> dict[int, DailiesClip]:
+    """Resolve many Versions with chunked ``id[$in]`` lookups.
+
+    Returns clips keyed by Version id so callers can regroup them per playlist.
+    Versions without playable media are omitted, matching
+    :func:`fetch_playlist_versions`.
+    """
+
+    unique_ids = list(dict.fromkeys(int(vid) for vid in version_ids))
+    size = max(1, int(batch_size))
+    clips: dict[int, DailiesClip] = {}
+    for start in range(0, len(unique_ids), size):
+        chunk = unique_ids[start : start + size]
+        filters: list[dict[str, object]] = [
+            {"id[$in]": ",".join(str(vid) for vid in chunk)}
+        ]
+        log.debug("dailies.fetch_versions_by_ids", count=len(chunk))
+        for record in client.list_versions_raw(filters, VERSION_FIELDS):
+            if not isinstance(record, dict) or record.get("id") is None:
+                continue
+            try:
+                identifier = int(cast(str | int, record["id"]))
+            except (TypeError, ValueError):
+                continue
+            clip = _build_clip(record)
+            if clip:
+                clips[identifier] = clip
+    return clips
 
 
 def fetch_today_approved_versions(
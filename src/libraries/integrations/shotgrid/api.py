@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 from urllib.parse import urljoin
@@ -328,6 +328,14 @@ class ShotGridClient:
     def get_project(self, name: str) -> Any:
         return self._get_single("Project", [{"name": name}])
 
+    def list_projects_by_name(self, names: Iterable[str]) -> List[Dict[str, Any]]:
+        """Return Project records for every name in *names* using one query."""
+
+        unique = sorted({str(name).strip() for name in names if str(name).strip()})
+        if not unique:
+            return []
+        return self._get_paginated("Project", [{"name[$in]": unique}], "id,name,code")
+
     def get_project_id_by_name(self, project_name: str) -> Optional[int]:
         log.debug("sg.get_project_id_by_name", project=project_name)
         result = self._get_single("Project", [{"name": project_name}])
@@ -370,6 +378,39 @@ class ShotGridClient:
         fields = "id,name,code,versions"
         return self._get_paginated("Playlist", filters, fields)
 
+    def list_playlists_for_projects(
+        self,
+        project_ids: Iterable[int],
+        fields: Sequence[str] | str = (
+            "id",
+            "name",
+            "code",
+            "project",
+            "updated_at",
+            "versions",
+        ),
+    ) -> List[Dict[str, Any]]:
+        """Return playlists for all *project_ids* in a single ``$in`` query.
+
+        Version memberships are included so callers can resolve every playlist's
+        versions with bulk ``id[$in]`` lookups instead of one request per
+        playlist.
+        """
+
+        identifiers = sorted({int(project_id) for project_id in project_ids})
+        if not identifiers:
+            return []
+
+        if isinstance(fields, str):
+            field_param = fields
+        else:
+            field_param = ",".join(str(field).strip() for field in fields if field)
+
+        filters = [
+            {"project.id[$in]": ",".join(str(identifier) for identifier in identifiers)}
+        ]
+        return self._get_paginated("Playlist", filters, field_param)
+
     def get_playlist_record(
         self,
         filters: Optional[List[Dict[str, Any]]] = None,
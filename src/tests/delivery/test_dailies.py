@@ -245,3 +245,33 @@ def test_dailies_cli_creates_missing_output_directory(
     assert ffmpeg_calls == [output]
     manifest_path = output.with_name(f"{output.name}.manifest.json")
     assert manifest_path.exists()
+
+
+def test_fetch_versions_by_ids_chunks_bulk_lookups() -> None:
+    client = _PaginatedShotGridClient()
+    requests: list[list[dict[str, object]]] = []
+    records = {
+        int(record["id"]): record  # type: ignore[call-overload]
+        for page in client._version_pages
+        for record in page
+    }
+
+    def _list_versions_raw(
+        filters: list[dict[str, object]],
+        fields: str,
+        *,
+        page_size: int | None = 100,
+    ) -> list[dict[str, object]]:
+        requests.append(filters)
+        ids = [int(value) for value in str(filters[0]["id[$in]"]).split(",")]
+        return [records[identifier] for identifier in ids]
+
+    client.list_versions_raw = _list_versions_raw  # type: ignore[method-assign]
+
+    clips = dailies.fetch_versions_by_ids(
+        client, [101, 102, 103, 101, 104], batch_size=3
+    )
+
+    assert requests == [[{"id[$in]": "101,102,103"}], [{"id[$in]": "104"}]]
+    assert sorted(clips) == [101, 102, 103, 104]
+    assert clips[103].shot == "shot_003"
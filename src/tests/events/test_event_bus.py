@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from apps.trafalgar.web.event_bus import EventHandler, SQLiteEventBus
+from apps.trafalgar.web.events import EventBroadcaster
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def test_sqlite_bus_delivers_to_other_processes_only(tmp_path: Path) -> None:
+    path = tmp_path / "events.db"
+    first = SQLiteEventBus(path, poll_interval=0.01)
+    second = SQLiteEventBus(path, poll_interval=0.01)
+    received: list[tuple[str, str | None, bytes]] = []
+    arrived = threading.Event()
+
+    def _collect(name: str) -> EventHandler:
+        def _handler(event: str | None, data: bytes) -> None:
+            received.append((name, event, data))
+            arrived.set()
+
+        return _handler
+
+    first.subscribe("render.jobs", _collect("first"))
+    second.subscribe("render.jobs", _collect("second"))
+    second.subscribe("ingest.runs", _collect("second-ingest"))
+    try:
+        first.publish("render.jobs", "job.created", b'{"event":"job.created"}')
+        assert arrived.wait(timeout=2)
+    finally:
+        first.close()
+        second.close()
+
+    assert received == [("second", "job.created", b'{"event":"job.created"}')]
+
+
+def test_sqlite_bus_keeps_frames_until_they_are_committed(tmp_path: Path) -> None:
+    path = tmp_path / "events.db"
+    bus = SQLiteEventBus(path)
+    bus._outbox.append(("render.jobs", "job.created", b"{}"))
+    blocker = sqlite3.connect(path)
+    blocker.execute("BEGIN IMMEDIATE")
+    connection = sqlite3.connect(path, timeout=0.01)
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            bus._write(connection)
+        assert len(bus._outbox) == 1
+
+        blocker.rollback()
+        bus._write(connection)
+        assert not bus._outbox
+        count = connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        assert count == 1
+    finally:
+        blocker.close()
+        connection.close()
+        bus.close()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_broadcasters_share_events_through_the_bus(tmp_path: Path) -> None:
+    path = tmp_path / "events.db"
+    bus_a = SQLiteEventBus(path, poll_interval=0.01)
+    worker_a = EventBroadcaster(bus=bus_a, channel="render.jobs")
+    bus_b = SQLiteEventBus(path, poll_interval=0.01)
+    worker_b = EventBroadcaster(bus=bus_b, channel="render.jobs")
+    queue = await worker_b.subscribe()
+    try:
+        worker_a.publish({"event": "job.created", "job": {"job_id": "a-1"}})
+        frame = await asyncio.wait_for(queue.get(), timeout=2)
+    finally:
+        await worker_b.unsubscribe(queue)
+        bus_a.close()
+        bus_b.close()
+
+    assert frame.payload == {"event": "job.created", "job": {"job_id": "a-1"}}
+    assert frame.id.endswith("-1")
+    assert worker_a.stats.relayed == 1
+    assert worker_b.stats.received == 1
@@ -12,7 +12,11 @@ from typing import Any, Iterator
 import pytest
 from fastapi.testclient import TestClient
 from apps.trafalgar.web import ingest, render
-from apps.trafalgar.web.events import EventBroadcaster, clear_keepalive_caches
+from apps.trafalgar.web.events import (
+    RESYNC_FRAME,
+    EventBroadcaster,
+    clear_keepalive_caches,
+)
 from libraries.automation.ingest.registry import IngestRunRecord
 from libraries.automation.ingest.service import IngestReport, IngestedMedia, MediaInfo
 from tests.security_patches import patch_security
@@ -170,7 +174,98 @@ async def test_publish_from_thread_without_running_loop() -> None:
     message = await asyncio.wait_for(queue.get(), timeout=1)
     await broadcaster.unsubscribe(queue)
 
-    assert message == {"event": "thread"}
+    assert message.payload == {"event": "thread"}
+    assert json.loads(message.data) == {"event": "thread"}
+
+
+@pytest.mark.anyio("asyncio")
+async def test_publish_shares_one_frame_and_replays_after_last_event_id() -> None:
+    broadcaster = EventBroadcaster(max_buffer=4, replay_size=2)
+    first = await broadcaster.subscribe()
+    second = await broadcaster.subscribe()
+
+    for index in range(3):
+        broadcaster.publish({"event": "tick", "index": index}, event="tick")
+    await asyncio.sleep(0)
+
+    frames = [first.get_nowait() for _ in range(3)]
+    shared = [second.get_nowait() for _ in range(3)]
+    assert all(mine is theirs for mine, theirs in zip(frames, shared))
+    assert frames[0].sse.startswith(b"event: tick\ndata: {")
+    assert frames[0].sse.endswith(b"id: " + frames[0].id.encode() + b"\n\n")
+    assert broadcaster.last_event_id == frames[-1].id
+
+    assert broadcaster.replay(frames[1].id) == [frames[2]]
+    assert broadcaster.replay(frames[2].id) == []
+    assert broadcaster.replay(frames[0].id) == [frames[1], frames[2]]
+    # The first frame was evicted, so resuming from before it needs a snapshot,
+    # as does an id minted by another broadcaster.
+    assert broadcaster.replay(frames[0].id.rsplit("-", 1)[0] + "-0") is None
+    assert broadcaster.replay("0" + frames[0].id) is None
+    assert broadcaster.replay("garbage") is None
+
+
+@pytest.mark.anyio("asyncio")
+async def test_publish_coalesces_bursts_per_key() -> None:
+    broadcaster = EventBroadcaster(max_buffer=8, coalesce_window=0.01)
+    queue = await broadcaster.subscribe()
+
+    for index in range(5):
+        broadcaster.publish({"job": "a", "index": index}, event="job.updated", key="a")
+    broadcaster.publish({"job": "b"}, event="job.updated", key="b")
+    broadcaster.publish({"event": "unkeyed"})
+
+    unkeyed = await asyncio.wait_for(queue.get(), timeout=1)
+    first = await asyncio.wait_for(queue.get(), timeout=1)
+    second = await asyncio.wait_for(queue.get(), timeout=1)
+    await broadcaster.unsubscribe(queue)
+
+    assert unkeyed.payload == {"event": "unkeyed"}
+    assert first.payload == {"job": "a", "index": 4}
+    assert second.payload == {"job": "b"}
+    assert queue.empty()
+    stats = broadcaster.stats
+    assert (stats.published, stats.coalesced, stats.delivered) == (7, 4, 3)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_coalesced_burst_keeps_the_creation_event() -> None:
+    broadcaster = EventBroadcaster(max_buffer=8, coalesce_window=0.01)
+    queue = await broadcaster.subscribe()
+
+    broadcaster.publish(
+        {"event": "job.created", "status": "queued"}, event="job.created", key="a"
+    )
+    broadcaster.publish(
+        {"event": "job.updated", "status": "running"}, event="job.updated", key="a"
+    )
+    broadcaster.publish({"event": "job.created"}, event="job.created", key="b")
+    broadcaster.publish({"event": "job.removed"}, event="job.removed", key="b")
+
+    created = await asyncio.wait_for(queue.get(), timeout=1)
+    removed = await asyncio.wait_for(queue.get(), timeout=1)
+    await broadcaster.unsubscribe(queue)
+
+    assert created.event == "job.created"
+    assert created.payload == {"event": "job.created", "status": "running"}
+    assert created.sse.startswith(b"event: job.created\n")
+    assert removed.event == "job.removed"
+    assert removed.payload == {"event": "job.removed"}
+
+
+@pytest.mark.anyio("asyncio")
+async def test_slow_subscriber_is_resynced_instead_of_growing() -> None:
+    broadcaster = EventBroadcaster(max_buffer=2)
+    slow = await broadcaster.subscribe()
+
+    for index in range(4):
+        broadcaster.publish({"index": index})
+
+    assert slow.qsize() == 2
+    assert slow.get_nowait() is RESYNC_FRAME
+    assert slow.get_nowait().payload == {"index": 3}
+    stats = broadcaster.stats
+    assert (stats.subscribers, stats.dropped, stats.resyncs) == (1, 3, 1)
 
 
 @pytest.mark.anyio("asyncio")
@@ -216,6 +311,46 @@ async def test_render_job_stream_emits_created_events(
     assert payload["job"]["job_id"] == "stub-1"
 
 
+@pytest.mark.anyio("asyncio")
+async def test_render_job_stream_resumes_from_last_event_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    adapter = StubJobAdapter()
+    broadcaster = EventBroadcaster(max_buffer=4)
+    monkeypatch.setattr(render, "JOB_EVENTS", broadcaster)
+    service = render.RenderSubmissionService({"mock": adapter}, broadcaster=broadcaster)
+    monkeypatch.setattr(render, "get_render_service", lambda: service)
+
+    class _Request:
+        async def is_disconnected(self) -> bool:  # pragma: no cover - simple stub
+            return False
+
+    listener = await broadcaster.subscribe()
+    request = render.RenderJobRequest(**_job_payload())
+    service.submit_job(request)
+    service.submit_job(request)
+    await asyncio.sleep(0)
+    first = listener.get_nowait()
+    second = listener.get_nowait()
+    await broadcaster.unsubscribe(listener)
+
+    stream = render._job_event_stream(_Request(), first.id)
+    chunk = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    await stream.aclose()
+
+    assert chunk == second.sse
+    assert chunk.startswith(b"event: job.created")
+    assert f"id: {second.id}".encode() in chunk
+    assert json.loads(second.data)["job"]["job_id"] == "stub-2"
+
+    stream = render._job_event_stream(_Request(), "unknown-7")
+    chunk = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    await stream.aclose()
+
+    assert chunk.startswith(b"event: jobs.snapshot")
+    assert f"id: {second.id}".encode() in chunk
+
+
 @pytest.mark.anyio("asyncio")
 async def test_render_job_stream_snapshot_offloads_job_listing(
     monkeypatch: pytest.MonkeyPatch,
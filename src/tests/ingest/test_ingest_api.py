@@ -17,6 +17,7 @@ import fastapi.security.api_key
 import apps.trafalgar.web.security as security
 from fastapi.security.http import HTTPAuthorizationCredentials
 from apps.trafalgar.web.ingest import app, get_ingest_run_service
+from apps.trafalgar.web.pagination import build_collection_query
 from apps.trafalgar.web import render, ingest
 
 
@@ -176,3 +177,62 @@ def test_get_run_returns_404_for_missing_record(monkeypatch: MonkeyPatch) -> Non
     assert response.status_code == 404, response.text
 
     app.dependency_overrides.clear()
+
+
+def test_page_runs_filters_and_serialises_only_the_page() -> None:
+    records = []
+    for index in range(5):
+        record = _make_record(f"run-{index}")
+        record.started_at = datetime(2024, 1, 5 - index, tzinfo=timezone.utc)
+        if index == 1:
+            record.completed_at = None
+        records.append(record)
+    serialised: list[str] = []
+
+    def _serialise(record: IngestRunRecord) -> dict[str, str]:
+        serialised.append(record.run_id)
+        return {"id": record.run_id, "status": "x", "extra": "y"}
+
+    service = IngestRunService(
+        provider=DummyIngestProvider(records), serializer=_serialise
+    )
+
+    first = service.page_runs(
+        build_collection_query(limit=2, status_values=["completed"], fields=["id"])
+    )
+    second = service.page_runs(
+        build_collection_query(
+            limit=2,
+            cursor=first.next_cursor,
+            status_values=["completed"],
+            fields=["id"],
+        )
+    )
+
+    assert first.items == [{"id": "run-0"}, {"id": "run-2"}]
+    assert second.items == [{"id": "run-3"}, {"id": "run-4"}]
+    assert second.next_cursor is None
+    assert serialised == ["run-0", "run-2", "run-3", "run-4"]
+
+
+def test_page_runs_walks_runs_with_tied_start_times() -> None:
+    started_at = datetime(2024, 1, 5, tzinfo=timezone.utc)
+    records = []
+    for run_id in ("run-a", "run-c", "run-b"):
+        record = _make_record(run_id)
+        record.started_at = started_at
+        records.append(record)
+    service = IngestRunService(provider=DummyIngestProvider(records))
+
+    seen: list[str] = []
+    cursor = None
+    for _ in range(len(records) + 1):
+        page = service.page_runs(
+            build_collection_query(limit=1, cursor=cursor, fields=["id"])
+        )
+        seen.extend(str(item["id"]) for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == ["run-c", "run-b", "run-a"]
@@ -135,3 +135,22 @@ def test_ingest_api_caches_repeated_missing_requests(
     assert registry.payload_reads == 1
 
     app.dependency_overrides.clear()
+
+
+def test_registry_generation_tracks_file_changes(tmp_path: Path) -> None:
+    registry_path = tmp_path / "registry.json"
+    _write_registry(registry_path, [])
+
+    registry = CountingRegistry(path=registry_path)
+
+    first = registry.generation
+    assert registry.generation == first
+    assert IngestRunRegistry(path=registry_path).generation == first
+    assert registry.payload_reads == 0
+
+    _write_registry(
+        registry_path,
+        [{"id": "run-1", "report": {"processed": [], "invalid": []}}],
+    )
+
+    assert registry.generation != first
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -8,21 +7,14 @@ from typing import Any
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
+from apps.perona.db.render_metrics import RenderMetricStore
 from apps.perona.engine import (
     CostModelInput,
     PeronaEngine,
     RenderMetric,
     ShotTelemetry,
 )
-
-
-class _StubMetricStore:
-    def __init__(self, path: Path) -> None:
-        self._path = path
-
-    @property
-    def path(self) -> Path:
-        return self._path
+from libraries.analytics.perona.ml_foundations import compute_feature_statistics
 
 
 @pytest.fixture()
@@ -69,26 +61,36 @@ def engine_with_stubbed_data(tmp_path: Path, monkeypatch: MonkeyPatch) -> Any:
         ),
     )
     engine._render_log = render_log
-    engine._frame_times_by_shot = engine._group_frame_times(render_log)
 
-    metrics_path = tmp_path / "metrics.ndjson"
-    persisted_metric = {
-        "sequence": "SQ01",
-        "shot_id": "SH001",
-        "timestamp": "2024-05-21T09:45:00",
-        "fps": 24.0,
-        "frame_time_ms": 150.0,
-        "error_count": 2,
-        "gpuUtilisation": 0.88,
-        "cacheHealth": 0.9,
-    }
-    metrics_path.write_text(json.dumps(persisted_metric) + "\n", encoding="utf-8")
+    metrics_store = RenderMetricStore(tmp_path / "metrics.db")
+    metrics_store.persist(
+        [
+            {
+                "sequence": "SQ01",
+                "shot_id": "SH001",
+                "timestamp": "2024-05-21T09:45:00",
+                "fps": 24.0,
+                "frame_time_ms": 150.0,
+                "error_count": 2,
+                "gpuUtilisation": 0.88,
+                "cacheHealth": 0.9,
+            },
+            {
+                "sequence": "SQ99",
+                "shot_id": "SH999",
+                "timestamp": "2024-05-21T10:00:00",
+                "fps": 12.0,
+                "frame_time_ms": 900.0,
+                "error_count": 9,
+                "gpuUtilisation": 0.2,
+                "cacheHealth": 0.1,
+            },
+        ]
+    )
 
     from apps.perona.web import dashboard as dashboard_module
 
-    monkeypatch.setattr(
-        dashboard_module, "_metrics_store", _StubMetricStore(metrics_path)
-    )
+    monkeypatch.setattr(dashboard_module, "_metrics_store", metrics_store)
 
     return engine
 
@@ -140,3 +142,57 @@ def test_cost_insights_returns_statistics_and_recommendations(
                 "cache_health",
             )
         )
+
+
+def test_cost_insights_fold_in_new_metrics_and_resume_from_snapshot(
+    engine_with_stubbed_data: PeronaEngine, monkeypatch: MonkeyPatch
+) -> None:
+    from apps.perona.web import dashboard as dashboard_module
+
+    engine = engine_with_stubbed_data
+    engine.cost_insights()
+    row = {
+        "sequence": "SQ01",
+        "shot_id": "SH001",
+        "timestamp": "2024-05-22T09:00:00",
+        "fps": 24.0,
+        "frame_time_ms": 180.0,
+        "error_count": 1,
+        "gpuUtilisation": 0.9,
+        "cacheHealth": 0.8,
+    }
+    dashboard_module._metrics_store.persist([row, row])
+
+    stats, _ = engine.cost_insights()
+
+    expected = compute_feature_statistics(engine._build_cost_training_dataset())
+    assert len(engine._build_cost_training_dataset()) == 3
+    for online, batch in zip(stats, expected):
+        assert online.name == batch.name
+        assert online.mean == pytest.approx(batch.mean)
+        assert online.stddev == pytest.approx(batch.stddev)
+
+    resumed = PeronaEngine(baseline_input=engine.baseline_cost_input)
+    resumed._telemetry = engine._telemetry
+    resumed._render_log = engine._render_log
+    monkeypatch.setattr(
+        dashboard_module,
+        "_metrics_store",
+        RenderMetricStore(dashboard_module._metrics_store.path),
+    )
+    samples: list[object] = []
+    original = resumed._training_examples
+
+    def _counting(pairs: Any) -> Any:
+        samples.extend(pairs)
+        return original(pairs)
+
+    monkeypatch.setattr(resumed, "_training_examples", _counting)
+
+    resumed_stats, _ = resumed.cost_insights()
+
+    # Only the boot sample and the synthetic fallback are rebuilt.
+    assert len(samples) == 2
+    assert [item.mean for item in resumed_stats] == pytest.approx(
+        [item.mean for item in stats]
+    )
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import random
+
+import pytest
+
 from libraries.analytics.perona.ml_foundations import (
+    NUMPY_AVAILABLE,
     Dataset,
+    FeatureAccumulator,
     FeatureImportance,
     MLFeature,
     TrainingExample,
     analyse_cost_relationships,
+    compute_correlation_matrix,
     compute_feature_statistics,
     recommend_best_practices,
 )
@@ -104,3 +112,134 @@ def test_recommendations_capture_relationship_trends() -> None:
         "Monitor revisions" in message or "Consider investing" in message
         for message in recommendations
     )
+
+
+def _random_dataset(size: int) -> Dataset:
+    rng = random.Random(7)
+    examples = []
+    for _ in range(size):
+        renders = rng.uniform(1, 20)
+        revisions = rng.randint(0, 5)
+        values = {"renders": renders, "revisions": revisions, "flat": 3.0}
+        if rng.random() < 0.2:
+            del values["revisions"]
+        examples.append(
+            TrainingExample(
+                feature_values=values,
+                cost=renders * 12 - revisions * 4 + rng.gauss(0, 5),
+            )
+        )
+    return Dataset(examples)
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed")
+def test_vectorised_backend_matches_pure_python() -> None:
+    dataset = _random_dataset(500)
+
+    for fast, slow in zip(
+        compute_feature_statistics(dataset, use_numpy=True),
+        compute_feature_statistics(dataset, use_numpy=False),
+    ):
+        assert fast.name == slow.name
+        assert fast.mean == pytest.approx(slow.mean, rel=1e-9)
+        assert fast.stddev == pytest.approx(slow.stddev, rel=1e-9, abs=1e-12)
+        assert (fast.minimum, fast.maximum) == (slow.minimum, slow.maximum)
+
+    fast_importances = analyse_cost_relationships(dataset, use_numpy=True)
+    slow_importances = analyse_cost_relationships(dataset, use_numpy=False)
+    assert [item.name for item in fast_importances] == [
+        item.name for item in slow_importances
+    ]
+    for fast_item, slow_item in zip(fast_importances, slow_importances):
+        assert fast_item.slope == pytest.approx(slow_item.slope, rel=1e-9, abs=1e-12)
+        assert fast_item.correlation == pytest.approx(
+            slow_item.correlation, rel=1e-9, abs=1e-12
+        )
+
+    fast_matrix = compute_correlation_matrix(dataset, use_numpy=True)
+    slow_matrix = compute_correlation_matrix(dataset, use_numpy=False)
+    assert fast_matrix.names == slow_matrix.names
+    for fast_row, slow_row in zip(fast_matrix.values, slow_matrix.values):
+        assert fast_row == pytest.approx(slow_row, rel=1e-9, abs=1e-12)
+
+
+def test_correlation_matrix_reports_pairwise_relationships() -> None:
+    dataset = Dataset(
+        [
+            TrainingExample({"a": 1.0, "b": 2.0, "c": 5.0}, cost=1.0),
+            TrainingExample({"a": 2.0, "b": 4.0, "c": 5.0}, cost=2.0),
+            TrainingExample({"a": 3.0, "b": 6.0, "c": 5.0}, cost=3.0),
+        ]
+    )
+
+    matrix = compute_correlation_matrix(dataset, use_numpy=False)
+
+    assert matrix.names == ("a", "b", "c")
+    assert matrix.get("a", "b") == pytest.approx(1.0)
+    assert matrix.get("a", "c") == 0.0
+    assert matrix.get("c", "c") == 1.0
+
+
+def _assert_matches_dataset(accumulator: FeatureAccumulator, dataset: Dataset) -> None:
+    for online, batch in zip(
+        accumulator.statistics(), compute_feature_statistics(dataset, use_numpy=False)
+    ):
+        assert online.name == batch.name
+        assert online.mean == pytest.approx(batch.mean, rel=1e-9, abs=1e-12)
+        assert online.stddev == pytest.approx(batch.stddev, rel=1e-9, abs=1e-12)
+        assert (online.minimum, online.maximum) == (batch.minimum, batch.maximum)
+    for online_item, batch_item in zip(
+        accumulator.importances(), analyse_cost_relationships(dataset, use_numpy=False)
+    ):
+        assert online_item.name == batch_item.name
+        assert online_item.slope == pytest.approx(batch_item.slope, rel=1e-9, abs=1e-12)
+    matrix = compute_correlation_matrix(dataset, use_numpy=False)
+    for online_row, batch_row in zip(
+        accumulator.correlation_matrix().values, matrix.values
+    ):
+        assert online_row == pytest.approx(batch_row, rel=1e-9, abs=1e-12)
+
+
+def test_feature_accumulator_updates_merges_and_round_trips() -> None:
+    dataset = _random_dataset(300)
+    examples = list(dataset)
+
+    first = FeatureAccumulator()
+    for example in examples[:120]:
+        first.update(example)
+    second = FeatureAccumulator()
+    second.update_many(examples[120:], use_numpy=False)
+    restored = FeatureAccumulator.from_dict(
+        json.loads(json.dumps(first.merge(second).to_dict()))
+    )
+
+    assert restored.count == 300
+    assert restored.feature_names == ("flat", "renders", "revisions")
+    _assert_matches_dataset(restored, dataset)
+    with pytest.raises(ValueError):
+        FeatureAccumulator().statistics()
+
+
+@pytest.mark.parametrize(
+    "use_numpy",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed"),
+        ),
+    ],
+)
+def test_feature_accumulator_handles_features_seen_mid_stream(use_numpy: bool) -> None:
+    early = [build_example(float(value), 1.0, value * 3.0) for value in range(1, 6)]
+    late = [
+        TrainingExample({"renders": 2.0, "late": float(value)}, cost=value * 2.0)
+        for value in range(1, 4)
+    ]
+
+    accumulator = FeatureAccumulator()
+    accumulator.update_many(early, use_numpy=use_numpy)
+    accumulator.update_many(late, use_numpy=use_numpy)
+
+    assert accumulator.feature_names == ("late", "renders", "revisions")
+    _assert_matches_dataset(accumulator, Dataset(early + late))
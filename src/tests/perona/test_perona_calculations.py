@@ -7,6 +7,8 @@ import time
 
 import pytest
 
+from apps.perona import engine as engine_module
+
 from apps.perona.engine import (
     DEFAULT_CURRENCY,
     PeronaEngine,
@@ -53,20 +55,19 @@ def test_risk_heatmap_scores_and_drivers(engine: PeronaEngine) -> None:
     assert lowest_risk.drivers == ("Render time volatility",)
 
 
-def test_risk_heatmap_uses_cached_frame_times(engine: PeronaEngine) -> None:
-    """Frame time grouping should not require re-scanning the render log."""
+def test_risk_heatmap_uses_cached_frame_times(
+    engine: PeronaEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Frame time grouping should not be rebuilt while the samples are unchanged."""
 
-    original_log = engine._render_log
-    try:
+    engine.risk_heatmap()
 
-        class FailOnIter:
-            def __iter__(self) -> AssertionError:
-                raise AssertionError("render log should not be iterated")
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("frame times should not be regrouped")
 
-        engine._render_log = FailOnIter()
-        heatmap = engine.risk_heatmap()
-    finally:
-        engine._render_log = original_log
+    monkeypatch.setattr(engine_module, "RenderMetricColumns", _fail)
+    monkeypatch.setattr(engine_module, "FrameTimeGroups", _fail)
+    heatmap = engine.risk_heatmap()
 
     assert len(heatmap) == 4
 
@@ -114,7 +115,7 @@ def test_risk_heatmap_large_log_benefits_from_caching(engine: PeronaEngine) -> N
 
     engine._telemetry = tuple(expanded_telemetry)
     engine._render_log = tuple(expanded_log)
-    engine._frame_times_by_shot = engine._group_frame_times(engine._render_log)
+    frame_times = engine.frame_time_groups()
 
     start = time.perf_counter()
     naive_grouping = [
@@ -130,7 +131,7 @@ def test_risk_heatmap_large_log_benefits_from_caching(engine: PeronaEngine) -> N
 
     start = time.perf_counter()
     cached_grouping = [
-        engine._frame_times_by_shot[(telemetry.sequence, telemetry.shot_id)]
+        frame_times[(telemetry.sequence, telemetry.shot_id)]
         for telemetry in engine._telemetry
     ]
     cached_duration = time.perf_counter() - start
@@ -0,0 +1,235 @@
+"""Tests for the columnar render telemetry helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import statistics
+
+import pytest
+
+from apps.perona.db.render_metrics import RenderMetricStore
+from apps.perona.engine import PeronaEngine, RenderMetric
+from libraries.analytics.perona.columnar import (
+    NUMPY_AVAILABLE,
+    FrameTimeGroups,
+    RenderMetricColumns,
+)
+
+BACKENDS = [
+    pytest.param(False, id="python"),
+    pytest.param(
+        True,
+        id="numpy",
+        marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed"),
+    ),
+]
+
+
+def _metric(shot_id: str, minute: int, frame_time_ms: float) -> RenderMetric:
+    return RenderMetric(
+        sequence="SQ01" if shot_id != "SH900" else "SQ09",
+        shot_id=shot_id,
+        timestamp=datetime(2024, 5, 20, 12, 0) + timedelta(minutes=minute),
+        fps=24.0,
+        frame_time_ms=frame_time_ms,
+        error_count=0,
+        gpu_utilisation=0.5 + minute / 100,
+        cache_health=0.9,
+    )
+
+
+SAMPLES = (
+    _metric("SH010", 0, 100.0),
+    _metric("SH020", 1, 400.0),
+    _metric("SH010", 2, 110.0),
+    _metric("SH900", 3, 250.0),
+    _metric("SH010", 4, 130.0),
+)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_select_filters_by_shot_and_time(use_numpy: bool) -> None:
+    columns = RenderMetricColumns(SAMPLES, use_numpy=use_numpy)
+
+    assert len(columns) == 5
+    assert columns.backend == ("numpy" if use_numpy else "python")
+    assert columns.select(shot_id="SH010") == [0, 2, 4]
+    assert columns.select(sequence="SQ09") == [3]
+    assert columns.select(sequence="SQ01", shot_id="SH900") == []
+    assert columns.select(
+        since=datetime(2024, 5, 20, 12, 1), until=datetime(2024, 5, 20, 12, 3)
+    ) == [1, 2, 3]
+    assert list(columns.column("gpu_utilisation")) == pytest.approx(
+        [0.5, 0.51, 0.52, 0.53, 0.54]
+    )
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_extended_appends_without_touching_the_original(use_numpy: bool) -> None:
+    base = RenderMetricColumns(SAMPLES[:3], use_numpy=use_numpy)
+
+    columns = base.extended(SAMPLES[3:])
+
+    assert base.extended(()) is base
+    assert len(base) == 3 and base.keys == (("SQ01", "SH010"), ("SQ01", "SH020"))
+    assert len(columns) == 5
+    assert columns.select(shot_id="SH010") == [0, 2, 4]
+    assert columns.select(sequence="SQ09") == [3]
+    grouped = columns.group_statistics("frame_time_ms")
+    assert grouped[("SQ01", "SH010")].total == 340.0
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_extended_grows_shared_storage_and_branches_safely(use_numpy: bool) -> None:
+    base = RenderMetricColumns(SAMPLES[:1], use_numpy=use_numpy)
+    columns = base
+    for sample in SAMPLES[1:4]:
+        columns = columns.extended([sample])
+    assert columns._buffer is base._buffer
+    assert len(base) == 1 and base.keys == (("SQ01", "SH010"),)
+
+    # Extending an older snapshot again must not disturb the newer one.
+    branch = base.extended([SAMPLES[4], _metric("SH777", 9, 70.0)])
+    assert branch._buffer is not base._buffer
+    assert [key[1] for key in branch.keys] == ["SH010", "SH777"]
+    assert list(branch.column("frame_time_ms")) == [100.0, 130.0, 70.0]
+    assert len(columns) == 4
+    assert list(columns.column("frame_time_ms")) == [100.0, 400.0, 110.0, 250.0]
+    assert columns.select(shot_id="SH777") == []
+    latest = columns.extended(SAMPLES[4:])
+    assert latest.select(shot_id="SH010") == [0, 2, 4]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_group_statistics_match_statistics_module(use_numpy: bool) -> None:
+    columns = RenderMetricColumns(SAMPLES, use_numpy=use_numpy)
+
+    grouped = columns.group_statistics("frame_time_ms")
+    shot = grouped[("SQ01", "SH010")]
+    assert shot.count == 3
+    assert shot.total == pytest.approx(340.0)
+    assert shot.mean == pytest.approx(statistics.fmean([100.0, 110.0, 130.0]))
+    assert shot.variance == pytest.approx(statistics.pvariance([100.0, 110.0, 130.0]))
+    assert grouped[("SQ09", "SH900")].variance == 0.0
+
+    values = columns.group_values("gpu_utilisation")
+    assert list(values) == [("SQ01", "SH010"), ("SQ01", "SH020"), ("SQ09", "SH900")]
+    assert values[("SQ01", "SH010")] == pytest.approx((0.5, 0.52, 0.54))
+    empty = RenderMetricColumns((), use_numpy=use_numpy)
+    assert empty.group_statistics("frame_time_ms") == {}
+
+
+def test_frame_time_groups_behave_as_mapping(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    columns = RenderMetricColumns(SAMPLES, use_numpy=False)
+    grouped: list[str] = []
+    group_values = columns.group_values
+
+    def _group_values(name: str) -> dict[tuple[str, str], tuple[float, ...]]:
+        grouped.append(name)
+        values: dict[tuple[str, str], tuple[float, ...]] = group_values(name)
+        return values
+
+    monkeypatch.setattr(columns, "group_values", _group_values)
+    groups = FrameTimeGroups(columns)
+    assert groups.statistics(("SQ01", "SH010")) is not None
+    assert ("SQ01", "SH010") in groups and list(groups)[0] == ("SQ01", "SH010")
+    assert grouped == []
+
+    assert groups[("SQ01", "SH010")] == (100.0, 110.0, 130.0)
+    assert groups.get(("SQ01", "SH999"), ()) == ()
+    assert len(groups) == 3
+    stats = groups.statistics(("SQ01", "SH020"))
+    assert stats is not None and stats.mean == 400.0
+    assert grouped == ["frame_time_ms"]
+    with pytest.raises(KeyError):
+        RenderMetricColumns(SAMPLES, use_numpy=False).column("fps")
+
+
+def test_engine_rebuilds_columns_when_render_log_changes() -> None:
+    engine = PeronaEngine()
+    columns = engine.render_columns()
+
+    assert engine.render_columns() is columns
+    engine._render_log = SAMPLES
+    assert len(engine.render_columns()) == 5
+    feed = list(engine.stream_render_metrics(2, shot_id="SH010"))
+    assert [sample.frame_time_ms for sample in feed] == [110.0, 130.0]
+
+
+def test_engine_columns_follow_persisted_metrics(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from apps.perona.web import dashboard as dashboard_module
+
+    store = RenderMetricStore(tmp_path / "metrics.db")
+    monkeypatch.setattr(dashboard_module, "_metrics_store", store)
+    engine = PeronaEngine()
+    engine._render_log = SAMPLES[:2]
+    record = {
+        "sequence": "SQ01",
+        "shot_id": "SH010",
+        "fps": 24.0,
+        "error_count": 0,
+        "gpuUtilisation": 0.5,
+        "cacheHealth": 0.9,
+    }
+    store.persist(
+        [
+            # Repeats the first boot sample, so it is not appended again.
+            {**record, "timestamp": "2024-05-20T12:00:00", "frame_time_ms": 100.0},
+            {**record, "timestamp": "2024-05-20T12:05:00", "frame_time_ms": 160.0},
+        ]
+    )
+
+    columns = engine.render_columns()
+    assert len(columns) == 3
+    assert engine.render_columns() is columns
+    stats = engine.frame_time_groups().statistics(("SQ01", "SH010"))
+    assert stats is not None and (stats.count, stats.mean) == (2, 130.0)
+
+    store.persist(
+        [{**record, "timestamp": "2024-05-20T12:06:00", "frame_time_ms": 190.0}]
+    )
+    assert len(engine.render_columns()) == 4
+    assert len(columns) == 3
+    feed = list(engine.stream_render_metrics(shot_id="SH010"))
+    assert [sample.frame_time_ms for sample in feed] == [100.0, 160.0, 190.0]
+
+
+def test_engine_totals_count_repeated_captures_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from apps.perona.web import dashboard as dashboard_module
+
+    store = RenderMetricStore(tmp_path / "metrics.db")
+    monkeypatch.setattr(dashboard_module, "_metrics_store", store)
+    engine = PeronaEngine()
+    engine._render_log = SAMPLES[:2]
+    record = {
+        "sequence": "SQ01",
+        "shot_id": "SH010",
+        "fps": 24.0,
+        "error_count": 0,
+        "gpuUtilisation": 0.5,
+        "cacheHealth": 0.9,
+    }
+    store.persist(
+        [
+            # The first row repeats a boot sample; the last repeats the second.
+            {**record, "timestamp": "2024-05-20T12:00:00", "frame_time_ms": 100.0},
+            {**record, "timestamp": "2024-05-20T12:05:00", "frame_time_ms": 160.0},
+            {**record, "timestamp": "2024-05-20T12:00:00", "frame_time_ms": 100.0},
+            {**record, "timestamp": "2024-05-20T12:05:00", "frame_time_ms": 160.0},
+        ]
+    )
+
+    totals, latest = engine.render_metric_totals()
+    by_shot = {item.shot_id: item for item in totals}
+    feed = list(engine.stream_render_metrics(shot_id="SH010"))
+    assert by_shot["SH010"].count == len(feed) == 2
+    assert by_shot["SH010"].frame_time_total == 260.0
+    assert by_shot["SH020"].count == 1
+    assert latest is not None and latest.timestamp == datetime(2024, 5, 20, 12, 5)
@@ -0,0 +1,200 @@
+"""Tests for the SQLite-backed Perona render metric store."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from typer.testing import CliRunner
+
+from apps.perona.app import app
+from apps.perona.db.render_metrics import RenderMetricStore
+
+
+def _record(shot_id: str, minute: int, frame_time_ms: float = 100.0) -> dict[str, Any]:
+    return {
+        "sequence": "SQ01",
+        "shot_id": shot_id,
+        "timestamp": f"2024-05-20T12:{minute:02d}:00Z",
+        "fps": 24.0,
+        "frame_time_ms": frame_time_ms,
+        "error_count": 1,
+        "gpuUtilisation": 0.5,
+        "cacheHealth": 0.9,
+    }
+
+
+def test_persist_batches_rows_and_queries_filters(tmp_path: Path) -> None:
+    store = RenderMetricStore(tmp_path / "metrics.db", batch_size=2)
+
+    written = store.persist(
+        [_record("SH010", minute, 100.0 + minute) for minute in range(5)]
+        + [_record("SH020", 30), {"sequence": "SQ01", "shot_id": "SH030"}]
+    )
+
+    assert written == 6
+    assert store.max_id() == 6
+    shot = store.query(sequence="SQ01", shot_id="SH010")
+    assert [metric.frame_time_ms for metric in shot] == [
+        100.0,
+        101.0,
+        102.0,
+        103.0,
+        104.0,
+    ]
+    assert shot[0].timestamp == datetime(2024, 5, 20, 12, 0)
+
+    window = store.query(
+        since=datetime(2024, 5, 20, 12, 1), until=datetime(2024, 5, 20, 12, 3)
+    )
+    assert [metric.timestamp.minute for metric in window] == [1, 2, 3]
+    assert [metric.timestamp.minute for metric in store.query(limit=2)] == [4, 30]
+    assert [metric.id for metric in store.query(after_id=4)] == [5, 6]
+    latest = store.latest()
+    assert latest is not None and latest.shot_id == "SH020"
+
+    totals = {item.shot_id: item for item in store.shot_totals()}
+    assert totals["SH010"].count == 5
+    assert totals["SH010"].frame_time_total == 510.0
+    assert totals["SH020"].error_total == 1.0
+
+
+def test_store_uses_wal_and_time_index(tmp_path: Path) -> None:
+    store = RenderMetricStore(tmp_path / "metrics.db")
+    store.persist([_record("SH010", 0)])
+
+    connection = sqlite3.connect(store.path)
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM perona_render_metrics "
+            "WHERE captured_at >= ?",
+            ("2024-05-20",),
+        ).fetchall()
+    finally:
+        connection.close()
+    assert any("idx_perona_render_metrics_captured" in row[-1] for row in plan)
+
+
+def test_metrics_import_command_skips_rows_already_stored(tmp_path: Path) -> None:
+    source = tmp_path / "render-metrics.ndjson"
+    lines = [json.dumps(_record("SH010", minute)) for minute in range(3)]
+    source.write_text("\n".join(lines + ["not json", ""]) + "\n", encoding="utf-8")
+    database = tmp_path / "metrics.db"
+    runner = CliRunner()
+
+    first = runner.invoke(
+        app, ["metrics", "import", str(source), "--database", str(database)]
+    )
+    second = runner.invoke(
+        app, ["metrics", "import", str(source), "--database", str(database)]
+    )
+
+    assert first.exit_code == 0, first.output
+    assert "Imported 3 render metrics" in first.output
+    assert "Imported 0 render metrics" in second.output
+    assert len(RenderMetricStore(database).query()) == 3
+
+
+def test_tail_reads_only_rows_added_since_last_refresh(tmp_path: Path) -> None:
+    store = RenderMetricStore(tmp_path / "metrics.db")
+    store.persist([_record("SH010", 5), _record("SH020", 6)])
+    tail = store.tail
+
+    assert tail.refresh() == 2
+    assert tail.refresh() == 0
+    store.persist([_record("SH010", 1, 250.0)])
+    assert tail.refresh() == 1
+
+    shot = tail.metrics(sequence="SQ01", shot_id="SH010")
+    assert [metric.timestamp.minute for metric in shot] == [1, 5]
+    assert [metric.shot_id for metric in tail.metrics(limit=2)] == ["SH010", "SH020"]
+    matches = tail.first_captures_matching(
+        [("SQ01", "SH010", datetime(2024, 5, 20, 12, 1))]
+    )
+    assert [metric.id for metric in matches] == [3]
+    totals = {item.shot_id: item for item in tail.shot_totals()}
+    assert totals["SH010"].frame_time_total == 350.0
+    assert [metric.id for metric in tail.rows_after(1)] == [2, 3]
+    assert tail.cursor == 3 and tail.epoch == 0
+    latest = tail.latest()
+    assert latest is not None and latest.shot_id == "SH020"
+    assert store.tail is tail
+
+
+def test_tail_handles_pruning_truncation_and_replacement(tmp_path: Path) -> None:
+    path = tmp_path / "metrics.db"
+    store = RenderMetricStore(path)
+    store.persist([_record("SH010", minute) for minute in range(4)])
+    tail = store.tail
+    tail.refresh()
+
+    with sqlite3.connect(path) as connection:
+        connection.execute("DELETE FROM perona_render_metrics WHERE id <= 2")
+    store.persist([_record("SH010", 10)])
+    assert tail.refresh() == 1
+    assert [metric.id for metric in tail.metrics()] == [3, 4, 5]
+    assert tail.shot_totals()[0].count == 3
+    assert [metric.id for metric in tail.rows_after(0)] == [3, 4, 5]
+    assert (tail.min_id, tail.epoch) == (3, 1)
+
+    with sqlite3.connect(path) as connection:
+        connection.execute("DELETE FROM perona_render_metrics")
+    assert tail.refresh() == 0
+    assert tail.metrics() == []
+
+    store.close()
+    path.unlink()
+    replacement = RenderMetricStore(path)
+    replacement.persist([_record("SH099", 0)])
+    replacement.close()
+    assert tail.refresh() == 1
+    assert [metric.shot_id for metric in tail.metrics()] == ["SH099"]
+
+
+def test_tail_feeds_stop_at_the_cursor_and_skip_repeated_captures(
+    tmp_path: Path,
+) -> None:
+    store = RenderMetricStore(tmp_path / "metrics.db")
+    store.persist([_record("SH010", 1), _record("SH010", 2), _record("SH010", 1)])
+    tail = store.tail
+    tail.refresh()
+    store.persist([_record("SH020", 3)])
+
+    assert [metric.id for metric in tail.metrics()] == [1, 3, 2]
+    assert [metric.id for metric in tail.rows_after(0)] == [1, 2, 3]
+    assert [metric.id for metric in tail.rows_after(0, first_captures=True)] == [1, 2]
+    assert [metric.id for metric in tail.rows_after(1, through_id=2)] == [2]
+    matches = tail.first_captures_matching(
+        [
+            ("SQ01", "SH010", datetime(2024, 5, 20, 12, 1)),
+            ("SQ01", "SH020", datetime(2024, 5, 20, 12, 3)),
+        ]
+    )
+    assert [metric.id for metric in matches] == [1]
+    assert [item.count for item in tail.shot_totals()] == [2]
+
+    assert tail.refresh() == 1
+    assert [item.shot_id for item in tail.shot_totals()] == ["SH010", "SH020"]
+    latest = tail.latest()
+    assert latest is not None and latest.id == 4
+
+
+def test_snapshots_round_trip_and_replace(tmp_path: Path) -> None:
+    store = RenderMetricStore(tmp_path / "metrics.db")
+
+    assert store.load_snapshot("insights") is None
+    store.save_snapshot(
+        "insights", fingerprint="abc", cursor=3, min_id=1, payload={"shots": []}
+    )
+    store.save_snapshot(
+        "insights", fingerprint="def", cursor=7, min_id=2, payload={"shots": [1]}
+    )
+
+    snapshot = RenderMetricStore(store.path).load_snapshot("insights")
+    assert snapshot is not None
+    assert (snapshot.fingerprint, snapshot.cursor, snapshot.min_id) == ("def", 7, 2)
+    assert snapshot.payload == {"shots": [1]}
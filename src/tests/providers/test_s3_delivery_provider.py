@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import io
+import json
 from datetime import datetime, timezone
 from typing import Any
 
@@ -115,3 +117,178 @@ def test_s3_delivery_provider_handles_service_errors(
 
     assert deliveries == []
     assert any("s3_delivery_list_failed" in record.message for record in caplog.records)
+
+
+class ManifestClient(DummyClient):
+    def __init__(self, paginator: RecordingPaginator, bodies: dict[str, str]) -> None:
+        super().__init__(paginator)
+        self.bodies = bodies
+        self.fetched: list[str] = []
+
+    def get_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        self.fetched.append(Key)
+        return {"Body": io.BytesIO(self.bodies[Key].encode("utf-8"))}
+
+
+def _manifest_entry(key: str, day: int, etag: str = "etag") -> dict[str, Any]:
+    return {
+        "Key": key,
+        "LastModified": datetime(2023, 5, day, tzinfo=timezone.utc),
+        "Size": 10,
+        "ETag": f'"{etag}"',
+    }
+
+
+def test_s3_delivery_provider_caches_listing_until_ttl_expires() -> None:
+    now = [0.0]
+    paginator = RecordingPaginator(
+        [{"Contents": [_manifest_entry("atlas/a/manifest.json", 1)]}]
+    )
+    provider = S3DeliveryProvider(
+        client=DummyClient(paginator),
+        bucket="bucket",
+        cache_ttl=10,
+        time_provider=lambda: now[0],
+    )
+
+    first = provider.list_deliveries("atlas")
+    now[0] = 5.0
+    second = provider.list_deliveries("atlas")
+
+    assert second is first
+    assert len(paginator.calls) == 1
+
+    now[0] = 11.0
+    provider.list_deliveries("atlas")
+    assert len(paginator.calls) == 2
+
+    provider.invalidate("atlas")
+    provider.list_deliveries("atlas")
+    assert len(paginator.calls) == 3
+
+
+def test_s3_delivery_provider_incremental_refresh_lists_after_last_key() -> None:
+    now = [0.0]
+    paginator = RecordingPaginator(
+        [{"Contents": [_manifest_entry("atlas/0520/manifest.json", 20)]}]
+    )
+    provider = S3DeliveryProvider(
+        client=DummyClient(paginator),
+        bucket="bucket",
+        cache_ttl=1,
+        incremental=True,
+        time_provider=lambda: now[0],
+    )
+
+    provider.list_deliveries("atlas")
+    paginator._pages = [{"Contents": [_manifest_entry("atlas/0521/manifest.json", 21)]}]
+    now[0] = 2.0
+    deliveries = provider.list_deliveries("atlas")
+
+    assert paginator.calls[-1] == {
+        "Bucket": "bucket",
+        "Prefix": "atlas/",
+        "StartAfter": "atlas/0520/manifest.json",
+    }
+    assert [delivery["key"] for delivery in deliveries] == [
+        "atlas/0521/manifest.json",
+        "atlas/0520/manifest.json",
+    ]
+
+
+def test_s3_delivery_provider_fetches_manifests_once_per_etag() -> None:
+    keys = [f"atlas/{index:02d}/manifest.json" for index in range(4)]
+    paginator = RecordingPaginator(
+        [{"Contents": [_manifest_entry(key, 1) for key in keys]}]
+    )
+    client = ManifestClient(
+        paginator,
+        {key: json.dumps({"files": [{"path": key}]}) for key in keys},
+    )
+    provider = S3DeliveryProvider(
+        client=client,
+        bucket="bucket",
+        cache_ttl=0,
+        fetch_manifests=True,
+        max_workers=2,
+    )
+
+    deliveries = provider.list_deliveries("atlas")
+    provider.list_deliveries("atlas")
+
+    assert sorted(client.fetched) == keys
+    assert {d["key"]: d["manifest_data"]["files"][0]["path"] for d in deliveries} == {
+        key: key for key in keys
+    }
+
+
+def test_s3_delivery_provider_bounds_manifest_cache() -> None:
+    keys = [f"atlas/{index:02d}/manifest.json" for index in range(4)]
+    paginator = RecordingPaginator(
+        [{"Contents": [_manifest_entry(key, 1) for key in keys]}]
+    )
+    client = ManifestClient(
+        paginator,
+        {key: json.dumps({"files": [{"path": key}]}) for key in keys},
+    )
+    provider = S3DeliveryProvider(
+        client=client,
+        bucket="bucket",
+        cache_ttl=0,
+        fetch_manifests=True,
+        manifest_cache_size=2,
+    )
+
+    provider.list_deliveries("atlas")
+    provider.list_deliveries("atlas")
+
+    assert len(provider._manifests) == 2
+    assert len(client.fetched) == 6
+
+
+def test_s3_delivery_provider_incremental_refresh_copies_changed_deliveries() -> None:
+    now = [0.0]
+    first_key = "atlas/0520/manifest.json"
+    second_key = "atlas/0521/manifest.json"
+    third_key = "atlas/0522/manifest.json"
+    paginator = RecordingPaginator(
+        [
+            {
+                "Contents": [
+                    _manifest_entry(first_key, 20),
+                    _manifest_entry(second_key, 21),
+                ]
+            }
+        ]
+    )
+    # The second manifest is missing at first, so its fetch fails.
+    client = ManifestClient(
+        paginator,
+        {
+            first_key: json.dumps({"files": [{"path": "a"}]}),
+            third_key: json.dumps({"files": [{"path": "c"}]}),
+        },
+    )
+    provider = S3DeliveryProvider(
+        client=client,
+        bucket="bucket",
+        cache_ttl=1,
+        incremental=True,
+        fetch_manifests=True,
+        time_provider=lambda: now[0],
+    )
+
+    previous = provider.list_deliveries("atlas")
+    snapshot = [dict(item) for item in previous]
+    assert "manifest_data" not in previous[0]
+    client.bodies[second_key] = json.dumps({"files": [{"path": "b"}]})
+    paginator._pages = [{"Contents": [_manifest_entry(third_key, 22)]}]
+    now[0] = 2.0
+    refreshed = provider.list_deliveries("atlas")
+
+    assert [dict(item) for item in previous] == snapshot
+    assert [item["key"] for item in refreshed] == [third_key, second_key, first_key]
+    assert refreshed[2] is previous[1]
+    assert refreshed[1] is not previous[0]
+    assert refreshed[1]["manifest_data"] == {"files": [{"path": "b"}]}
+    assert client.fetched.count(first_key) == 1
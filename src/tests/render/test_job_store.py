@@ -141,3 +141,57 @@ def test_job_store_skips_records_with_invalid_timestamps(
     records = store.load()
 
     assert [record.job_id for record in records] == ["valid"]
+
+
+def test_job_store_replays_journal_and_compacts_on_load(
+    tmp_path: Path, job_request: RenderJobRequest
+) -> None:
+    path = tmp_path / "jobs.json"
+    store = JobStore(path, retention=timedelta(hours=1))
+    now = datetime.now(timezone.utc)
+    first = _record("first", job_request, created_at=now - timedelta(minutes=2))
+    second = _record("second", job_request, created_at=now - timedelta(minutes=1))
+    expired = _record("expired", job_request, created_at=now - timedelta(hours=3))
+    store.save([first])
+
+    second.status = "running"
+    store.append([second, expired])
+    store.append([], removed=["first"])
+    with store.journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"op": "put", "job": {"job_id"')
+
+    assert json.loads(path.read_text()) == [first.to_storage()]
+    assert store.stats.journal_entries == 3
+
+    reloaded = JobStore(path, retention=timedelta(hours=1))
+    records = reloaded.load()
+
+    assert [(record.job_id, record.status) for record in records] == [
+        ("second", "running")
+    ]
+    assert [entry["job_id"] for entry in json.loads(path.read_text())] == ["second"]
+    assert not reloaded.journal_path.exists()
+    assert reloaded.stats.total_pruned == 1
+    assert reloaded.stats.journal_entries == 0
+
+
+def test_job_store_keeps_changes_appended_during_compaction(
+    tmp_path: Path, job_request: RenderJobRequest
+) -> None:
+    path = tmp_path / "jobs.json"
+    store = JobStore(path, compact_min_entries=2)
+    now = datetime.now(timezone.utc)
+    first = _record("first", job_request, created_at=now - timedelta(minutes=2))
+    late = _record("late", job_request, created_at=now - timedelta(minutes=1))
+
+    store.append([first])
+    assert not store.needs_compaction
+    store.append([first])
+    assert store.needs_compaction
+
+    store.begin_compaction()
+    store.append([late])
+    store.compact([first])
+
+    assert [entry["job_id"] for entry in json.loads(path.read_text())] == ["first"]
+    assert [record.job_id for record in JobStore(path).load()] == ["first", "late"]
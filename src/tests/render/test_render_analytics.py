@@ -311,3 +311,73 @@ def test_render_analytics_normalises_status_keys() -> None:
     assert analytics.statuses["queued"].count == 2
     assert analytics.adapters["mock"].statuses == {"running": 2}
     assert analytics.adapters["tractor"].statuses == {"unknown": 1}
+
+
+class _SequencedAdapter:
+    def __init__(self) -> None:
+        self._counter = 0
+        self.statuses: dict[str, str] = {}
+
+    def __call__(self, **_: object) -> dict[str, object]:
+        self._counter += 1
+        return {"job_id": f"job-{self._counter}", "status": "queued"}
+
+    def get_job_status(self, job_id: str) -> dict[str, object]:
+        return {"job_id": job_id, "status": self.statuses.get(job_id, "queued")}
+
+
+def test_render_analytics_index_tracks_transitions_and_pruning(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    clock = [base_time]
+    monkeypatch.setattr(render_module, "_utcnow", lambda: clock[0])
+    adapter = _SequencedAdapter()
+    service = RenderSubmissionService(adapters={"mock": adapter}, history_limit=4)
+
+    for index in range(6):
+        clock[0] = base_time + timedelta(minutes=20 * index)
+        service.submit_job(_request())
+    for job_id, status in (("job-3", "running"), ("job-4", "completed")):
+        clock[0] += timedelta(minutes=7)
+        adapter.statuses[job_id] = status
+        service.get_job(job_id)
+    clock[0] += timedelta(minutes=3)
+    adapter.statuses["job-3"] = "failed"
+    service.get_job("job-3")
+
+    now = clock[0] + timedelta(minutes=30)
+    incremental = service.get_render_analytics(now=now)
+    service._analytics_source = None
+    rebuilt = service.get_render_analytics(now=now)
+
+    assert incremental.model_dump() == rebuilt.model_dump()
+    assert incremental.total_jobs == 4
+    assert incremental.adapters["mock"].first_submission_at == base_time + timedelta(
+        minutes=40
+    )
+    assert incremental.statuses["running"].count == 1
+    assert incremental.statuses["running"].active == 0
+    assert incremental.statuses["running"].durations.total_seconds == pytest.approx(
+        600.0
+    )
+    assert incremental.statuses["queued"].active == 2
+    assert incremental.submission_windows["1h"].total_jobs == 1
+
+
+def test_stored_jobs_are_counted_before_they_are_announced(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = RenderSubmissionService(adapters={"mock": _SequencedAdapter()})
+    service.submit_job(_request())
+
+    def _fail_rebuild(records: object) -> None:
+        raise AssertionError("the analytics index should not be rebuilt")
+
+    monkeypatch.setattr(service._analytics, "rebuild", _fail_rebuild)
+    monkeypatch.setattr(service, "_emit_event", lambda *args, **kwargs: None)
+    service.submit_job(_request())
+
+    analytics = service.get_render_analytics()
+    assert analytics.total_jobs == 2
+    assert analytics.adapters["mock"].total_jobs == 2
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+from libraries.automation.render.chunking import (
+    FrameTime,
+    FrameTimeHistory,
+    format_frames,
+    parse_frames,
+    plan_chunks,
+)
+
+
+def test_parse_and_format_frames_round_trip() -> None:
+    frames = parse_frames("1-5,7-11x2,20")
+
+    assert frames == (1, 2, 3, 4, 5, 7, 9, 11, 20)
+    assert format_frames(frames) == "1-5,7-11x2,20"
+    with pytest.raises(ValueError):
+        parse_frames("10-1")
+
+
+def test_history_interpolates_between_recorded_frames() -> None:
+    history = FrameTimeHistory.from_samples(
+        [
+            FrameTime(frame=1, frame_time_ms=1000.0, shot_id="sh010"),
+            FrameTime(frame=11, frame_time_ms=3000.0, shot_id="sh010"),
+            FrameTime(frame=11, frame_time_ms=5000.0, shot_id="sh010"),
+            FrameTime(frame=5, frame_time_ms=90000.0, shot_id="sh020"),
+        ],
+        shot_id="sh010",
+    )
+
+    assert history.estimate_ms(1) == pytest.approx(1000.0)
+    assert history.estimate_ms(6) == pytest.approx(2500.0)
+    assert history.estimate_ms(50) == pytest.approx(4000.0)
+
+
+def test_uniform_history_plans_a_single_segment() -> None:
+    history = FrameTimeHistory(default_ms=60_000.0)
+
+    plan = plan_chunks(
+        parse_frames("1-100"), history, target_seconds=600.0, max_chunk_size=50
+    )
+
+    assert len(plan.segments) == 1
+    assert plan.segments[0].frames == "1-100"
+    assert plan.segments[0].chunk_size == 10
+    assert plan.chunk_count == 10
+    assert plan.longest_chunk_seconds == pytest.approx(600.0)
+
+
+def test_variable_history_shrinks_chunks_where_frames_are_expensive() -> None:
+    # Frames 1-50 are light (30s), frames 51-100 are heavy (5 minutes).
+    frame_times = {frame: 30_000.0 for frame in range(1, 51)}
+    frame_times.update({frame: 300_000.0 for frame in range(51, 101)})
+    history = FrameTimeHistory(frame_times)
+
+    plan = plan_chunks(parse_frames("1-100"), history, target_seconds=900.0)
+
+    sizes = [segment.chunk_size for segment in plan.segments]
+    assert sizes[0] == 30
+    assert sizes[-1] == 3
+    assert plan.segments[0].frames.startswith("1-")
+    assert plan.segments[-1].frames.endswith("-100")
+    assert sum(segment.frame_count for segment in plan.segments) == 100
+    # A static 10 frame chunk would put 50 minutes into the heavy chunks.
+    assert plan.longest_chunk_seconds <= 900.0 * 1.25
+
+
+def test_plan_respects_adapter_limits_and_overhead() -> None:
+    history = FrameTimeHistory(default_ms=1_000.0)
+
+    plan = plan_chunks(
+        parse_frames("1-200"),
+        history,
+        target_seconds=120.0,
+        overhead_seconds=20.0,
+        max_chunk_size=50,
+    )
+
+    assert [segment.chunk_size for segment in plan.segments] == [50]
+    assert plan.chunk_count == 4
+    assert plan.longest_chunk_seconds == pytest.approx(70.0)
+
+    expensive = plan_chunks(
+        parse_frames("1-10"),
+        FrameTimeHistory(default_ms=3_600_000.0),
+        target_seconds=60.0,
+        min_chunk_size=2,
+    )
+    assert [segment.chunk_size for segment in expensive.segments] == [2]
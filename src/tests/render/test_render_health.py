@@ -12,6 +12,7 @@ from apps.trafalgar.web.render import (
     get_render_service,
 )
 from apps.trafalgar.web import security
+from apps.trafalgar.web.job_store import JobStore
 
 
 def _build_headers(key: str, secret: str) -> dict[str, str]:
@@ -37,6 +38,12 @@ def test_health_reports_history_and_pruning(
         response = client.get("/health", headers=headers)
         payload = response.json()
         assert payload["render_history"]["history_size"] == 0
+        assert {"published", "coalesced", "dropped", "resyncs"} <= set(
+            payload["render_history"]["events"]
+        )
+        assert {"ttl_seconds", "farms"} <= set(
+            payload["render_history"]["capabilities"]
+        )
         assert payload["render_summary"]["total_jobs"] == 0
         assert payload["render_summary"]["submission_windows"]["1h"] == 0
 
@@ -62,12 +69,18 @@ def test_health_reports_history_and_pruning(
         assert summary["active_jobs"] >= 0
         assert summary["by_status"]
 
-        data = json.loads(store_path.read_text())
-        assert len(data) == 1
-        data[0]["created_at"] = (
-            datetime.now(timezone.utc) - timedelta(hours=2)
-        ).isoformat()
-        store_path.write_text(json.dumps(data), encoding="utf-8")
+        journal_path = JobStore(store_path).journal_path
+        entries = [json.loads(line) for line in journal_path.read_text().splitlines()]
+        assert {entry["job"]["job_id"] for entry in entries} == {
+            create_response.json()["job_id"]
+        }
+        for entry in entries:
+            entry["job"]["created_at"] = (
+                datetime.now(timezone.utc) - timedelta(hours=2)
+            ).isoformat()
+        journal_path.write_text(
+            "".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8"
+        )
 
         get_render_service.cache_clear()
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -99,10 +100,57 @@ def test_serialised_history_preserves_order_across_restart(
     job_ids = list(service._jobs.keys())
     assert job_ids == ["job-1", "job-2", "job-3"]
 
-    raw_payload = json.loads(store.path.read_text(encoding="utf-8"))
-    assert [entry["job_id"] for entry in raw_payload] == job_ids
+    assert not store.path.exists()
+    journal = store.journal_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["job"]["job_id"] for line in journal] == job_ids
 
     service_reloaded = RenderSubmissionService(
         adapters={"mock": adapter}, job_store=store, history_limit=5
     )
     assert list(service_reloaded._jobs.keys()) == job_ids
+
+
+def test_service_compacts_journal_once_it_outgrows_the_snapshot(
+    tmp_path: Path, sample_request: RenderJobRequest
+) -> None:
+    store = JobStore(tmp_path / "jobs.json", compact_min_entries=2)
+    service = RenderSubmissionService(
+        adapters={"mock": _CountingAdapter()}, job_store=store
+    )
+
+    for _ in range(3):
+        service.submit_job(sample_request)
+
+    snapshot = json.loads(store.path.read_text(encoding="utf-8"))
+    assert [entry["job_id"] for entry in snapshot] == ["job-1", "job-2"]
+    assert store.stats.journal_entries == 1
+    assert [record.job_id for record in JobStore(store.path).load()] == [
+        "job-1",
+        "job-2",
+        "job-3",
+    ]
+
+
+def test_service_compacts_copies_taken_under_the_lock(
+    tmp_path: Path, sample_request: RenderJobRequest
+) -> None:
+    compacted: list[list[_JobRecord]] = []
+
+    class _RecordingStore(JobStore):  # type: ignore[misc]
+        def compact(self, records: Iterable[_JobRecord]) -> None:
+            compacted.append(list(records))
+            super().compact(compacted[-1])
+
+    store = _RecordingStore(tmp_path / "jobs.json", compact_min_entries=2)
+    service = RenderSubmissionService(
+        adapters={"mock": _CountingAdapter()}, job_store=store
+    )
+    for _ in range(3):
+        service.submit_job(sample_request)
+
+    assert compacted
+    for record in compacted[-1]:
+        live = service._jobs[record.job_id]
+        assert record is not live
+        assert record.status_history == live.status_history
+        assert record.status_history is not live.status_history
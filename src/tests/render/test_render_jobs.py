@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import random
+import threading
+import time
 from collections.abc import Iterable, Iterator
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from apps.trafalgar.web.events import EventBroadcaster
 from apps.trafalgar.web.job_store import JobStore, JobStoreStats
+from apps.trafalgar.web.poll_schedule import PollScheduler
 
 import fastapi.security
 import fastapi.security.api_key
@@ -81,6 +88,7 @@ class RecordingJobStore:
 
     def __init__(self) -> None:
         self.saved_batches: list[list[str]] = []
+        self.save_threads: list[int] = []
         self.stats = JobStoreStats(retention=None)
 
     def load(self) -> list[render._JobRecord]:
@@ -88,6 +96,7 @@ class RecordingJobStore:
 
     def save(self, records: Iterable[render._JobRecord]) -> None:
         self.saved_batches.append([record.job_id for record in records])
+        self.save_threads.append(threading.get_ident())
 
 
 @pytest.fixture(autouse=True)
@@ -188,15 +197,423 @@ async def test_background_poller_throttles_persist_operations() -> None:
             await asyncio.sleep(0.05)
         else:
             pytest.fail("Persisted records were not flushed after throttle interval")
+        # The poller writes the store from its executor, not the event loop.
+        assert store.save_threads[-1] != threading.get_ident()
     finally:
         await service.stop_background_polling()
 
 
+class StubBatchAdapter(StubJobAdapter):
+    """Adapter exposing the optional batch status capability."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_requests: list[list[str]] = []
+
+    def get_job_statuses(self, job_ids: list[str]) -> dict[str, dict[str, Any]]:
+        self.batch_requests.append(list(job_ids))
+        return {
+            job_id: {"job_id": job_id, "status": self._jobs[job_id]["status"]}
+            for job_id in job_ids[:-1]
+        }
+
+
+class SlowStatusAdapter(StubJobAdapter):
+    """Adapter whose status lookups block for a fixed delay."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._active_lock = threading.Lock()
+
+    def get_job_status(self, job_id: str) -> dict[str, str | None]:
+        with self._active_lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._active_lock:
+                self.active -= 1
+        return super().get_job_status(job_id)
+
+
+class FlakyStatusAdapter(StubJobAdapter):
+    """Adapter whose status lookups fail for selected jobs."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failing: set[str] = set()
+
+    def get_job_status(self, job_id: str) -> dict[str, str | None]:
+        if job_id in self.failing:
+            self.status_requests.append(job_id)
+            raise render.RenderSubmissionError(f"farm unavailable for {job_id}")
+        return super().get_job_status(job_id)
+
+
+def _submit(service: render.RenderSubmissionService, farm: str = "mock") -> str:
+    request = render.RenderJobRequest(
+        dcc="maya",
+        scene="/projects/demo/scene.ma",
+        frames="1-10",
+        output="/tmp/output",
+        farm=farm,
+        priority=50,
+        user="tester",
+    )
+    return str(service.submit_job(request)["job_id"])
+
+
+@pytest.mark.anyio("asyncio")
+async def test_poller_batches_statuses_and_skips_terminal_jobs() -> None:
+    batch_adapter = StubBatchAdapter()
+    single_adapter = StubJobAdapter()
+    single_adapter._counter = 100
+    service = render.RenderSubmissionService(
+        {"mock": batch_adapter, "tractor": single_adapter}
+    )
+    batch_ids = [_submit(service, "mock") for _ in range(3)]
+    single_id = _submit(service, "tractor")
+    service._jobs[batch_ids[0]].status = "completed"
+    for job_id in batch_ids[1:]:
+        batch_adapter.set_status(job_id, "running")
+    single_adapter.set_status(single_id, "running")
+
+    try:
+        changed = await service._poll_statuses()
+    finally:
+        service._poll_executor.shutdown()
+
+    assert changed is True
+    assert batch_adapter.batch_requests == [batch_ids[1:]]
+    assert batch_adapter.status_requests == [batch_ids[2]]
+    assert single_adapter.status_requests == [single_id]
+    assert all(service._jobs[job_id].status == "running" for job_id in batch_ids[1:])
+
+
+class EmptyBatchAdapter(StubJobAdapter):
+    """Adapter whose batch status lookups return a fixed, unhelpful result."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_result: Any = None
+
+    def get_job_statuses(self, job_ids: list[str]) -> Any:
+        return self.batch_result
+
+
+def test_batch_refresh_looks_up_jobs_with_empty_results_individually() -> None:
+    adapter = EmptyBatchAdapter()
+    service = render.RenderSubmissionService({"mock": adapter})
+    job_ids = [_submit(service) for _ in range(3)]
+    for job_id in job_ids:
+        adapter.set_status(job_id, "running")
+    adapter.batch_result = {job_ids[0]: None, job_ids[1]: {}}
+
+    changed, outcomes = service._refresh_job_batch("mock", job_ids)
+
+    assert changed is True
+    assert adapter.status_requests == job_ids
+    assert outcomes == dict.fromkeys(job_ids, True)
+
+    adapter.status_requests.clear()
+    adapter.batch_result = None
+    service._refresh_job_batch("mock", job_ids)
+
+    assert adapter.status_requests == job_ids
+
+
+@pytest.mark.anyio("asyncio")
+async def test_poller_runs_adapter_calls_concurrently_off_the_loop() -> None:
+    adapter = SlowStatusAdapter(delay=0.05)
+    service = render.RenderSubmissionService(
+        {"mock": adapter}, status_poll_concurrency=4
+    )
+    for _ in range(8):
+        _submit(service)
+
+    ticks = 0
+
+    async def _ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker = asyncio.create_task(_ticker())
+    try:
+        await service._poll_statuses()
+    finally:
+        ticker.cancel()
+        service._poll_executor.shutdown()
+
+    assert len(adapter.status_requests) == 8
+    assert 1 < adapter.peak <= 4
+    assert ticks >= 5
+
+
+@pytest.mark.anyio("asyncio")
+async def test_poll_schedule_adapts_intervals_and_backs_off_failures() -> None:
+    adapter = FlakyStatusAdapter()
+    service = render.RenderSubmissionService(
+        {"mock": adapter}, status_poll_interval=5.0
+    )
+    clock = [0.0]
+    service._poll_schedule = schedule = PollScheduler(
+        base_interval=5.0,
+        max_interval=60.0,
+        terminal_statuses=render.TERMINAL_STATUSES,
+        clock=lambda: clock[0],
+        rng=random.Random(3),
+    )
+    job_ids = [_submit(service) for _ in range(4)]
+    running_id, done_id, flaky_id, stale_id = job_ids
+    adapter.set_status(running_id, "running")
+    adapter.set_status(done_id, "completed")
+    adapter.failing.add(flaky_id)
+    service._jobs[stale_id].updated_at = render._utcnow() - timedelta(hours=1)
+
+    assert schedule.pop_due(now=5.0) == job_ids
+    try:
+        await service._poll_statuses(job_ids)
+    finally:
+        service._poll_executor.shutdown()
+
+    assert done_id not in schedule
+    assert schedule.pop_due(now=5.0) == [running_id]
+    assert schedule.pop_due(now=12.5) == [flaky_id]
+    assert schedule.pop_due(now=59.0) == []
+    assert schedule.pop_due(now=60.0) == [stale_id]
+
+
+class SlowSubmitAdapter(StubJobAdapter):
+    """Adapter whose submissions block and that tracks peak concurrency."""
+
+    def __init__(self, prefix: str, delay: float) -> None:
+        super().__init__()
+        self.prefix = prefix
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._guard = threading.Lock()
+
+    def __call__(self, *, scene: str, **kwargs: Any) -> dict[str, str]:
+        with self._guard:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self._counter += 1
+            job_id = f"{self.prefix}-{self._counter}"
+        try:
+            time.sleep(self.delay)
+            if "broken" in scene:
+                raise render.RenderSubmissionError(
+                    "scene rejected", code="adapter.rejected"
+                )
+            self._jobs[job_id] = {"status": "submitted", "message": None}
+            return {"job_id": job_id, "status": "submitted", "farm_type": "stub"}
+        finally:
+            with self._guard:
+                self.active -= 1
+
+
+@pytest.mark.anyio("asyncio")
+async def test_submit_jobs_dispatches_concurrently_within_farm_limits() -> None:
+    mock = SlowSubmitAdapter("mock", delay=0.05)
+    tractor = SlowSubmitAdapter("tractor", delay=0.05)
+    broadcaster = EventBroadcaster(max_buffer=8)
+    service = render.RenderSubmissionService(
+        {"mock": mock, "tractor": tractor},
+        broadcaster=broadcaster,
+        submission_concurrency=2,
+    )
+    queue = await broadcaster.subscribe()
+    requests = [
+        render.RenderJobRequest(**_job_payload(farm="mock" if index % 2 else "tractor"))
+        for index in range(8)
+    ]
+    requests.append(
+        render.RenderJobRequest(
+            **{**_job_payload(), "scene": "/projects/demo/broken.ma"}
+        )
+    )
+
+    started = time.perf_counter()
+    response = await service.submit_jobs(requests)
+    elapsed = time.perf_counter() - started
+
+    assert (response.submitted, response.failed) == (8, 1)
+    assert [result.index for result in response.results] == list(range(9))
+    assert response.results[-1].error is not None
+    assert response.results[-1].error.code == "adapter.rejected"
+    assert mock.peak == 2 and tractor.peak == 2
+    # Nine 50ms submissions run as three waves of at most two per farm.
+    assert elapsed < 0.3
+    assert len(service.list_jobs()) == 8
+
+    await asyncio.sleep(0)
+    frame = queue.get_nowait()
+    assert queue.empty()
+    assert frame.event == "jobs.created"
+    assert len(json.loads(frame.data)["jobs"]) == 8
+    await broadcaster.unsubscribe(queue)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_submit_jobs_shares_farm_limits_across_batches() -> None:
+    adapter = SlowSubmitAdapter("mock", delay=0.02)
+    # The idle second farm leaves the submission executor room for more than
+    # two mock submissions, so only the farm limit can hold the peak at two.
+    service = render.RenderSubmissionService(
+        {"mock": adapter, "tractor": SlowSubmitAdapter("tractor", delay=0)},
+        submission_concurrency=2,
+    )
+    batches = [
+        [render.RenderJobRequest(**_job_payload()) for _ in range(4)] for _ in range(3)
+    ]
+
+    responses = await asyncio.gather(*(service.submit_jobs(batch) for batch in batches))
+
+    assert [response.submitted for response in responses] == [4, 4, 4]
+    assert adapter.peak == 2
+
+
+@pytest.mark.anyio("asyncio")
+async def test_submit_jobs_rejects_invalid_batches_before_dispatch() -> None:
+    adapter = SlowSubmitAdapter("mock", delay=0)
+    service = render.RenderSubmissionService({"mock": adapter})
+    service.register_adapter(
+        "limited", adapter, capabilities={"priority_min": 0, "priority_max": 10}
+    )
+    registry = {"farm_registry": service.adapter_keys()}
+    requests = [
+        render.RenderJobRequest.model_validate(_job_payload(), context=registry),
+        render.RenderJobRequest.model_validate(
+            _job_payload(farm="limited"), context=registry
+        ),
+    ]
+
+    with pytest.raises(render.RenderSubmissionError) as excinfo:
+        await service.submit_jobs(requests)
+
+    assert excinfo.value.code == "render.batch_invalid"
+    assert excinfo.value.status_code == 422
+    assert [error["index"] for error in excinfo.value.context["errors"]] == [1]
+    assert adapter.peak == 0
+    assert service.list_jobs() == []
+
+
+@pytest.mark.anyio("asyncio")
+async def test_capabilities_are_cached_and_refreshed_after_failures() -> None:
+    adapter = SlowSubmitAdapter("bespoke", delay=0)
+    discovered: list[float] = []
+
+    def provider() -> dict[str, Any]:
+        discovered.append(time.monotonic())
+        return {"default_priority": 40, "priority_min": 0, "priority_max": 100}
+
+    service = render.RenderSubmissionService(
+        {"bespoke": adapter},
+        capability_registry={"bespoke": provider},
+        status_poll_interval=0.01,
+        capability_ttl=60.0,
+    )
+    registry = {"farm_registry": service.adapter_keys()}
+
+    def _request(**overrides: Any) -> render.RenderJobRequest:
+        payload = {**_job_payload("bespoke"), **overrides}
+        return render.RenderJobRequest.model_validate(payload, context=registry)
+
+    service.start_background_polling()
+    try:
+        for _ in range(20):
+            if discovered:
+                break
+            await asyncio.sleep(0.01)
+        # The refresher discovered the farm, so submissions hit the cache.
+        assert len(discovered) == 1
+        for _ in range(3):
+            service.submit_job(_request())
+        service.list_farms()
+        assert len(discovered) == 1
+
+        with pytest.raises(render.RenderSubmissionError):
+            service.submit_job(_request(scene="/projects/broken.ma"))
+        state = service.get_metrics()["capabilities"]["farms"]["bespoke"]
+        assert state["cached"] is True
+        assert state["invalidations"] == 1
+
+        # The failure only marked the entry stale; the refresher renews it
+        # off the request path.
+        for _ in range(50):
+            if len(discovered) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert len(discovered) == 2
+        service.submit_job(_request())
+        assert len(discovered) == 2
+        state = service.get_metrics()["capabilities"]["farms"]["bespoke"]
+        assert state["fresh"] is True
+        assert state["hits"] >= 4
+    finally:
+        await service.stop_background_polling()
+
+
+def test_list_jobs_uses_indexes_kept_in_sync_with_transitions() -> None:
+    adapter = StubJobAdapter()
+    service = render.RenderSubmissionService({"mock": adapter}, history_limit=3)
+    job_ids = []
+    for user in ("ana", "ben", "ana", "ana"):
+        request = render.RenderJobRequest(
+            dcc="maya",
+            scene="/projects/demo/scene.ma",
+            frames="1-10",
+            output="/tmp/output",
+            farm="mock",
+            user=user,
+        )
+        job_ids.append(str(service.submit_job(request)["job_id"]))
+    adapter.set_status(job_ids[2], "running")
+    service.get_job(job_ids[2])
+
+    by_user = service.list_jobs(user=["ANA"])
+    running = service.list_jobs(status=["running"], user=["ana"])
+    submitted = service.list_jobs(status=["submitted"], limit=1)
+
+    assert [job.job_id for job in by_user] == [job_ids[3], job_ids[2]]
+    assert [job.job_id for job in running] == [job_ids[2]]
+    assert running[0].status == "running"
+    assert [job.job_id for job in submitted] == [job_ids[3]]
+    assert adapter.status_requests == [job_ids[2]]
+
+
+def test_stored_jobs_are_indexed_before_they_are_announced(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    service = render.RenderSubmissionService({"mock": StubJobAdapter()})
+    service.submit_job(render.RenderJobRequest(**_job_payload()))
+
+    def _fail_rebuild() -> None:
+        raise AssertionError("the index should not be rebuilt")
+
+    monkeypatch.setattr(service._index, "clear", _fail_rebuild)
+    monkeypatch.setattr(service, "_emit_event", lambda *args, **kwargs: None)
+    job_id = str(
+        service.submit_job(render.RenderJobRequest(**_job_payload()))["job_id"]
+    )
+
+    listed = service.list_jobs()
+    assert [job.job_id for job in listed][0] == job_id
+    assert len(listed) == 2
+
+
 @pytest.mark.anyio("asyncio")
 async def test_list_jobs_reflects_latest_status(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Ensure that /jobs reflects the latest adapter status updates."""
+    """Ensure that /jobs serves cached jobs unless a refresh is requested."""
     monkeypatch.setattr(
         fastapi.security.HTTPBearer,
         "__call__",
@@ -241,8 +658,11 @@ async def test_list_jobs_reflects_latest_status(
 
         adapter.set_status(job_id, "running", "frame 5 of 10")
 
-        list_response = await client.get("/jobs")
+        cached_response = await client.get("/jobs")
+        assert adapter.status_requests == []
+        list_response = await client.get("/jobs", params={"refresh": "true"})
 
+    assert cached_response.json()["jobs"][0]["status"] == "submitted"
     assert list_response.status_code == 200
     payload = list_response.json()
     assert payload["jobs"][0]["job_id"] == job_id
@@ -303,6 +723,7 @@ async def test_list_jobs_supports_limit_and_filters(
         adapter.set_status(created_jobs[0][1], "running")
         adapter.set_status(created_jobs[1][1], "completed")
         adapter.set_status(created_jobs[2][1], "failed")
+        service.list_jobs(refresh=True)
 
         limited = await client.get("/jobs", params={"limit": 2})
         status_filtered = await client.get("/jobs", params=[("status", "running")])
@@ -382,7 +803,7 @@ async def test_list_jobs_limit_prioritises_recent_jobs(
         adapter.set_status(job_ids[2], "failed")
 
         adapter.status_requests.clear()
-        limited = await client.get("/jobs", params={"limit": 1})
+        limited = await client.get("/jobs", params={"limit": 1, "refresh": "true"})
 
     assert limited.status_code == 200
     payload = limited.json()
@@ -812,3 +1233,112 @@ async def test_history_limit_removes_old_jobs(
     new_service = render.RenderSubmissionService({}, job_store=JobStore(store_path))
     jobs = new_service.list_jobs()
     assert [job.job_id for job in jobs] == [latest_job_id]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_list_jobs_returns_not_modified_until_jobs_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        fastapi.security.HTTPBearer,
+        "__call__",
+        lambda self, request=None: HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials="test-bearer-token"
+        ),
+    )
+
+    class DummyCredentialStore:
+        def authenticate_bearer(self, token: str) -> render.AuthenticatedPrincipal:
+            return render.AuthenticatedPrincipal(
+                identifier="mock-service",
+                scheme="Bearer",
+                roles={"render:read", "render:submit"},
+            )
+
+    monkeypatch.setattr(
+        security, "get_credential_store", lambda *a, **kw: DummyCredentialStore()
+    )
+
+    adapter = StubJobAdapter()
+    service = render.RenderSubmissionService({"mock": adapter})
+    render.app.dependency_overrides[render.get_render_service] = lambda: service
+
+    transport = ASGITransport(app=render.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        submit_response = await client.post("/jobs", json=_job_payload())
+        job_id = submit_response.json()["job_id"]
+
+        first = await client.get("/jobs")
+        etag = first.headers["etag"]
+        unchanged = await client.get("/jobs", headers={"If-None-Match": etag})
+        filtered = await client.get(
+            "/jobs", params={"status": "running"}, headers={"If-None-Match": etag}
+        )
+
+        adapter.set_status(job_id, "running")
+        stale = await client.get("/jobs", headers={"If-None-Match": etag})
+        changed = await client.get(
+            "/jobs", params={"refresh": "true"}, headers={"If-None-Match": etag}
+        )
+
+    assert first.status_code == 200
+    assert unchanged.status_code == 304
+    assert stale.status_code == 304
+    assert adapter.status_requests == [job_id]
+    assert unchanged.content == b""
+    assert filtered.status_code == 200
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["jobs"][0]["status"] == "running"
+
+
+@pytest.mark.anyio("asyncio")
+async def test_list_jobs_pages_with_cursor_and_selects_fields(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        fastapi.security.HTTPBearer,
+        "__call__",
+        lambda self, request=None: HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials="test-bearer-token"
+        ),
+    )
+
+    class DummyCredentialStore:
+        def authenticate_bearer(self, token: str) -> render.AuthenticatedPrincipal:
+            return render.AuthenticatedPrincipal(
+                identifier="mock-service",
+                scheme="Bearer",
+                roles={"render:read", "render:submit"},
+            )
+
+    monkeypatch.setattr(
+        security, "get_credential_store", lambda *a, **kw: DummyCredentialStore()
+    )
+
+    adapter = StubJobAdapter()
+    service = render.RenderSubmissionService({"mock": adapter})
+    render.app.dependency_overrides[render.get_render_service] = lambda: service
+
+    transport = ASGITransport(app=render.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        job_ids = []
+        for _ in range(3):
+            response = await client.post("/jobs", json=_job_payload())
+            job_ids.append(response.json()["job_id"])
+
+        first = await client.get("/jobs", params={"limit": 2, "fields": "job_id"})
+        cursor = first.headers["x-next-cursor"]
+        adapter.status_requests.clear()
+        second = await client.get(
+            "/jobs",
+            params={"limit": 2, "fields": "job_id", "cursor": cursor, "refresh": True},
+        )
+        invalid = await client.get("/jobs", params={"cursor": "%%%"})
+
+    assert first.json() == {"jobs": [{"job_id": job_ids[2]}, {"job_id": job_ids[1]}]}
+    assert 'rel="next"' in first.headers["link"]
+    assert second.json() == {"jobs": [{"job_id": job_ids[0]}]}
+    assert "x-next-cursor" not in second.headers
+    assert adapter.status_requests == [job_ids[0]]
+    assert invalid.status_code == 400
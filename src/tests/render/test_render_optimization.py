@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from libraries.automation.render.optimization import (
+    NUMPY_AVAILABLE,
     CostBreakdown,
+    CostModelBatch,
     CostModelInput,
     OptimizationProjection,
     OptimizationScenario,
     estimate_cost,
+    estimate_costs,
     simulate_optimizations,
 )
 
+BACKENDS = [
+    pytest.param(False, id="python"),
+    pytest.param(
+        True,
+        id="numpy",
+        marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed"),
+    ),
+]
+
 
 def test_estimate_cost_returns_breakdown() -> None:
     inputs = CostModelInput(
@@ -102,3 +116,87 @@ def test_simulate_optimizations_rejects_invalid_gpu_count() -> None:
             baseline,
             [OptimizationScenario(name="invalid", gpu_count=0)],
         )
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_estimate_costs_matches_estimate_cost(use_numpy: bool) -> None:
+    inputs = [
+        CostModelInput(
+            frame_count=100 + index * 37,
+            average_frame_time_ms=1_500.0 + index * 211.5,
+            gpu_hourly_rate=6.5 + index,
+            gpu_count=1 + index % 4,
+            render_hours=0.0 if index % 2 else 1.25 * index,
+            render_farm_hourly_rate=2.0,
+            storage_gb=4.0 * index,
+            storage_rate_per_gb=0.3,
+            data_egress_gb=1.5,
+            egress_rate_per_gb=0.1,
+            misc_costs=12.0,
+        )
+        for index in range(6)
+    ]
+
+    batch = estimate_costs(inputs, use_numpy=use_numpy)
+
+    assert len(batch) == 6
+    assert list(batch) == [estimate_cost(item) for item in inputs]
+    assert list(batch.column("frame_count")) == [item.frame_count for item in inputs]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_estimate_costs_rounds_like_estimate_cost(use_numpy: bool) -> None:
+    rng = random.Random(20240501)
+    inputs = [
+        CostModelInput(
+            frame_count=rng.randint(1, 20_000),
+            average_frame_time_ms=round(rng.uniform(50.0, 600_000.0), 1),
+            gpu_hourly_rate=round(rng.uniform(0.0, 12.0), 2),
+            gpu_count=rng.randint(1, 16),
+            render_hours=rng.choice([0.0, round(rng.uniform(0.0, 500.0), 2)]),
+            render_farm_hourly_rate=round(rng.uniform(0.0, 8.0), 2),
+            storage_gb=round(rng.uniform(0.0, 5_000.0), 1),
+            storage_rate_per_gb=round(rng.uniform(0.0, 0.1), 3),
+            data_egress_gb=round(rng.uniform(0.0, 2_000.0), 1),
+            egress_rate_per_gb=round(rng.uniform(0.0, 0.12), 3),
+            misc_costs=round(rng.uniform(0.0, 500.0), 2),
+        )
+        for _ in range(20_000)
+    ]
+    # 2.5 GB at 0.01 is stored just above 0.025, which round() takes to 0.03.
+    inputs.append(
+        CostModelInput(
+            frame_count=1,
+            average_frame_time_ms=1.0,
+            gpu_hourly_rate=0.0,
+            storage_gb=2.5,
+            storage_rate_per_gb=0.01,
+        )
+    )
+
+    batch = estimate_costs(inputs, use_numpy=use_numpy)
+
+    assert list(batch) == [estimate_cost(item) for item in inputs]
+    assert batch[-1].storage_cost == 0.03
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_estimate_costs_broadcasts_scalars_and_validates(use_numpy: bool) -> None:
+    baseline = CostModelInput(
+        frame_count=240, average_frame_time_ms=120_000.0, gpu_hourly_rate=8.0
+    )
+    batch = CostModelBatch.from_baseline(
+        baseline, average_frame_time_ms=[60_000.0, 120_000.0, 240_000.0]
+    )
+
+    costs = estimate_costs(batch, use_numpy=use_numpy).column("gpu_cost")
+
+    assert list(costs) == pytest.approx([32.0, 64.0, 128.0])
+    with pytest.raises(ValueError, match="gpu_count must be positive"):
+        estimate_costs(
+            CostModelBatch.from_baseline(baseline, gpu_count=[1, 0]),
+            use_numpy=use_numpy,
+        )
+    with pytest.raises(ValueError):
+        CostModelBatch.from_baseline(baseline, frame_count=[1, 2], gpu_count=[1])
+    assert len(estimate_costs([], use_numpy=use_numpy)) == 0
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import getpass
+import json
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -332,6 +333,170 @@ def test_render_preset_crud_flow(
     assert captured["chunk_size"] == 3
 
 
+def test_render_submit_plans_chunks_from_frame_history(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    scene_file = tmp_path / "shot01.nk"
+    scene_file.write_text("print('render')\n")
+    output_dir = tmp_path / "renders"
+    output_dir.mkdir()
+
+    history = tmp_path / "frame_times.ndjson"
+    records = [
+        {"shot_id": "sh010", "frame": frame, "frame_time_ms": 30_000.0}
+        for frame in range(1, 21)
+    ]
+    records += [
+        {"shot_id": "sh010", "frame": frame, "frame_time_ms": 300_000.0}
+        for frame in range(21, 41)
+    ]
+    records.append({"shot_id": "sh020", "frame": 1, "frame_time_ms": 9_000_000.0})
+    history.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+    calls: list[tuple[str, int | None]] = []
+
+    def fake_submit(
+        scene: str,
+        frames: str,
+        output: str,
+        dcc: str,
+        priority: int,
+        user: str,
+        chunk_size: int | None,
+    ) -> dict[str, str]:
+        calls.append((frames, chunk_size))
+        return {
+            "job_id": f"job-{len(calls)}",
+            "status": "queued",
+            "farm_type": "mock",
+        }
+
+    monkeypatch.setitem(submit_module.FARM_ADAPTERS, "mock", fake_submit)
+    monkeypatch.setitem(
+        submit_module.FARM_CAPABILITY_PROVIDERS,
+        "mock",
+        lambda: {
+            "default_priority": 50,
+            "chunk_size_enabled": True,
+            "default_chunk_size": 5,
+            "chunk_size_min": 1,
+            "chunk_size_max": 50,
+        },
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "render",
+            "submit",
+            "--dcc",
+            "nuke",
+            "--scene",
+            str(scene_file),
+            "--frames",
+            "1-40",
+            "--output",
+            str(output_dir),
+            "--chunk-target",
+            "600",
+            "--frame-times",
+            str(history),
+            "--shot",
+            "sh010",
+        ],
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert calls == [("1-20", 20), ("21-40", 2)]
+    assert result.stdout.count("Submitted nuke scene") == 2
+
+    conflicting = runner.invoke(
+        app,
+        [
+            "render",
+            "submit",
+            "--dcc",
+            "nuke",
+            "--scene",
+            str(scene_file),
+            "--output",
+            str(output_dir),
+            "--chunk-size",
+            "5",
+            "--chunk-target",
+            "600",
+            "--frame-times",
+            str(history),
+        ],
+    )
+
+    assert conflicting.exit_code != 0
+    assert isinstance(conflicting.exception, OnePieceValidationError)
+
+
+def test_render_submit_reports_jobs_queued_before_a_failed_segment(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    scene_file = tmp_path / "shot01.nk"
+    scene_file.write_text("print('render')\n")
+    output_dir = tmp_path / "renders"
+    output_dir.mkdir()
+
+    history = tmp_path / "frame_times.ndjson"
+    records = [
+        {"frame": frame, "frame_time_ms": 30_000.0 if frame <= 20 else 300_000.0}
+        for frame in range(1, 41)
+    ]
+    history.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+    calls: list[str] = []
+
+    def fake_submit(
+        scene: str,
+        frames: str,
+        output: str,
+        dcc: str,
+        priority: int,
+        user: str,
+        chunk_size: int | None,
+    ) -> dict[str, str]:
+        calls.append(frames)
+        if len(calls) > 1:
+            raise RenderSubmissionError("farm offline")
+        return {"job_id": "job-1", "status": "queued", "farm_type": "mock"}
+
+    monkeypatch.setitem(submit_module.FARM_ADAPTERS, "mock", fake_submit)
+    monkeypatch.setitem(
+        submit_module.FARM_CAPABILITY_PROVIDERS,
+        "mock",
+        lambda: {"default_priority": 50, "chunk_size_enabled": True},
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "render",
+            "submit",
+            "--dcc",
+            "nuke",
+            "--scene",
+            str(scene_file),
+            "--frames",
+            "1-40",
+            "--output",
+            str(output_dir),
+            "--chunk-target",
+            "600",
+            "--frame-times",
+            str(history),
+        ],
+    )
+
+    assert calls == ["1-20", "21-40"]
+    assert isinstance(result.exception, OnePieceExternalServiceError)
+    assert "Already submitted job IDs: job-1." in str(result.exception)
+
+
 def test_render_submit_requires_existing_scene(tmp_path: Path) -> None:
     output_dir = tmp_path / "renders"
     output_dir.mkdir()
@@ -478,3 +478,64 @@ def test_submit_job_invalid_dcc_returns_validation_error(client: TestClient) ->
     assert response.status_code == 422
     payload = response.json()
     assert payload["detail"][0]["loc"][-1] == "dcc"
+
+
+def test_submit_jobs_batch_reports_per_job_results(
+    client: TestClient,
+    render_service: render_module.RenderSubmissionService,
+) -> None:
+    counter = iter(range(1, 100))
+
+    def bespoke(**kwargs: Any) -> dict[str, Any]:
+        if kwargs["scene"].endswith("broken.ma"):
+            raise RenderAdapterUnavailableError("farm offline")
+        return {"job_id": f"bespoke-{next(counter)}", "status": "queued"}
+
+    render_service.register_adapter("bespoke", bespoke)
+    job = {
+        "dcc": "maya",
+        "scene": "/projects/show/shot.ma",
+        "frames": "1-10",
+        "output": "/tmp/output",
+        "farm": "bespoke",
+    }
+
+    response = client.post(
+        "/jobs/batch",
+        json={"jobs": [job, {**job, "scene": "/projects/show/broken.ma"}, job]},
+    )
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert (payload["submitted"], payload["failed"]) == (2, 1)
+    results = payload["results"]
+    assert [result["status"] for result in results] == ["queued", "error", "queued"]
+    assert results[1]["error"]["message"] == "farm offline"
+    assert {result["job_id"] for result in results if result["job_id"]} == {
+        "bespoke-1",
+        "bespoke-2",
+    }
+
+
+def test_submit_jobs_batch_validates_every_job_up_front(client: TestClient) -> None:
+    job = {
+        "dcc": "maya",
+        "scene": "/projects/show/shot.ma",
+        "frames": "1-10",
+        "output": "/tmp/output",
+        "farm": "mock",
+    }
+
+    invalid_frames = client.post(
+        "/jobs/batch", json={"jobs": [job, {**job, "frames": "1-10x0,foo"}]}
+    )
+    invalid_priority = client.post(
+        "/jobs/batch", json={"jobs": [{**job, "priority": 200}, job]}
+    )
+
+    assert invalid_frames.status_code == 422
+    assert invalid_frames.json()["detail"][0]["loc"] == ["body", "jobs", 1, "frames"]
+    assert invalid_priority.status_code == 422
+    error = invalid_priority.json()["error"]
+    assert error["code"] == "render.batch_invalid"
+    assert [entry["index"] for entry in error["context"]["errors"]] == [0]
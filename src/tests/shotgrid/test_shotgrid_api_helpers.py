@@ -940,3 +940,41 @@ def test_version_view_full_fields_and_parser() -> None:
         "description": "Waiting for notes",
         "project_id": 42,
     }
+
+
+def test_list_playlists_for_projects_uses_single_in_filter(
+    client: ShotGridClient,
+) -> None:
+    client._get_paginated = MagicMock(return_value=[{"id": 1}])
+
+    result = client.list_playlists_for_projects([7, 3, 7])
+
+    assert result == [{"id": 1}]
+    client._get_paginated.assert_called_once_with(
+        "Playlist",
+        [{"project.id[$in]": "3,7"}],
+        "id,name,code,project,updated_at,versions",
+    )
+    assert client.list_playlists_for_projects([]) == []
+
+
+def test_list_projects_by_name_deduplicates_names(client: ShotGridClient) -> None:
+    client._get_paginated = MagicMock(return_value=[])
+
+    client.list_projects_by_name(["beta", "alpha", "beta", " ", "Smith, Jones"])
+
+    client._get_paginated.assert_called_once_with(
+        "Project", [{"name[$in]": ["Smith, Jones", "alpha", "beta"]}], "id,name,code"
+    )
+
+
+def test_in_filters_encode_each_value_separately(client: ShotGridClient) -> None:
+    params = client._build_query_params(
+        [{"name[$in]": ["Smith, Jones", "alpha"]}], "id,name"
+    )
+
+    assert params == {
+        "fields": "id,name",
+        "filter[0][name[$in]][0]": "Smith, Jones",
+        "filter[0][name[$in]][1]": "alpha",
+    }
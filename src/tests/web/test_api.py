@@ -664,7 +664,7 @@ def test_settings_endpoint_reports_warnings(
 
 
 def test_metrics_ingest_persists_payload(tmp_path: Path) -> None:
-    metrics_path = tmp_path / "metrics.ndjson"
+    metrics_path = tmp_path / "metrics.db"
     original_store = dashboard_module._metrics_store
     dashboard_module._metrics_store = dashboard_module.RenderMetricStore(metrics_path)
     try:
@@ -688,19 +688,29 @@ def test_metrics_ingest_persists_payload(tmp_path: Path) -> None:
         assert response.json() == {"status": "accepted", "enqueued": 1}
 
         assert metrics_path.exists()
-        contents = metrics_path.read_text(encoding="utf-8").strip().splitlines()
-        assert len(contents) == 1
-        stored = json.loads(contents[0])
-        assert stored["sequence"] == "SQ42"
-        assert stored["shot_id"] == "SQ42_SH010"
-        assert stored["timestamp"] == "2024-05-20T12:30:00Z"
-        assert stored["gpuUtilisation"] == pytest.approx(0.78)
+        stored = dashboard_module._metrics_store.query(shot_id="SQ42_SH010")
+        assert len(stored) == 1
+        assert stored[0].sequence == "SQ42"
+        assert stored[0].timestamp == datetime(2024, 5, 20, 12, 30)
+        assert stored[0].gpu_utilisation == pytest.approx(0.78)
+
+        feed = client.get("/render-feed", params={"shot_id": "SQ42_SH010"})
+        assert feed.status_code == 200
+        assert [sample["frame_time_ms"] for sample in feed.json()] == [125.6]
+
+        summary = client.get("/metrics").json()
+        sq42 = next(
+            entry for entry in summary["sequences"] if entry["sequence"] == "SQ42"
+        )
+        assert sq42["shots"] == 1
+        assert sq42["avg_frame_time_ms"] == pytest.approx(125.6)
+        assert summary["latest_sample"]["shot_id"] == "SQ42_SH010"
     finally:
         dashboard_module._metrics_store = original_store
 
 
 def test_metrics_ingest_rejects_empty_payload(tmp_path: Path) -> None:
-    metrics_path = tmp_path / "metrics.ndjson"
+    metrics_path = tmp_path / "metrics.db"
     original_store = dashboard_module._metrics_store
     dashboard_module._metrics_store = dashboard_module.RenderMetricStore(metrics_path)
     try:
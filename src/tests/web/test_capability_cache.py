@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from apps.trafalgar.web.capability_cache import CapabilityCache
+from libraries.automation.render.base import AdapterCapabilities, RenderSubmissionError
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Provider:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self) -> AdapterCapabilities:
+        self.calls += 1
+        if self.fail:
+            raise RenderSubmissionError("capabilities endpoint down")
+        return AdapterCapabilities(default_priority=self.calls)
+
+
+def test_entries_are_served_until_they_expire() -> None:
+    clock = _Clock()
+    cache = CapabilityCache(ttl=60.0, refresh_ahead=0.25, clock=clock)
+    provider = _Provider()
+
+    assert cache.get("deadline", provider)["default_priority"] == 1
+    clock.now = 30.0
+    assert cache.get("deadline", provider)["default_priority"] == 1
+    assert cache.due() == []
+    assert cache.seconds_until_next() == 15.0
+
+    clock.now = 50.0
+    assert cache.due() == ["deadline"]
+    clock.now = 61.0
+    assert cache.get("deadline", provider, allow_stale=True)["default_priority"] == 1
+    assert cache.get("deadline", provider)["default_priority"] == 2
+    assert provider.calls == 2
+
+    farm = cache.snapshot()["farms"]["deadline"]
+    assert (farm["hits"], farm["stale_hits"], farm["misses"]) == (1, 1, 2)
+    assert farm["fresh"] is True
+    assert farm["expires_in_seconds"] == 60.0
+
+
+def test_failures_drop_entries() -> None:
+    cache = CapabilityCache(ttl=60.0, clock=_Clock())
+    provider = _Provider()
+    cache.get("tractor", provider)
+
+    provider.fail = True
+    with pytest.raises(RenderSubmissionError):
+        cache.refresh("tractor", provider)
+
+    farm = cache.snapshot()["farms"]["tractor"]
+    assert farm["cached"] is False
+    assert (farm["invalidations"], farm["errors"]) == (0, 1)
+    assert farm["last_error"] == "capabilities endpoint down"
+
+    provider.fail = False
+    assert cache.get("tractor", provider)["default_priority"] == 3
+    assert cache.snapshot()["farms"]["tractor"]["last_error"] is None
+
+
+def test_mark_stale_keeps_entry_until_refreshed() -> None:
+    clock = _Clock()
+    cache = CapabilityCache(ttl=60.0, clock=clock)
+    provider = _Provider()
+    cache.get("deadline", provider)
+    clock.now = 10.0
+
+    assert cache.mark_stale("deadline", reason="adapter.rejected") is True
+    assert cache.mark_stale("opencue") is False
+    assert cache.due() == ["deadline"]
+    assert cache.get("deadline", provider, allow_stale=True)["default_priority"] == 1
+    assert provider.calls == 1
+
+    cache.refresh("deadline", provider)
+    farm = cache.snapshot()["farms"]["deadline"]
+    assert (farm["fresh"], farm["invalidations"]) == (True, 1)
+    assert cache.due() == []
+
+
+def test_zero_ttl_disables_caching() -> None:
+    cache = CapabilityCache(ttl=0)
+    provider = _Provider()
+
+    cache.get("mock", provider)
+    cache.get("mock", provider)
+
+    assert provider.calls == 2
+    assert cache.snapshot()["farms"] == {}
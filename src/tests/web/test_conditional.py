@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+from starlette.requests import Request
+
+from apps.trafalgar.web import conditional
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode("latin-1")))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_compute_etag_is_stable_and_requires_known_generations() -> None:
+    etag = conditional.compute_etag("status", 3, 7)
+
+    assert etag == conditional.compute_etag("status", 3, 7)
+    assert etag != conditional.compute_etag("status", 3, 8)
+    assert etag != conditional.compute_etag("status", 3, 7, params=10)
+    assert etag is not None and etag.startswith('"') and etag.endswith('"')
+    assert conditional.compute_etag("status", 3, None) is None
+    assert conditional.compute_etag("jobs", 1, params=None) is not None
+
+
+def test_etag_matches_handles_lists_weak_tags_and_wildcards() -> None:
+    etag = conditional.compute_etag("jobs", 1)
+    assert etag is not None
+
+    assert conditional.etag_matches(_request(f'"other", {etag}'), etag)
+    assert conditional.etag_matches(_request(f"W/{etag}"), etag)
+    assert conditional.etag_matches(_request("*"), etag)
+    assert not conditional.etag_matches(_request('"other"'), etag)
+    assert not conditional.etag_matches(_request(), etag)
+    assert not conditional.etag_matches(_request("*"), None)
+
+
+def test_not_modified_sets_cache_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(conditional.CACHE_CONTROL_ENV, "private, max-age=5")
+
+    response = conditional.not_modified('"abc"')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == "private, max-age=5"
+
+
+def test_generation_tracker_only_advances_when_payload_changes() -> None:
+    tracker = conditional.GenerationTracker()
+
+    assert tracker.generation() is None
+    first = tracker.observe([{"shot": "a"}])
+    assert tracker.observe([{"shot": "a"}]) == first
+    second = tracker.observe([{"shot": "b"}])
+    assert second > first
+    alpha = tracker.observe([], key="alpha")
+    assert tracker.generation() == second
+    assert tracker.generation("alpha") == alpha
+
+
+def test_generation_trackers_never_share_generations() -> None:
+    first = conditional.GenerationTracker().observe(["a"])
+    second = conditional.GenerationTracker().observe(["b"])
+
+    assert first != second
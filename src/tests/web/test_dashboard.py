@@ -4,6 +4,7 @@ import asyncio
 import copy
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
 from typing import Any, Callable, Generator, Iterable, Mapping, Sequence
@@ -21,6 +22,7 @@ from apps.trafalgar.providers.providers import (
     initialize_providers,
 )
 from apps.trafalgar.web import dashboard
+from libraries.automation.review.dailies import DailiesClip
 
 
 initialize_providers()
@@ -184,6 +186,21 @@ def test_delivery_service_uses_default_provider() -> None:
     assert payload == []
 
 
+def test_delivery_service_manifest_cache_is_thread_safe() -> None:
+    service = dashboard.DeliveryService(manifest_cache_size=4)
+
+    def _churn(offset: int) -> None:
+        for index in range(2000):
+            key = (offset + index) % 12
+            service._store_manifest(key, {"files": []})
+            service._lookup_manifest((key + 1) % 12)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_churn, range(8)))
+
+    assert len(service._manifest_cache) == 4
+
+
 def test_require_dashboard_auth_accepts_matching_token(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -537,6 +554,106 @@ def test_shotgrid_service_manual_invalidation_clears_cache() -> None:
     assert client.calls == 2
 
 
+def test_shotgrid_service_reuses_aggregates_for_cached_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    versions = [
+        {"project": "alpha", "shot": "EP01_SC001_SH0010", "status": "apr"},
+        {"project": "alpha", "shot": "EP02_SC001_SH0010", "status": "pub"},
+    ]
+    client = DummyShotgridClient(versions)
+    clock = FakeMonotonic()
+    service = dashboard.ShotGridService(
+        client, known_projects={"alpha"}, cache_ttl=10.0, time_provider=clock
+    )
+
+    builds: list[int] = []
+    original_init = dashboard._VersionAggregates.__init__
+
+    def _tracking_init(self: Any, source: Sequence[Mapping[str, Any]]) -> None:
+        builds.append(len(source))
+        original_init(self, source)
+
+    monkeypatch.setattr(dashboard._VersionAggregates, "__init__", _tracking_init)
+
+    service.overall_status()
+    service.project_summary("alpha")
+    service.project_episode_summary("ALPHA")
+
+    assert builds == [2]
+    assert service.data_generation == 1
+
+    aggregates = service._aggregates
+    clock.advance(11.0)
+    service.overall_status()
+
+    # A fresh snapshot is aggregated again, but an unchanged fingerprint keeps
+    # the existing aggregates and generation.
+    assert builds == [2, 2]
+    assert client.calls == 2
+    assert service._aggregates is aggregates
+    assert service.data_generation == 1
+
+
+def test_shotgrid_service_keeps_aggregates_without_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    versions = [{"project": "alpha", "shot": "EP01_SC001_SH0010", "status": "wip"}]
+    client = DummyShotgridClient(versions)
+    service = dashboard.ShotGridService(client, known_projects={"alpha"}, cache_ttl=0)
+
+    builds: list[int] = []
+    original_init = dashboard._VersionAggregates.__init__
+
+    def _tracking_init(self: Any, source: Sequence[Mapping[str, Any]]) -> None:
+        builds.append(len(source))
+        original_init(self, source)
+
+    monkeypatch.setattr(dashboard._VersionAggregates, "__init__", _tracking_init)
+
+    service.overall_status()
+    service.project_summary("alpha")
+
+    assert client.calls == 2
+    assert builds == [1, 1]
+    assert service.data_generation == 1
+
+
+def test_shotgrid_service_generation_advances_when_snapshot_changes() -> None:
+    versions = [{"project": "alpha", "shot": "EP01_SC001_SH0010", "status": "wip"}]
+    client = DummyShotgridClient(versions)
+    service = dashboard.ShotGridService(client, known_projects={"alpha"}, cache_ttl=0)
+
+    assert service.refresh_aggregates() == 1
+    assert service.project_summary("alpha")["status_totals"] == {"wip": 1}
+
+    versions[0]["status"] = "Approved"
+
+    summary = service.project_summary("alpha")
+
+    assert service.data_generation == 2
+    assert summary["approved_versions"] == 1
+    assert summary["status_totals"] == {"approved": 1}
+
+
+def test_shotgrid_service_summaries_are_isolated_from_callers() -> None:
+    versions = [
+        {"project": "alpha", "shot": "EP01_SC001_SH0010", "status": "pub"},
+    ]
+    service = dashboard.ShotGridService(
+        DummyShotgridClient(versions), known_projects={"alpha"}, cache_ttl=30.0
+    )
+
+    first = service.project_episode_summary("alpha")
+    first["episodes"][0]["status_counts"]["published"] = 99
+    first["status_totals"].clear()
+
+    second = service.project_episode_summary("alpha")
+
+    assert second["episodes"][0]["status_counts"] == {"published": 1}
+    assert second["status_totals"] == {"published": 1}
+
+
 def test_shotgrid_service_overall_status_handles_mapping_projects() -> None:
     versions: Sequence[dict[str, Any]] = [
         {"project": {"name": "alpha"}},
@@ -676,6 +793,8 @@ async def test_status_endpoint_aggregates_counts() -> None:
     assert data["render"] == render_summary
     assert render_facade.calls == 1
     assert data["review"] == review_summary
+    assert data["degraded"] is False
+    assert data["degraded_sources"] == []
     assert review_facade.project_calls
     assert set(review_facade.project_calls[0]).issuperset({"alpha", "beta"})
 
@@ -1081,6 +1200,40 @@ async def test_deliveries_endpoint_handles_missing_entries() -> None:
     assert data[0]["file_count"] == 0
 
 
+@pytest.mark.anyio("asyncio")
+async def test_deliveries_endpoint_paginates_and_filters_by_date() -> None:
+    deliveries = [
+        {
+            "project": "alpha",
+            "id": f"delivery-{day}",
+            "name": f"alpha_202401{day:02d}",
+            "created_at": f"2024-01-{day:02d}T10:00:00Z",
+            "items": [],
+        }
+        for day in (1, 3, 2, 4)
+    ]
+    dashboard.app.dependency_overrides[dashboard.get_delivery_service] = (
+        lambda: dashboard.DeliveryService(DummyDeliveryProvider(deliveries))
+    )
+
+    transport = ASGITransport(app=dashboard.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        params: dict[str, str | int] = {
+            "limit": 2,
+            "since": "2024-01-02T00:00:00Z",
+            "fields": "name",
+        }
+        first = await client.get("/deliveries/alpha", params=params)
+        second = await client.get(
+            "/deliveries/alpha",
+            params={**params, "cursor": first.headers["x-next-cursor"]},
+        )
+
+    assert first.json() == [{"name": "alpha_20240104"}, {"name": "alpha_20240103"}]
+    assert second.json() == [{"name": "alpha_20240102"}]
+    assert "x-next-cursor" not in second.headers
+
+
 @pytest.mark.anyio("asyncio")
 async def test_deliveries_endpoint_uses_default_provider() -> None:
     previous = dashboard.app.dependency_overrides.pop(
@@ -1377,7 +1530,7 @@ def test_delivery_service_get_manifest_raises_for_unknown_delivery() -> None:
         service.get_delivery_manifest("alpha", "missing")
 
 
-def test_delivery_service_reuses_cached_manifest_and_returns_deep_copy(
+def test_delivery_service_shares_cached_manifest_between_listings(
     delivery_provider_factory: Callable[..., SequencedDeliveryProvider],
 ) -> None:
     provider = delivery_provider_factory(
@@ -1403,16 +1556,10 @@ def test_delivery_service_reuses_cached_manifest_and_returns_deep_copy(
     first = service.list_deliveries("alpha")
     assert first[0]["items"] == [{"path": "alpha.mov"}]
 
-    original_items = first[0]["items"]
-    original_file = original_items[0]
-    original_items.append({"path": "mutated.mov"})
-    original_file["path"] = "tampered.mov"
-
     second = service.list_deliveries("alpha")
 
     assert second[0]["items"] == [{"path": "alpha.mov"}]
-    assert second[0]["items"] is not original_items
-    assert second[0]["items"][0] is not original_file
+    assert second[0]["items"] is first[0]["items"]
 
 
 def test_delivery_service_evicts_oldest_manifest_when_cache_full(
@@ -1543,3 +1690,284 @@ async def test_landing_page_returns_html() -> None:
     assert response.status_code == 200
     assert "OnePiece Production Dashboard" in response.text
     assert 'href="/errors/summary"' in response.text
+
+
+def _review_version(identifier: int, shot: str) -> dict[str, Any]:
+    return {
+        "id": identifier,
+        "attributes": {
+            "code": f"{shot}_v{identifier:03d}",
+            "sg_path_to_movie": f"/media/{shot}_{identifier}.mov",
+            "sg_uploaded_movie_frame_count": 48,
+            "sg_uploaded_movie_frame_rate": 24,
+        },
+        "relationships": {"entity": {"data": {"name": shot}}},
+    }
+
+
+class BatchedReviewClient:
+    def __init__(self) -> None:
+        self.playlists: list[dict[str, Any]] = [
+            {
+                "id": 11,
+                "attributes": {"code": "Dailies", "updated_at": "2024-05-01T10:00"},
+                "relationships": {
+                    "project": {"data": {"id": 1}},
+                    "versions": {"data": [{"id": 101}, {"id": 102}]},
+                },
+            },
+            {
+                "id": 12,
+                "attributes": {"code": "Client", "updated_at": "2024-05-01T11:00"},
+                "relationships": {
+                    "project": {"data": {"id": 1}},
+                    "versions": {"data": [{"id": 102}]},
+                },
+            },
+            {
+                "id": 21,
+                "attributes": {"code": "Dailies", "updated_at": "2024-05-02T09:00"},
+                "relationships": {
+                    "project": {"data": {"id": 2}},
+                    "versions": {"data": [{"id": 201}]},
+                },
+            },
+        ]
+        self.versions = {
+            101: _review_version(101, "sh010"),
+            102: _review_version(102, "sh020"),
+            201: _review_version(201, "sh100"),
+        }
+        self.calls: list[str] = []
+        self.version_filters: list[list[dict[str, object]]] = []
+
+    def list_projects_by_name(self, names: Iterable[str]) -> list[dict[str, Any]]:
+        self.calls.append("projects")
+        known = {"alpha": 1, "beta": 2}
+        return [
+            {"id": known[name], "attributes": {"name": name}}
+            for name in names
+            if name in known
+        ]
+
+    def list_playlists_for_projects(
+        self, project_ids: Iterable[int]
+    ) -> list[dict[str, Any]]:
+        self.calls.append("playlists")
+        wanted = set(project_ids)
+        return [
+            playlist
+            for playlist in self.playlists
+            if playlist["relationships"]["project"]["data"]["id"] in wanted
+        ]
+
+    def list_versions_raw(
+        self, filters: list[dict[str, object]], fields: str, **_: Any
+    ) -> list[dict[str, Any]]:
+        self.calls.append("versions")
+        self.version_filters.append(filters)
+        requested = [int(value) for value in str(filters[0]["id[$in]"]).split(",")]
+        return [self.versions[vid] for vid in requested if vid in self.versions]
+
+    def get_playlist_record(self, *_: Any, **__: Any) -> Any:
+        raise AssertionError("batched summaries must not fetch playlists one by one")
+
+
+def test_review_facade_batches_playlist_and_version_queries() -> None:
+    client = BatchedReviewClient()
+    facade = dashboard.ReviewDashboardFacade(client)
+
+    summary = facade.summarise_projects(["alpha", "beta", "gamma"])
+
+    assert client.calls == ["projects", "playlists", "versions"]
+    assert client.version_filters == [[{"id[$in]": "101,102,201"}]]
+    assert summary["totals"] == {
+        "projects": 3,
+        "playlists": 3,
+        "clips": 4,
+        "shots": 4,
+        "duration_seconds": pytest.approx(8.0),
+    }
+    assert [entry["project"] for entry in summary["projects"]] == [
+        "alpha",
+        "beta",
+        "gamma",
+    ]
+    assert summary["projects"][0]["playlists"] == 2
+    assert summary["projects"][0]["clips"] == 3
+    assert summary["projects"][2]["playlists"] == 0
+
+
+def test_review_facade_reuses_playlist_summaries_until_updated() -> None:
+    client = BatchedReviewClient()
+    facade = dashboard.ReviewDashboardFacade(client)
+    facade.summarise_projects(["alpha", "beta"])
+    client.calls.clear()
+    client.version_filters.clear()
+
+    facade.summarise_projects(["alpha", "beta"])
+
+    assert client.calls == ["projects", "playlists"]
+
+    client.playlists[2]["attributes"]["updated_at"] = "2024-05-03T09:00"
+    client.playlists[2]["relationships"]["versions"]["data"].append({"id": 101})
+
+    summary = facade.summarise_projects(["alpha", "beta"])
+
+    assert client.version_filters == [[{"id[$in]": "201,101"}]]
+    assert summary["projects"][1]["clips"] == 2
+
+
+def test_review_facade_falls_back_to_per_playlist_queries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class LegacyClient:
+        pass
+
+    playlists = {"alpha": ["Dailies"], "beta": ["Client", "Dailies"]}
+
+    def _list_playlists(client: Any, project: str) -> list[str]:
+        if project == "broken":
+            raise dashboard.ShotGridError("offline")
+        return playlists[project]
+
+    def _fetch(client: Any, project: str, playlist: str) -> list[DailiesClip]:
+        return [
+            DailiesClip(
+                shot=f"{project}_{playlist}",
+                version="v001",
+                source_path="/media/clip.mov",
+                frame_range="1-24",
+                user="artist",
+                duration_seconds=1.0,
+            )
+        ]
+
+    monkeypatch.setattr(
+        dashboard.review_module, "_list_project_playlists", _list_playlists
+    )
+    monkeypatch.setattr(dashboard, "fetch_playlist_versions", _fetch)
+
+    facade = dashboard.ReviewDashboardFacade(LegacyClient(), max_workers=2)
+    summary = facade.summarise_projects(["alpha", "broken", "beta"])
+
+    assert [entry["project"] for entry in summary["projects"]] == ["alpha", "beta"]
+    assert summary["totals"]["playlists"] == 3
+    assert summary["totals"]["clips"] == 3
+
+
+@pytest.mark.anyio("asyncio")
+async def test_project_detail_honours_if_none_match() -> None:
+    versions = [
+        {"project": "alpha", "shot": "EP01_SC001_SH0010", "version": "v001"},
+    ]
+    shotgrid_client = DummyShotgridClient(versions)
+    service = dashboard.ShotGridService(shotgrid_client, cache_ttl=300)
+    dashboard.app.dependency_overrides[dashboard.get_shotgrid_service] = lambda: service
+
+    transport = ASGITransport(app=dashboard.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        first = await client.get("/projects/alpha")
+        etag = first.headers["etag"]
+        cached = await client.get("/projects/alpha", headers={"If-None-Match": etag})
+
+        shotgrid_client._versions.append(
+            {"project": "alpha", "shot": "EP01_SC001_SH0020", "version": "v001"}
+        )
+        service.invalidate_cache()
+        refreshed = await client.get("/projects/alpha", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert refreshed.json()["shots"] == 2
+
+
+@pytest.mark.anyio("asyncio")
+async def test_project_detail_fetches_once_without_cache() -> None:
+    versions = [
+        {"project": "alpha", "shot": "EP01_SC001_SH0010", "version": "v001"},
+    ]
+    shotgrid_client = DummyShotgridClient(versions)
+    service = dashboard.ShotGridService(
+        shotgrid_client, known_projects={"alpha"}, cache_ttl=0
+    )
+    dashboard.app.dependency_overrides[dashboard.get_shotgrid_service] = lambda: service
+
+    transport = ASGITransport(app=dashboard.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        first = await client.get("/projects/alpha")
+        etag = first.headers["etag"]
+        revalidated = await client.get(
+            "/projects/alpha", headers={"If-None-Match": etag}
+        )
+
+    assert first.status_code == 200
+    assert revalidated.status_code == 304
+    assert shotgrid_client.calls == 2
+    assert service.cached_generation() is None
+
+
+@pytest.mark.anyio("asyncio")
+async def test_error_summary_etag_uses_generation_read_with_mismatches() -> None:
+    mismatches = [{"type": "missing", "shot": "sh010", "path": "/plates/sh010"}]
+    returned: list[int] = []
+
+    class RacingReconcileService(dashboard.ReconcileService):  # type: ignore[misc]
+        def list_errors_with_generation(
+            self,
+        ) -> tuple[list[Mapping[str, Any]], int]:
+            listed, generation = super().list_errors_with_generation()
+            returned.append(generation)
+            # A concurrent request observes different data after this read.
+            self._generations.observe([{"type": "concurrent"}])
+            return listed, generation
+
+    service = RacingReconcileService(
+        DummyReconcileProvider({}), comparator_fn=lambda *_, **__: mismatches
+    )
+    dashboard.app.dependency_overrides[dashboard.get_reconcile_service] = (
+        lambda: service
+    )
+
+    transport = ASGITransport(app=dashboard.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.get("/errors/summary")
+
+    assert response.status_code == 200
+    assert response.json()[0]["shots"] == ["sh010"]
+    assert response.headers["etag"] == dashboard.compute_etag(
+        "errors.summary", returned[0]
+    )
+    assert service.data_generation != returned[0]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_error_summary_revalidates_before_summarising(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    mismatches = [{"type": "missing", "shot": "sh010", "path": "/plates/sh010"}]
+    service = dashboard.ReconcileService(
+        DummyReconcileProvider({}), comparator_fn=lambda *_, **__: mismatches
+    )
+    dashboard.app.dependency_overrides[dashboard.get_reconcile_service] = (
+        lambda: service
+    )
+
+    def _fail(_: Any) -> list[dict[str, Any]]:
+        raise AssertionError("summary rebuilt for a matching validator")
+
+    transport = ASGITransport(app=dashboard.app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        first = await client.get("/errors/summary")
+        monkeypatch.setattr(dashboard, "_summarise_mismatches", _fail)
+        revalidated = await client.get(
+            "/errors/summary", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+    assert first.status_code == 200
+    assert revalidated.status_code == 304
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Any, Iterable, Iterator, Mapping
 
 import pytest
@@ -250,3 +251,56 @@ async def test_dashboard_mount_injects_base_path(
     assert isinstance(payload.get("statuses"), dict)
     assert isinstance(payload.get("adapters"), dict)
     assert isinstance(payload.get("submission_windows"), dict)
+
+
+@pytest.mark.anyio("asyncio")
+async def test_status_returns_partial_payload_when_shotgrid_is_slow(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+
+    class SlowShotGridService(StubShotGridService):
+        def overall_status(self) -> Mapping[str, int]:
+            release.wait(timeout=2)
+            return super().overall_status()
+
+    monkeypatch.setenv("TRAFALGAR_SOURCE_TIMEOUT_SHOTGRID", "0.05")
+    facade = StubIngestFacade(
+        {"counts": {"total": 1}, "last_success_at": None, "failure_streak": 0}
+    )
+    render_facade = StubRenderFacade({"jobs": 2, "by_status": {}, "by_farm": {}})
+    review_facade = StubReviewFacade({"totals": {}, "projects": []})
+
+    dashboard.app.dependency_overrides[dashboard.get_shotgrid_service] = (
+        lambda: SlowShotGridService()
+    )
+    dashboard.app.dependency_overrides[dashboard.get_reconcile_service] = (
+        lambda: StubReconcileService()
+    )
+    dashboard.app.dependency_overrides[dashboard.get_ingest_dashboard_facade] = (
+        lambda: facade
+    )
+    dashboard.app.dependency_overrides[dashboard.get_render_dashboard_facade] = (
+        lambda: render_facade
+    )
+    dashboard.app.dependency_overrides[dashboard.get_review_dashboard_facade] = (
+        lambda: review_facade
+    )
+
+    transport = ASGITransport(app=dashboard.app)
+    try:
+        async with AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+            response = await client.get("/status")
+    finally:
+        release.set()
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["degraded"] is True
+    assert payload["degraded_sources"] == ["shotgrid"]
+    assert payload["projects"] == 0
+    assert payload["errors"] == 1
+    assert payload["render"]["jobs"] == 2
+    assert payload["ingest"]["counts"] == {"total": 1}
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from apps.trafalgar.web import execution
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio("asyncio")
+async def test_blocking_executor_runs_calls_off_the_event_loop() -> None:
+    executor = execution.BlockingExecutor(max_workers=2)
+    loop_thread = threading.get_ident()
+
+    def _work(value: int) -> tuple[int, int]:
+        time.sleep(0.05)
+        return value * 2, threading.get_ident()
+
+    ticks = 0
+
+    async def _ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker = asyncio.create_task(_ticker())
+    try:
+        result, worker_thread = await executor.run(_work, 21)
+    finally:
+        ticker.cancel()
+        executor.shutdown()
+
+    assert result == 42
+    assert worker_thread != loop_thread
+    assert ticks >= 3
+
+
+@pytest.mark.anyio("asyncio")
+async def test_blocking_executor_bounds_concurrency() -> None:
+    executor = execution.BlockingExecutor(max_workers=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _work() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    try:
+        await asyncio.gather(*(executor.run(_work) for _ in range(6)))
+    finally:
+        executor.shutdown()
+
+    assert executor.max_workers == 2
+    assert peak == 2
+
+
+@pytest.mark.anyio("asyncio")
+async def test_concurrency_limiter_bounds_holders_and_survives_cancellation() -> None:
+    limiter = execution.AsyncConcurrencyLimiter(2)
+    active = 0
+    peak = 0
+    order: list[int] = []
+
+    async def _hold(index: int) -> None:
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            order.append(index)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await limiter.acquire()
+    await limiter.acquire()
+    cancelled = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    limiter.release()
+    limiter.release()
+
+    await asyncio.gather(*(_hold(index) for index in range(6)))
+
+    assert cancelled.cancelled()
+    assert peak == 2
+    assert order == list(range(6))
+
+
+def test_concurrency_limiter_is_shared_across_event_loops() -> None:
+    limiter = execution.AsyncConcurrencyLimiter(1)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    async def _hold() -> None:
+        nonlocal active, peak
+        async with limiter:
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            with lock:
+                active -= 1
+
+    def _run_loop() -> None:
+        asyncio.run(_hold())
+
+    threads = [threading.Thread(target=_run_loop) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=2)
+
+    assert peak == 1
+
+
+@pytest.mark.anyio("asyncio")
+async def test_gather_sources_reports_slow_and_failing_sources() -> None:
+    async def _fast() -> str:
+        return "ok"
+
+    async def _slow() -> str:
+        await asyncio.sleep(1)
+        return "late"
+
+    async def _broken() -> Any:
+        raise RuntimeError("boom")
+
+    started = time.perf_counter()
+    results, degraded = await execution.gather_sources(
+        {"fast": _fast, "slow": _slow, "broken": _broken},
+        timeouts={"fast": 1.0, "slow": 0.05, "broken": 1.0},
+        defaults={"slow": "fallback"},
+    )
+    elapsed = time.perf_counter() - started
+
+    assert results == {"fast": "ok", "slow": "fallback", "broken": None}
+    assert degraded == ["broken", "slow"]
+    assert elapsed < 0.5
+
+
+def test_resolve_source_timeout_prefers_source_specific_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(execution.SOURCE_TIMEOUT_ENV, "4")
+    monkeypatch.setenv(f"{execution.SOURCE_TIMEOUT_ENV}_SHOTGRID", "1.5")
+    monkeypatch.setenv(f"{execution.SOURCE_TIMEOUT_ENV}_REVIEW", "invalid")
+
+    assert execution.resolve_source_timeout("shotgrid") == 1.5
+    assert execution.resolve_source_timeout("review") == 4.0
+    assert execution.resolve_source_timeout("ingest") == 4.0
+
+    monkeypatch.delenv(execution.SOURCE_TIMEOUT_ENV)
+
+    assert execution.resolve_source_timeout("ingest", default=2.0) == 2.0
+
+
+@pytest.mark.anyio("asyncio")
+async def test_source_executors_isolate_hung_sources(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(f"{execution.BLOCKING_WORKERS_ENV}_BULKHEAD_SLOW", "1")
+    release = threading.Event()
+    slow = execution.get_source_executor("bulkhead.slow")
+    fast = execution.get_source_executor("bulkhead.fast")
+
+    assert slow.max_workers == 1
+    assert execution.get_source_executor("Bulkhead.Slow") is slow
+    results, degraded = await execution.gather_sources(
+        {
+            "slow": lambda: execution.run_for_source("bulkhead.slow", release.wait),
+            "fast": lambda: execution.run_for_source("bulkhead.fast", lambda: "ok"),
+        },
+        timeouts={"slow": 0.05, "fast": 1.0},
+    )
+    # The timed-out call still holds the only slow thread; other sources are
+    # unaffected.
+    assert results["fast"] == "ok" and degraded == ["slow"]
+    assert await execution.run_for_source("bulkhead.fast", lambda: 1) == 1
+
+    release.set()
+    slow.shutdown(wait=True)
+    fast.shutdown(wait=True)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from apps.trafalgar.web.job_index import JobIndex
+
+
+def _key(day: int, job_id: str) -> tuple[str, str]:
+    return (f"2024-05-{day:02d}T00:00:00+00:00", job_id)
+
+
+def _build() -> JobIndex[str]:
+    index: JobIndex[str] = JobIndex()
+    for day, job_id, farm, status, user in (
+        (1, "a", "mock", "running", "ana"),
+        (2, "b", "tractor", "queued", "ben"),
+        (3, "c", "mock", "completed", "ana"),
+        (4, "d", "mock", "running", None),
+    ):
+        index.upsert(
+            job_id,
+            _key(day, job_id),
+            f"view-{job_id}",
+            {"farm": farm, "status": status, "user": user},
+        )
+    return index
+
+
+def test_select_orders_newest_first_and_honours_range_and_cursor() -> None:
+    index = _build()
+
+    assert [view for _, view in index.select()] == [
+        "view-d",
+        "view-c",
+        "view-b",
+        "view-a",
+    ]
+    assert [
+        view
+        for _, view in index.select(
+            since="2024-05-02T00:00:00+00:00", until="2024-05-03T00:00:00+00:00"
+        )
+    ] == ["view-c", "view-b"]
+    assert [view for _, view in index.select(before=_key(3, "c"), limit=1)] == [
+        "view-b"
+    ]
+
+
+def test_select_intersects_postings_and_tracks_transitions() -> None:
+    index = _build()
+
+    assert [
+        view
+        for _, view in index.select(filters={"farm": ["Mock"], "status": ["running"]})
+    ] == ["view-d", "view-a"]
+    assert [view for _, view in index.select(filters={"user": ["ana"]})] == [
+        "view-c",
+        "view-a",
+    ]
+
+    index.upsert("a", _key(1, "a"), "view-a2", {"farm": "mock", "status": "failed"})
+    index.remove("d")
+
+    assert index.select(filters={"status": ["running"]}) == []
+    assert index.select(filters={"user": ["ana"]}) == [(_key(3, "c"), "view-c")]
+    assert [view for _, view in index.select(filters={"status": ["failed"]})] == [
+        "view-a2"
+    ]
+    assert len(index) == 3
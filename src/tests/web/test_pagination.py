@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from apps.trafalgar.web import pagination
+
+
+def _items(count: int) -> list[dict[str, str]]:
+    return [
+        {"id": f"item-{index:02d}", "created_at": f"2024-05-{index + 1:02d}T00:00:00Z"}
+        for index in reversed(range(count))
+    ]
+
+
+def _key(item: dict[str, str]) -> pagination.CursorKey:
+    return (pagination.sortable_timestamp(item["created_at"]), item["id"])
+
+
+def test_cursor_round_trip_and_rejects_garbage() -> None:
+    token = pagination.encode_cursor(("2024-05-01T00:00:00+00:00", "shot/010"))
+
+    assert pagination.decode_cursor(token) == ("2024-05-01T00:00:00+00:00", "shot/010")
+    with pytest.raises(ValueError):
+        pagination.decode_cursor("not-a-cursor!")
+    with pytest.raises(HTTPException) as excinfo:
+        pagination.build_collection_query(cursor="e30")
+    assert excinfo.value.status_code == 400
+
+
+def test_paginate_walks_every_item_once() -> None:
+    items = _items(7)
+    seen: list[str] = []
+    cursor: str | None = None
+    pages = 0
+    while True:
+        query = pagination.build_collection_query(limit=3, cursor=cursor)
+        page = pagination.paginate(items, key=_key, query=query)
+        seen.extend(item["id"] for item in page.items)
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen == [item["id"] for item in items]
+
+
+def test_paginate_inexact_stops_at_page_boundary() -> None:
+    consumed: list[str] = []
+
+    def _lazy() -> object:
+        for item in _items(4):
+            consumed.append(item["id"])
+            yield item
+
+    query = pagination.build_collection_query(limit=2)
+    page = pagination.paginate(_lazy(), key=_key, query=query, exact=False)
+
+    assert len(page.items) == 2
+    assert page.next_cursor is not None
+    assert consumed == ["item-03", "item-02"]
+
+
+def test_collection_query_filters_and_selects_fields() -> None:
+    query = pagination.build_collection_query(
+        status_values=["Running,completed"],
+        since=datetime(2024, 5, 2),
+        until=datetime(2024, 5, 3, tzinfo=timezone.utc),
+        fields=["id,status", "id"],
+    )
+
+    assert query.status == frozenset({"running", "completed"})
+    assert query.fields == ("id", "status")
+    assert query.matches_status(" RUNNING ")
+    assert not query.matches_status("failed")
+    assert query.matches_timestamp("2024-05-02T12:00:00Z")
+    assert not query.matches_timestamp("2024-05-04T00:00:00+00:00")
+    assert not query.matches_timestamp(None)
+    assert pagination.select_fields(
+        {"id": "a", "status": "running", "report": {}}, query.fields
+    ) == {"id": "a", "status": "running"}
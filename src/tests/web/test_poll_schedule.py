@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import random
+
+from apps.trafalgar.web.poll_schedule import PollScheduler
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pop_due_returns_jobs_in_due_order_and_skips_replaced_entries() -> None:
+    clock = _Clock()
+    scheduler = PollScheduler(base_interval=5.0, clock=clock)
+    scheduler.schedule("late", delay=10.0)
+    scheduler.schedule("early", delay=2.0)
+    scheduler.schedule("moved", delay=1.0)
+    scheduler.schedule("moved", delay=20.0)
+    scheduler.schedule("dropped", delay=0.0)
+    scheduler.discard("dropped")
+
+    assert scheduler.seconds_until_next() == 2.0
+    clock.now = 10.0
+    assert scheduler.pop_due() == ["early", "late"]
+    assert scheduler.seconds_until_next() == 10.0
+    assert "moved" in scheduler
+    assert len(scheduler) == 1
+
+
+def test_interval_adapts_to_status_age_and_stops_for_terminal_jobs() -> None:
+    scheduler = PollScheduler(
+        base_interval=5.0,
+        max_interval=60.0,
+        fresh_window=60.0,
+        terminal_statuses={"completed"},
+    )
+
+    assert scheduler.interval_for("running", 10.0) == 5.0
+    assert scheduler.interval_for("running", 300.0) == 25.0
+    assert scheduler.interval_for("running", 3600.0) == 60.0
+    assert scheduler.interval_for(" Completed ", 0.0) is None
+
+    scheduler.schedule("job-1")
+    assert scheduler.record_success("job-1", "completed", 0.0) is None
+    assert "job-1" not in scheduler
+
+
+def test_failures_back_off_exponentially_with_bounded_jitter() -> None:
+    clock = _Clock()
+    scheduler = PollScheduler(
+        base_interval=1.0,
+        max_backoff=8.0,
+        jitter=0.25,
+        clock=clock,
+        rng=random.Random(7),
+    )
+
+    delays = [scheduler.record_failure("job-1") for _ in range(5)]
+
+    for attempt, delay in enumerate(delays, start=1):
+        expected = min(2.0**attempt, 8.0)
+        assert expected * 0.75 <= delay <= expected * 1.25
+    assert scheduler.seconds_until_next() == delays[-1]
+
+    assert scheduler.record_success("job-1", "running", 0.0) == 1.0
+    assert 1.5 <= scheduler.record_failure("job-1") <= 2.5
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Any, cast
+
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from apps.trafalgar.web import responses
+from apps.trafalgar.web.conditional import (
+    apply_cache_headers,
+    compute_etag,
+    etag_matches,
+    not_modified,
+)
+
+
+class _Payload(BaseModel):
+    name: str
+    created_at: datetime
+
+
+def _build_app(*, minimum_size: int) -> FastAPI:
+    app = FastAPI(default_response_class=responses.FastJSONResponse)
+    router = APIRouter(
+        default_response_class=responses.FastJSONResponse,
+        route_class=responses.compressed_route_class(minimum_size=minimum_size),
+    )
+
+    @router.get("/items")
+    def list_items(count: int = 1) -> dict[str, list[str]]:
+        return {"items": [f"item-{index:04d}" for index in range(count)]}
+
+    @router.get("/tagged")
+    def tagged(request: Request, count: int = 1) -> Any:
+        etag = compute_etag("items", 1, params=count)
+        if etag_matches(request, etag):
+            return not_modified(cast(str, etag))
+        content = {"items": [f"item-{index:04d}" for index in range(count)]}
+        return apply_cache_headers(responses.FastJSONResponse(content=content), etag)
+
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_render_json_matches_stdlib_output(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(responses, "_orjson", None)
+    elif responses._orjson is None:
+        pytest.skip("orjson is not installed")
+
+    payload = _Payload(
+        name="shot-010", created_at=datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+    )
+    rendered = responses.render_json({"payload": payload, "count": 1})
+
+    assert json.loads(rendered) == {
+        "payload": {"name": "shot-010", "created_at": "2024-05-01T12:00:00Z"},
+        "count": 1,
+    }
+    assert b" " not in rendered
+
+
+def test_compressed_route_gzips_large_bodies_for_accepting_clients() -> None:
+    client = TestClient(_build_app(minimum_size=256))
+
+    large = client.get("/items", params={"count": 100})
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.headers["vary"] == "Accept-Encoding"
+    assert len(large.json()["items"]) == 100
+
+    small = client.get("/items", params={"count": 1})
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+
+    plain = client.get(
+        "/items", params={"count": 100}, headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == large.json()
+
+
+def test_compress_response_disabled_by_zero_minimum_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(responses.GZIP_MINIMUM_SIZE_ENV, "0")
+    monkeypatch.setenv(responses.GZIP_LEVEL_ENV, "12")
+
+    assert responses.resolve_gzip_minimum_size() == 0
+    assert responses.resolve_gzip_level() == 5
+
+    client = TestClient(_build_app(minimum_size=0))
+    response = client.get("/items", params={"count": 100})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_compressed_variant_has_its_own_validator() -> None:
+    client = TestClient(_build_app(minimum_size=256))
+
+    compressed = client.get("/tagged", params={"count": 100})
+    plain = client.get(
+        "/tagged", params={"count": 100}, headers={"Accept-Encoding": "identity"}
+    )
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+
+    revalidated = client.get(
+        "/tagged",
+        params={"count": 100},
+        headers={"If-None-Match": compressed.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == compressed.headers["etag"]
+    assert revalidated.headers["vary"] == "Accept-Encoding"
+
+    identity = client.get(
+        "/tagged",
+        params={"count": 100},
+        headers={"If-None-Match": plain.headers["etag"], "Accept-Encoding": "identity"},
+    )
+    assert identity.status_code == 304
+    assert identity.headers["etag"] == plain.headers["etag"]
+
+
+def test_large_bodies_are_compressed_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    offloaded: list[object] = []
+    original = responses.asyncio.to_thread
+
+    async def _to_thread(func: Any, *args: Any, **kwargs: Any) -> Any:
+        offloaded.append(func)
+        return await original(func, *args, **kwargs)
+
+    monkeypatch.setattr(responses.asyncio, "to_thread", _to_thread)
+    client = TestClient(_build_app(minimum_size=256))
+
+    client.get("/items", params={"count": 100})
+    assert offloaded == []
+
+    large = client.get("/items", params={"count": 10_000})
+    assert large.headers["content-encoding"] == "gzip"
+    assert offloaded == [responses.gzip.compress]